@@ -0,0 +1,289 @@
+"""
+Recursive Linux inotify watcher (ctypes, no extra dependency).
+
+Reports file additions and removals under a set of root directories so the
+DJ asset cache and the music library can be updated incrementally instead of
+re-walking their trees. Events are delivered in batches (one per read of the
+inotify descriptor) on the watcher thread.
+
+- A file counts as added once it is fully written (IN_CLOSE_WRITE) or moved in
+  (IN_MOVED_TO); a rename is reported as removed + added.
+- New directories are watched as they appear, and files already inside them
+  are reported as added.
+- If the kernel event queue overflows, on_overflow is called so the owner can
+  fall back to a full rescan.
+- inotify only sees changes made through the local kernel, so roots on network
+  filesystems (is_network_filesystem) are not worth watching.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# inotify(7) event masks
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (
+    IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+)
+
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+READ_BUFFER_BYTES = 64 * 1024
+
+# (kind, path, is_dir) with kind "added" or "removed"
+FsEvent = Tuple[str, str, bool]
+
+# Mount types whose changes made on other hosts never reach inotify
+NETWORK_FS_TYPES = {
+    "nfs", "nfs4", "cifs", "smb3", "smbfs", "9p", "ceph", "glusterfs", "lustre", "afs",
+    "fuse.sshfs", "fuse.rclone", "fuse.s3fs", "fuse.glusterfs",
+}
+
+
+def is_network_filesystem(path: str, mounts_path: str = "/proc/self/mounts") -> bool:
+    """True if path lives on a network mount (by the longest matching mount point)."""
+    path = os.path.realpath(path)
+    best_mount, best_type = "", ""
+    try:
+        with open(mounts_path, "r", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) < 3:
+                    continue
+                # Mount points escape spaces as \040
+                mount = fields[1].replace("\\040", " ")
+                prefix = mount.rstrip("/") + "/"
+                if (path == mount or path.startswith(prefix)) and len(mount) >= len(best_mount):
+                    best_mount, best_type = mount, fields[2]
+    except OSError:
+        return False
+    return best_type in NETWORK_FS_TYPES
+
+
+def _load_libc() -> Optional[ctypes.CDLL]:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1  # noqa: B018 - probe symbol
+    except (OSError, AttributeError):
+        return None
+    libc.inotify_init1.argtypes = [ctypes.c_int]
+    libc.inotify_init1.restype = ctypes.c_int
+    libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    libc.inotify_add_watch.restype = ctypes.c_int
+    libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+    libc.inotify_rm_watch.restype = ctypes.c_int
+    return libc
+
+
+class InotifyWatcher:
+    """
+    Watch directory trees and report file adds/removes in batches.
+
+    Usage:
+        watcher = InotifyWatcher(on_events=handle_batch, on_overflow=rescan)
+        watcher.add_root("/music")
+        watcher.start()
+        ...
+        watcher.stop()
+    """
+
+    def __init__(
+        self,
+        on_events: Callable[[List[FsEvent]], None],
+        on_overflow: Optional[Callable[[], None]] = None,
+    ):
+        self._on_events = on_events
+        self._on_overflow = on_overflow
+        self._libc = _load_libc()
+        self._fd = -1
+        self._wd_to_path: Dict[int, str] = {}
+        self._path_to_wd: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop_r, self._stop_w = -1, -1
+        self.events_delivered = 0
+        self.overflows = 0
+
+    @staticmethod
+    def available() -> bool:
+        """True on Linux when libc exposes inotify."""
+        return _load_libc() is not None
+
+    def _ensure_fd(self) -> None:
+        if self._fd >= 0:
+            return
+        if self._libc is None:
+            raise OSError(errno.ENOSYS, "inotify is not available on this platform")
+        fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self._fd = fd
+
+    def watch_count(self) -> int:
+        with self._lock:
+            return len(self._wd_to_path)
+
+    def add_root(self, root: str) -> None:
+        """Watch root and every directory below it (hidden directories skipped)."""
+        self._ensure_fd()
+        self._watch_tree(os.path.normpath(root), report_files=None)
+
+    def _add_watch(self, path: str) -> bool:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err == errno.ENOSPC:
+                logger.warning(
+                    f"[FS-WATCH] inotify watch limit reached at {path} "
+                    f"(raise fs.inotify.max_user_watches); changes below it rely on rescans"
+                )
+            elif err not in (errno.ENOENT, errno.ENOTDIR):
+                logger.warning(f"[FS-WATCH] Cannot watch {path}: {os.strerror(err)}")
+            return False
+        with self._lock:
+            self._wd_to_path[wd] = path
+            self._path_to_wd[path] = wd
+        return True
+
+    def _watch_tree(self, top: str, report_files: Optional[List[FsEvent]]) -> None:
+        for root, dirs, files in os.walk(top):
+            dirs[:] = [d for d in dirs if not d.startswith(".")]
+            if not self._add_watch(root):
+                dirs[:] = []
+                continue
+            if report_files is not None:
+                # Files that landed before the watch existed
+                report_files.extend(("added", os.path.join(root, name), False) for name in files)
+
+    def _forget_tree(self, top: str) -> None:
+        prefix = top.rstrip(os.sep) + os.sep
+        with self._lock:
+            for path in [p for p in self._path_to_wd if p == top or p.startswith(prefix)]:
+                wd = self._path_to_wd.pop(path)
+                self._wd_to_path.pop(wd, None)
+
+    def start(self) -> None:
+        """Start the watcher thread."""
+        self._ensure_fd()
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_r, self._stop_w = os.pipe()
+        self._thread = threading.Thread(target=self._run, name="fs-watch", daemon=True)
+        self._thread.start()
+        logger.info(f"[FS-WATCH] Watching {self.watch_count()} directories")
+
+    def stop(self) -> None:
+        """Stop the watcher thread and release the inotify descriptor. Idempotent."""
+        if self._stop_w >= 0:
+            try:
+                os.write(self._stop_w, b"x")
+            except OSError:
+                pass
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2.0)
+        self._thread = None
+        for fd in (self._stop_r, self._stop_w, self._fd):
+            if fd >= 0:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        self._stop_r = self._stop_w = self._fd = -1
+        with self._lock:
+            self._wd_to_path.clear()
+            self._path_to_wd.clear()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                readable, _, _ = select.select([self._fd, self._stop_r], [], [])
+            except (OSError, ValueError):
+                return
+            if self._stop_r in readable:
+                return
+            try:
+                data = os.read(self._fd, READ_BUFFER_BYTES)
+            except BlockingIOError:
+                continue
+            except OSError as e:
+                logger.error(f"[FS-WATCH] Read failed, watcher stopping: {e}")
+                return
+            try:
+                self._dispatch(data)
+            except Exception as e:
+                logger.error(f"[FS-WATCH] Event handler failed: {e}", exc_info=True)
+
+    def _dispatch(self, data: bytes) -> None:
+        events: List[FsEvent] = []
+        overflow = False
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, name_len = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = os.fsdecode(data[offset:offset + name_len].rstrip(b"\0"))
+            offset += name_len
+
+            if mask & IN_Q_OVERFLOW:
+                overflow = True
+                continue
+            with self._lock:
+                directory = self._wd_to_path.get(wd)
+            if directory is None:
+                continue
+            if mask & IN_IGNORED:
+                with self._lock:
+                    self._wd_to_path.pop(wd, None)
+                    if self._path_to_wd.get(directory) == wd:
+                        del self._path_to_wd[directory]
+                continue
+            if mask & (IN_DELETE_SELF | IN_MOVE_SELF) or not name:
+                continue  # reported by the parent's DELETE / MOVED_FROM
+
+            path = os.path.join(directory, name)
+            is_dir = bool(mask & IN_ISDIR)
+            if is_dir:
+                if name.startswith("."):
+                    continue
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    self._watch_tree(path, report_files=events)
+                elif mask & (IN_DELETE | IN_MOVED_FROM):
+                    self._forget_tree(path)
+                    events.append(("removed", path, True))
+            elif mask & (IN_CLOSE_WRITE | IN_MOVED_TO):
+                events.append(("added", path, False))
+            elif mask & (IN_DELETE | IN_MOVED_FROM):
+                events.append(("removed", path, False))
+
+        if overflow:
+            self.overflows += 1
+            logger.warning("[FS-WATCH] inotify queue overflow - requesting full rescan")
+            if self._on_overflow:
+                self._on_overflow()
+        if events:
+            self.events_delivered += len(events)
+            self._on_events(events)
@@ -5,7 +5,9 @@ import time
 from typing import Optional, Dict, Any
 from pathlib import Path
 
+from station.app.fs_watcher import InotifyWatcher, is_network_filesystem
 from station.music_logic.media_library import MediaLibrary
+from station.music_logic.metadata_index import MediaMetadataIndex, set_metadata_index
 from station.music_logic.rotation import RotationManager
 from station.dj_logic.dj_engine import DJEngine
 from station.dj_logic.asset_discovery import AssetDiscoveryManager
@@ -15,6 +17,15 @@ from station.broadcast_core.playout_engine import PlayoutEngine
 from station.outputs.factory import create_output_sink
 from station.outputs.tower_pcm_sink import TowerPCMSink
 from station.outputs.tower_control import TowerControlClient
+from station.outputs.tower_event_sender import DEFAULT_EVENT_LINGER_SEC, DEFAULT_EVENT_QUEUE_SIZE, TowerEventSender
+from station.outputs.tower_telemetry import (
+    DEFAULT_TELEMETRY_INTERVAL_SEC,
+    TowerBufferTelemetry,
+    default_push_socket_path,
+)
+from station.dj_logic.song_planner import DEFAULT_LOOKAHEAD_SONGS, SongPlanner
+from station.dj_logic.think_worker import DEFAULT_THINK_LEAD_SEC, ThinkWorker
+from station.dj_logic.tickler_executor import DEFAULT_TICKLER_WORKERS, TicklerExecutor
 from station.state.dj_state_store import DJStateStore
 from station.state.station_state import StationStateManager
 
@@ -84,15 +95,23 @@ class Station:
         
         # Component references (initialized in start())
         self.library: Optional[MediaLibrary] = None
+        self.metadata_index: Optional[MediaMetadataIndex] = None
         self.asset_manager: Optional[AssetDiscoveryManager] = None
+        self.fs_watcher: Optional[InotifyWatcher] = None
+        self._fs_watcher_lock = threading.Lock()
         self.state_store: Optional[DJStateStore] = None
         self.rotation: Optional[RotationManager] = None
         self.dj: Optional[DJEngine] = None
+        self.song_planner: Optional[SongPlanner] = None
+        self.think_worker: Optional[ThinkWorker] = None
+        self.tickler_executor: Optional[TicklerExecutor] = None
         self.engine: Optional[PlayoutEngine] = None
         self.sink: Optional[TowerPCMSink] = None
         self.http_server: Optional[object] = None  # HTTP server for /station/state endpoint
         self.http_server_thread: Optional[threading.Thread] = None
         self.tower_control: Optional[TowerControlClient] = None
+        self.tower_telemetry: Optional[TowerBufferTelemetry] = None
+        self.tower_event_sender: Optional[TowerEventSender] = None
         self.station_state_manager: Optional[StationStateManager] = None
         
         # Runtime state
@@ -166,10 +185,23 @@ class Station:
         # AssetDiscoveryManager performs initial scan in __init__, so it's ready now
         logger.info("AssetDiscoveryManager initialized and initial scan completed")
         
+        # Persistent metadata index: THINK/playout lookups never fork ffprobe once warm
+        logger.info("Loading media metadata index...")
+        self.metadata_index = MediaMetadataIndex.from_env()
+        set_metadata_index(self.metadata_index)
+        # Announcements first (needed at startup), then the library, in the background
+        self.metadata_index.start_warmup(
+            self.asset_manager.startup_announcements
+            + self.asset_manager.shutdown_announcements
+            + self.library.all_tracks
+        )
+        logger.info(f"Media metadata index loaded ({len(self.metadata_index)} entries, warm-up running)")
+        
         # SL1.1: Load DJStateStore
         logger.info("Loading DJStateStore...")
         state_path = os.getenv("DJ_STATE_PATH", "/tmp/appalachia_dj_state.json")
-        self.state_store = DJStateStore(path=state_path)
+        # Plays/talk/IDs are journaled between full saves (crash recovery)
+        self.state_store = DJStateStore(path=state_path, apply_record=DJEngine.apply_journal_record)
         logger.info("DJStateStore loaded")
         
         # Initialize RotationManager (needs MediaLibrary)
@@ -180,14 +212,48 @@ class Station:
         )
         logger.info("RotationManager initialized")
         
+        # Library was served from its persisted index: revalidate off the startup path
+        def on_library_changed(library: MediaLibrary) -> None:
+            self.rotation.set_tracks(library.regular_tracks, library.holiday_tracks)
+            if self.metadata_index:
+                self.metadata_index.start_warmup(library.all_tracks)
+        self.library.start_background_validation(on_change=on_library_changed)
+        
         # Initialize DJEngine (needs RotationManager, AssetDiscoveryManager)
         logger.info("Initializing DJEngine...")
         # Initialize Tower control client first (needed for DJEngine events)
         tower_host = os.getenv("TOWER_HOST", "127.0.0.1")
-        tower_port = int(os.getenv("TOWER_PORT", "8005"))
+        # Tower's keep-alive control-plane listener, when it runs one, else the main port
+        tower_port = int(os.getenv("TOWER_CONTROL_PORT") or os.getenv("TOWER_PORT", "8005"))
         tower_control = TowerControlClient(tower_host=tower_host, tower_port=tower_port)
         logger.info(f"Tower control client initialized (url=http://{tower_host}:{tower_port})")
         
+        # Emitters only queue events; one thread sends them to Tower in batches
+        # (TOWER_EVENT_QUEUE_SIZE=0 sends each event from the emitting thread)
+        event_queue_size = int(os.getenv("TOWER_EVENT_QUEUE_SIZE", str(DEFAULT_EVENT_QUEUE_SIZE)))
+        if event_queue_size > 0:
+            event_linger_ms = float(os.getenv("TOWER_EVENT_LINGER_MS", str(DEFAULT_EVENT_LINGER_SEC * 1000)))
+            self.tower_event_sender = TowerEventSender(
+                tower_control, max_queue=event_queue_size, linger_sec=event_linger_ms / 1000.0
+            )
+            self.tower_event_sender.start()
+            tower_control.event_sender = self.tower_event_sender
+        
+        # One Tower buffer telemetry source shared by the sink health monitor, pre-fill and PID:
+        # samples pushed by Tower, /tower/buffer polling while no pushed sample is fresh
+        # (TOWER_TELEMETRY_INTERVAL_MS=0 leaves each consumer polling on its own;
+        # TOWER_BUFFER_PUSH_SOCKET_PATH=off polls only)
+        telemetry_ms = float(os.getenv("TOWER_TELEMETRY_INTERVAL_MS", str(DEFAULT_TELEMETRY_INTERVAL_SEC * 1000)))
+        if telemetry_ms > 0:
+            tower_socket_path = os.getenv("TOWER_SOCKET_PATH", "/var/run/retrowaves/pcm.sock")
+            push_socket_path = os.getenv("TOWER_BUFFER_PUSH_SOCKET_PATH") or default_push_socket_path(tower_socket_path)
+            self.tower_telemetry = TowerBufferTelemetry(
+                tower_control,
+                interval_sec=telemetry_ms / 1000.0,
+                push_socket_path=None if push_socket_path == "off" else push_socket_path,
+            )
+            self.tower_telemetry.start()
+        
         self.dj = DJEngine(
             playout_engine=None,  # Will be set after engine creation
             rotation_manager=self.rotation,
@@ -196,6 +262,7 @@ class Station:
         )
         # Replace asset_manager with our initialized one (DJEngine creates its own, but we want to use ours)
         self.dj.asset_manager = self.asset_manager
+        self.dj.state_store = self.state_store
         logger.info("DJEngine initialized")
         
         # SL1.1: Load persisted DJ state (warm-start recovery)
@@ -206,10 +273,30 @@ class Station:
         else:
             logger.info("Cold start: no previous state found")
         
+        # Keep the next songs pre-selected off the THINK path (DJ_LOOKAHEAD_SONGS=0 disables)
+        lookahead = int(os.getenv("DJ_LOOKAHEAD_SONGS", str(DEFAULT_LOOKAHEAD_SONGS)))
+        if lookahead > 0:
+            self.song_planner = SongPlanner(self.rotation, depth=lookahead)
+            self.song_planner.start()
+            self.dj.song_planner = self.song_planner
+        
+        # Song THINK runs off the playout thread, due DJ_THINK_LEAD_SEC before the song ends
+        if os.getenv("DJ_THINK_WORKER", "1") != "0":
+            self.think_worker = ThinkWorker(lead_sec=float(os.getenv("DJ_THINK_LEAD_SEC", str(DEFAULT_THINK_LEAD_SEC))))
+            self.think_worker.start()
+            self.dj.think_worker = self.think_worker
+        
+        # Ticklers run on background workers as soon as DO schedules them (0 = during THINK)
+        tickler_workers = int(os.getenv("DJ_TICKLER_WORKERS", str(DEFAULT_TICKLER_WORKERS)))
+        if tickler_workers > 0:
+            self.tickler_executor = TicklerExecutor(self.dj, workers=tickler_workers)
+            self.tickler_executor.start()
+            self.dj.tickler_executor = self.tickler_executor
+        
         # Initialize output sink (Tower PCM socket)
         logger.info("Initializing Tower PCM sink...")
         tower_socket_path = os.getenv("TOWER_SOCKET_PATH", "/var/run/retrowaves/pcm.sock")
-        self.sink = TowerPCMSink(socket_path=tower_socket_path, tower_control=tower_control)
+        self.sink = TowerPCMSink(socket_path=tower_socket_path, tower_control=tower_control, telemetry=self.tower_telemetry)
         logger.info(f"Tower PCM sink initialized (socket={tower_socket_path})")
         
         # Store tower_control for PlayoutEngine
@@ -220,7 +307,8 @@ class Station:
         self.engine = PlayoutEngine(
             dj_callback=self.dj,
             output_sink=self.sink,
-            tower_control=self.tower_control
+            tower_control=self.tower_control,
+            tower_telemetry=self.tower_telemetry,
         )
         # Set playout engine reference in DJ
         self.dj.set_playout_engine(self.engine)
@@ -418,6 +506,14 @@ class Station:
         self.engine.run()  # This starts the playout loop in a background thread
         logger.info("Playout engine started (startup complete, playout running in background)")
         
+        # Keep the asset cache and track lists current from filesystem events. Adding
+        # the watches walks every tree, so it runs off the startup path, after playout
+        # has begun; the startup revalidation covers changes made before it completes.
+        threading.Thread(
+            target=self._start_fs_watcher, args=(dj_path, on_library_changed),
+            name="fs-watch-setup", daemon=True,
+        ).start()
+        
         # Update lifecycle state to RUNNING (only logs if state actually changes)
         self._set_lifecycle_state("RUNNING")
         self.running = True
@@ -473,11 +569,9 @@ class Station:
             # Wait for terminal playout to complete (terminal DO executed AND terminal segment finished if any)
             # This is the definitive signal, not thread liveness
             max_wait = self._shutdown_timeout_seconds
-            start_wait = time.monotonic()
             logger.info(f"[SHUTDOWN] PHASE 1: Waiting for terminal playout to complete (timeout: {max_wait}s)...")
             
-            while not self.engine._terminal_playout_complete and (time.monotonic() - start_wait) < max_wait:
-                time.sleep(0.1)
+            self.engine.wait_for_terminal_playout(timeout=max_wait)
             
             # Check if terminal playout completed
             if self.engine._terminal_playout_complete:
@@ -578,10 +672,7 @@ class Station:
             if not self.engine._terminal_playout_complete:
                 logger.warning("[SHUTDOWN] PHASE 2: Terminal playout not complete, waiting...")
                 # Wait a bit more for terminal playout to complete
-                max_wait = 5.0
-                start_wait = time.monotonic()
-                while not self.engine._terminal_playout_complete and (time.monotonic() - start_wait) < max_wait:
-                    time.sleep(0.1)
+                self.engine.wait_for_terminal_playout(timeout=5.0)
             
             logger.info("[SHUTDOWN] PHASE 2: Terminal playout confirmed complete, stopping playout engine...")
             self.engine.stop()
@@ -596,6 +687,8 @@ class Station:
                 logger.info("DJ state saved successfully")
             except Exception as e:
                 logger.error(f"Failed to save DJ state: {e}", exc_info=True)
+            finally:
+                self.state_store.close()
         
         # SL2.3.3: Close Tower PCM sink connection
         # CRITICAL: Only close sink AFTER terminal playout completes and engine is stopped
@@ -619,8 +712,110 @@ class Station:
                 self.http_server = None
                 self.http_server_thread = None
         
+        with self._fs_watcher_lock:
+            fs_watcher, self.fs_watcher = self.fs_watcher, None
+        if fs_watcher:
+            fs_watcher.stop()
+        
+        if self.tower_telemetry:
+            logger.info(f"Stopping Tower buffer telemetry ({self.tower_telemetry.stats()})")
+            self.tower_telemetry.stop()
+            self.tower_telemetry = None
+        
+        if self.tower_event_sender:
+            # Delivers what is still queued (station_shutdown included) before closing the pool
+            self.tower_event_sender.stop()
+            logger.info(f"Stopped Tower event sender ({self.tower_event_sender.stats()})")
+            if self.tower_control:
+                self.tower_control.event_sender = None
+            self.tower_event_sender = None
+        
+        if self.tower_control:
+            self.tower_control.close()
+        
+        if self.think_worker:
+            logger.info(f"Stopping THINK worker ({self.think_worker.stats()}, degraded={self.dj.degraded_intents if self.dj else 0})")
+            logger.info(f"THINK phase timings: {self.dj.think_phases.stats() if self.dj else {}}")
+            self.think_worker.stop()
+            self.think_worker = None
+        
+        if self.tickler_executor:
+            logger.info(f"Stopping tickler executor ({self.tickler_executor.stats()})")
+            self.tickler_executor.stop()
+            self.tickler_executor = None
+        
+        if self.song_planner:
+            logger.info(f"Stopping song planner ({self.song_planner.stats()})")
+            self.song_planner.stop()
+            self.song_planner = None
+        
+        if self.metadata_index:
+            logger.info(f"Closing media metadata index ({self.metadata_index.stats()})")
+            self.metadata_index.close()
+        
         logger.info("=== Station stopped ===")
     
+    def _start_fs_watcher(self, dj_path: str, on_library_changed) -> None:
+        """
+        Watch DJ_PATH and the music roots with inotify and apply changes incrementally.
+        
+        Runs on the "fs-watch-setup" thread (adding watches walks each tree). Roots
+        on network filesystems are not watched: inotify does not see changes made
+        on other hosts. Without a watcher for DJ_PATH (non-Linux, network mount,
+        watch limits) the hourly asset rescan in THINK remains its refresh path; the
+        music roots then rely on the startup library revalidation.
+        """
+        if not InotifyWatcher.available():
+            logger.info("Filesystem watcher unavailable - relying on periodic asset rescans")
+            return
+        roots = []
+        for root in (dj_path, self.library.regular_root, self.library.holiday_root):
+            if not root or not os.path.isdir(root):
+                continue
+            if is_network_filesystem(root):
+                logger.info(f"Not watching {root}: network filesystem (inotify cannot see remote changes)")
+                continue
+            roots.append(root)
+        if not roots:
+            return
+        
+        dj_prefix = os.path.normpath(dj_path).rstrip(os.sep) + os.sep
+        
+        def on_events(events) -> None:
+            library_changes = []
+            for kind, path, is_dir in events:
+                if path.startswith(dj_prefix):
+                    self.asset_manager.apply_change(kind, path, is_dir)
+                else:
+                    library_changes.append((kind, path, is_dir))
+            if library_changes and self.library.apply_changes(library_changes):
+                on_library_changed(self.library)
+        
+        def on_overflow() -> None:
+            # Events were lost: fall back to full rescans, off the THINK path
+            self.asset_manager.rescan_in_background()
+            self.library.needs_validation = True
+            self.library.start_background_validation(on_change=on_library_changed)
+        
+        watcher = InotifyWatcher(on_events=on_events, on_overflow=on_overflow)
+        try:
+            for root in roots:
+                if self._shutdown_initiated:
+                    break
+                watcher.add_root(root)
+            watcher.start()
+        except OSError as e:
+            logger.warning(f"Filesystem watcher failed to start ({e}) - relying on periodic asset rescans")
+            watcher.stop()
+            return
+        with self._fs_watcher_lock:
+            if self._shutdown_initiated:
+                watcher.stop()
+                return
+            self.fs_watcher = watcher
+        if dj_path in roots:
+            self.asset_manager.set_watching(True)
+    
     @staticmethod
     def _load_dotenv_simple(dotenv_path: Optional[str] = None) -> None:
         """
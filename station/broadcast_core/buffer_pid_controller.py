@@ -44,6 +44,7 @@ class BufferPIDController:
         update_interval: float = 0.5,
         query_timeout: float = 0.1,
         enabled: bool = True,
+        telemetry=None,
     ):
         """
         Initialize PID controller.
@@ -61,6 +62,8 @@ class BufferPIDController:
             update_interval: Buffer status update interval in seconds (default: 0.5)
             query_timeout: HTTP query timeout in seconds (default: 0.1)
             enabled: Whether PID controller is enabled (default: True)
+            telemetry: Optional shared TowerBufferTelemetry; when given, buffer status
+                comes from its latest snapshot instead of a request of our own
         """
         # PE6.3: Configuration Parameters
         self.kp = kp
@@ -99,6 +102,8 @@ class BufferPIDController:
         # Polling state
         self._last_poll_time = 0.0
         self._polling_in_progress = False
+        self.telemetry = telemetry
+        self._client: Optional[httpx.Client] = None  # keep-alive connection for our own polls
         
         # Suppress httpx INFO level logging
         httpx_logger = logging.getLogger("httpx")
@@ -282,41 +287,50 @@ class BufferPIDController:
             self._last_poll_time = now
         
         try:
+            if self.telemetry is not None:
+                # Shared Station telemetry: read its snapshot, no request of our own
+                buffer_data = self.telemetry.get_buffer(max_age_sec=2 * max(self.update_interval, self.query_timeout))
+                if buffer_data is not None:
+                    buffer_data = dict(buffer_data, ratio=max(0.0, min(1.0, buffer_data.get("ratio", 0.0))))
+                self.update_buffer_status(buffer_data)
+                return buffer_data
+            
             # PE6.4: Non-blocking query with timeout
             url = f"{self.base_url}/tower/buffer"
             
             try:
-                # Use httpx with timeout
-                with httpx.Client(timeout=self.query_timeout) as client:
-                    response = client.get(url)
-                    response.raise_for_status()
-                    buffer_data = response.json()
-                    
-                    # PE6.4: Validate response format
-                    if not isinstance(buffer_data, dict):
-                        logger.warning(f"[PID] Invalid buffer response format: {buffer_data}")
-                        return None
-                    
-                    # Extract ratio (required field per T-BUF2)
-                    # If ratio is missing, calculate it from fill/capacity
-                    if "ratio" not in buffer_data:
-                        if "fill" in buffer_data and "capacity" in buffer_data:
-                            capacity = buffer_data.get("capacity", 1)
-                            if capacity > 0:
-                                buffer_data["ratio"] = buffer_data.get("fill", 0) / capacity
-                            else:
-                                buffer_data["ratio"] = 0.0
+                # Reuse one keep-alive connection across polls
+                if self._client is None:
+                    self._client = httpx.Client(timeout=self.query_timeout)
+                response = self._client.get(url)
+                response.raise_for_status()
+                buffer_data = response.json()
+                
+                # PE6.4: Validate response format
+                if not isinstance(buffer_data, dict):
+                    logger.warning(f"[PID] Invalid buffer response format: {buffer_data}")
+                    return None
+                
+                # Extract ratio (required field per T-BUF2)
+                # If ratio is missing, calculate it from fill/capacity
+                if "ratio" not in buffer_data:
+                    if "fill" in buffer_data and "capacity" in buffer_data:
+                        capacity = buffer_data.get("capacity", 1)
+                        if capacity > 0:
+                            buffer_data["ratio"] = buffer_data.get("fill", 0) / capacity
                         else:
-                            logger.warning(f"[PID] Buffer response missing 'ratio' and cannot calculate from fill/capacity: {buffer_data}")
-                            return None
-                    
-                    # Ensure ratio is between 0.0 and 1.0
-                    buffer_data["ratio"] = max(0.0, min(1.0, buffer_data["ratio"]))
-                    
-                    # Update buffer status
-                    self.update_buffer_status(buffer_data)
-                    return buffer_data
-                    
+                            buffer_data["ratio"] = 0.0
+                    else:
+                        logger.warning(f"[PID] Buffer response missing 'ratio' and cannot calculate from fill/capacity: {buffer_data}")
+                        return None
+                
+                # Ensure ratio is between 0.0 and 1.0
+                buffer_data["ratio"] = max(0.0, min(1.0, buffer_data["ratio"]))
+                
+                # Update buffer status
+                self.update_buffer_status(buffer_data)
+                return buffer_data
+                
             except httpx.TimeoutException:
                 logger.debug(f"[PID] Buffer query timeout ({self.query_timeout}s)")
                 self.update_buffer_status(None)
@@ -334,6 +348,12 @@ class BufferPIDController:
             with self._polling_lock:
                 self._polling_in_progress = False
     
+    def close(self) -> None:
+        """Close the keep-alive connection used for our own polls."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+    
     def get_state(self) -> Dict[str, Any]:
         """
         Get PID state for observability.
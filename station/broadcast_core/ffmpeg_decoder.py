@@ -1,8 +1,13 @@
 import logging
 import os
 import subprocess
+import threading
+from typing import Optional
+
 import numpy as np
 
+from station.broadcast_core.frame_pool import PCMFramePool
+
 logger = logging.getLogger(__name__)
 
 # Setup file handler for contract-compliant logging (LOG1, LOG2, LOG3, LOG4)
@@ -34,6 +39,59 @@ except Exception:
     # Catch all exceptions (including I/O errors) to prevent import-time failures
     pass
 
+# Chunk size for streaming a file into a pre-spawned ffmpeg's stdin
+STDIN_FEED_CHUNK_BYTES = 64 * 1024
+
+
+def kill_process_group(proc: subprocess.Popen, grace_period_seconds: float = 2.0) -> None:
+    """
+    SIGTERM (then SIGKILL after grace_period_seconds) the process group of an
+    ffmpeg started with os.setsid, so no orphaned processes remain.
+    
+    Shared by FFmpegDecoder.kill() and FFmpegDecoderPool.shutdown().
+    """
+    # Check if process is still running
+    if proc.poll() is not None:
+        # Process already exited
+        logger.debug(f"[DECODER] FFmpeg process already exited (pid={proc.pid})")
+        return
+    
+    try:
+        # Get process group ID (negative PID sends signal to process group)
+        pgid = os.getpgid(proc.pid)
+        logger.info(f"[DECODER] FFmpeg SIGTERM sent (pid={proc.pid}, pgid={pgid})")
+        
+        # Send SIGTERM to process group
+        os.killpg(pgid, 15)  # 15 = SIGTERM
+        
+        # Wait for clean exit
+        try:
+            proc.wait(timeout=grace_period_seconds)
+            logger.info(f"[DECODER] FFmpeg exited cleanly (pid={proc.pid})")
+            return
+        except subprocess.TimeoutExpired:
+            # Process didn't exit within grace period, force kill
+            logger.warning(f"[DECODER] FFmpeg SIGKILL sent (timeout exceeded, pid={proc.pid}, pgid={pgid})")
+            os.killpg(pgid, 9)  # 9 = SIGKILL
+            try:
+                proc.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                logger.error(f"[DECODER] FFmpeg process group did not exit after SIGKILL (pid={proc.pid}, pgid={pgid})")
+            except Exception:
+                pass
+    except ProcessLookupError:
+        # Process already exited (race condition)
+        logger.debug(f"[DECODER] FFmpeg process already exited (pid={proc.pid})")
+    except Exception as e:
+        logger.error(f"[DECODER] Error killing FFmpeg process (pid={proc.pid}): {e}", exc_info=True)
+        # Try fallback: kill just the process (not process group)
+        try:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait(timeout=1)
+        except Exception:
+            pass
+
 
 class FFmpegDecoder:
     """
@@ -46,16 +104,30 @@ class FFmpegDecoder:
     Station pushes frames immediately as decoded - Tower owns all timing.
     """
 
-    def __init__(self, path: str, frame_size: int = 1024):
+    def __init__(self, path: str, frame_size: int = 1024,
+                 proc: Optional[subprocess.Popen] = None):
         """
         Initialize FFmpeg decoder.
         
         Args:
             path: Path to audio file
             frame_size: Number of samples per frame (default: 1024)
+            proc: Optional pre-spawned ffmpeg reading its input from stdin
+                  (see FFmpegDecoderPool). The file is streamed into its stdin
+                  by a feeder thread instead of being opened by ffmpeg.
         """
         self.path = path
         self.frame_size = frame_size
+        self._feeder: Optional[threading.Thread] = None
+        self._feeder_stop = threading.Event()
+        
+        if proc is not None:
+            self.proc = proc
+            self._feeder = threading.Thread(
+                target=self._feed_stdin, name="ffmpeg-stdin-feed", daemon=True
+            )
+            self._feeder.start()
+            return
         
         # Launch ffmpeg to decode to raw s16le stereo 48k
         # Use preexec_fn=os.setsid to isolate FFmpeg from Ctrl-C (SIGINT) sent to parent
@@ -74,48 +146,77 @@ class FFmpegDecoder:
             preexec_fn=os.setsid,
         )
 
-    def read_frames(self):
+    def _feed_stdin(self) -> None:
+        """Stream the source file into a pre-spawned ffmpeg's stdin, then close it (EOF)."""
+        proc = self.proc
+        if proc is None or proc.stdin is None:
+            return
+        try:
+            chunk = bytearray(STDIN_FEED_CHUNK_BYTES)
+            view = memoryview(chunk)
+            with open(self.path, "rb", buffering=0) as f:
+                while not self._feeder_stop.is_set():
+                    n = f.readinto(chunk)
+                    if not n:
+                        break
+                    proc.stdin.write(view[:n])
+        except (BrokenPipeError, ValueError):
+            # ffmpeg exited or was killed mid-feed - reader sees EOF
+            pass
+        except OSError as e:
+            logger.error(f"[DECODER] Error feeding {self.path} to ffmpeg stdin: {e}")
+        finally:
+            try:
+                proc.stdin.close()
+            except Exception:
+                pass
+
+    def _stop_feeder(self) -> None:
+        self._feeder_stop.set()
+        if self._feeder is not None and self._feeder is not threading.current_thread():
+            self._feeder.join(timeout=1.0)
+        self._feeder = None
+
+    def read_frames(self, frame_pool: Optional[PCMFramePool] = None):
         """
         Generator yielding PCM frames as numpy int16 arrays shaped (N, 2).
         
         Each frame is exactly frame_size samples (1024 samples = 4096 bytes).
+        ffmpeg output is read with readinto() straight into the frame's buffer;
+        with a frame_pool the frames are recycled buffers (the consumer returns
+        them via frame_pool.release()), so no per-frame allocation occurs.
+        A trailing partial frame at EOF is dropped (FD1.3).
         
         ARCHITECTURAL INVARIANT: Yields frames at natural decoder pacing.
         No timing logic, no rate limiting, no synchronization.
         If decoder bursts → yields immediately. If decoder stalls → yields when ready.
         """
         assert self.proc.stdout is not None
+        stdout = self.proc.stdout
         bytes_per_frame = self.frame_size * 2 * 2  # samples * 2 bytes * 2 channels
-        
-        # Buffer for partial frames
-        buffer = bytearray()
 
         try:
             while True:
-                # Read data (may return more or less than bytes_per_frame)
-                data = self.proc.stdout.read(bytes_per_frame * 2)  # Read up to 2 frames to handle buffering
-                if not data:
-                    # EOF - check if we have a partial frame in buffer
-                    if len(buffer) >= bytes_per_frame:
-                        # Extract complete frame from buffer
-                        frame_data = bytes(buffer[:bytes_per_frame])
-                        buffer = buffer[bytes_per_frame:]
-                        frame = np.frombuffer(frame_data, dtype=np.int16).reshape(-1, 2)
-                        yield frame
-                    break
+                if frame_pool is not None:
+                    frame = frame_pool.acquire()
+                else:
+                    frame = np.empty((self.frame_size, 2), dtype=np.int16)
                 
-                # Add to buffer
-                buffer.extend(data)
+                # Fill exactly one frame (readinto may return short reads)
+                with memoryview(frame).cast("B") as view:
+                    filled = stdout.readinto(view)
+                    while filled and filled < bytes_per_frame:
+                        n = stdout.readinto(view[filled:])
+                        if not n:
+                            break
+                        filled += n
                 
-                # Extract complete frames from buffer
-                while len(buffer) >= bytes_per_frame:
-                    # Extract exactly one frame
-                    frame_data = bytes(buffer[:bytes_per_frame])
-                    buffer = buffer[bytes_per_frame:]
-                    frame = np.frombuffer(frame_data, dtype=np.int16).reshape(-1, 2)
-                    yield frame
-                
-                # If buffer has partial frame, keep it for next iteration
+                if not filled or filled < bytes_per_frame:
+                    # EOF - drop partial frame
+                    if frame_pool is not None:
+                        frame_pool.release(frame)
+                    break
+                yield frame
         finally:
             # Always cleanup, even if generator is stopped early
             self.close()
@@ -137,53 +238,9 @@ class FFmpegDecoder:
         """
         if self.proc is None:
             return
-        
-        # Check if process is still running
-        if self.proc.poll() is not None:
-            # Process already exited
-            logger.debug(f"[DECODER] FFmpeg process already exited (pid={self.proc.pid})")
-            self.proc = None
-            return
-        
-        try:
-            # Get process group ID (negative PID sends signal to process group)
-            pgid = os.getpgid(self.proc.pid)
-            logger.info(f"[DECODER] FFmpeg SIGTERM sent (pid={self.proc.pid}, pgid={pgid})")
-            
-            # Send SIGTERM to process group
-            os.killpg(pgid, 15)  # 15 = SIGTERM
-            
-            # Wait for clean exit
-            try:
-                self.proc.wait(timeout=grace_period_seconds)
-                logger.info(f"[DECODER] FFmpeg exited cleanly (pid={self.proc.pid})")
-                self.proc = None
-                return
-            except subprocess.TimeoutExpired:
-                # Process didn't exit within grace period, force kill
-                logger.warning(f"[DECODER] FFmpeg SIGKILL sent (timeout exceeded, pid={self.proc.pid}, pgid={pgid})")
-                os.killpg(pgid, 9)  # 9 = SIGKILL
-                try:
-                    self.proc.wait(timeout=1)
-                except subprocess.TimeoutExpired:
-                    logger.error(f"[DECODER] FFmpeg process group did not exit after SIGKILL (pid={self.proc.pid}, pgid={pgid})")
-                except Exception:
-                    pass
-                self.proc = None
-        except ProcessLookupError:
-            # Process already exited (race condition)
-            logger.debug(f"[DECODER] FFmpeg process already exited (pid={self.proc.pid})")
-            self.proc = None
-        except Exception as e:
-            logger.error(f"[DECODER] Error killing FFmpeg process (pid={self.proc.pid}): {e}", exc_info=True)
-            # Try fallback: kill just the process (not process group)
-            try:
-                if self.proc.poll() is None:
-                    self.proc.kill()
-                    self.proc.wait(timeout=1)
-            except Exception:
-                pass
-            self.proc = None
+        kill_process_group(self.proc, grace_period_seconds)
+        self.proc = None
+        self._stop_feeder()
     
     def close(self) -> None:
         """
@@ -194,7 +251,9 @@ class FFmpegDecoder:
         
         Note: For PHASE 2 shutdown, use kill() instead to ensure process group termination.
         """
+        self._feeder_stop.set()
         if self.proc is None:
+            self._stop_feeder()
             return
         
         try:
@@ -221,5 +280,7 @@ class FFmpegDecoder:
                 pass
         
         self.proc = None
+        # Join the stdin feeder last - it unblocks once ffmpeg's stdin pipe breaks
+        self._stop_feeder()
 
 
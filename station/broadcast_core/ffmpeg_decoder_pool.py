@@ -0,0 +1,222 @@
+"""
+Warm FFmpeg decoder pool — keeps K ffmpeg processes pre-spawned and idle.
+
+Each idle process is already past fork+exec and library init, blocked reading
+its input from stdin. A new segment takes a warm process, its file is streamed
+into stdin by FFmpegDecoder, and a replacement is spawned in the background so
+process startup never sits on the segment's critical path.
+"""
+
+import logging
+import os
+import subprocess
+import threading
+import time
+from collections import deque
+from typing import Deque, List, Optional
+
+from station.broadcast_core.ffmpeg_decoder import FFmpegDecoder, kill_process_group
+
+logger = logging.getLogger(__name__)
+
+# Decode whatever arrives on stdin to raw s16le stereo 48k on stdout
+FFMPEG_STDIN_COMMAND = [
+    "ffmpeg",
+    "-i", "pipe:0",
+    "-f", "s16le",
+    "-ac", "2",
+    "-ar", "48000",
+    "-",
+]
+
+DEFAULT_POOL_SIZE = 2
+
+
+class FFmpegDecoderPool:
+    """
+    Pool of pre-spawned ffmpeg processes handed out as FFmpegDecoders.
+
+    Every process is started with os.setsid like a regular FFmpegDecoder, so
+    kill()/process-group shutdown guarantees are unchanged: acquired processes
+    are killed through their decoder, idle ones through shutdown().
+    """
+
+    def __init__(
+        self,
+        size: int = DEFAULT_POOL_SIZE,
+        frame_size: int = 1024,
+        command: Optional[List[str]] = None,
+    ):
+        """
+        Args:
+            size: Number of warm processes to keep idle (K)
+            frame_size: Samples per frame for decoders handed out
+            command: Process argv (default: ffmpeg decoding stdin to s16le)
+        """
+        self._size = max(0, size)
+        self._frame_size = frame_size
+        self._command = list(command or FFMPEG_STDIN_COMMAND)
+        self._idle: Deque[subprocess.Popen] = deque()
+        self._lock = threading.Lock()
+        self._refill_wake = threading.Event()
+        self._closed = False
+        self._refill_thread: Optional[threading.Thread] = None
+
+        # Stats (reported via stats() and the shutdown summary)
+        self._hits = 0
+        self._misses = 0
+        self._spawns = 0
+        self._spawn_failures = 0
+        self._spawn_ms_total = 0.0
+        self._spawn_ms_max = 0.0
+        self._last_spawn_ms = 0.0
+
+    @classmethod
+    def from_env(cls, frame_size: int = 1024) -> "FFmpegDecoderPool":
+        """Build a pool sized by DECODER_POOL_SIZE (0 disables pre-spawning)."""
+        size = int(os.getenv("DECODER_POOL_SIZE", str(DEFAULT_POOL_SIZE)))
+        return cls(size=size, frame_size=frame_size)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def idle_count(self) -> int:
+        with self._lock:
+            return len(self._idle)
+
+    def start(self) -> None:
+        """Start the background refill worker and pre-spawn K processes."""
+        if self._size == 0:
+            return
+        if self._refill_thread and self._refill_thread.is_alive():
+            return
+        self._closed = False
+        self._refill_thread = threading.Thread(
+            target=self._refill_loop, name="decoder-pool-refill", daemon=True
+        )
+        self._refill_thread.start()
+        self._refill_wake.set()
+        logger.info(f"[DECODER-POOL] Started (size={self._size})")
+
+    def acquire(self, path: str, frame_size: Optional[int] = None) -> FFmpegDecoder:
+        """
+        Return a decoder for path, backed by a warm process when one is idle.
+
+        Falls back to spawning synchronously (a pool miss) when the pool is
+        empty. Spawn errors propagate exactly as FFmpegDecoder's would.
+        """
+        proc = self._take_idle()
+        if proc is not None:
+            self._hits += 1
+            logger.debug(
+                f"[DECODER-POOL] Hit (pid={proc.pid}, idle={self.idle_count()}, "
+                f"hits={self._hits}, misses={self._misses})"
+            )
+        else:
+            self._misses += 1
+            logger.debug(
+                f"[DECODER-POOL] Miss — spawning on demand (hits={self._hits}, misses={self._misses})"
+            )
+            proc = self._spawn()
+        self._refill_wake.set()
+        return FFmpegDecoder(path, frame_size=frame_size or self._frame_size, proc=proc)
+
+    def shutdown(self, grace_period_seconds: float = 1.0) -> None:
+        """Stop refilling and kill every idle process group. Idempotent."""
+        self._closed = True
+        self._refill_wake.set()
+        if self._refill_thread and self._refill_thread is not threading.current_thread():
+            self._refill_thread.join(timeout=2.0)
+        self._refill_thread = None
+
+        with self._lock:
+            idle = list(self._idle)
+            self._idle.clear()
+        for proc in idle:
+            try:
+                if proc.stdin:
+                    proc.stdin.close()
+            except Exception:
+                pass
+            kill_process_group(proc, grace_period_seconds)
+            try:
+                if proc.stdout:
+                    proc.stdout.close()
+            except Exception:
+                pass
+
+        if self._size:
+            logger.info(f"[DECODER-POOL] Shut down ({self._format_stats()})")
+
+    def stats(self) -> dict:
+        """Pool hit/miss counts and spawn latency (ms)."""
+        spawns = self._spawns
+        return {
+            "size": self._size,
+            "idle": self.idle_count(),
+            "hits": self._hits,
+            "misses": self._misses,
+            "spawns": spawns,
+            "spawn_failures": self._spawn_failures,
+            "spawn_ms_avg": (self._spawn_ms_total / spawns) if spawns else 0.0,
+            "spawn_ms_max": self._spawn_ms_max,
+            "spawn_ms_last": self._last_spawn_ms,
+        }
+
+    def _format_stats(self) -> str:
+        s = self.stats()
+        return (
+            f"hits={s['hits']}, misses={s['misses']}, spawns={s['spawns']}, "
+            f"spawn_failures={s['spawn_failures']}, spawn_ms_avg={s['spawn_ms_avg']:.1f}, "
+            f"spawn_ms_max={s['spawn_ms_max']:.1f}"
+        )
+
+    def _take_idle(self) -> Optional[subprocess.Popen]:
+        with self._lock:
+            while self._idle:
+                proc = self._idle.popleft()
+                if proc.poll() is None:
+                    return proc
+                logger.debug(f"[DECODER-POOL] Discarding exited idle process (pid={proc.pid})")
+        return None
+
+    def _spawn(self) -> subprocess.Popen:
+        start = time.monotonic()
+        proc = subprocess.Popen(
+            self._command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=self._frame_size * 4,  # hint
+            preexec_fn=os.setsid,
+        )
+        elapsed_ms = (time.monotonic() - start) * 1000.0
+        self._spawns += 1
+        self._spawn_ms_total += elapsed_ms
+        self._last_spawn_ms = elapsed_ms
+        self._spawn_ms_max = max(self._spawn_ms_max, elapsed_ms)
+        logger.debug(f"[DECODER-POOL] Spawned warm process (pid={proc.pid}, spawn_ms={elapsed_ms:.1f})")
+        return proc
+
+    def _refill_loop(self) -> None:
+        while True:
+            self._refill_wake.wait()
+            self._refill_wake.clear()
+            if self._closed:
+                return
+            while not self._closed and self.idle_count() < self._size:
+                try:
+                    proc = self._spawn()
+                except Exception as e:
+                    # Wait for the next acquire before retrying - never busy-loop
+                    self._spawn_failures += 1
+                    logger.warning(f"[DECODER-POOL] Failed to pre-spawn ffmpeg: {e}")
+                    break
+                with self._lock:
+                    if not self._closed:
+                        self._idle.append(proc)
+                        proc = None
+                if proc is not None:
+                    # Pool shut down while spawning
+                    kill_process_group(proc, 0.5)
@@ -0,0 +1,97 @@
+"""
+Recycled PCM frame buffers for the decode → mix → send hot path.
+
+FFmpegDecoder reads ffmpeg output straight into pooled int16 frames, the Mixer
+applies gain in place, TowerPCMSink sends the frame's buffer via memoryview and
+PCMOutputPipeline hands the frame back here once the sink has sent it. In steady
+state no per-frame numpy or bytes objects are allocated.
+"""
+
+import threading
+from typing import Dict, List, Optional
+
+import numpy as np
+
+DEFAULT_FRAME_SIZE = 1024
+DEFAULT_CHANNELS = 2
+
+
+class PCMFramePool:
+    """
+    Free list of preallocated (frame_size, channels) int16 frames.
+
+    acquire() never blocks: if every frame is in flight a new one is allocated
+    (counted in `allocations`) and adopted into the pool. The pool owns at most
+    max_frames frames: while it is over that bound, release() drops returned
+    frames (counted in `dropped`) instead of keeping them, so a burst does not
+    grow it for good. release() ignores arrays the pool does not own, so
+    silence or caller-built frames can flow through the same code paths.
+
+    Sinks MUST NOT retain a frame after write() returns — it is recycled.
+    """
+
+    def __init__(self, prealloc: int = 128, frame_size: int = DEFAULT_FRAME_SIZE,
+                 channels: int = DEFAULT_CHANNELS, max_frames: Optional[int] = None):
+        """
+        Args:
+            prealloc: Frames allocated up front
+            max_frames: Most frames the pool keeps (default: twice prealloc,
+                and at least prealloc + 32)
+        """
+        self._shape = (frame_size, channels)
+        self._lock = threading.Lock()
+        self._free: List[np.ndarray] = []
+        prealloc = max(0, prealloc)
+        self.max_frames = max_frames if max_frames is not None else max(2 * prealloc, prealloc + 32)
+        # id -> frame; the strong refs keep owned ids from being reused by unrelated arrays
+        self._owned: Dict[int, np.ndarray] = {}
+        self.allocations = 0
+        self.acquired = 0
+        self.released = 0
+        self.dropped = 0
+        for _ in range(prealloc):
+            self._free.append(self._allocate())
+        # Preallocation is not per-frame cost
+        self.allocations = 0
+
+    @property
+    def frame_bytes(self) -> int:
+        return self._shape[0] * self._shape[1] * 2
+
+    def _allocate(self) -> np.ndarray:
+        frame = np.empty(self._shape, dtype=np.int16)
+        self._owned[id(frame)] = frame
+        self.allocations += 1
+        return frame
+
+    def acquire(self) -> np.ndarray:
+        """Return a writable frame (contents undefined)."""
+        with self._lock:
+            self.acquired += 1
+            if self._free:
+                return self._free.pop()
+            return self._allocate()
+
+    def release(self, frame: np.ndarray) -> None:
+        """Return a frame to the free list. No-op for frames the pool does not own."""
+        if id(frame) not in self._owned:
+            return
+        with self._lock:
+            self.released += 1
+            if len(self._owned) > self.max_frames:
+                # Over the bound after a burst: let this frame go
+                del self._owned[id(frame)]
+                self.dropped += 1
+                return
+            self._free.append(frame)
+
+    def owns(self, frame: np.ndarray) -> bool:
+        return id(frame) in self._owned
+
+    def free_count(self) -> int:
+        with self._lock:
+            return len(self._free)
+
+    def size(self) -> int:
+        """Frames currently owned by the pool (free plus in flight)."""
+        return len(self._owned)
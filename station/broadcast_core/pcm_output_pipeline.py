@@ -5,16 +5,21 @@ A dedicated pump thread sends exactly one frame every ~21.333ms to Tower.
 Tower AudioPump is the sole playback clock — this pump must never burst.
 Producers push decoded frames into a queue; when empty, silence is sent
 at the same cadence so Tower never sees a PCM gap.
+
+Backpressure and level changes are signalled with condition variables:
+blocked producers wake as soon as the pump frees a slot, and callers can
+block on "depth >= N" or "drained" instead of polling depth().
 """
 
 import logging
 import threading
 import time
 from collections import deque
-from typing import Optional
+from typing import Callable, Optional, Sequence
 
 import numpy as np
 
+from station.broadcast_core.frame_pool import PCMFramePool
 from station.outputs.base_sink import BaseSink
 
 logger = logging.getLogger(__name__)
@@ -42,24 +47,39 @@ except Exception:
     pass
 
 FRAME_DURATION_SEC = 1024.0 / 48000.0
-DEFAULT_QUEUE_CAPACITY = 100  # ~2.1 s at 48 kHz / 1024 samples
+DEFAULT_QUEUE_CAPACITY_MS = 2133.0  # ~100 frames at 48 kHz / 1024 samples
+MIN_QUEUE_CAPACITY_FRAMES = 8
+
+
+def capacity_frames_for_ms(capacity_ms: float) -> int:
+    """Number of queued frames holding capacity_ms of audio (at least 8)."""
+    return max(MIN_QUEUE_CAPACITY_FRAMES, int(round(capacity_ms / (FRAME_DURATION_SEC * 1000.0))))
 
 
 class PCMOutputPipeline:
     """Fixed-cadence PCM sender with a producer/consumer frame queue."""
 
-    def __init__(self, sink: BaseSink, capacity: int = DEFAULT_QUEUE_CAPACITY):
+    def __init__(self, sink: BaseSink, capacity_ms: float = DEFAULT_QUEUE_CAPACITY_MS,
+                 frame_pool: Optional[PCMFramePool] = None):
         self._sink = sink
-        self._capacity = max(8, capacity)
+        self._frame_pool = frame_pool  # Frames are recycled here once sent
+        self._capacity = capacity_frames_for_ms(capacity_ms)
         self._queue: deque = deque()
         self._lock = threading.Lock()
+        self._space = threading.Condition(self._lock)  # producers wait for a free slot
+        self._level = threading.Condition(self._lock)  # depth/drain waiters
+        self._in_flight = 0  # dequeued by the pump, not yet written to the sink
         self._stop = threading.Event()
         self._thread: Optional[threading.Thread] = None
         self._silence = np.zeros((1024, 2), dtype=np.int16)
         self._frames_sent = 0
         self._program_frames_sent = 0
         self._starve_count = 0
+        self._starve_events = 0
+        self._silence_frames_sent = 0
         self._dropped_push = 0
+        self._producer_block_count = 0
+        self._producer_block_sec = 0.0
         self._next_tick = 0.0
 
     def start(self) -> None:
@@ -71,41 +91,138 @@ class PCMOutputPipeline:
         self._thread.start()
         logger.info(
             f"[PCM-PUMP] Started (cadence={FRAME_DURATION_SEC*1000:.3f}ms, "
-            f"queue_capacity={self._capacity})"
+            f"queue_capacity={self._capacity} frames/{self.capacity_ms:.0f}ms)"
         )
 
     def stop(self) -> None:
         self._stop.set()
+        self.interrupt()
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=2.0)
         self._thread = None
+        logger.info(f"[PCM-PUMP] Stopped ({self._format_stats()})")
+
+    def interrupt(self) -> None:
+        """Wake every blocked producer and waiter so they re-check their abort conditions."""
+        with self._lock:
+            self._space.notify_all()
+            self._level.notify_all()
 
     def depth(self) -> int:
         with self._lock:
             return len(self._queue)
 
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def capacity_ms(self) -> float:
+        return self._capacity * FRAME_DURATION_SEC * 1000.0
+
     @property
     def frames_sent(self) -> int:
         return self._frames_sent
 
+    def stats(self) -> dict:
+        """Queue level and producer/consumer counters."""
+        with self._lock:
+            depth = len(self._queue)
+        return {
+            "depth": depth,
+            "capacity_frames": self._capacity,
+            "capacity_ms": self.capacity_ms,
+            "frames_sent": self._frames_sent,
+            "program_frames_sent": self._program_frames_sent,
+            "silence_frames_sent": self._silence_frames_sent,
+            "starve_events": self._starve_events,
+            "dropped_push": self._dropped_push,
+            "producer_block_count": self._producer_block_count,
+            "producer_block_ms": self._producer_block_sec * 1000.0,
+        }
+
+    def _format_stats(self) -> str:
+        s = self.stats()
+        return (
+            f"frames_sent={s['frames_sent']}, program={s['program_frames_sent']}, "
+            f"silence={s['silence_frames_sent']}, starve_events={s['starve_events']}, "
+            f"dropped_push={s['dropped_push']}, producer_blocks={s['producer_block_count']}, "
+            f"producer_block_ms={s['producer_block_ms']:.1f}"
+        )
+
     def push(self, frame: np.ndarray, block: bool = True, timeout: float = 30.0) -> bool:
         """Enqueue a mixed PCM frame. Blocks until space is available unless block=False."""
+        return self.push_many((frame,), block=block, timeout=timeout) == 1
+
+    def push_many(self, frames: Sequence[np.ndarray], block: bool = True, timeout: float = 30.0) -> int:
+        """
+        Enqueue frames in order under a single lock acquisition.
+
+        Blocks (on a condition, not a sleep loop) while the queue is full unless
+        block=False. Returns how many frames were enqueued; frames[n:] were not
+        and remain owned by the caller.
+        """
         deadline = time.monotonic() + timeout
-        while True:
-            with self._lock:
-                if len(self._queue) < self._capacity:
-                    self._queue.append(frame)
-                    return True
-                if not block:
-                    self._dropped_push += 1
-                    return False
-            if time.monotonic() >= deadline:
-                self._dropped_push += 1
-                logger.warning("[PCM-PUMP] Queue full — dropped producer frame")
-                return False
-            if self._stop.is_set():
-                return False
-            time.sleep(0.001)
+        pushed = 0
+        with self._lock:
+            for frame in frames:
+                if len(self._queue) >= self._capacity:
+                    if not block:
+                        self._dropped_push += len(frames) - pushed
+                        break
+                    if pushed:
+                        # Let depth waiters see what is already queued before we block
+                        self._level.notify_all()
+                    blocked_at = time.monotonic()
+                    self._producer_block_count += 1
+                    has_space = self._space.wait_for(
+                        lambda: len(self._queue) < self._capacity or self._stop.is_set(),
+                        timeout=max(0.0, deadline - blocked_at),
+                    )
+                    self._producer_block_sec += time.monotonic() - blocked_at
+                    if self._stop.is_set():
+                        break
+                    if not has_space:
+                        self._dropped_push += len(frames) - pushed
+                        logger.warning("[PCM-PUMP] Queue full — dropped producer frame")
+                        break
+                self._queue.append(frame)
+                pushed += 1
+            if pushed:
+                self._level.notify_all()
+        return pushed
+
+    def wait_for_depth(self, min_frames: int, timeout: float,
+                       abort: Optional[Callable[[], bool]] = None) -> int:
+        """
+        Block until at least min_frames are queued, timeout, stop, or abort() is true.
+
+        Callers that pass abort must call interrupt() when its result changes.
+        Returns the queue depth at wake-up.
+        """
+        with self._lock:
+            self._level.wait_for(
+                lambda: len(self._queue) >= min_frames
+                or self._stop.is_set()
+                or (abort is not None and abort()),
+                timeout=timeout,
+            )
+            return len(self._queue)
+
+    def wait_drained(self, timeout: float, abort: Optional[Callable[[], bool]] = None) -> bool:
+        """
+        Block until every queued frame has been written to the sink.
+
+        Returns True once drained; False on timeout, stop, or abort().
+        """
+        with self._lock:
+            self._level.wait_for(
+                lambda: (not self._queue and self._in_flight == 0)
+                or self._stop.is_set()
+                or (abort is not None and abort()),
+                timeout=timeout,
+            )
+            return not self._queue and self._in_flight == 0
 
     def _pump_loop(self) -> None:
         write_frame = getattr(self._sink, "write_paced", self._sink.write)
@@ -123,10 +240,16 @@ class PCMOutputPipeline:
             with self._lock:
                 if self._queue:
                     frame = self._queue.popleft()
+                    self._in_flight += 1
+                    self._space.notify()
+            from_queue = frame is not None
 
             if frame is None:
                 frame = self._silence
+                if self._starve_count == 0:
+                    self._starve_events += 1
                 self._starve_count += 1
+                self._silence_frames_sent += 1
                 if self._starve_count >= starve_log_next:
                     if starve_log_next == 0:
                         starve_log_next = 50
@@ -150,3 +273,10 @@ class PCMOutputPipeline:
                 self._frames_sent += 1
             except Exception as e:
                 logger.error(f"[PCM-PUMP] Sink write failed: {e}", exc_info=True)
+            finally:
+                if from_queue:
+                    if self._frame_pool is not None:
+                        self._frame_pool.release(frame)
+                    with self._lock:
+                        self._in_flight -= 1
+                        self._level.notify_all()
@@ -10,26 +10,32 @@ Architecture 3.1 Reference:
 - Section 5: Updated Playout Engine Flow (Event-Driven, Intent-Aware)
 """
 
-import json
 import logging
 import os
-import subprocess
 import threading
 import time
 from abc import ABC, abstractmethod
 from typing import Optional, Protocol, Dict, Any
 
-import httpx
 import numpy as np
 
 from station.broadcast_core.audio_event import AudioEvent
 from station.broadcast_core.playout_queue import PlayoutQueue
 from station.broadcast_core.ffmpeg_decoder import FFmpegDecoder
+from station.broadcast_core.ffmpeg_decoder_pool import FFmpegDecoderPool
+from station.broadcast_core.frame_pool import PCMFramePool
 from station.broadcast_core.buffer_pid_controller import BufferPIDController
-from station.broadcast_core.pcm_output_pipeline import PCMOutputPipeline, FRAME_DURATION_SEC
+from station.broadcast_core.pcm_output_pipeline import (
+    PCMOutputPipeline,
+    FRAME_DURATION_SEC,
+    DEFAULT_QUEUE_CAPACITY_MS,
+    capacity_frames_for_ms,
+)
 from station.broadcast_core.segment_decoder import SegmentDecoder
 from station.mixer.mixer import Mixer
+from station.music_logic.metadata_index import get_metadata_index
 from station.outputs.base_sink import BaseSink
+from station.outputs.tower_control import TowerControlClient
 
 logger = logging.getLogger(__name__)
 
@@ -62,42 +68,31 @@ except Exception:
     # Catch all exceptions (including I/O errors) to prevent import-time failures
     pass
 
+# Playout thread waits are event-driven (see PlayoutEngine._wake); these bound a
+# missed wakeup. During DRAINING the idle terminal-DO kick is retried at this rate.
+_WAKE_SAFETY_TIMEOUT_SEC = 1.0
+_DRAIN_RETRY_SEC = 0.1
+
 
 def _get_audio_duration(file_path: str) -> Optional[float]:
     """
-    Get the duration of an audio file in seconds using ffprobe.
+    Get the duration of an audio file in seconds.
     
-    Returns None if ffprobe fails or file doesn't exist.
+    Served from the media metadata index; ffprobe runs only on an index miss.
+    Returns None if the duration cannot be determined or the file doesn't exist.
     """
-    try:
-        cmd = [
-            "ffprobe",
-            "-v", "error",
-            "-show_entries", "format=duration",
-            "-of", "default=noprint_wrappers=1:nokey=1",
-            file_path
-        ]
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=2.0
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            return float(result.stdout.strip())
-    except (subprocess.TimeoutExpired, ValueError, FileNotFoundError):
-        pass
-    return None
+    return get_metadata_index().lookup(file_path)["duration"]
 
 
 def _get_mp3_metadata(file_path: str) -> dict:
     """
-    Get MP3 metadata (title, artist, album, duration) using ffprobe.
+    Get MP3 metadata (title, artist, album, duration).
     
-    Returns a dictionary with keys: title, artist, album, duration.
-    Missing values will be None.
+    Returns a dictionary with keys: title, artist, album, duration (plus
+    sample_rate and channels). Missing values will be None.
     
-    Uses a single ffprobe call to get both format duration and tags for efficiency.
+    Served from the media metadata index (O(1) once warm); a single ffprobe
+    call fills the index on a miss.
     
     Args:
         file_path: Path to MP3 file
@@ -105,53 +100,7 @@ def _get_mp3_metadata(file_path: str) -> dict:
     Returns:
         Dictionary with metadata fields
     """
-    metadata = {
-        "title": None,
-        "artist": None,
-        "album": None,
-        "duration": None
-    }
-    
-    try:
-        # Get both duration and tags in a single ffprobe call for efficiency
-        cmd = [
-            "ffprobe",
-            "-v", "error",
-            "-show_entries", "format=duration:format_tags=title:format_tags=artist:format_tags=album",
-            "-of", "json",
-            file_path
-        ]
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=1.0  # Reduced timeout for faster failure
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            try:
-                data = json.loads(result.stdout)
-                format_info = data.get("format", {})
-                
-                # Extract duration
-                if "duration" in format_info:
-                    duration_str = format_info["duration"]
-                    if duration_str:
-                        metadata["duration"] = float(duration_str)
-                
-                # Extract tags
-                tags = format_info.get("tags", {})
-                if "title" in tags:
-                    metadata["title"] = tags["title"]
-                if "artist" in tags:
-                    metadata["artist"] = tags["artist"]
-                if "album" in tags:
-                    metadata["album"] = tags["album"]
-            except (json.JSONDecodeError, KeyError, ValueError):
-                pass
-    except (subprocess.TimeoutExpired, ValueError, FileNotFoundError):
-        pass
-    
-    return metadata
+    return get_metadata_index().lookup(file_path)
 
 
 def _get_segment_metadata(segment: AudioEvent) -> Dict[str, str]:
@@ -282,7 +231,8 @@ class PlayoutEngine:
     Architecture 3.2 Reference: Section 5
     """
     
-    def __init__(self, dj_callback: Optional[DJCallback] = None, output_sink: Optional[BaseSink] = None, tower_control: Optional = None):
+    def __init__(self, dj_callback: Optional[DJCallback] = None, output_sink: Optional[BaseSink] = None, tower_control: Optional = None,
+                 tower_telemetry: Optional = None):
         """
         Initialize the playout engine.
         
@@ -291,11 +241,18 @@ class PlayoutEngine:
                         on_segment_started and on_segment_finished methods
             output_sink: Output sink to write audio frames to (required for real audio playback)
             tower_control: Optional TowerControlClient (for PID controller Tower connection)
+            tower_telemetry: Optional shared TowerBufferTelemetry; pre-fill and the PID
+                controller read its latest /tower/buffer snapshot instead of polling
         """
-        self._queue = PlayoutQueue()
+        # Single wakeup for the playout thread: queue arrival, decode completion,
+        # DRAINING/shutdown transitions and stop() all set it
+        self._wake = threading.Event()
+        self._queue = PlayoutQueue(on_enqueue=self._wake.set)
         self._dj_callback = dj_callback
         self._output_sink = output_sink
         self._tower_control = tower_control
+        self._tower_telemetry = tower_telemetry
+        self._buffer_client = None  # pooled client for buffer checks when no tower_control is given
         self._current_segment: Optional[AudioEvent] = None
         self._is_playing = False
         self._is_running = False
@@ -304,9 +261,19 @@ class PlayoutEngine:
         self._current_decoder: Optional[FFmpegDecoder] = None  # Track active decoder for PHASE 2 kill
         self._segment_decoder: Optional[SegmentDecoder] = None
         self._pcm_pipeline: Optional[PCMOutputPipeline] = None
+        self._frame_pool: Optional[PCMFramePool] = None
+        self._decoder_pool: Optional[FFmpegDecoderPool] = None
         if output_sink is not None:
-            queue_size = int(os.getenv("PCM_OUTPUT_QUEUE_SIZE", "100"))
-            self._pcm_pipeline = PCMOutputPipeline(output_sink, capacity=queue_size)
+            queue_ms = self._pcm_queue_capacity_ms()
+            # Recycled frames for decode → mix → send (queue plus in-flight headroom)
+            self._frame_pool = PCMFramePool(prealloc=capacity_frames_for_ms(queue_ms) + 8)
+            self._pcm_pipeline = PCMOutputPipeline(
+                output_sink, capacity_ms=queue_ms, frame_pool=self._frame_pool
+            )
+            # Warm ffmpeg processes so segment start never pays fork+exec (DECODER_POOL_SIZE=0 disables)
+            pool = FFmpegDecoderPool.from_env()
+            if pool.size > 0:
+                self._decoder_pool = pool
         self._mixer = Mixer()
         self._shutdown_requested = False  # Per contract SL2.2: Prevent THINK/DO after shutdown
         self._is_draining = False  # Per contract SL2.2.1: DRAINING state (stop dequeuing, finish current)
@@ -314,6 +281,7 @@ class PlayoutEngine:
         self._terminal_do_executed = False  # Track if terminal DO has been executed (per SL2.2, E1.3)
         self._terminal_audio_queued = False  # Track if shutdown announcement was queued by terminal DO
         self._terminal_audio_played = False  # Track if shutdown announcement actually played to EOF (frames emitted)
+        self._terminal_playout_done = threading.Event()
         self._terminal_playout_complete = False  # Definitive flag: terminal DO executed AND (no audio queued OR audio played)
         self._playout_stopped_event = threading.Event()  # Signal when playout loop has finished
         self._current_segment_is_terminal = False  # Track if currently playing segment is the terminal shutdown announcement
@@ -331,6 +299,15 @@ class PlayoutEngine:
         self._last_queue_log_time = time.time()
         self._queue_log_interval = 5.0  # Log queue stats every 5 seconds
         
+        # Monitoring: playout thread wakeups and segment-to-segment transition latency
+        self._wakeups = 0
+        self._wakeups_at_last_log = 0
+        self._run_started_at: Optional[float] = None
+        self._last_segment_drained_at: Optional[float] = None
+        self._transition_ms_last = 0.0
+        self._transition_ms_max = 0.0
+        self._transitions = 0
+        
         # Fallback segment durations (in seconds) if we can't detect real duration
         self._default_segment_duration = 180.0  # 3 minutes default for songs
         self._fallback_durations = {
@@ -355,11 +332,39 @@ class PlayoutEngine:
                 tower_host=tower_host,
                 tower_port=tower_port,
                 enabled=True,
+                telemetry=tower_telemetry,
             )
             logger.info("PID controller enabled for adaptive Clock A pacing")
         else:
             logger.info("PID controller disabled - using fixed-rate Clock A pacing")
     
+    @staticmethod
+    def _pcm_queue_capacity_ms() -> float:
+        """PCM output queue capacity in ms (PCM_OUTPUT_QUEUE_MS; legacy PCM_OUTPUT_QUEUE_SIZE in frames)."""
+        queue_ms = os.getenv("PCM_OUTPUT_QUEUE_MS")
+        if queue_ms is not None:
+            return float(queue_ms)
+        legacy_frames = os.getenv("PCM_OUTPUT_QUEUE_SIZE")
+        if legacy_frames is not None:
+            return int(legacy_frames) * FRAME_DURATION_SEC * 1000.0
+        return DEFAULT_QUEUE_CAPACITY_MS
+    
+    @property
+    def _terminal_playout_complete(self) -> bool:
+        return self._terminal_playout_done.is_set()
+    
+    @_terminal_playout_complete.setter
+    def _terminal_playout_complete(self, value: bool) -> None:
+        if value:
+            self._terminal_playout_done.set()
+        else:
+            self._terminal_playout_done.clear()
+    
+    def _wait_for_wake(self, timeout: float = _WAKE_SAFETY_TIMEOUT_SEC) -> None:
+        """Block the playout thread until something happens (caller clears _wake before re-checking state)."""
+        self._wake.wait(timeout)
+        self._wakeups += 1
+    
     def set_dj_callback(self, dj_callback: Optional[DJCallback]) -> None:
         """
         Set the DJ callback object.
@@ -378,6 +383,7 @@ class PlayoutEngine:
         This flag is checked before firing callbacks to ensure strict compliance.
         """
         self._shutdown_requested = True
+        self._wake.set()
     
     def set_draining(self, is_draining: bool = True) -> None:
         """
@@ -394,6 +400,7 @@ class PlayoutEngine:
         self._is_draining = is_draining
         if is_draining:
             logger.info("[PLAYOUT] Entering DRAINING state - current segment will finish, no new segments will be dequeued")
+        self._wake.set()
     
     def _trigger_terminal_do_if_idle(self) -> None:
         """Queue shutdown announcement when draining begins with nothing actively playing."""
@@ -455,6 +462,13 @@ class PlayoutEngine:
         self._current_segment = segment
         self._is_playing = True
         self._segment_start_time = time.monotonic()
+        if self._last_segment_drained_at is not None:
+            # Previous segment's last frame sent → this segment's start (DO + dequeue + wakeup)
+            self._transition_ms_last = (self._segment_start_time - self._last_segment_drained_at) * 1000.0
+            self._transition_ms_max = max(self._transition_ms_max, self._transition_ms_last)
+            self._transitions += 1
+            self._last_segment_drained_at = None
+            logger.debug(f"[PLAYOUT] Transition latency: {self._transition_ms_last:.1f}ms")
         self._current_segment_id = f"{segment.type}_{os.path.basename(segment.path)}_{int(time.monotonic() * 1000)}"
         self._last_progress_event_time = time.monotonic()
 
@@ -557,27 +571,28 @@ class PlayoutEngine:
             mixer=self._mixer,
             pipeline=self._pcm_pipeline,
             on_decoder=self._set_current_decoder,
+            decoder_factory=self._decoder_pool.acquire if self._decoder_pool else None,
+            frame_pool=self._frame_pool,
+            on_done=self._wake.set,
         )
         self._segment_decoder.start()
         with self._segment_active_lock:
             self._decoding_pcm = True
         logger.debug(f"[PLAYOUT] Background decode started for {segment.path}")
 
+    def _playout_aborted(self) -> bool:
+        return self._stop_event.is_set() or not self._is_running
+
     def _wait_pcm_preroll(self, min_frames: int = 10, timeout_sec: float = 1.0) -> int:
         """Wait until the PCM queue has enough decoded audio before playback is considered live."""
         if self._pcm_pipeline is None:
             return 0
-        deadline = time.monotonic() + timeout_sec
-        while time.monotonic() < deadline:
-            depth = self._pcm_pipeline.depth()
-            if depth >= min_frames:
-                logger.debug(f"[PLAYOUT] PCM preroll ready (depth={depth}, min={min_frames})")
-                return depth
-            if self._stop_event.is_set() or not self._is_running:
-                break
-            time.sleep(0.005)
-        depth = self._pcm_pipeline.depth()
-        if depth < min_frames:
+        depth = self._pcm_pipeline.wait_for_depth(
+            min_frames, timeout=timeout_sec, abort=self._playout_aborted
+        )
+        if depth >= min_frames:
+            logger.debug(f"[PLAYOUT] PCM preroll ready (depth={depth}, min={min_frames})")
+        elif not self._playout_aborted():
             logger.warning(
                 f"[PLAYOUT] PCM preroll timeout (depth={depth}, wanted>={min_frames}, "
                 f"timeout={timeout_sec:.1f}s)"
@@ -588,25 +603,22 @@ class PlayoutEngine:
         """Wait until all queued PCM frames have been sent to Tower."""
         if self._pcm_pipeline is None:
             return True
-        deadline = time.monotonic() + timeout_sec
         initial_depth = self._pcm_pipeline.depth()
-        while self._pcm_pipeline.depth() > 0:
-            if allow_abort and (self._stop_event.is_set() or not self._is_running):
-                logger.warning(
-                    f"[PLAYOUT] PCM drain aborted (depth={self._pcm_pipeline.depth()})"
-                )
-                return False
-            if time.monotonic() >= deadline:
-                logger.warning(
-                    f"[PLAYOUT] PCM drain timeout (depth={self._pcm_pipeline.depth()}, "
-                    f"started_at={initial_depth}, timeout={timeout_sec:.1f}s)"
-                )
-                return False
-            time.sleep(0.005)
-        # One more tick so the pump sends the last dequeued frame
-        time.sleep(FRAME_DURATION_SEC + 0.01)
-        logger.debug(f"[PLAYOUT] PCM drain complete (started_at={initial_depth})")
-        return True
+        drained = self._pcm_pipeline.wait_drained(
+            timeout=timeout_sec, abort=self._playout_aborted if allow_abort else None
+        )
+        if drained:
+            logger.debug(f"[PLAYOUT] PCM drain complete (started_at={initial_depth})")
+        elif allow_abort and self._playout_aborted():
+            logger.warning(
+                f"[PLAYOUT] PCM drain aborted (depth={self._pcm_pipeline.depth()})"
+            )
+        else:
+            logger.warning(
+                f"[PLAYOUT] PCM drain timeout (depth={self._pcm_pipeline.depth()}, "
+                f"started_at={initial_depth}, timeout={timeout_sec:.1f}s)"
+            )
+        return drained
 
     def _stop_segment_decoder(self) -> None:
         if self._segment_decoder is not None:
@@ -710,14 +722,21 @@ class PlayoutEngine:
             # Loop continues until: stop event OR terminal playout complete
             # During DRAINING, loop MUST continue until terminal DO executed AND terminal segment (if any) finished
             while self._is_running and not self._stop_event.is_set() and not self._terminal_playout_complete:
+                # Clear before inspecting state: anything that changes it afterwards sets _wake again
+                self._wake.clear()
+                
                 # Periodic queue monitoring (every 5 seconds)
                 now = time.time()
                 if now - self._last_queue_log_time >= self._queue_log_interval:
                     queue_size = self._queue.size()
+                    wakeups_per_sec = (self._wakeups - self._wakeups_at_last_log) / (now - self._last_queue_log_time)
                     logger.info(
-                        f"[QUEUE_MONITOR] PlayoutQueue: {queue_size} segments waiting"
+                        f"[QUEUE_MONITOR] PlayoutQueue: {queue_size} segments waiting "
+                        f"(wakeups/s={wakeups_per_sec:.1f}, transition_ms_last={self._transition_ms_last:.1f}, "
+                        f"transition_ms_max={self._transition_ms_max:.1f})"
                     )
                     self._last_queue_log_time = now
+                    self._wakeups_at_last_log = self._wakeups
                 
                 # Per contract PE7.2: Stop dequeuing new segments once DRAINING state begins
                 # Exception: Allow exactly one terminal segment (shutdown announcement) to be dequeued (per PE7.3)
@@ -747,13 +766,14 @@ class PlayoutEngine:
                         if not self._terminal_do_executed:
                             # Waiting for terminal DO
                             logger.debug("[PLAYOUT] DRAINING: Queue empty, waiting for terminal DO...")
-                            time.sleep(0.1)
+                            # Idle DO kick is retried on timeout; queue_audio() wakes immediately
+                            self._wait_for_wake(_DRAIN_RETRY_SEC)
                             continue
                         # Terminal DO executed - check if audio was queued
                         if self._terminal_audio_queued and not self._terminal_audio_played:
                             # Terminal audio was queued but not in queue - this shouldn't happen, but wait a bit
                             logger.debug("[PLAYOUT] DRAINING: Terminal audio queued but not in queue, waiting...")
-                            time.sleep(0.1)
+                            self._wait_for_wake(_DRAIN_RETRY_SEC)
                             continue
                         # Terminal DO executed and no audio queued (or already played) - complete
                         self._terminal_playout_complete = True
@@ -778,8 +798,9 @@ class PlayoutEngine:
                     self._current_segment_is_terminal = False
                 
                 if segment is None:
-                    # PCM output pump sends silence while queue is empty
-                    time.sleep(0.05)
+                    # PCM output pump sends silence while queue is empty; sleep until enqueue
+                    self._last_segment_drained_at = None  # idle gap is not transition latency
+                    self._wait_for_wake()
                     continue
                 
                 # Start the segment (triggers on_segment_started - THINK phase)
@@ -836,33 +857,19 @@ class PlayoutEngine:
         Returns:
             Buffer status dict with 'capacity', 'count', 'ratio' keys, or None if unavailable
         """
-        # Use TowerControlClient if available, otherwise create temporary HTTP client
+        # Shared Station telemetry: latest snapshot (None if stale), no request of our own
+        if self._tower_telemetry is not None:
+            return self._tower_telemetry.get_buffer()
+        
+        # Use TowerControlClient if available, otherwise one pooled client of our own
         if self._tower_control:
             return self._tower_control.get_buffer()
-        
-        # Fallback: create temporary HTTP client
-        tower_host = os.getenv("TOWER_HOST", "127.0.0.1")
-        tower_port = int(os.getenv("TOWER_PORT", "8005"))
-        url = f"http://{tower_host}:{tower_port}/tower/buffer"
-        
-        try:
-            with httpx.Client(timeout=0.1) as client:
-                response = client.get(url)
-                response.raise_for_status()
-                return response.json()
-        except httpx.HTTPError as e:
-            # Log HTTP errors at warning level (but don't spam if Tower is down)
-            # Only log periodically to avoid log spam
-            import random
-            if random.random() < 0.1:  # Log ~10% of errors to avoid spam
-                logger.warning(f"[PREFILL] Failed to get buffer status from Tower: {e}")
-            return None
-        except Exception as e:
-            # Log unexpected errors at warning level (but don't spam)
-            import random
-            if random.random() < 0.1:  # Log ~10% of errors to avoid spam
-                logger.warning(f"[PREFILL] Unexpected error getting buffer status: {e}")
-            return None
+        if self._buffer_client is None:
+            self._buffer_client = TowerControlClient(
+                tower_host=os.getenv("TOWER_HOST", "127.0.0.1"),
+                tower_port=int(os.getenv("TOWER_PORT", "8005")),
+            )
+        return self._buffer_client.get_buffer()
     
     def _get_buffer_ratio(self, buffer_status: Dict[str, Any]) -> float:
         """
@@ -887,20 +894,6 @@ class PlayoutEngine:
         
         return 0.0
     
-    _FRAME_DURATION_SEC = 1024.0 / 48000.0
-
-    def _send_idle_keepalive_frame(self) -> None:
-        """Feed Tower silence at ~real-time while the queue is empty (DJ THINK/DO)."""
-        if not self._output_sink:
-            time.sleep(0.1)
-            return
-        silence = np.zeros((1024, 2), dtype=np.int16)
-        try:
-            self._output_sink.write(silence)
-        except Exception:
-            pass
-        time.sleep(self._FRAME_DURATION_SEC)
-    
     def _run_prefill_if_needed(
         self,
         segment: AudioEvent,
@@ -1116,7 +1109,10 @@ class PlayoutEngine:
             self._segment_active = True
 
         try:
-            while not decoder_task.exhausted:
+            while True:
+                self._wake.clear()
+                if decoder_task.exhausted:
+                    break
                 if self._is_draining:
                     if not self._is_running:
                         logger.warning(
@@ -1132,7 +1128,8 @@ class PlayoutEngine:
                         )
                         decoder_task.stop()
                         break
-                time.sleep(0.005)
+                # Woken by decode completion, shutdown/draining transitions or stop()
+                self._wait_for_wake()
 
             if decoder_task.error is not None:
                 raise decoder_task.error
@@ -1141,6 +1138,7 @@ class PlayoutEngine:
             drain_timeout = max(expected_duration * 1.5, 30.0)
             allow_drain_abort = not (self._is_draining and segment.is_terminal)
             self._wait_pcm_drain(timeout_sec=drain_timeout, allow_abort=allow_drain_abort)
+            self._last_segment_drained_at = time.monotonic()
 
             total_time = time.monotonic() - start_time
             expected_frames = max(1, int(expected_duration / FRAME_DURATION_SEC))
@@ -1196,9 +1194,15 @@ class PlayoutEngine:
         self._terminal_playout_complete = False
         self._current_segment_is_terminal = False
         self._current_decoder = None  # Clear decoder reference on new run
+        self._wakeups = 0
+        self._wakeups_at_last_log = 0
+        self._run_started_at = time.monotonic()
+        self._last_segment_drained_at = None
         
         if self._pcm_pipeline is not None:
             self._pcm_pipeline.start()
+        if self._decoder_pool is not None:
+            self._decoder_pool.start()
         
         # Start playout loop in background thread
         self._play_thread = threading.Thread(target=self._playout_loop, daemon=True)
@@ -1219,6 +1223,10 @@ class PlayoutEngine:
         logger.info("Stopping playout engine")
         self._is_running = False
         self._stop_event.set()
+        self._wake.set()
+        if self._pcm_pipeline is not None:
+            # Wake preroll/drain waiters so they observe the stop
+            self._pcm_pipeline.interrupt()
         
         self._stop_segment_decoder()
         
@@ -1250,10 +1258,19 @@ class PlayoutEngine:
                         pass
                     self._current_decoder = None
         
+        # PHASE 2: Kill idle warm decoders (same process-group guarantee as active ones)
+        if self._decoder_pool is not None:
+            self._decoder_pool.shutdown()
+        
         if self._pcm_pipeline is not None:
             self._wait_pcm_drain(timeout_sec=15.0, allow_abort=False)
             self._pcm_pipeline.stop()
         
+        if self._pid_controller is not None:
+            self._pid_controller.close()
+        if self._buffer_client is not None:
+            self._buffer_client.close()
+        
         logger.info("Playout engine stopped")
     
     def wait_for_playout_stopped(self, timeout: Optional[float] = None) -> bool:
@@ -1271,6 +1288,38 @@ class PlayoutEngine:
         """
         return self._playout_stopped_event.wait(timeout=timeout)
     
+    def wait_for_terminal_playout(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for terminal playout to complete (per PE7.3, SL2.2).
+        
+        Terminal playout is complete when the terminal DO executed AND the shutdown
+        announcement (if one was queued) played to EOF.
+        
+        Args:
+            timeout: Maximum time to wait in seconds (None = wait indefinitely)
+        
+        Returns:
+            True if terminal playout completed within timeout, False otherwise
+        """
+        return self._terminal_playout_done.wait(timeout=timeout)
+    
+    def stats(self) -> Dict[str, float]:
+        """
+        Playout thread wakeup and transition-latency counters.
+        
+        Returns:
+            Dict with wakeups, wakeups_per_sec (since run()), transitions,
+            transition_ms_last and transition_ms_max
+        """
+        elapsed = time.monotonic() - self._run_started_at if self._run_started_at else 0.0
+        return {
+            "wakeups": self._wakeups,
+            "wakeups_per_sec": (self._wakeups / elapsed) if elapsed > 0 else 0.0,
+            "transitions": self._transitions,
+            "transition_ms_last": self._transition_ms_last,
+            "transition_ms_max": self._transition_ms_max,
+        }
+    
     def is_playing(self) -> bool:
         """
         Check if a segment is currently playing.
@@ -10,7 +10,7 @@ Architecture 3.1 Reference:
 
 import logging
 from collections import deque
-from typing import Optional, Tuple
+from typing import Callable, Optional, Tuple
 import uuid
 
 from station.broadcast_core.audio_event import AudioEvent
@@ -27,9 +27,15 @@ class PlayoutQueue:
     Architecture 3.1 Reference: Section 4.4
     """
     
-    def __init__(self):
-        """Initialize the playout queue."""
+    def __init__(self, on_enqueue: Optional[Callable[[], None]] = None):
+        """
+        Initialize the playout queue.
+        
+        Args:
+            on_enqueue: Optional callback invoked after each enqueue (wakes the playout loop)
+        """
         self._queue: deque[Tuple[uuid.UUID, AudioEvent]] = deque()
+        self._on_enqueue = on_enqueue
     
     def enqueue(self, audio_event: AudioEvent) -> None:
         """
@@ -45,6 +51,8 @@ class PlayoutQueue:
         intent_id = audio_event.intent_id if audio_event.intent_id else uuid.uuid4()
         self._queue.append((intent_id, audio_event))
         logger.debug(f"Enqueued: intent_id={intent_id}, type={audio_event.type}, path={audio_event.path}")
+        if self._on_enqueue:
+            self._on_enqueue()
     
     def enqueue_multiple(self, audio_events: list[AudioEvent]) -> None:
         """
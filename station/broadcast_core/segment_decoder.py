@@ -4,16 +4,20 @@ Background segment decoder — FFmpeg on a worker thread, frames pushed to PCMOu
 
 import logging
 import threading
-from typing import Callable, Optional
+from typing import Callable, List, Optional
 
 import numpy as np
 
 from station.broadcast_core.ffmpeg_decoder import FFmpegDecoder
+from station.broadcast_core.frame_pool import PCMFramePool
 from station.broadcast_core.pcm_output_pipeline import PCMOutputPipeline
 from station.mixer.mixer import Mixer
 
 logger = logging.getLogger(__name__)
 
+# Frames handed to PCMOutputPipeline.push_many() per lock acquisition (~85 ms of audio)
+PUSH_BATCH_FRAMES = 4
+
 
 class SegmentDecoder:
     """Decode one audio file on a worker thread and push mixed frames to the output pipeline."""
@@ -26,6 +30,9 @@ class SegmentDecoder:
         pipeline: PCMOutputPipeline,
         on_decoder: Optional[Callable[[FFmpegDecoder], None]] = None,
         frame_size: int = 1024,
+        decoder_factory: Optional[Callable[[str, int], FFmpegDecoder]] = None,
+        frame_pool: Optional[PCMFramePool] = None,
+        on_done: Optional[Callable[[], None]] = None,
     ):
         self._path = path
         self._gain = gain
@@ -33,7 +40,11 @@ class SegmentDecoder:
         self._pipeline = pipeline
         self._on_decoder = on_decoder
         self._frame_size = frame_size
+        self._decoder_factory = decoder_factory or FFmpegDecoder
+        self._frame_pool = frame_pool
+        self._on_done = on_done
         self._stop = threading.Event()
+        self._done = threading.Event()
         self._thread: Optional[threading.Thread] = None
         self._exhausted = False
         self._error: Optional[BaseException] = None
@@ -44,6 +55,10 @@ class SegmentDecoder:
     def exhausted(self) -> bool:
         return self._exhausted
 
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until decode is exhausted (EOF, stop or error). True if it finished."""
+        return self._done.wait(timeout)
+
     @property
     def error(self) -> Optional[BaseException]:
         return self._error
@@ -69,18 +84,28 @@ class SegmentDecoder:
     def _run(self) -> None:
         decoder: Optional[FFmpegDecoder] = None
         try:
-            decoder = FFmpegDecoder(self._path, frame_size=self._frame_size)
+            decoder = self._decoder_factory(self._path, self._frame_size)
             self._decoder = decoder
             if self._on_decoder:
                 self._on_decoder(decoder)
 
-            for frame in decoder.read_frames():
-                if self._stop.is_set():
-                    break
-                processed = self._mixer.mix(frame, gain=self._gain)
-                if not self._pipeline.push(processed, block=True):
-                    break
-                self._frames_pushed += 1
+            frames = decoder.read_frames(self._frame_pool) if self._frame_pool else decoder.read_frames()
+            batch: List[np.ndarray] = []
+            try:
+                for frame in frames:
+                    if self._stop.is_set():
+                        self._release(frame)
+                        break
+                    # Gain is applied in place on pooled frames
+                    batch.append(self._mixer.mix(frame, gain=self._gain))
+                    if len(batch) >= PUSH_BATCH_FRAMES and not self._push_batch(batch):
+                        break
+                else:
+                    self._push_batch(batch)
+            finally:
+                # Frames the pipeline did not take go back to the pool
+                for frame in batch:
+                    self._release(frame)
 
             self._exhausted = True
             logger.debug(
@@ -93,3 +118,22 @@ class SegmentDecoder:
             logger.error(f"[SEG-DECODE] Error decoding {self._path}: {e}", exc_info=True)
         finally:
             self._decoder = None
+            self._done.set()
+            if self._on_done:
+                try:
+                    self._on_done()
+                except Exception:
+                    pass
+
+    def _push_batch(self, batch: List[np.ndarray]) -> bool:
+        """Push batch to the pipeline; pushed frames are removed from it. True if all were taken."""
+        if not batch:
+            return True
+        pushed = self._pipeline.push_many(batch, block=True)
+        self._frames_pushed += pushed
+        del batch[:pushed]
+        return not batch
+
+    def _release(self, frame: np.ndarray) -> None:
+        if self._frame_pool is not None:
+            self._frame_pool.release(frame)
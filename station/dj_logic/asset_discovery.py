@@ -14,12 +14,33 @@ Architecture 3.2 Reference:
 import logging
 import os
 import re
+import threading
 import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Patterns to match
+# Note: Accept both _outro (canonical) and _outtro (historical typo) for compatibility
+_INTRO_PATTERN = re.compile(r'^(.+?)_intro.*\.mp3$', re.IGNORECASE)
+_OUTRO_PATTERN = re.compile(r'^(.+?)_outt?ro.*\.mp3$', re.IGNORECASE)  # Matches both _outro and _outtro
+_GENERIC_INTRO_PATTERN = re.compile(r'^generic_intro.*\.mp3$', re.IGNORECASE)
+_GENERIC_OUTRO_PATTERN = re.compile(r'^generic_outt?ro.*\.mp3$', re.IGNORECASE)  # Matches both generic_outro and generic_outtro
+
+# Flat cache lists by category
+_LIST_FOR_CATEGORY = {
+    "generic_intro": "generic_intros",
+    "generic_outro": "generic_outros",
+    "startup": "startup_announcements",
+    "shutdown": "shutdown_announcements",
+    "legal_id": "legal_ids",
+    "generic_id": "generic_ids",
+}
+
+# Safety-net full rescan interval while a filesystem watcher keeps the cache current
+WATCHED_SCAN_INTERVAL_SECONDS = 24 * 3600
+
 
 class AssetDiscoveryManager:
     """
@@ -29,8 +50,11 @@ class AssetDiscoveryManager:
     - Per-song intros: <songroot>_intro*.mp3
     - Per-song outros: <songroot>_outtro*.mp3
     - Generic intros: generic_intro*.mp3
+    - Station IDs: ids/legal/*.mp3, ids/generic/*.mp3
     
     Maintains in-memory maps for fast access during THINK phase.
+    version increases whenever the cache changes (scan swap or apply_change),
+    so consumers can index it once per change instead of once per THINK.
     Only scans once per hour (configurable).
     """
     
@@ -44,7 +68,14 @@ class AssetDiscoveryManager:
         """
         self.dj_path = Path(dj_path)
         self.scan_interval_seconds = scan_interval_seconds
+        self.watched_scan_interval_seconds = WATCHED_SCAN_INTERVAL_SECONDS
         self.last_scan_time: Optional[float] = None
+        self.watching = False  # True while filesystem events keep the cache current
+        self.version = 0  # bumped on every cache change
+        self._lock = threading.RLock()
+        self._scanning = False
+        self._pending_changes: List[Tuple[str, str, bool]] = []
+        self._scan_thread: Optional[threading.Thread] = None
         
         # In-memory caches (built during scan)
         self.intros_per_song: Dict[str, List[str]] = {}  # songroot -> [list of intro paths]
@@ -56,6 +87,10 @@ class AssetDiscoveryManager:
         self.startup_announcements: List[str] = []  # list of startup announcement paths
         self.shutdown_announcements: List[str] = []  # list of shutdown announcement paths
         
+        # Station ID pools
+        self.legal_ids: List[str] = []
+        self.generic_ids: List[str] = []
+        
         # Perform initial scan
         self._scan()
     
@@ -65,13 +100,125 @@ class AssetDiscoveryManager:
         
         Should be called during THINK phase (on_segment_started).
         Only scans once per hour to avoid blocking.
+        
+        While a filesystem watcher keeps the cache current (set_watching(True)),
+        the rescan is a rare safety net that runs on a background thread and
+        never on the THINK path.
         """
         now = time.time()
         
+        if self.watching:
+            if (now - self.last_scan_time) >= self.watched_scan_interval_seconds:
+                self.rescan_in_background()
+            return
+        
         # First scan or enough time has passed
         if self.last_scan_time is None or (now - self.last_scan_time) >= self.scan_interval_seconds:
             self._scan()
     
+    def set_watching(self, watching: bool) -> None:
+        """Mark the cache as kept current by filesystem events (apply_change)."""
+        self.watching = watching
+    
+    def rescan_in_background(self) -> None:
+        """Run a full scan on a background thread; the cache is swapped in when it completes."""
+        with self._lock:
+            if self._scan_thread is not None and self._scan_thread.is_alive():
+                return
+            # Claim the interval now so THINK does not re-trigger while scanning
+            self.last_scan_time = time.time()
+            self._scan_thread = threading.Thread(target=self._scan, name="asset-rescan", daemon=True)
+            self._scan_thread.start()
+    
+    def _classify(self, full_path: str) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        Classify one file under DJ_PATH.
+        
+        Returns:
+            (category, songroot) where category is one of intro, outro, generic_intro,
+            generic_outro, startup, shutdown, legal_id, generic_id (songroot only for
+            intro/outro), or None
+            if the file is not an asset
+        """
+        path = Path(full_path)
+        try:
+            rel_parts = path.relative_to(self.dj_path).parts
+        except ValueError:
+            return None
+        # Skip hidden directories
+        if any(part.startswith('.') for part in rel_parts[:-1]):
+            return None
+        
+        filename = path.name
+        parent = path.parent
+        
+        # Lifecycle announcement directories (per ADM2.4): only their direct children
+        if parent.name in ("station_starting_up", "station_shutting_down"):
+            # Same files glob("*.mp3") picked up: case-sensitive, no hidden files
+            if parent == self.dj_path / parent.name and filename.endswith('.mp3') and not filename.startswith('.'):
+                return ("startup" if parent.name == "station_starting_up" else "shutdown", None)
+            return None
+        
+        # Station ID directories: only their direct children
+        if parent.name in ("legal", "generic") and parent.parent == self.dj_path / "ids":
+            if filename.endswith('.mp3') and not filename.startswith('.'):
+                return ("legal_id" if parent.name == "legal" else "generic_id", None)
+            return None
+        
+        # Only process .mp3 files
+        if not filename.lower().endswith('.mp3'):
+            return None
+        
+        # Check for generic intros FIRST (before per-song patterns and ignore patterns)
+        if _GENERIC_INTRO_PATTERN.match(filename):
+            return ("generic_intro", None)
+        
+        # Check for generic outros (before per-song patterns and ignore patterns)
+        if _GENERIC_OUTRO_PATTERN.match(filename):
+            return ("generic_outro", None)
+        
+        # Check for per-song intros (before ignore patterns - intros/outros should never be ignored)
+        intro_match = _INTRO_PATTERN.match(filename)
+        if intro_match:
+            songroot = intro_match.group(1)
+            # Skip if it's actually a generic intro (shouldn't happen, but safety check)
+            return ("intro", songroot) if songroot.lower() != "generic" else None
+        
+        # Check for per-song outros (before ignore patterns - intros/outros should never be ignored)
+        outro_match = _OUTRO_PATTERN.match(filename)
+        if outro_match:
+            songroot = outro_match.group(1)
+            # Skip if it's actually a generic outro (shouldn't happen, but safety check)
+            return ("outro", songroot) if songroot.lower() != "generic" else None
+        
+        # Anything else (including ignored JulieScene*, CatherineScene*, mus_radio_76_general_*)
+        # is not an asset
+        return None
+    
+    @staticmethod
+    def _empty_cache() -> dict:
+        return {
+            "intros_per_song": {},
+            "outtros_per_song": {},
+            "generic_intros": [],
+            "generic_outros": [],
+            "startup_announcements": [],
+            "shutdown_announcements": [],
+            "legal_ids": [],
+            "generic_ids": [],
+        }
+    
+    @staticmethod
+    def _cache_add(cache: dict, full_path: str, category: str, songroot: Optional[str]) -> None:
+        if category == "intro":
+            paths = cache["intros_per_song"].setdefault(songroot, [])
+        elif category == "outro":
+            paths = cache["outtros_per_song"].setdefault(songroot, [])
+        else:
+            paths = cache[_LIST_FOR_CATEGORY[category]]
+        if full_path not in paths:
+            paths.append(full_path)
+    
     def _scan(self) -> None:
         """
         Scan DJ_PATH directory tree for intro/outro assets.
@@ -88,111 +235,57 @@ class AssetDiscoveryManager:
         - mus_radio_76_general_*
         - Anything not matching patterns
         - Non-.mp3 files
+        
+        The new cache is built off to the side and swapped in atomically (ADM2.1).
+        Changes applied by apply_change() while the scan runs are replayed after the swap.
         """
         logger.info("[ASSET SCAN] Scanning intros/outtros...")
         
-        # Clear previous results
-        self.intros_per_song.clear()
-        self.outtros_per_song.clear()
-        self.generic_intros.clear()
-        self.generic_outros.clear()
-        self.startup_announcements.clear()
-        self.shutdown_announcements.clear()
+        with self._lock:
+            self._scanning = True
+            self._pending_changes = []
+        
+        cache = self._empty_cache()
         
         if not self.dj_path.exists():
             logger.warning(f"[ASSET SCAN] DJ path does not exist: {self.dj_path}")
-            self.last_scan_time = time.time()
-            return
-        
-        # Patterns to match
-        # Note: Accept both _outro (canonical) and _outtro (historical typo) for compatibility
-        intro_pattern = re.compile(r'^(.+?)_intro.*\.mp3$', re.IGNORECASE)
-        outro_pattern = re.compile(r'^(.+?)_outt?ro.*\.mp3$', re.IGNORECASE)  # Matches both _outro and _outtro
-        generic_intro_pattern = re.compile(r'^generic_intro.*\.mp3$', re.IGNORECASE)
-        generic_outro_pattern = re.compile(r'^generic_outt?ro.*\.mp3$', re.IGNORECASE)  # Matches both generic_outro and generic_outtro
-        
-        # Patterns to ignore
-        ignore_patterns = [
-            re.compile(r'^JulieScene.*', re.IGNORECASE),
-            re.compile(r'^CatherineScene.*', re.IGNORECASE),
-            re.compile(r'^mus_radio_76_general_.*', re.IGNORECASE),
-        ]
-        
-        def should_ignore(filename: str) -> bool:
-            """Check if file should be ignored."""
-            for pattern in ignore_patterns:
-                if pattern.match(filename):
-                    return True
-            return False
-        
-        # Scan lifecycle announcement directories first (per ADM2.4)
-        startup_dir = self.dj_path / "station_starting_up"
-        shutdown_dir = self.dj_path / "station_shutting_down"
-        
-        if startup_dir.exists() and startup_dir.is_dir():
-            for file_path in startup_dir.glob("*.mp3"):
-                if file_path.is_file():
-                    self.startup_announcements.append(str(file_path))
-        
-        if shutdown_dir.exists() and shutdown_dir.is_dir():
-            for file_path in shutdown_dir.glob("*.mp3"):
-                if file_path.is_file():
-                    self.shutdown_announcements.append(str(file_path))
-        
-        # Walk the directory tree
-        for root, dirs, files in os.walk(self.dj_path):
-            # Skip hidden directories
-            dirs[:] = [d for d in dirs if not d.startswith('.')]
-            
-            # Skip lifecycle announcement directories (already scanned above)
-            if Path(root).name in ("station_starting_up", "station_shutting_down"):
-                continue
+        else:
+            # Scan lifecycle announcement directories first (per ADM2.4)
+            for dir_name in ("station_starting_up", "station_shutting_down"):
+                lifecycle_dir = self.dj_path / dir_name
+                if lifecycle_dir.exists() and lifecycle_dir.is_dir():
+                    for file_path in lifecycle_dir.glob("*.mp3"):
+                        if file_path.is_file():
+                            classified = self._classify(str(file_path))
+                            if classified:
+                                self._cache_add(cache, str(file_path), *classified)
             
-            for filename in files:
-                # Only process .mp3 files
-                if not filename.lower().endswith('.mp3'):
-                    continue
-                
-                full_path = os.path.join(root, filename)
-                
-                # Check for generic intros FIRST (before per-song patterns and ignore patterns)
-                if generic_intro_pattern.match(filename):
-                    self.generic_intros.append(full_path)
-                    continue
-                
-                # Check for generic outros (before per-song patterns and ignore patterns)
-                if generic_outro_pattern.match(filename):
-                    self.generic_outros.append(full_path)
-                    continue
+            # Walk the directory tree
+            for root, dirs, files in os.walk(self.dj_path):
+                # Skip hidden directories
+                dirs[:] = [d for d in dirs if not d.startswith('.')]
                 
-                # Check for per-song intros (before ignore patterns - intros/outros should never be ignored)
-                intro_match = intro_pattern.match(filename)
-                if intro_match:
-                    songroot = intro_match.group(1)
-                    # Skip if it's actually a generic intro (shouldn't happen, but safety check)
-                    if songroot.lower() != "generic":
-                        if songroot not in self.intros_per_song:
-                            self.intros_per_song[songroot] = []
-                        self.intros_per_song[songroot].append(full_path)
+                # Skip lifecycle announcement directories (already scanned above)
+                if Path(root).name in ("station_starting_up", "station_shutting_down"):
                     continue
                 
-                # Check for per-song outros (before ignore patterns - intros/outros should never be ignored)
-                outro_match = outro_pattern.match(filename)
-                if outro_match:
-                    songroot = outro_match.group(1)
-                    # Skip if it's actually a generic outro (shouldn't happen, but safety check)
-                    if songroot.lower() != "generic":
-                        if songroot not in self.outtros_per_song:
-                            self.outtros_per_song[songroot] = []
-                        self.outtros_per_song[songroot].append(full_path)
-                    continue
-                
-                # Skip ignored files (only after we've checked for intro/outro patterns)
-                if should_ignore(filename):
-                    continue
+                for filename in files:
+                    full_path = os.path.join(root, filename)
+                    classified = self._classify(full_path)
+                    if classified:
+                        self._cache_add(cache, full_path, *classified)
         
-        # Update scan time
-        self.last_scan_time = time.time()
+        # Swap in the new cache and replay changes that raced with the walk
+        with self._lock:
+            for name, value in cache.items():
+                setattr(self, name, value)
+            for change in self._pending_changes:
+                self._apply_change_locked(*change)
+            self._pending_changes = []
+            self._scanning = False
+            self.version += 1
+            # Update scan time
+            self.last_scan_time = time.time()
         
         # Log results
         total_per_song_intros = sum(len(v) for v in self.intros_per_song.values())
@@ -207,7 +300,9 @@ class AssetDiscoveryManager:
             f"{len(self.generic_intros)} generic intros, "
             f"{len(self.generic_outros)} generic outros, "
             f"{len(self.startup_announcements)} startup announcements, "
-            f"{len(self.shutdown_announcements)} shutdown announcements."
+            f"{len(self.shutdown_announcements)} shutdown announcements, "
+            f"{len(self.legal_ids)} legal IDs, "
+            f"{len(self.generic_ids)} generic IDs."
         )
         
         # Debug: log a few examples if we found any
@@ -218,6 +313,71 @@ class AssetDiscoveryManager:
             example_outtros = list(self.outtros_per_song.items())[:3]
             logger.debug(f"[ASSET SCAN] Example per-song outtros: {example_outtros}")
     
+    def apply_change(self, kind: str, path: str, is_dir: bool = False) -> bool:
+        """
+        Apply one filesystem change incrementally (no directory walk).
+        
+        Args:
+            kind: "added" or "removed" (a rename is removed + added)
+            path: Full path of the file or directory
+            is_dir: True if path is a directory (removal drops every asset under it)
+        
+        Returns:
+            True if the cache changed
+        """
+        with self._lock:
+            if self._scanning:
+                self._pending_changes.append((kind, path, is_dir))
+            changed = self._apply_change_locked(kind, path, is_dir)
+            if changed:
+                self.version += 1
+            return changed
+    
+    def _apply_change_locked(self, kind: str, path: str, is_dir: bool) -> bool:
+        if is_dir:
+            if kind == "removed":
+                return self._remove_under(path)
+            # Added directories are reported file by file by the watcher
+            return False
+        classified = self._classify(path)
+        if classified is None:
+            return False
+        category, songroot = classified
+        if kind == "added":
+            cache = {name: getattr(self, name) for name in self._empty_cache()}
+            self._cache_add(cache, path, category, songroot)
+            logger.info(f"[ASSET SCAN] Added {category}: {path}")
+            return True
+        return self._remove_path(path)
+    
+    def _remove_path(self, path: str) -> bool:
+        removed = False
+        for per_song in (self.intros_per_song, self.outtros_per_song):
+            for songroot, paths in list(per_song.items()):
+                if path in paths:
+                    paths.remove(path)
+                    removed = True
+                    if not paths:
+                        del per_song[songroot]
+        for name in _LIST_FOR_CATEGORY.values():
+            paths = getattr(self, name)
+            if path in paths:
+                paths.remove(path)
+                removed = True
+        if removed:
+            logger.info(f"[ASSET SCAN] Removed: {path}")
+        return removed
+    
+    def _remove_under(self, directory: str) -> bool:
+        prefix = directory.rstrip(os.sep) + os.sep
+        under = [p for paths in self.intros_per_song.values() for p in paths if p.startswith(prefix)]
+        under += [p for paths in self.outtros_per_song.values() for p in paths if p.startswith(prefix)]
+        for name in _LIST_FOR_CATEGORY.values():
+            under += [p for p in getattr(self, name) if p.startswith(prefix)]
+        for path in under:
+            self._remove_path(path)
+        return bool(under)
+    
     def get_intros_for_song(self, song_path: str) -> List[str]:
         """
         Get intro paths for a specific song.
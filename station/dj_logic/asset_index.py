@@ -0,0 +1,228 @@
+"""
+Asset selection index for Appalachia Radio 3.1.
+
+Keeps the DJ's selectable assets (per-song intros/outros, generic pools,
+station IDs) as per-category arrays with use cooldowns, so THINK asks
+"which of these are available now?" without scanning history lists or
+stat-ing candidate files:
+
+- Each category holds an array of all members and an array of the members
+  not on cooldown (swap-remove: O(1) add, remove and random pick)
+- Cooldowns are an expiry map plus a min-heap of (expires_at, path) per
+  category; a query first releases the entries that have expired, O(log n)
+  each, so "available now" costs O(log n) amortized instead of O(n)
+- The clock belongs to the caller: seconds for time-based cooldowns, or a
+  use counter for "not within the last N uses"
+- Membership is synced from the AssetDiscoveryManager cache (kept current
+  by the asset watcher), so files are validated once when they are indexed
+  rather than on every THINK
+
+Architecture 3.1 Reference:
+- Section 9: Intro/Outro/ID Decision Model
+"""
+
+import heapq
+import random
+import threading
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+
+class _IndexedSet:
+    """Array-backed set: O(1) add, discard, membership and random choice."""
+
+    __slots__ = ("items", "_pos")
+
+    def __init__(self):
+        self.items: List[str] = []
+        self._pos: Dict[str, int] = {}
+
+    def __contains__(self, item: str) -> bool:
+        return item in self._pos
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def add(self, item: str) -> None:
+        if item not in self._pos:
+            self._pos[item] = len(self.items)
+            self.items.append(item)
+
+    def discard(self, item: str) -> None:
+        pos = self._pos.pop(item, None)
+        if pos is None:
+            return
+        last = self.items.pop()
+        if pos < len(self.items):
+            self.items[pos] = last
+            self._pos[last] = pos
+
+
+class _Category:
+    __slots__ = ("members", "ready", "heap", "version")
+
+    def __init__(self):
+        self.members = _IndexedSet()
+        self.ready = _IndexedSet()  # members not on cooldown
+        self.heap: List[Tuple[float, str]] = []  # (expires_at, path); stale entries skipped lazily
+        self.version: Optional[Hashable] = None
+
+
+class CooldownIndex:
+    """
+    Per-category asset arrays with cooldowns on a caller-supplied clock.
+
+    Usage:
+        index = CooldownIndex()
+        index.sync("generic_intro", asset_manager.generic_intros, version=asset_manager.version)
+        path = index.choose("generic_intro", now=uses)
+        index.use(path, until=uses + 5)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._categories: Dict[str, _Category] = {}
+        self._categories_of: Dict[str, Set[str]] = {}
+        self._expiry: Dict[str, float] = {}  # path -> clock value at which its cooldown ends
+
+    def sync(self, category: str, paths: Iterable[str], version: Optional[Hashable] = None) -> None:
+        """
+        Make paths the members of category.
+
+        Skipped when version matches the version of the last sync, so callers
+        can pass their cache generation and sync on every lookup. Cooldowns of
+        paths that stay (or come back) are kept.
+        """
+        with self._lock:
+            cat = self._categories.get(category)
+            if cat is None:
+                cat = self._categories[category] = _Category()
+            elif version is not None and cat.version == version:
+                return
+            wanted = list(paths)
+            keep = set(wanted)
+            for path in [p for p in cat.members.items if p not in keep]:
+                self._remove_locked(category, cat, path)
+            for path in wanted:
+                self._add_locked(category, cat, path)
+            cat.version = version
+
+    def add(self, category: str, path: str) -> None:
+        with self._lock:
+            cat = self._categories.get(category)
+            if cat is None:
+                cat = self._categories[category] = _Category()
+            self._add_locked(category, cat, path)
+
+    def discard(self, path: str) -> None:
+        """Remove path from every category (its cooldown is remembered)."""
+        with self._lock:
+            for category in list(self._categories_of.get(path, ())):
+                self._remove_locked(category, self._categories[category], path)
+
+    def clear_members(self) -> None:
+        """Drop every category, keeping cooldowns (e.g. when the asset source is replaced)."""
+        with self._lock:
+            self._categories.clear()
+            self._categories_of.clear()
+
+    def clear_cooldowns(self) -> None:
+        """Make every member available again."""
+        with self._lock:
+            self._expiry.clear()
+            for cat in self._categories.values():
+                cat.heap.clear()
+                for path in cat.members.items:
+                    cat.ready.add(path)
+
+    def use(self, path: str, until: float) -> None:
+        """Put path on cooldown until the clock reaches until (a later use extends it)."""
+        with self._lock:
+            self._expiry[path] = until
+            for category in self._categories_of.get(path, ()):
+                cat = self._categories[category]
+                cat.ready.discard(path)
+                heapq.heappush(cat.heap, (until, path))
+
+    def is_cooling(self, path: str, now: float) -> bool:
+        """True if path is on cooldown at now (O(1))."""
+        until = self._expiry.get(path)
+        return until is not None and until > now
+
+    def categories_of(self, path: str) -> Set[str]:
+        with self._lock:
+            return set(self._categories_of.get(path, ()))
+
+    def members(self, category: str) -> List[str]:
+        with self._lock:
+            cat = self._categories.get(category)
+            return list(cat.members.items) if cat else []
+
+    def size(self, category: str) -> int:
+        cat = self._categories.get(category)
+        return len(cat.members) if cat else 0
+
+    def available(self, category: str, now: float) -> List[str]:
+        """Members of category not on cooldown at now."""
+        with self._lock:
+            cat = self._categories.get(category)
+            if cat is None:
+                return []
+            self._release_locked(cat, now)
+            return list(cat.ready.items)
+
+    def choose(self, category: str, now: float, rng=random) -> Optional[str]:
+        """
+        Random member not on cooldown at now; if all are cooling, a random
+        member; None if the category is empty.
+        """
+        with self._lock:
+            cat = self._categories.get(category)
+            if cat is None or not cat.members:
+                return None
+            self._release_locked(cat, now)
+            pool = cat.ready if cat.ready else cat.members
+            return rng.choice(pool.items)
+
+    def oldest(self, category: str) -> Optional[str]:
+        """Member whose cooldown ends first (a never-used or released member if there is one)."""
+        with self._lock:
+            cat = self._categories.get(category)
+            if cat is None or not cat.members:
+                return None
+            if cat.ready:
+                return cat.ready.items[0]
+            while cat.heap:
+                until, path = cat.heap[0]
+                if self._expiry.get(path) == until and path in cat.members:
+                    return path
+                heapq.heappop(cat.heap)
+            return cat.members.items[0]
+
+    def _add_locked(self, category: str, cat: _Category, path: str) -> None:
+        if path in cat.members:
+            return
+        cat.members.add(path)
+        self._categories_of.setdefault(path, set()).add(category)
+        until = self._expiry.get(path)
+        if until is None:
+            cat.ready.add(path)
+        else:
+            # Possibly still cooling; the next query releases it if not
+            heapq.heappush(cat.heap, (until, path))
+
+    def _remove_locked(self, category: str, cat: _Category, path: str) -> None:
+        cat.members.discard(path)
+        cat.ready.discard(path)
+        categories = self._categories_of.get(path)
+        if categories is not None:
+            categories.discard(category)
+            if not categories:
+                del self._categories_of[path]
+
+    def _release_locked(self, cat: _Category, now: float) -> None:
+        heap = cat.heap
+        while heap and heap[0][0] <= now:
+            until, path = heapq.heappop(heap)
+            # Skip entries superseded by a later use or left by a removed member
+            if self._expiry.get(path) == until and path in cat.members:
+                cat.ready.add(path)
@@ -16,6 +16,7 @@ Architecture 3.1 Reference:
 import logging
 import os
 import random
+import threading
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -26,6 +27,9 @@ from station.broadcast_core.playout_engine import DJCallback, PlayoutEngine, _ge
 from station.dj_logic.intent_model import DJIntent
 from station.dj_logic.ticklers import Tickler, GenerateIntroTickler, GenerateOutroTickler, RefillGenericIDTickler
 from station.dj_logic.asset_discovery import AssetDiscoveryManager
+from station.dj_logic.asset_index import CooldownIndex
+from station.dj_logic.think_worker import THINK_DO_GRACE_SEC, PhaseTimer, ThinkJob, ThinkPhaseHistogram
+from station.music_logic.metadata_index import get_metadata_index
 from station.music_logic.rotation import RotationManager
 
 logger = logging.getLogger(__name__)
@@ -59,6 +63,9 @@ except Exception:
     # Catch all exceptions (including I/O errors) to prevent import-time failures
     pass
 
+# Deadline budget for a song whose duration is unknown (matches PlayoutEngine's fallback)
+DEFAULT_SEGMENT_DURATION_SEC = 180.0
+
 
 class DJEngine:
     """
@@ -118,19 +125,41 @@ class DJEngine:
         self.intro_history: list[str] = []  # List of intro paths used recently
         self.outro_history: list[str] = []  # List of outro paths used recently
         self.cooldown_len = 5  # cannot reuse same file within last 5 uses
+        # Selection index over the asset cache; intro/outro cooldowns run on use counters
+        self.asset_index = CooldownIndex()
+        self._asset_uses = {"intro": 0, "outro": 0}
+        self._indexed_asset_manager = None
         
         # Current DJIntent (built during THINK, executed during DO)
         self.current_intent: Optional[DJIntent] = None
         
-        # Phase 6: Tickler Queue
+        # Phase 6: Tickler Queue (run during THINK unless a TicklerExecutor is set by Station)
         self.ticklers: list[Tickler] = []
+        self.tickler_executor = None
+        
+        # Phase 9: Asset Discovery Manager for intros/outros/IDs
+        self.asset_manager = AssetDiscoveryManager(self.dj_asset_path)
         
         # Phase 6: Track available generic IDs for pool health checks
         self.available_generic_ids: list[str] = []
         self._scan_generic_ids()
         
-        # Phase 9: Asset Discovery Manager for intros/outros
-        self.asset_manager = AssetDiscoveryManager(self.dj_asset_path)
+        # Optional DJStateStore journaling per-event records between full saves
+        # (set by Station; see apply_journal_record())
+        self.state_store = None
+        
+        # Optional ThinkWorker running song THINK off the playout thread (set by Station)
+        self.think_worker = None
+        self._think_job: Optional[ThinkJob] = None
+        self._intent_lock = threading.Lock()  # THINK commit vs DO degrade
+        # (job, song path, PlannedSong) once an in-flight THINK has taken its song;
+        # a DO degrade reuses it instead of consuming another planned slot
+        self._think_song: Optional[tuple] = None
+        self.think_phases = ThinkPhaseHistogram()
+        self.degraded_intents = 0
+        
+        # Optional SongPlanner keeping the next songs pre-selected (set by Station)
+        self.song_planner = None
         
         # Lifecycle state (set by Station, observed during THINK)
         self._is_startup = False  # True during initial startup THINK
@@ -205,6 +234,9 @@ class DJEngine:
         
         # Check for shutdown state (per DJ2.5, E1.2)
         if self._is_draining:
+            # A normal THINK still in flight must not overwrite the terminal intent
+            self._cancel_think()
+            
             # Shutdown THINK: Select shutdown announcement if available, produce terminal intent
             # CRITICAL: Only create terminal intent if one doesn't already exist
             # Prevent duplicate terminal intent creation (e.g., when shutdown announcement segment starts)
@@ -290,20 +322,49 @@ class DJEngine:
                     logger.warning("[DJ] THINK: Shutdown announcement started but no terminal intent exists - this should not happen")
                 return
         
+        # 1. Clear any previous DJIntent that was already executed
+        if self.current_intent:
+            logger.debug("[DJ] Clearing previous intent (already executed)")
+            self.current_intent = None
+        
+        # Song THINK runs on the THINK worker against a deadline so it never
+        # holds up the playout thread; startup announcement THINK stays inline
+        if self.think_worker and segment.type == "song":
+            self._think_job = self.think_worker.submit(
+                lambda job: self._think(segment, job),
+                deadline=self.think_worker.deadline_for(self._segment_duration(segment)),
+                label=segment.path,
+            )
+            return
+        self._think(segment)
+    
+    def _think(self, segment: AudioEvent, job: Optional[ThinkJob] = None) -> None:
+        """
+        Normal THINK body: decide the break and commit a DJIntent.
+        
+        Args:
+            segment: The song/announcement segment that just started
+            job: THINK worker job when running off the playout thread; optional
+                 break elements are dropped once its deadline is at risk and the
+                 intent is discarded if DO already gave up on it
+        """
         # DJ4.1: Emit dj_think_started event before THINK logic begins (Station-local only)
         think_start_time = time.monotonic()
+        metadata_probes_start = get_metadata_index().probes
+        timer = PhaseTimer(self.think_phases)
         logger.info(f"[DJ] THINK started: segment={segment.type} path={segment.path}")
         
         # Phase 9: Maybe rescan assets (only once per hour, non-blocking)
         self.asset_manager.maybe_rescan()
+        timer.mark("rescan")
         
-        # 1. Clear any previous DJIntent that was already executed
-        if self.current_intent:
-            logger.debug("[DJ] Clearing previous intent (already executed)")
-            self.current_intent = None
+        # A THINK that DO already gave up on must leave no side effects behind
+        if self._think_abandoned(job, "ticklers"):
+            return
         
         # 2. Run deferred tasks (Phase 6: Tickler execution)
         self._run_ticklers()
+        timer.mark("ticklers")
         
         # 3. Decide break structure (Phase 5: Structured Break Composition)
         logger.info("[DJ] THINK: Deciding break structure...")
@@ -328,30 +389,62 @@ class DJEngine:
         # If next song is upbeat or DJ hasn't used an intro recently
         should_use_intro = self._should_use_intro()
         
+        # Deadline at risk: degrade to song only (no talk, IDs or intro)
+        degraded = job is not None and job.at_risk()
+        if degraded:
+            needs_legal_id = should_talk = needs_generic_id = should_use_intro = False
+        
         logger.info(f"[DJ] THINK: Break plan - talk={should_talk}, legal_id={needs_legal_id}, "
-                   f"generic_id={needs_generic_id}, intro={should_use_intro}")
+                   f"generic_id={needs_generic_id}, intro={should_use_intro}, degraded={degraded}")
+        timer.mark("plan")
         
         # 4. Select concrete MP3 files
         logger.info("[DJ] THINK: Selecting concrete MP3 files...")
         
-        # Choose next song using rotation logic (weighted variety)
-        next_song_path = self._select_next_song(current_song_path=segment.path)
-        
-        # Extract MP3 metadata during THINK phase (not DO phase)
-        # This ensures metadata extraction doesn't block playout
-        metadata = _get_mp3_metadata(next_song_path) if next_song_path else None
+        # Choose next song: pop the lookahead plan, else rotation logic (weighted variety)
+        # Cancel check and selection are atomic with DO's degrade: either DO
+        # cancels first and this THINK takes nothing, or DO reuses this song
+        with self._intent_lock:
+            if self._think_abandoned(job, "song selection"):
+                return
+            planned = self.song_planner.take(segment.path) if self.song_planner else None
+            if planned:
+                next_song_path = planned.path
+            else:
+                next_song_path = self._select_next_song(current_song_path=segment.path)
+                if self.song_planner:
+                    self.song_planner.rebase(segment.path, next_song_path)
+            if job is not None:
+                self._think_song = (job, next_song_path, planned)
+        if planned:
+            metadata = planned.metadata
+            logger.info(f"[DJ] THINK: Selected next song (planned) - {next_song_path}")
+        else:
+            # Extract MP3 metadata during THINK phase (not DO phase)
+            # This ensures metadata extraction doesn't block playout
+            metadata = _get_mp3_metadata(next_song_path) if next_song_path else None
+            logger.info(f"[DJ] THINK: Selected next song - {next_song_path}")
         next_song = AudioEvent(path=next_song_path, type="song", metadata=metadata)
-        logger.info(f"[DJ] THINK: Selected next song - {next_song_path}")
+        timer.mark("song")
+        
+        if self._think_abandoned(job, "break selection"):
+            return
+        
+        if not degraded and job is not None and job.at_risk():
+            degraded = True
+            should_talk = needs_legal_id = needs_generic_id = should_use_intro = False
+            logger.warning("[DJ] THINK: Deadline at risk after song selection - degrading to song only")
         
         # Select outro if talking
         outro: Optional[AudioEvent] = None
         if should_talk:
             outro_path = self._select_outro(segment.path if segment.type == "song" else None)
-            if outro_path and os.path.exists(outro_path):
+            if outro_path and self._asset_exists(outro_path):
                 outro = AudioEvent(path=outro_path, type="outro")
                 logger.info(f"[DJ] THINK: Selected outro - {outro_path}")
             elif outro_path:
                 logger.warning(f"[DJ] THINK: Outro file does not exist, skipping - {outro_path}")
+        timer.mark("outro")
         
         # Select station IDs if needed
         station_ids: Optional[list[AudioEvent]] = None
@@ -360,7 +453,7 @@ class DJEngine:
             id_paths = self._select_station_ids(count=1, legal=True)
             if id_paths:
                 # Filter to only existing files
-                existing_ids = [path for path in id_paths if os.path.exists(path)]
+                existing_ids = [path for path in id_paths if self._asset_exists(path)]
                 if existing_ids:
                     station_ids = [AudioEvent(path=path, type="id") for path in existing_ids]
                     has_legal_id = True  # We selected a legal ID
@@ -371,28 +464,30 @@ class DJEngine:
             id_paths = self._select_station_ids(count=1, legal=False)
             if id_paths:
                 # Filter to only existing files
-                existing_ids = [path for path in id_paths if os.path.exists(path)]
+                existing_ids = [path for path in id_paths if self._asset_exists(path)]
                 if existing_ids:
                     station_ids = [AudioEvent(path=path, type="id") for path in existing_ids]
                     has_legal_id = False  # We selected a generic ID
                     logger.info(f"[DJ] THINK: Selected generic ID - {existing_ids[0]}")
                 else:
                     logger.warning(f"[DJ] THINK: No generic ID files exist, skipping - {id_paths}")
+        timer.mark("ids")
         
         # Select intro if needed
         intro: Optional[AudioEvent] = None
         if should_use_intro:
             intro_path = self._select_intro(next_song_path)
-            if intro_path and os.path.exists(intro_path):
+            if intro_path and self._asset_exists(intro_path):
                 intro = AudioEvent(path=intro_path, type="intro")
                 logger.info(f"[DJ] THINK: Selected intro - {intro_path}")
             elif intro_path:
                 logger.warning(f"[DJ] THINK: Intro file does not exist, skipping - {intro_path}")
+        timer.mark("intro")
         
         # 5. Validate asset availability - file existence checks done above
         
         # 6. Commit intent (all decisions made, all files validated)
-        self.current_intent = DJIntent(
+        intent = DJIntent(
             next_song=next_song,
             outro=outro,
             station_ids=station_ids,
@@ -401,7 +496,7 @@ class DJEngine:
         )
         
         # Propagate intent_id to all AudioEvents in the intent (for atomic execution tracking)
-        intent_id = self.current_intent.intent_id
+        intent_id = intent.intent_id
         if next_song:
             next_song.intent_id = intent_id
         if outro:
@@ -412,6 +507,9 @@ class DJEngine:
         if intro:
             intro.intent_id = intent_id
         
+        if not self._commit_intent(intent, job):
+            return
+        
         logger.info(f"[DJ] THINK: DJIntent committed - intent_id={intent_id}, "
                    f"outro={outro is not None}, ids={len(station_ids) if station_ids else 0}, "
                    f"intro={intro is not None}, song={next_song.path if next_song else None}")
@@ -421,7 +519,96 @@ class DJEngine:
         think_duration_ms = (think_end_time - think_start_time) * 1000.0
         intent_id = self.current_intent.intent_id if self.current_intent else None
         is_terminal = self.current_intent.is_terminal if self.current_intent else None
-        logger.info(f"[DJ] THINK completed: duration={think_duration_ms:.2f}ms intent_id={intent_id} is_terminal={is_terminal}")
+        # metadata_probes > 0 means THINK forked ffprobe (metadata index miss)
+        metadata_probes = get_metadata_index().probes - metadata_probes_start
+        self.think_phases.record("total", think_duration_ms)
+        logger.info(
+            f"[DJ] THINK completed: duration={think_duration_ms:.2f}ms intent_id={intent_id} "
+            f"is_terminal={is_terminal} metadata_probes={metadata_probes} degraded={degraded} "
+            f"phases: {timer.summary()}"
+        )
+    
+    def _commit_intent(self, intent: DJIntent, job: Optional[ThinkJob]) -> bool:
+        """Publish a THINK result unless DO already replaced it with a degraded intent."""
+        with self._intent_lock:
+            if job is not None:
+                if job.cancelled:
+                    logger.warning(f"[DJ] THINK: Discarding late intent {intent.intent_id} (DO already degraded)")
+                    return False
+                job.committed = True
+                self._think_song = None
+            self.current_intent = intent
+            return True
+    
+    def _think_abandoned(self, job: Optional[ThinkJob], step: str) -> bool:
+        """True (and logged) if DO already cancelled this THINK; it must stop before step."""
+        if job is None or not job.cancelled:
+            return False
+        logger.warning(f"[DJ] THINK: Abandoned before {step} (DO already degraded)")
+        return True
+    
+    def _segment_duration(self, segment: AudioEvent) -> float:
+        duration = (segment.metadata or {}).get("duration")
+        return float(duration) if duration else DEFAULT_SEGMENT_DURATION_SEC
+    
+    def _cancel_think(self) -> None:
+        """Abandon any in-flight THINK job (its intent will not be committed)."""
+        with self._intent_lock:
+            job, self._think_job = self._think_job, None
+            self._think_song = None
+            if job is not None and not job.committed:
+                job.cancelled = True
+    
+    def _await_think(self, segment: AudioEvent) -> None:
+        """
+        DO side of the THINK deadline: make sure an intent exists for this transition.
+        
+        Waits at most THINK_DO_GRACE_SEC for an in-flight THINK; if it has not
+        committed by then (or failed), the job is cancelled and a degraded
+        song-only intent is built so playout never waits on a slow THINK.
+        """
+        job = self._think_job
+        if job is None:
+            return
+        if not job.done():
+            job.wait(THINK_DO_GRACE_SEC)
+        with self._intent_lock:
+            self._think_job = None
+            if job.committed:
+                return
+            job.cancelled = True
+            if self._is_draining:
+                self._think_song = None
+                return  # DRAINING DO builds the terminal intent instead
+            self.degraded_intents += 1
+            logger.warning(
+                f"[DJ] DO: THINK missed its deadline ({'failed' if job.error else 'still running'}) - "
+                f"using degraded song-only intent"
+            )
+            self.current_intent = self._degraded_intent(segment, job)
+    
+    def _degraded_intent(self, segment: AudioEvent, job: Optional[ThinkJob] = None) -> DJIntent:
+        """
+        Cheap song-only intent: the song the cancelled THINK already took, else
+        the planned song if available, else an in-memory rotation pick.
+        """
+        taken, self._think_song = self._think_song, None
+        if taken is not None and taken[0] is job:
+            _, path, planned = taken
+            song = AudioEvent(path=path, type="song", metadata=planned.metadata if planned else None)
+        else:
+            planned = self.song_planner.take(segment.path) if self.song_planner else None
+            if planned:
+                song = AudioEvent(path=planned.path, type="song", metadata=planned.metadata)
+            else:
+                path = self._select_next_song(current_song_path=segment.path)
+                if self.song_planner:
+                    self.song_planner.rebase(segment.path, path)
+                # No metadata probe here: DO must not block on I/O
+                song = AudioEvent(path=path, type="song")
+        intent = DJIntent(next_song=song)
+        song.intent_id = intent.intent_id
+        return intent
     
     def on_segment_finished(self, segment: AudioEvent) -> None:
         """
@@ -441,6 +628,9 @@ class DJEngine:
         Args:
             segment: The AudioEvent that just finished playing
         """
+        # Song THINK may still be running on the THINK worker
+        self._await_think(segment)
+        
         # Handle terminal intents (per INT2.4, E1.3)
         # Terminal intents may be triggered by non-song segments (e.g., shutdown announcement)
         is_terminal = False
@@ -509,11 +699,14 @@ class DJEngine:
         if not is_terminal:
             self._record_song_played(segment.path)
             # Update rotation manager history as well
+            is_holiday = False
             if self.rotation_manager:
                 try:
                     self.rotation_manager.record_song_played(segment.path)
+                    is_holiday = self.rotation_manager._is_holiday_track(segment.path)
                 except Exception as e:
                     logger.warning(f"[DJ] Failed to record play in RotationManager: {e}")
+            self._journal({"type": "song", "path": segment.path, "ts": time.time(), "holiday": is_holiday})
         
         # SS4.3: DJ DO MUST NOT run until STARTUP_DO_ENQUEUE state
         # Check startup state if getter is available (Station provides this)
@@ -691,6 +884,7 @@ class DJEngine:
                 # Generic ID
                 self.last_generic_id_time = now
                 logger.debug(f"[DJ] DO: Updated last_generic_id_time to {now}")
+            self._journal({"type": "id", "legal": bool(self.current_intent.has_legal_id), "ts": now.timestamp()})
         
         # Update talk timestamp if outro was queued
         if self.current_intent.outro:
@@ -699,18 +893,14 @@ class DJEngine:
         
         # Update intro/outro histories
         if self.current_intent.intro:
-            self.intro_history.append(self.current_intent.intro.path)
-            # Keep only last cooldown_len entries
-            if len(self.intro_history) > self.cooldown_len:
-                self.intro_history.pop(0)
+            self._record_asset_use("intro", self.current_intent.intro.path)
             logger.debug(f"[DJ] DO: Added intro to history: {self.current_intent.intro.path}")
+            self._journal({"type": "intro", "path": self.current_intent.intro.path})
         
         if self.current_intent.outro:
-            self.outro_history.append(self.current_intent.outro.path)
-            # Keep only last cooldown_len entries
-            if len(self.outro_history) > self.cooldown_len:
-                self.outro_history.pop(0)
+            self._record_asset_use("outro", self.current_intent.outro.path)
             logger.debug(f"[DJ] DO: Added outro to history: {self.current_intent.outro.path}")
+            self._journal({"type": "talk", "outro": self.current_intent.outro.path, "ts": now.timestamp()})
         
         # 4. Schedule ticklers for future content (Phase 6)
         # Do this before clearing intent so we can check what was used
@@ -827,6 +1017,70 @@ class DJEngine:
         """
         return file not in history[-self.cooldown_len:]
     
+    def _record_asset_use(self, kind: str, path: str) -> None:
+        """
+        Add an intro/outro to its history and put it on cooldown in the asset index.
+        
+        The cooldown clock for each kind counts uses, so a file used now stays
+        unavailable until cooldown_len further uses have happened (the same rule
+        as _cooldown_ok() over the history list).
+        """
+        history = self.intro_history if kind == "intro" else self.outro_history
+        history.append(path)
+        # Keep only last cooldown_len entries
+        if len(history) > self.cooldown_len:
+            history.pop(0)
+        self._asset_uses[kind] += 1
+        self.asset_index.use(path, until=self._asset_uses[kind] + self.cooldown_len)
+    
+    def _rebuild_asset_cooldowns(self) -> None:
+        """Re-derive index cooldowns from the intro/outro histories (after a restore)."""
+        self.asset_index.clear_cooldowns()
+        for kind, history in (("intro", self.intro_history), ("outro", self.outro_history)):
+            self._asset_uses[kind] = 0
+            for path in history[-self.cooldown_len:]:
+                self._asset_uses[kind] += 1
+                self.asset_index.use(path, until=self._asset_uses[kind] + self.cooldown_len)
+    
+    def _asset_category(self, category: str, paths: list[str]) -> str:
+        """
+        Sync one category of the asset index from the asset cache and return it.
+        
+        The sync is skipped while the cache version is unchanged, so each
+        category is re-indexed once per cache change rather than once per THINK.
+        """
+        manager = self.asset_manager
+        if manager is not self._indexed_asset_manager:
+            # Asset manager replaced: re-index from scratch, keeping cooldowns
+            self.asset_index.clear_members()
+            self._indexed_asset_manager = manager
+        self.asset_index.sync(category, paths, version=manager.version)
+        return category
+    
+    def _talk_category(self, kind: str, song_path: Optional[str]) -> Optional[str]:
+        """Index category for an intro/outro: the song's own pool if it has one, else the generic pool."""
+        manager = self.asset_manager
+        if song_path:
+            songroot = manager._extract_songroot(song_path)
+            per_song = (manager.intros_per_song if kind == "intro" else manager.outtros_per_song).get(songroot)
+            if per_song:
+                return self._asset_category(f"{kind}:{songroot}", per_song)
+        generic = manager.generic_intros if kind == "intro" else manager.generic_outros
+        category = self._asset_category(f"generic_{kind}", generic)
+        return category if self.asset_index.size(category) else None
+    
+    def _asset_exists(self, path: str) -> bool:
+        """
+        Existence check for a selected asset.
+        
+        While the asset watcher keeps the cache current, indexed files are
+        trusted without touching the filesystem; otherwise (cache refreshed only
+        by periodic scans) the selected file is stat-ed once.
+        """
+        if self.asset_manager.watching and self.asset_index.categories_of(path):
+            return True
+        return os.path.exists(path)
+    
     def _should_use_intro(self) -> bool:
         """
         Phase 5: Decide if an intro should be used for next song.
@@ -856,21 +1110,16 @@ class DJEngine:
         if not self.rotation_manager:
             raise RuntimeError("RotationManager not available - cannot select next song")
         
-        # Get all available tracks from rotation manager
-        # Filter out current song to avoid immediate repeat
-        all_tracks = self.rotation_manager._regular_tracks + self.rotation_manager._holiday_tracks
-        candidates = [s for s in all_tracks if s != current_song_path]
-        
-        if not candidates:
-            # If filtering out current song leaves nothing, use all tracks anyway
-            candidates = all_tracks
-        
         try:
-            selected = self.rotation_manager.select_next_song(candidates)
+            # Select from all of RotationManager's tracks, leaving out the current
+            # song to avoid an immediate repeat (unless it is the only track)
+            selected = self.rotation_manager.select_next_song(exclude=current_song_path)
             logger.debug(f"[DJ] Selected via RotationManager: {selected}")
             return selected
         except Exception as e:
             logger.error(f"[DJ] RotationManager selection failed: {e}")
+            all_tracks = self.rotation_manager._regular_tracks + self.rotation_manager._holiday_tracks
+            candidates = [s for s in all_tracks if s != current_song_path] or all_tracks
             # Last resort: random selection from candidates
             if candidates:
                 selected = random.choice(candidates)
@@ -890,22 +1139,11 @@ class DJEngine:
     
     def _scan_generic_ids(self) -> None:
         """
-        Scan for available generic ID files.
+        Refresh the list of available generic ID files.
         
-        Updates self.available_generic_ids with paths to available IDs.
+        Updates self.available_generic_ids from the asset cache (ids/generic).
         """
-        generic_ids_dir = self.dj_asset_path / "ids" / "generic"
-        if not generic_ids_dir.exists():
-            self.available_generic_ids = []
-            return
-        
-        try:
-            self.available_generic_ids = [
-                str(f) for f in generic_ids_dir.glob("*.mp3")
-            ]
-        except Exception as e:
-            logger.warning(f"[DJ] Error scanning generic IDs: {e}")
-            self.available_generic_ids = []
+        self.available_generic_ids = list(self.asset_manager.generic_ids)
     
     def _select_outro(self, song_path: Optional[str] = None) -> Optional[str]:
         """
@@ -922,48 +1160,19 @@ class DJEngine:
         Returns:
             Path to outro MP3 file, or None if no outro available
         """
-        # Phase 9: Try per-song outros first
-        if song_path:
-            candidate_outtros = self.asset_manager.get_outtros_for_song(song_path)
-            if candidate_outtros:
-                # Filter by cooldown
-                available_outtros = [
-                    outro for outro in candidate_outtros
-                    if self._cooldown_ok(outro, self.outro_history)
-                ]
-                
-                # If none available due to cooldown, use any (fallback)
-                if not available_outtros:
-                    logger.debug("[DJ] All per-song outros in cooldown, using any")
-                    available_outtros = candidate_outtros
-                
-                # Select randomly
-                selected = random.choice(available_outtros)
-                logger.info(f"[DJ] THINK: Selected per-song outro: {selected}")
-                return selected
+        category = self._talk_category("outro", song_path)
+        if category is None:
+            # No outros available (neither per-song nor generic)
+            logger.debug("[DJ] No outro found (neither per-song nor generic)")
+            return None
         
-        # Phase 9: Fallback to generic outros if no per-song outros
-        candidate_outtros = self.asset_manager.get_generic_outros()
-        if candidate_outtros:
-            # Filter by cooldown (same logic as intros)
-            available_outtros = [
-                outro for outro in candidate_outtros
-                if self._cooldown_ok(outro, self.outro_history)
-            ]
-            
-            # If none available due to cooldown, use any (fallback)
-            if not available_outtros:
-                logger.debug("[DJ] All generic outros in cooldown, using any")
-                available_outtros = candidate_outtros
-            
-            # Select randomly
-            selected = random.choice(available_outtros)
+        # Random pick among outros out of cooldown (any outro if all are cooling)
+        selected = self.asset_index.choose(category, now=self._asset_uses["outro"])
+        if category == "generic_outro":
             logger.info(f"[DJ] THINK: Selected generic outro (fallback): {selected}")
-            return selected
-        
-        # No outros available (neither per-song nor generic)
-        logger.debug("[DJ] No outro found (neither per-song nor generic)")
-        return None
+        else:
+            logger.info(f"[DJ] THINK: Selected per-song outro: {selected}")
+        return selected
     
     def _select_station_ids(self, count: int = 1, legal: bool = False) -> list[str]:
         """
@@ -976,43 +1185,27 @@ class DJEngine:
         Returns:
             List of paths to station ID MP3 files
         """
-        id_paths = []
-        
-        if legal:
-            ids_dir = self.dj_asset_path / "ids" / "legal"
-        else:
-            ids_dir = self.dj_asset_path / "ids" / "generic"
+        kind = "legal" if legal else "generic"
+        category = self._asset_category(
+            f"{kind}_id", self.asset_manager.legal_ids if legal else self.asset_manager.generic_ids
+        )
         
-        if not ids_dir.exists():
+        if not self.asset_index.size(category):
+            if (self.dj_asset_path / "ids" / kind).exists():
+                logger.warning(f"[DJ] No {kind} ID files found")
+                return []
             # Fallback paths
             if legal:
                 base_path = str(self.dj_asset_path / "ids" / "legal" / "legal_id.mp3")
             else:
                 base_path = str(self.dj_asset_path / "ids" / "generic" / "generic_id_001.mp3")
-            
-            for i in range(count):
-                id_paths.append(base_path)
             logger.debug(f"[DJ] Selected ID (fallback): {base_path}")
-            return id_paths
+            return [base_path] * count
         
-        # Get all ID files
-        try:
-            all_ids = [f.name for f in ids_dir.glob("*.mp3")]
-            if not all_ids:
-                logger.warning(f"[DJ] No {'legal' if legal else 'generic'} ID files found")
-                return []
-            
-            # Select randomly (IDs don't have cooldowns in Phase 5, only timing rules)
-            for i in range(count):
-                selected = random.choice(all_ids)
-                id_paths.append(str(ids_dir / selected))
-            
-            logger.debug(f"[DJ] Selected {len(id_paths)} {'legal' if legal else 'generic'} ID(s)")
-            return id_paths
-            
-        except Exception as e:
-            logger.warning(f"[DJ] Error selecting IDs: {e}")
-            return []
+        # Select randomly (IDs don't have cooldowns in Phase 5, only timing rules)
+        id_paths = [self.asset_index.choose(category, now=0) for _ in range(count)]
+        logger.debug(f"[DJ] Selected {len(id_paths)} {kind} ID(s)")
+        return id_paths
     
     def _select_intro(self, song_path: str) -> Optional[str]:
         """
@@ -1028,31 +1221,16 @@ class DJEngine:
         Returns:
             Path to intro MP3 file, or None if no intro available
         """
-        # Phase 9: Try per-song intros first
-        candidate_intros = self.asset_manager.get_intros_for_song(song_path)
-        
-        # Phase 9: Fallback to generic intros if no per-song intros
-        if not candidate_intros:
-            candidate_intros = self.asset_manager.generic_intros
-            logger.debug(f"[DJ] No per-song intro found, using generic intros ({len(candidate_intros)} available)")
-        
-        if not candidate_intros:
+        category = self._talk_category("intro", song_path)
+        if category is None:
             logger.warning("[DJ] No intro files found (neither per-song nor generic)")
             return None
         
-        # Filter by cooldown
-        available_intros = [
-            intro for intro in candidate_intros
-            if self._cooldown_ok(intro, self.intro_history)
-        ]
-        
-        # If none available due to cooldown, use any (fallback)
-        if not available_intros:
-            logger.debug("[DJ] All intros in cooldown, using any")
-            available_intros = candidate_intros
+        if category == "generic_intro":
+            logger.debug(f"[DJ] No per-song intro found, using generic intros ({self.asset_index.size(category)} available)")
         
-        # Select randomly
-        selected = random.choice(available_intros)
+        # Random pick among intros out of cooldown (any intro if all are cooling)
+        selected = self.asset_index.choose(category, now=self._asset_uses["intro"])
         logger.debug(f"[DJ] Selected intro: {selected}")
         return selected
     
@@ -1084,15 +1262,20 @@ class DJEngine:
     
     # ===== Phase 6: Tickler System =====
     
-    def add_tickler(self, tickler: Tickler) -> None:
+    def add_tickler(self, tickler: Tickler, deadline: Optional[float] = None) -> None:
         """
         Add a tickler to the queue.
         
-        Ticklers are executed during the next THINK window.
+        With a TicklerExecutor the tickler is submitted to its workers right
+        away; otherwise it is executed during the next THINK window.
         
         Args:
             tickler: Tickler instance to add
+            deadline: Optional time.monotonic() by which its output is needed
         """
+        if self.tickler_executor:
+            self.tickler_executor.submit(tickler, deadline=deadline)
+            return
         self.ticklers.append(tickler)
         logger.info(f"[DJ DO] Scheduling tickler: {tickler}")
     
@@ -1129,17 +1312,22 @@ class DJEngine:
         Args:
             intent: The DJIntent that was just executed
         """
+        # Assets for the song just queued are needed by the break after it at the earliest
+        needed_by = None
+        if intent.next_song:
+            needed_by = time.monotonic() + self._segment_duration(intent.next_song)
+        
         # Example: If we used an intro, schedule a replacement for later
         if intent.intro:
             # Schedule intro generation for the next song that will need it
             # For now, schedule for the next song that was just queued
             if intent.next_song:
-                self.add_tickler(GenerateIntroTickler(intent.next_song.path))
+                self.add_tickler(GenerateIntroTickler(intent.next_song.path), deadline=needed_by)
         
         # If we used an outro, we might want to schedule outro generation
         if intent.outro and intent.next_song:
             # Schedule outro generation for future use
-            self.add_tickler(GenerateOutroTickler(intent.next_song.path))
+            self.add_tickler(GenerateOutroTickler(intent.next_song.path), deadline=needed_by)
         
         # If generic ID pool is low, schedule a refill
         if self._generic_id_pool_low():
@@ -1171,7 +1359,9 @@ class DJEngine:
             "intro_history": self.intro_history[-20:],  # Keep it reasonable
             "outro_history": self.outro_history[-20:],
             "last_played_songs": self.last_played_songs,
-            "ticklers": [repr(t) for t in self.ticklers],  # Store as strings for now
+            "ticklers": [repr(t) for t in self.ticklers] + (
+                self.tickler_executor.pending() if self.tickler_executor else []
+            ),  # Store as strings for now
         }
         
         # Add rotation state if rotation_manager is available
@@ -1370,6 +1560,48 @@ class DJEngine:
             f"({len(expanded_segments)} segments, intent_id={intent_id})"
         )
     
+    def _journal(self, record: dict) -> None:
+        """Journal one state event through the state store (O(1), never raises)."""
+        if self.state_store is None:
+            return
+        try:
+            self.state_store.record(record)
+        except Exception as e:
+            logger.warning(f"[DJ] Failed to journal state event {record.get('type')}: {e}")
+    
+    @staticmethod
+    def apply_journal_record(data: dict, record: dict) -> None:
+        """
+        Fold one journaled DO event into a to_dict()-shaped state dict.
+        
+        Used by DJStateStore to replay the journal on warm start and to compact
+        it into a snapshot; list caps match to_dict() and _record_song_played().
+        """
+        kind = record.get("type")
+        if kind == "song":
+            path = record["path"]
+            songs = data.setdefault("last_played_songs", [])
+            songs.append(path)
+            del songs[:-10]  # max_history
+            rot = data.setdefault("rotation", {})
+            history = rot.setdefault("history", [])
+            history.append({"path": path, "timestamp": record["ts"], "is_holiday": bool(record.get("holiday"))})
+            del history[:-20]
+            counts = rot.setdefault("holiday_play_counts" if record.get("holiday") else "play_counts", {})
+            counts[path] = counts.get(path, 0) + 1
+            rot["last_played"] = [item["path"] for item in reversed(history)]
+        elif kind == "intro":
+            intros = data.setdefault("intro_history", [])
+            intros.append(record["path"])
+            del intros[:-20]
+        elif kind == "talk":
+            outros = data.setdefault("outro_history", [])
+            outros.append(record["outro"])
+            del outros[:-20]
+            data["last_talk_time"] = record["ts"]
+        elif kind == "id":
+            data["last_legal_id_time" if record.get("legal") else "last_generic_id_time"] = record["ts"]
+    
     def from_dict(self, data: dict) -> None:
         """
         Phase 7: Load DJ state from dictionary (from JSON).
@@ -1385,6 +1617,7 @@ class DJEngine:
         # Restore histories
         self.intro_history = data.get("intro_history", [])
         self.outro_history = data.get("outro_history", [])
+        self._rebuild_asset_cooldowns()
         
         # Restore last played songs
         self.last_played_songs = data.get("last_played_songs", [])
@@ -12,11 +12,13 @@ Architecture 3.1 Reference:
 import logging
 import os
 import random
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
 from station.broadcast_core.audio_event import AudioEvent
+from station.dj_logic.asset_index import CooldownIndex
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +60,11 @@ class IDLogic:
         # Initialize mock asset paths
         self._initialize_mock_assets()
         
+        # Pools indexed with cooldown expiries (time.time() clock)
+        self.index = CooldownIndex()
+        self.index.sync("legal", self.legal_ids)
+        self.index.sync("generic", self.generic_ids)
+        
         logger.info(f"IDLogic initialized with {len(self.legal_ids)} legal IDs, "
                    f"{len(self.generic_ids)} generic IDs")
     
@@ -85,29 +92,19 @@ class IDLogic:
         Returns:
             True if ID is on cooldown (used recently)
         """
-        if id_path not in self.cooldowns:
-            return False
-        
-        last_used = self.cooldowns[id_path]
-        
-        # Legal IDs have longer cooldown
-        is_legal = any(legal in id_path for legal in self.legal_ids)
-        cooldown_minutes = LEGAL_ID_COOLDOWN_HOURS * 60 if is_legal else ID_COOLDOWN_MINUTES
-        
-        cooldown_end = last_used + timedelta(minutes=cooldown_minutes)
-        return datetime.now() < cooldown_end
+        return self.index.is_cooling(id_path, time.time())
     
-    def _get_available_ids(self, id_list: list[str]) -> list[str]:
+    def _get_available_ids(self, pool: str) -> list[str]:
         """
         Get list of IDs that are not on cooldown.
         
         Args:
-            id_list: List of ID paths
+            pool: "legal" or "generic"
             
         Returns:
             List of available (not on cooldown) ID paths
         """
-        return [id_path for id_path in id_list if not self._is_on_cooldown(id_path)]
+        return self.index.available(pool, time.time())
     
     def needs_legal_id(self, break_context: Optional[dict] = None) -> bool:
         """
@@ -213,16 +210,12 @@ class IDLogic:
             Path to legal ID, or None if not available
         """
         # Get available legal IDs (not on cooldown)
-        available = self._get_available_ids(self.legal_ids)
+        available = self._get_available_ids("legal")
         
         if not available:
             # If all are on cooldown, use the oldest one (legal IDs are required)
-            if self.legal_ids:
-                sorted_ids = sorted(
-                    self.legal_ids,
-                    key=lambda x: self.cooldowns.get(x, datetime.min)
-                )
-                selected = sorted_ids[0]
+            selected = self.index.oldest("legal")
+            if selected:
                 logger.warning(f"[ID] All legal IDs on cooldown, using oldest: {selected}")
                 return selected
             return None
@@ -241,17 +234,11 @@ class IDLogic:
             Path to generic ID, or None if pool empty
         """
         # Get available generic IDs (not on cooldown)
-        available = self._get_available_ids(self.generic_ids)
+        available = self._get_available_ids("generic")
         
         if not available:
             # If all are on cooldown, use the oldest one
-            if self.generic_ids:
-                sorted_ids = sorted(
-                    self.generic_ids,
-                    key=lambda x: self.cooldowns.get(x, datetime.min)
-                )
-                return sorted_ids[0]
-            return None
+            return self.index.oldest("generic")
         
         # Consider talk frequency - if talked recently, maybe avoid IDs that were used then
         if break_context:
@@ -278,6 +265,10 @@ class IDLogic:
             is_legal: Whether this was a legal ID
         """
         self.cooldowns[id_path] = datetime.now()
+        # Legal IDs have longer cooldown
+        is_legal_path = "legal" in self.index.categories_of(id_path)
+        cooldown_minutes = LEGAL_ID_COOLDOWN_HOURS * 60 if is_legal_path else ID_COOLDOWN_MINUTES
+        self.index.use(id_path, time.time() + cooldown_minutes * 60)
         
         if is_legal:
             self.last_legal_id_time = datetime.now()
@@ -12,11 +12,13 @@ Architecture 3.1 Reference:
 import logging
 import os
 import random
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 from station.broadcast_core.audio_event import AudioEvent
+from station.dj_logic.asset_index import CooldownIndex
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +56,11 @@ class IntroLogic:
         # Initialize mock asset paths
         self._initialize_mock_assets()
         
+        # Pools indexed with cooldown expiries (time.time() clock)
+        self.index = CooldownIndex()
+        self.index.sync("personality", self.personality_intros)
+        self.index.sync("generic", self.generic_intros)
+        
         logger.info(f"IntroLogic initialized with {len(self.generic_intros)} generic intros")
     
     def _initialize_mock_assets(self) -> None:
@@ -80,24 +87,19 @@ class IntroLogic:
         Returns:
             True if intro is on cooldown (used recently)
         """
-        if intro_path not in self.cooldowns:
-            return False
-        
-        last_used = self.cooldowns[intro_path]
-        cooldown_end = last_used + timedelta(minutes=INTRO_COOLDOWN_MINUTES)
-        return datetime.now() < cooldown_end
+        return self.index.is_cooling(intro_path, time.time())
     
-    def _get_available_intros(self, intro_list: list[str]) -> list[str]:
+    def _get_available_intros(self, pool: str) -> list[str]:
         """
         Get list of intros that are not on cooldown.
         
         Args:
-            intro_list: List of intro paths
+            pool: "personality" or "generic"
             
         Returns:
             List of available (not on cooldown) intro paths
         """
-        return [intro for intro in intro_list if not self._is_on_cooldown(intro)]
+        return self.index.available(pool, time.time())
     
     def select_intro(self, next_song: str) -> Optional[AudioEvent]:
         """
@@ -154,7 +156,7 @@ class IntroLogic:
         # In production, this would use a database or mapping
         
         # Get available personality intros (not on cooldown)
-        available = self._get_available_intros(self.personality_intros)
+        available = self._get_available_intros("personality")
         
         if not available:
             return None
@@ -174,18 +176,11 @@ class IntroLogic:
             Path to generic intro, or None if pool empty
         """
         # Get available generic intros (not on cooldown)
-        available = self._get_available_intros(self.generic_intros)
+        available = self._get_available_intros("generic")
         
         if not available:
             # If all are on cooldown, use the oldest one
-            if self.generic_intros:
-                # Sort by last used time, pick oldest
-                sorted_intros = sorted(
-                    self.generic_intros,
-                    key=lambda x: self.cooldowns.get(x, datetime.min)
-                )
-                return sorted_intros[0]
-            return None
+            return self.index.oldest("generic")
         
         # Random selection from available
         return random.choice(available)
@@ -210,4 +205,5 @@ class IntroLogic:
             intro_path: Path to the intro that was used
         """
         self.cooldowns[intro_path] = datetime.now()
+        self.index.use(intro_path, time.time() + INTRO_COOLDOWN_MINUTES * 60)
         logger.debug(f"[INTRO] Recorded usage: {os.path.basename(intro_path)}")
@@ -12,11 +12,13 @@ Architecture 3.1 Reference:
 import logging
 import os
 import random
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
 from station.broadcast_core.audio_event import AudioEvent
+from station.dj_logic.asset_index import CooldownIndex
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +56,11 @@ class OutroLogic:
         # Initialize mock asset paths
         self._initialize_mock_assets()
         
+        # Pools indexed with cooldown expiries (time.time() clock)
+        self.index = CooldownIndex()
+        self.index.sync("personality", self.personality_outros)
+        self.index.sync("generic", self.generic_outros)
+        
         logger.info(f"OutroLogic initialized with {len(self.generic_outros)} generic outros")
     
     def _initialize_mock_assets(self) -> None:
@@ -80,24 +87,19 @@ class OutroLogic:
         Returns:
             True if outro is on cooldown (used recently)
         """
-        if outro_path not in self.cooldowns:
-            return False
-        
-        last_used = self.cooldowns[outro_path]
-        cooldown_end = last_used + timedelta(minutes=OUTRO_COOLDOWN_MINUTES)
-        return datetime.now() < cooldown_end
+        return self.index.is_cooling(outro_path, time.time())
     
-    def _get_available_outros(self, outro_list: list[str]) -> list[str]:
+    def _get_available_outros(self, pool: str) -> list[str]:
         """
         Get list of outros that are not on cooldown.
         
         Args:
-            outro_list: List of outro paths
+            pool: "personality" or "generic"
             
         Returns:
             List of available (not on cooldown) outro paths
         """
-        return [outro for outro in outro_list if not self._is_on_cooldown(outro)]
+        return self.index.available(pool, time.time())
     
     def select_outro(self, current_song: str, talk_frequency: Optional[dict] = None) -> Optional[AudioEvent]:
         """
@@ -159,7 +161,7 @@ class OutroLogic:
             Path to personality outro, or None if not available
         """
         # Get available personality outros (not on cooldown)
-        available = self._get_available_outros(self.personality_outros)
+        available = self._get_available_outros("personality")
         
         if not available:
             return None
@@ -184,18 +186,11 @@ class OutroLogic:
             Path to generic outro, or None if pool empty
         """
         # Get available generic outros (not on cooldown)
-        available = self._get_available_outros(self.generic_outros)
+        available = self._get_available_outros("generic")
         
         if not available:
             # If all are on cooldown, use the oldest one
-            if self.generic_outros:
-                # Sort by last used time, pick oldest
-                sorted_outros = sorted(
-                    self.generic_outros,
-                    key=lambda x: self.cooldowns.get(x, datetime.min)
-                )
-                return sorted_outros[0]
-            return None
+            return self.index.oldest("generic")
         
         # If talked recently (within last 10 minutes), avoid recently used outros
         if talk_frequency:
@@ -233,4 +228,5 @@ class OutroLogic:
             outro_path: Path to the outro that was used
         """
         self.cooldowns[outro_path] = datetime.now()
+        self.index.use(outro_path, time.time() + OUTRO_COOLDOWN_MINUTES * 60)
         logger.debug(f"[OUTRO] Recorded usage: {os.path.basename(outro_path)}")
@@ -0,0 +1,270 @@
+"""
+Lookahead song planner for Appalachia Radio 3.1.
+
+Keeps the next K song selections pre-computed on a background worker so the
+THINK phase pops a ready answer instead of weighting the library, probing
+metadata and checking the song file on the prep-window clock.
+
+The plan is a chain [current, S1, S2, ...]: each pick is drawn from a fork of
+the RotationManager onto which the chain entries that will have been recorded
+by then (DO records each segment as it finishes) are applied first, so a
+planned pick sees the same history the synchronous path would. For every
+pick the planner also:
+- resolves metadata through the media metadata index
+- verifies the song file is readable (unreadable picks are skipped)
+
+The real rotation reports every recorded play to the planner. A play that
+follows the chain just advances it; anything else (a different song, or the
+track lists / history / play counts being replaced) changes the weights, so
+the unconsumed part of the plan is dropped and recomputed. Weights that
+depend on wall-clock time (age bonus) are evaluated when the pick is
+planned, at most K songs early. Plays are reported under the rotation lock
+and the planner forks while holding it, so a fork never contains a play the
+planner has not counted yet.
+
+Architecture 3.1 Reference:
+- Section 4.3: DJ Prep Window Behavior (chooses next song)
+"""
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from station.music_logic.metadata_index import get_metadata_index
+from station.music_logic.rotation import RotationManager
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LOOKAHEAD_SONGS = 3
+
+# Picks redrawn when the selected file is not readable
+MAX_UNREADABLE_REDRAWS = 5
+
+
+@dataclass
+class PlannedSong:
+    """One pre-computed selection, ready for THINK."""
+    path: str
+    metadata: Optional[dict]
+    planned_at: float = 0.0
+
+
+class SongPlanner:
+    """
+    Background lookahead over RotationManager selections.
+
+    Usage:
+        planner = SongPlanner(rotation, depth=3)
+        planner.start()
+        planned = planner.take(current_path)        # O(1); None on a miss
+        if planned is None:
+            selected = ...                           # synchronous path
+            planner.rebase(current_path, selected)
+        planner.stop()
+    """
+
+    def __init__(
+        self,
+        rotation_manager: RotationManager,
+        depth: int = DEFAULT_LOOKAHEAD_SONGS,
+    ):
+        """
+        Initialize the planner (no work until start()).
+
+        Args:
+            rotation_manager: Live RotationManager (forked for planning, never mutated)
+            depth: Number of selections to keep ready (K)
+        """
+        self.rotation_manager = rotation_manager
+        self.depth = max(1, int(depth))
+
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+
+        # _chain[0] is the song the plan hangs off; _slots[i] is the pick after _chain[i]
+        self._chain: List[str] = []
+        self._slots: List[PlannedSong] = []
+        self._taken = 0  # slots handed to THINK
+        self._recorded = 0  # chain entries the real rotation has recorded
+        self._generation = 0  # bumped whenever the chain is cut or rebased
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.planned = 0
+        self.last_refill_ms = 0.0
+
+        rotation_manager.add_listener(self._on_rotation_changed)
+
+    def start(self) -> None:
+        """Start the planner thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="song-planner", daemon=True)
+        self._thread.start()
+        logger.info(f"[PLANNER] Lookahead planner started (depth={self.depth})")
+
+    def stop(self) -> None:
+        """Stop the planner thread. Idempotent."""
+        self._stopping = True
+        self._wake.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=5.0)
+        self._thread = None
+
+    def take(self, current_path: str) -> Optional[PlannedSong]:
+        """
+        Pop the planned song to follow current_path.
+
+        Returns None (a miss) if no valid plan hangs off current_path; the
+        caller selects synchronously and calls rebase().
+        """
+        with self._lock:
+            if (
+                self._chain
+                and self._taken < len(self._slots)
+                and self._chain[self._taken] == current_path
+                and self._recorded == self._taken
+            ):
+                planned = self._slots[self._taken]
+                self._taken += 1
+                self.hits += 1
+                self._trim_locked()
+                self._wake.set()
+                return planned
+            self.misses += 1
+        return None
+
+    def rebase(self, current_path: str, selected_path: str) -> None:
+        """Restart the plan after a synchronous selection of selected_path."""
+        with self._lock:
+            self._chain = [current_path, selected_path]
+            self._slots = [PlannedSong(path=selected_path, metadata=None, planned_at=time.time())]
+            self._taken = 1
+            self._recorded = 0
+            self._generation += 1
+        self._wake.set()
+
+    def peek(self) -> List[PlannedSong]:
+        """Planned songs not yet taken, in play order (e.g. for decode-ahead)."""
+        with self._lock:
+            return list(self._slots[self._taken:])
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            ready = len(self._slots) - self._taken if self._chain else 0
+        return {
+            "depth": self.depth,
+            "ready": ready,
+            "lag": max(0, self.depth - ready),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "planned": self.planned,
+            "last_refill_ms": round(self.last_refill_ms, 3),
+        }
+
+    def _on_rotation_changed(self, song_path: Optional[str]) -> None:
+        with self._lock:
+            if not self._chain:
+                return
+            if song_path is not None and self._recorded < len(self._chain) and self._chain[self._recorded] == song_path:
+                self._recorded += 1
+                self._trim_locked()
+                return
+            # Weights moved off the plan: keep what THINK already committed, replan the rest
+            if song_path is None and self._recorded <= self._taken:
+                del self._chain[self._taken + 1:]
+                del self._slots[self._taken:]
+            else:
+                self._chain, self._slots = [], []
+                self._taken = self._recorded = 0
+            self._generation += 1
+            self.invalidations += 1
+        logger.debug(f"[PLANNER] Plan invalidated ({'state replaced' if song_path is None else 'unplanned play'})")
+        self._wake.set()
+
+    def _trim_locked(self) -> None:
+        # Drop the prefix both THINK and DO have moved past
+        done = min(self._taken, self._recorded)
+        if done:
+            del self._chain[:done]
+            del self._slots[:done]
+            self._taken -= done
+            self._recorded -= done
+
+    def _run(self) -> None:
+        while not self._stopping:
+            self._wake.wait()
+            self._wake.clear()
+            if self._stopping:
+                return
+            try:
+                self._refill()
+            except Exception as e:
+                logger.error(f"[PLANNER] Refill failed: {e}", exc_info=True)
+
+    def _refill(self) -> None:
+        start = time.monotonic()
+        # Rotation lock first (the order plays are notified in): every play in
+        # the fork has already advanced _recorded
+        with self.rotation_manager.lock, self._lock:
+            if not self._chain:
+                return
+            missing = self.depth - (len(self._slots) - self._taken)
+            if missing <= 0:
+                return
+            generation = self._generation
+            chain = list(self._chain)
+            recorded = self._recorded
+            fork = self.rotation_manager.fork()
+
+        # Plays DO will have recorded by the time the next pick is needed
+        for path in chain[recorded:-1]:
+            fork.record_song_played(path)
+        previous = chain[-1]
+        picks: List[PlannedSong] = []
+        for _ in range(missing):
+            planned = self._plan_after(fork, previous)
+            if planned is None:
+                break
+            picks.append(planned)
+            fork.record_song_played(previous)
+            previous = planned.path
+
+        with self._lock:
+            if generation != self._generation or self._chain[-1] != chain[-1]:
+                return  # cut or rebased meanwhile; the wake-up is already pending
+            for planned in picks:
+                self._chain.append(planned.path)
+                self._slots.append(planned)
+            self.planned += len(picks)
+        self.last_refill_ms = (time.monotonic() - start) * 1000.0
+        if picks:
+            logger.debug(f"[PLANNER] Planned {len(picks)} song(s) in {self.last_refill_ms:.2f}ms")
+
+    def _plan_after(self, fork: RotationManager, previous: str) -> Optional[PlannedSong]:
+        unreadable: set = set()
+        for _ in range(MAX_UNREADABLE_REDRAWS):
+            available = None
+            if unreadable:
+                # Rare: redraw without the files that failed the check
+                available = [t for t in fork._regular_tracks + fork._holiday_tracks if t not in unreadable]
+                if not available:
+                    return None
+            try:
+                path = fork.select_next_song(available, exclude=previous)
+            except ValueError as e:
+                logger.warning(f"[PLANNER] No selection possible: {e}")
+                return None
+            if os.access(path, os.R_OK):
+                return PlannedSong(path=path, metadata=get_metadata_index().lookup(path), planned_at=time.time())
+            logger.warning(f"[PLANNER] Skipping unreadable song: {path}")
+            unreadable.add(path)
+        return None
@@ -0,0 +1,215 @@
+"""
+THINK worker for Appalachia Radio 3.1.
+
+Runs the DJ's THINK phase for songs on a dedicated thread instead of the
+playout thread that fires on_segment_started, so a slow rescan, tickler or
+NFS stat can never delay playout. Each job carries a deadline ("intent ready
+N seconds before the segment ends"); THINK checks it between phases and
+drops optional break elements when it is at risk, and DO falls back to a
+degraded song-only intent if the job still has not committed.
+
+Per-phase THINK timings are kept in fixed-bucket histograms (ThinkPhaseHistogram).
+
+Architecture 3.1 Reference:
+- Section 4.3: DJ Prep Window Behavior (THINK must be time-bounded)
+"""
+
+import bisect
+import logging
+import math
+import queue
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_THINK_LEAD_SEC = 10.0
+
+# Longest DO waits past the deadline for an in-flight THINK before degrading
+THINK_DO_GRACE_SEC = 0.1
+
+# Histogram bucket upper bounds (ms); the last bucket is open-ended
+PHASE_BUCKETS_MS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0, 2500.0, 5000.0)
+
+
+class ThinkPhaseHistogram:
+    """Thread-safe per-phase latency histograms with fixed millisecond buckets."""
+
+    def __init__(self, buckets_ms=PHASE_BUCKETS_MS):
+        self.buckets_ms = tuple(buckets_ms)
+        self._lock = threading.Lock()
+        self._counts: Dict[str, List[int]] = {}
+        self._max_ms: Dict[str, float] = {}
+
+    def record(self, phase: str, ms: float) -> None:
+        slot = bisect.bisect_left(self.buckets_ms, ms)
+        with self._lock:
+            counts = self._counts.get(phase)
+            if counts is None:
+                counts = self._counts[phase] = [0] * (len(self.buckets_ms) + 1)
+            counts[slot] += 1
+            self._max_ms[phase] = max(self._max_ms.get(phase, 0.0), ms)
+
+    def percentile(self, phase: str, pct: float) -> Optional[float]:
+        """Upper bound (ms) of the bucket holding the pct-th sample (max for the open bucket)."""
+        with self._lock:
+            counts = list(self._counts.get(phase, ()))
+            max_ms = self._max_ms.get(phase, 0.0)
+        total = sum(counts)
+        if not total:
+            return None
+        rank = max(1, math.ceil(total * pct / 100.0))
+        seen = 0
+        for slot, count in enumerate(counts):
+            seen += count
+            if seen >= rank:
+                return min(self.buckets_ms[slot], max_ms) if slot < len(self.buckets_ms) else max_ms
+        return max_ms
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            phases = {phase: sum(counts) for phase, counts in self._counts.items()}
+            max_ms = dict(self._max_ms)
+        return {
+            phase: {
+                "count": count,
+                "p50_ms": self.percentile(phase, 50),
+                "p99_ms": self.percentile(phase, 99),
+                "max_ms": round(max_ms[phase], 3),
+            }
+            for phase, count in phases.items()
+        }
+
+
+class PhaseTimer:
+    """Splits one THINK into named phases; mark(phase) closes the phase that just ran."""
+
+    def __init__(self, histogram: Optional[ThinkPhaseHistogram] = None):
+        self._histogram = histogram
+        self.phases: Dict[str, float] = {}
+        self._last = time.monotonic()
+
+    def mark(self, phase: str) -> None:
+        now = time.monotonic()
+        ms = (now - self._last) * 1000.0
+        self._last = now
+        self.phases[phase] = self.phases.get(phase, 0.0) + ms
+        if self._histogram is not None:
+            self._histogram.record(phase, ms)
+
+    def summary(self) -> str:
+        return " ".join(f"{phase}={ms:.1f}ms" for phase, ms in self.phases.items())
+
+
+class ThinkJob:
+    """One submitted THINK; the THINK body commits its intent only if not cancelled."""
+
+    def __init__(self, fn: Callable[["ThinkJob"], None], deadline: float, label: str = ""):
+        self.fn = fn
+        self.deadline = deadline  # time.monotonic() by which the intent should be committed
+        self.label = label
+        self.cancelled = False
+        self.committed = False  # set by the THINK body when its intent is committed
+        self.error: Optional[BaseException] = None
+        self.submitted_at = time.monotonic()
+        self._done = threading.Event()
+
+    def at_risk(self, margin_sec: float = 0.0) -> bool:
+        """True once the deadline (less margin_sec) has passed."""
+        return time.monotonic() >= self.deadline - margin_sec
+
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float]) -> bool:
+        return self._done.wait(timeout)
+
+
+class ThinkWorker:
+    """
+    Single dedicated thread running THINK jobs in submission order.
+
+    Usage:
+        worker = ThinkWorker(lead_sec=10.0)
+        worker.start()
+        job = worker.submit(think_fn, deadline=worker.deadline_for(duration_sec))
+        ...
+        worker.stop()
+    """
+
+    def __init__(self, lead_sec: float = DEFAULT_THINK_LEAD_SEC):
+        """
+        Args:
+            lead_sec: How long before the segment ends the intent should be ready
+        """
+        self.lead_sec = lead_sec
+        self._queue: "queue.Queue[Optional[ThinkJob]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.late = 0  # completed after their deadline
+
+    def start(self) -> None:
+        """Start the worker thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name="dj-think", daemon=True)
+        self._thread.start()
+        logger.info(f"[THINK-WORKER] Started (lead={self.lead_sec:.1f}s)")
+
+    def stop(self) -> None:
+        """Stop the worker after the job in progress. Idempotent."""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout=5.0)
+        self._thread = None
+
+    def deadline_for(self, duration_sec: float, started_at: Optional[float] = None) -> float:
+        """Deadline for a segment of duration_sec starting at started_at (monotonic; default now)."""
+        start = time.monotonic() if started_at is None else started_at
+        return start + max(0.0, duration_sec - self.lead_sec)
+
+    def submit(self, fn: Callable[[ThinkJob], None], deadline: float, label: str = "") -> ThinkJob:
+        """Queue fn(job) on the worker thread and return the job."""
+        job = ThinkJob(fn, deadline, label)
+        self._queue.put(job)
+        return job
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "completed": self.completed,
+            "failed": self.failed,
+            "cancelled": self.cancelled,
+            "late": self.late,
+            "pending": self.pending(),
+        }
+
+    def _run(self) -> None:
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            if job.cancelled:
+                self.cancelled += 1
+                job._done.set()
+                continue
+            try:
+                job.fn(job)
+                self.completed += 1
+                if time.monotonic() > job.deadline:
+                    self.late += 1
+                    logger.warning(f"[THINK-WORKER] THINK finished after its deadline: {job.label}")
+            except Exception as e:
+                job.error = e
+                self.failed += 1
+                logger.error(f"[THINK-WORKER] THINK failed: {job.label}: {e}", exc_info=True)
+            finally:
+                job._done.set()
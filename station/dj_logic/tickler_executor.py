@@ -0,0 +1,252 @@
+"""
+Background tickler executor for Appalachia Radio 3.1.
+
+Runs DJ ticklers on a small pool of worker threads instead of draining the
+whole tickler queue at the start of THINK, so future work (voice-track
+generation, asset refreshes) never lands on the THINK critical path.
+
+- Priority: lower Tickler.priority runs first; within a priority the earliest
+  deadline runs first (ties in submission order)
+- Deadline: when the asset is needed; work not started by then is dropped
+  as expired, since its output could no longer be used
+- Deduplication: submitting a tickler whose dedup_key() matches one still
+  pending returns the pending handle (the earlier deadline wins)
+- Cancellation: per handle, per key, or everything pending
+
+Queue depth, queue wait and run latency are exported through stats().
+
+Architecture 3.1 Reference:
+- Section 2.4: Ticklers (Deferred DJ Tasks)
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import Dict, List, Optional
+
+from station.dj_logic.think_worker import ThinkPhaseHistogram
+from station.dj_logic.ticklers import Tickler
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TICKLER_WORKERS = 1
+
+
+class TicklerHandle:
+    """A submitted tickler; cancel() drops it if it has not started yet."""
+
+    def __init__(self, executor: "TicklerExecutor", tickler: Tickler, key: str, priority: int, deadline: Optional[float]):
+        self._executor = executor
+        self.tickler = tickler
+        self.key = key
+        self.priority = priority
+        self.deadline = deadline  # time.monotonic(); None = no deadline
+        self.submitted_at = time.monotonic()
+        self.state = "pending"  # pending | running | done | failed | cancelled | expired
+        self._done = threading.Event()
+
+    def cancel(self) -> bool:
+        """Cancel if still pending. Returns True if it will not run."""
+        return self._executor._cancel_handle(self)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._done.wait(timeout)
+
+    def _sort_key(self, seq: int):
+        return (self.priority, self.deadline if self.deadline is not None else float("inf"), seq)
+
+
+class TicklerExecutor:
+    """
+    Prioritized, deadline-aware pool for DJ ticklers.
+
+    Usage:
+        executor = TicklerExecutor(dj_engine, workers=1)
+        executor.start()
+        handle = executor.submit(GenerateIntroTickler(path), deadline=time.monotonic() + 180)
+        executor.stop()
+    """
+
+    def __init__(self, dj_engine, workers: int = DEFAULT_TICKLER_WORKERS):
+        """
+        Args:
+            dj_engine: DJEngine passed to Tickler.run()
+            workers: Number of worker threads
+        """
+        self.dj_engine = dj_engine
+        self.workers = max(1, int(workers))
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        self._heap: List[tuple] = []
+        self._pending: Dict[str, TicklerHandle] = {}
+        self._seq = itertools.count()
+        self._threads: List[threading.Thread] = []
+        self._stopping = False
+        self._running = 0
+
+        self.latency = ThinkPhaseHistogram()  # "wait" (queued) and "run" phases
+        self.submitted = 0
+        self.deduplicated = 0
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.expired = 0
+
+    def start(self) -> None:
+        """Start the worker threads."""
+        with self._lock:
+            if self._threads:
+                return
+            self._stopping = False
+            for i in range(self.workers):
+                thread = threading.Thread(target=self._run, name=f"tickler-{i}", daemon=True)
+                self._threads.append(thread)
+                thread.start()
+        logger.info(f"[TICKLER] Executor started ({self.workers} worker(s))")
+
+    def stop(self, cancel_pending: bool = True) -> None:
+        """Stop the workers after their current tickler. Idempotent."""
+        if cancel_pending:
+            self.cancel_all()
+        with self._lock:
+            self._stopping = True
+            threads, self._threads = self._threads, []
+            self._cond.notify_all()
+        for thread in threads:
+            if thread is not threading.current_thread():
+                thread.join(timeout=5.0)
+
+    def submit(
+        self,
+        tickler: Tickler,
+        priority: Optional[int] = None,
+        deadline: Optional[float] = None,
+    ) -> TicklerHandle:
+        """
+        Queue a tickler.
+
+        Args:
+            tickler: Tickler to run
+            priority: Overrides tickler.priority (lower runs first)
+            deadline: time.monotonic() by which the output is needed (None = no deadline)
+
+        Returns:
+            Handle for the queued work (the already-pending one if deduplicated)
+        """
+        key = tickler.dedup_key()
+        with self._lock:
+            existing = self._pending.get(key)
+            if existing is not None and existing.state == "pending":
+                self.deduplicated += 1
+                if deadline is not None and (existing.deadline is None or deadline < existing.deadline):
+                    # Tighter deadline: requeue; whichever heap entry pops second is skipped
+                    existing.deadline = deadline
+                    heapq.heappush(self._heap, (existing._sort_key(next(self._seq)), existing))
+                    self._cond.notify()
+                logger.debug(f"[TICKLER] Deduplicated {tickler}")
+                return existing
+            handle = TicklerHandle(self, tickler, key, tickler.priority if priority is None else priority, deadline)
+            self._pending[key] = handle
+            heapq.heappush(self._heap, (handle._sort_key(next(self._seq)), handle))
+            self.submitted += 1
+            self._cond.notify()
+        logger.info(f"[TICKLER] Queued {tickler} (priority={handle.priority})")
+        return handle
+
+    def cancel(self, key: str) -> bool:
+        """Cancel the pending tickler with this dedup key."""
+        with self._lock:
+            handle = self._pending.get(key)
+        return handle is not None and self._cancel_handle(handle)
+
+    def cancel_all(self) -> int:
+        """Cancel everything still pending. Returns the number cancelled."""
+        with self._lock:
+            handles = list(self._pending.values())
+        return sum(1 for handle in handles if self._cancel_handle(handle))
+
+    def _cancel_handle(self, handle: TicklerHandle) -> bool:
+        with self._lock:
+            if handle.state == "pending":
+                handle.state = "cancelled"
+                if self._pending.get(handle.key) is handle:
+                    del self._pending[handle.key]
+                self.cancelled += 1
+                handle._done.set()
+                logger.debug(f"[TICKLER] Cancelled {handle.tickler}")
+            return handle.state == "cancelled"
+
+    def pending(self) -> List[str]:
+        """Pending ticklers in execution order (repr)."""
+        with self._lock:
+            live = sorted((entry for entry in self._heap if entry[1].state == "pending"), key=lambda e: e[0])
+            seen, order = set(), []
+            for _, handle in live:
+                if id(handle) not in seen:
+                    seen.add(id(handle))
+                    order.append(repr(handle.tickler))
+            return order
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            depth = len(self._pending)
+            running = self._running
+        latency = self.latency.stats()
+        return {
+            "queue_depth": depth,
+            "running": running,
+            "submitted": self.submitted,
+            "deduplicated": self.deduplicated,
+            "completed": self.completed,
+            "failed": self.failed,
+            "cancelled": self.cancelled,
+            "expired": self.expired,
+            "wait_ms": latency.get("wait"),
+            "run_ms": latency.get("run"),
+        }
+
+    def _next(self) -> Optional[TicklerHandle]:
+        with self._lock:
+            while True:
+                while self._heap:
+                    _, handle = heapq.heappop(self._heap)
+                    if handle.state != "pending" or self._pending.get(handle.key) is not handle:
+                        continue  # cancelled, or a stale entry of a requeued handle
+                    del self._pending[handle.key]
+                    if handle.deadline is not None and time.monotonic() > handle.deadline:
+                        handle.state = "expired"
+                        handle._done.set()
+                        self.expired += 1
+                        logger.warning(f"[TICKLER] Dropping {handle.tickler}: deadline passed before it could run")
+                        continue
+                    handle.state = "running"
+                    self._running += 1
+                    return handle
+                if self._stopping:
+                    return None
+                self._cond.wait()
+
+    def _run(self) -> None:
+        while True:
+            handle = self._next()
+            if handle is None:
+                return
+            started = time.monotonic()
+            self.latency.record("wait", (started - handle.submitted_at) * 1000.0)
+            try:
+                handle.tickler.run(self.dj_engine)
+                handle.state = "done"
+            except Exception as e:
+                handle.state = "failed"
+                logger.error(f"[TICKLER] Error executing {handle.tickler}: {e}")
+            finally:
+                self.latency.record("run", (time.monotonic() - started) * 1000.0)
+                with self._lock:
+                    self._running -= 1
+                    if handle.state == "done":
+                        self.completed += 1
+                    else:
+                        self.failed += 1
+                handle._done.set()
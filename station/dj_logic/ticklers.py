@@ -33,10 +33,17 @@ class Tickler(ABC):
         """
         pass
     
+    # Executor ordering: lower runs first (see TicklerExecutor)
+    priority: int = 50
+    
     @abstractmethod
     def __repr__(self) -> str:
         """Return string representation of the tickler."""
         pass
+    
+    def dedup_key(self) -> str:
+        """Identical pending ticklers (same key) are executed once."""
+        return repr(self)
 
 
 class GenerateIntroTickler(Tickler):
@@ -47,6 +54,8 @@ class GenerateIntroTickler(Tickler):
     For now, it's a stub that logs the action.
     """
     
+    priority = 10  # needed before the song's next break
+    
     def __init__(self, song_path: str):
         """
         Initialize intro generation tickler.
@@ -77,6 +86,8 @@ class GenerateOutroTickler(Tickler):
     For now, it's a stub that logs the action.
     """
     
+    priority = 10
+    
     def __init__(self, song_path: str):
         """
         Initialize outro generation tickler.
@@ -107,6 +118,8 @@ class RefillGenericIDTickler(Tickler):
     For now, it's a stub that logs the action.
     """
     
+    priority = 90  # pool maintenance, no particular segment waits on it
+    
     def run(self, dj_engine) -> None:
         """
         Refill generic ID assets.
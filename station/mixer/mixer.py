@@ -1,5 +1,10 @@
+import threading
+
 import numpy as np
 
+_INT16_MIN = np.float32(-32768.0)
+_INT16_MAX = np.float32(32767.0)
+
 
 class Mixer:
     """
@@ -9,12 +14,33 @@ class Mixer:
     Station pushes frames as fast as decoder produces them - Tower owns all timing.
     """
 
+    def __init__(self):
+        # Per-thread float32 scratch frame so gain needs no per-frame temporaries
+        self._scratch = threading.local()
+
     def mix(self, frame: np.ndarray, gain: float = 1.0) -> np.ndarray:
+        """
+        Apply gain to an int16 frame.
+        
+        Writable frames (e.g. pooled decoder frames) are modified in place and
+        returned; read-only frames get a new output array.
+        """
         if gain == 1.0:
             return frame
-        # Apply gain in float then clip back to int16
-        out = frame.astype(np.float32) * float(gain)
-        np.clip(out, -32768.0, 32767.0, out=out)
-        return out.astype(np.int16)
-
+        if not frame.flags.writeable:
+            # Apply gain in float then clip back to int16
+            out = frame.astype(np.float32) * float(gain)
+            np.clip(out, -32768.0, 32767.0, out=out)
+            return out.astype(np.int16)
 
+        scratch = getattr(self._scratch, "buf", None)
+        if scratch is None or scratch.shape != frame.shape:
+            scratch = np.empty(frame.shape, dtype=np.float32)
+            self._scratch.buf = scratch
+        # Widen into scratch first: int16 * float32 with out= would allocate a cast buffer
+        np.copyto(scratch, frame)
+        np.multiply(scratch, np.float32(gain), out=scratch)
+        np.minimum(scratch, _INT16_MAX, out=scratch)
+        np.maximum(scratch, _INT16_MIN, out=scratch)
+        np.copyto(frame, scratch, casting="unsafe")
+        return frame
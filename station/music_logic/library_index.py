@@ -0,0 +1,171 @@
+"""
+Persistent, incrementally revalidated directory index for MediaLibrary.
+
+Stores every directory under a music root with its mtime, its .mp3 files
+(size, mtime) and its subdirectories. Revalidation stats each indexed
+directory and re-lists only those whose mtime changed — a directory's mtime
+changes exactly when an entry is added, removed or renamed inside it — so an
+unchanged library costs one stat() per directory instead of a full walk.
+
+Persisted as JSON with the same temp-file + atomic rename as DJStateStore.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_PATH = "/tmp/appalachia_media_library.json"
+INDEX_VERSION = 1
+
+
+@dataclass
+class ScanStats:
+    """Cost of one revalidation pass over a root."""
+    dirs_checked: int = 0
+    dirs_listed: int = 0
+    elapsed_ms: float = 0.0
+
+
+def _is_track(name: str) -> bool:
+    # Match the previous glob("**/*.mp3"): case-sensitive, hidden entries skipped
+    return name.endswith(".mp3") and not name.startswith(".")
+
+
+class LibraryIndex:
+    """
+    Directory-mtime index of .mp3 files under one or more roots.
+
+    Layout per root: {dir_path: {"mtime_ns": int, "files": {name: [size, mtime_ns]},
+    "dirs": [subdir names]}}. Thread-safe; scans may run in the background.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize the index and load it from disk.
+
+        Args:
+            path: JSON index file, or None for an in-memory index
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._roots: Dict[str, Dict[str, dict]] = {}
+        if path:
+            self._load()
+
+    @classmethod
+    def from_env(cls) -> "LibraryIndex":
+        """Build an index persisted at MEDIA_LIBRARY_INDEX_PATH (default under /tmp)."""
+        return cls(path=os.getenv("MEDIA_LIBRARY_INDEX_PATH", DEFAULT_INDEX_PATH))
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.warning(f"[LIBRARY-INDEX] Failed to load {self.path}: {e} - rebuilding")
+            return
+        if data.get("version") != INDEX_VERSION:
+            logger.info("[LIBRARY-INDEX] Index version changed - rebuilding")
+            return
+        self._roots = data.get("roots", {})
+
+    def save(self) -> None:
+        """Persist the index atomically (temp file + rename). Errors are logged, not raised."""
+        if not self.path:
+            return
+        with self._lock:
+            payload = json.dumps({"version": INDEX_VERSION, "roots": self._roots})
+        tmp = self.path + ".tmp"
+        try:
+            with open(tmp, "w") as f:
+                f.write(payload)
+            os.replace(tmp, self.path)
+        except Exception as e:
+            logger.warning(f"[LIBRARY-INDEX] Failed to save {self.path}: {e}")
+            try:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+            except Exception:
+                pass
+
+    def has_root(self, root: str) -> bool:
+        with self._lock:
+            return root in self._roots
+
+    def tracks(self, root: str) -> List[str]:
+        """Sorted track paths under root as last indexed (no filesystem access)."""
+        with self._lock:
+            dirs = self._roots.get(root, {})
+            paths = [os.path.join(d, name) for d, entry in dirs.items() for name in entry["files"]]
+        return sorted(paths)
+
+    def scan(self, root: str) -> ScanStats:
+        """
+        Bring root's index up to date, re-listing only directories whose mtime changed.
+
+        Directories that vanished are dropped with everything under them.
+        """
+        start = time.monotonic()
+        stats = ScanStats()
+        with self._lock:
+            old = dict(self._roots.get(root, {}))
+        new: Dict[str, dict] = {}
+        seen = set()  # (st_dev, st_ino): symlinked directory loops
+
+        pending = [root]
+        while pending:
+            directory = pending.pop()
+            try:
+                st = os.stat(directory)
+            except OSError:
+                continue
+            if (st.st_dev, st.st_ino) in seen:
+                continue
+            seen.add((st.st_dev, st.st_ino))
+            mtime_ns = st.st_mtime_ns
+            stats.dirs_checked += 1
+            cached = old.get(directory)
+            if cached is not None and cached["mtime_ns"] == mtime_ns:
+                entry = cached
+            else:
+                entry = self._list_directory(directory, mtime_ns)
+                if entry is None:
+                    continue
+                stats.dirs_listed += 1
+            new[directory] = entry
+            pending.extend(os.path.join(directory, name) for name in entry["dirs"])
+
+        with self._lock:
+            self._roots[root] = new
+        stats.elapsed_ms = (time.monotonic() - start) * 1000.0
+        return stats
+
+    @staticmethod
+    def _list_directory(directory: str, mtime_ns: int) -> Optional[dict]:
+        files: Dict[str, List[int]] = {}
+        dirs: List[str] = []
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.name.startswith("."):
+                        continue
+                    try:
+                        if entry.is_dir():
+                            dirs.append(entry.name)
+                        elif _is_track(entry.name) and entry.is_file():
+                            st = entry.stat()
+                            files[entry.name] = [st.st_size, st.st_mtime_ns]
+                    except OSError:
+                        continue
+        except OSError as e:
+            logger.warning(f"[LIBRARY-INDEX] Cannot list {directory}: {e}")
+            return None
+        return {"mtime_ns": mtime_ns, "files": files, "dirs": sorted(dirs)}
@@ -1,8 +1,12 @@
-import glob
+import bisect
 import logging
 import os
-from dataclasses import dataclass
-from typing import List, Optional
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Tuple
+
+from station.music_logic.library_index import LibraryIndex
 
 logger = logging.getLogger(__name__)
 
@@ -11,7 +15,7 @@ logger = logging.getLogger(__name__)
 class MediaLibrary:
     """
     Filesystem-backed media library.
-    
+
     Phase 1 requirements:
     - Read REGULAR_MUSIC_PATH and HOLIDAY_MUSIC_PATH from environment
     - Discover only .mp3 files (recursive)
@@ -21,13 +25,39 @@ class MediaLibrary:
       - all_tracks
     - Validate paths exist; raise RuntimeError if missing
     - No rotation/weighting/random choice logic
+
+    Discovery goes through a persisted LibraryIndex: a warm start serves the
+    lists from the index and revalidates in the background
+    (start_background_validation()); a cold start scans once and saves it.
+
+    Updates (revalidate(), apply_changes()) run on background threads. They are
+    serialized by one lock and publish new lists rather than mutating the
+    current ones, so a reader always sees a consistent, unchanging snapshot.
     """
     regular_tracks: List[str]
     holiday_tracks: List[str]
     all_tracks: List[str]
+    index: Optional[LibraryIndex] = field(default=None, repr=False, compare=False)
+    regular_root: Optional[str] = None
+    holiday_root: Optional[str] = None
+    needs_validation: bool = False
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
 
     @classmethod
-    def from_env(cls, regular_env: str = "REGULAR_MUSIC_PATH", holiday_env: str = "HOLIDAY_MUSIC_PATH") -> "MediaLibrary":
+    def from_env(
+        cls,
+        regular_env: str = "REGULAR_MUSIC_PATH",
+        holiday_env: str = "HOLIDAY_MUSIC_PATH",
+        index: Optional[LibraryIndex] = None,
+    ) -> "MediaLibrary":
+        """
+        Load the library for the configured roots.
+
+        Args:
+            regular_env: Env var naming the regular music root
+            holiday_env: Env var naming the holiday music root
+            index: Library index to use (default: LibraryIndex.from_env())
+        """
         regular_path = os.getenv(regular_env)
         holiday_path = os.getenv(holiday_env)
 
@@ -36,19 +66,167 @@ class MediaLibrary:
         if not holiday_path or not os.path.isdir(holiday_path):
             raise RuntimeError(f"HOLIDAY_MUSIC_PATH is missing or not a directory: {holiday_path!r}")
 
-        def discover_mp3s(root: str) -> List[str]:
-            pattern = os.path.join(root, "**", "*.mp3")
-            return sorted(glob.glob(pattern, recursive=True))
+        start = time.monotonic()
+        if index is None:
+            index = LibraryIndex.from_env()
+        cached = index.has_root(regular_path) and index.has_root(holiday_path)
+        if not cached:
+            # Cold start: one full scan, then persisted for next time
+            index.scan(regular_path)
+            index.scan(holiday_path)
+            index.save()
 
-        regular_tracks = discover_mp3s(regular_path)
-        holiday_tracks = discover_mp3s(holiday_path)
+        regular_tracks = index.tracks(regular_path)
+        holiday_tracks = index.tracks(holiday_path)
         all_tracks = regular_tracks + holiday_tracks
+        elapsed_ms = (time.monotonic() - start) * 1000.0
 
         logger.info(
             f"[MediaLibrary] Discovered {len(regular_tracks)} regular tracks in {regular_path} "
-            f"and {len(holiday_tracks)} holiday tracks in {holiday_path}"
+            f"and {len(holiday_tracks)} holiday tracks in {holiday_path} "
+            f"(time_to_index={elapsed_ms:.1f}ms, source={'index' if cached else 'scan'})"
         )
 
-        return cls(regular_tracks=regular_tracks, holiday_tracks=holiday_tracks, all_tracks=all_tracks)
+        return cls(
+            regular_tracks=regular_tracks,
+            holiday_tracks=holiday_tracks,
+            all_tracks=all_tracks,
+            index=index,
+            regular_root=regular_path,
+            holiday_root=holiday_path,
+            needs_validation=cached,
+        )
+
+    def revalidate(self) -> bool:
+        """
+        Revalidate the index against the filesystem and refresh the track lists.
+
+        Changed lists are published as new list objects (see class docstring).
+
+        Returns:
+            True if the track lists changed
+        """
+        if self.index is None:
+            return False
+        start = time.monotonic()
+        # Held across the scan: a filesystem change applied meanwhile would be
+        # overwritten by this scan's older view of the tree
+        with self._lock:
+            regular_stats = self.index.scan(self.regular_root)
+            holiday_stats = self.index.scan(self.holiday_root)
+            regular = self.index.tracks(self.regular_root)
+            holiday = self.index.tracks(self.holiday_root)
+            changed = regular != self.regular_tracks or holiday != self.holiday_tracks
+            if changed:
+                self._publish_locked(regular, holiday)
+            if changed or regular_stats.dirs_listed or holiday_stats.dirs_listed:
+                self.index.save()
+            self.needs_validation = False
+        logger.info(
+            f"[MediaLibrary] Revalidated in {(time.monotonic() - start) * 1000.0:.1f}ms "
+            f"(dirs_checked={regular_stats.dirs_checked + holiday_stats.dirs_checked}, "
+            f"dirs_listed={regular_stats.dirs_listed + holiday_stats.dirs_listed}, changed={changed}, "
+            f"regular={len(self.regular_tracks)}, holiday={len(self.holiday_tracks)})"
+        )
+        return changed
+
+    def _publish_locked(self, regular: List[str], holiday: List[str]) -> None:
+        # all_tracks last: each attribute is a complete list at every moment
+        self.regular_tracks = regular
+        self.holiday_tracks = holiday
+        self.all_tracks = regular + holiday
+
+    def _list_for(self, path: str, regular: List[str], holiday: List[str]) -> Optional[List[str]]:
+        """Track list a path belongs to, or None if it is not a track under a root."""
+        for root, tracks in ((self.regular_root, regular), (self.holiday_root, holiday)):
+            if not root:
+                continue
+            prefix = root.rstrip(os.sep) + os.sep
+            if path.startswith(prefix):
+                rel_parts = path[len(prefix):].split(os.sep)
+                if any(part.startswith(".") for part in rel_parts):
+                    return None
+                return tracks
+        return None
+
+    def apply_changes(self, changes: List[Tuple[str, str, bool]]) -> bool:
+        """
+        Apply filesystem changes incrementally (lists stay sorted).
+
+        The batch is applied to copies, published together (see class docstring).
+
+        Args:
+            changes: (kind, path, is_dir) tuples; kind is "added" or "removed".
+                     Removing a directory drops every track under it.
+
+        Returns:
+            True if the track lists changed
+        """
+        with self._lock:
+            regular, holiday = list(self.regular_tracks), list(self.holiday_tracks)
+            changed = False
+            for kind, path, is_dir in changes:
+                if self._apply_change_locked(kind, path, is_dir, regular, holiday):
+                    changed = True
+            if changed:
+                self._publish_locked(regular, holiday)
+                logger.info(
+                    f"[MediaLibrary] Applied {len(changes)} filesystem change(s): "
+                    f"regular={len(regular)}, holiday={len(holiday)}"
+                )
+        return changed
+
+    def _apply_change_locked(self, kind: str, path: str, is_dir: bool,
+                             regular: List[str], holiday: List[str]) -> bool:
+        """Apply one change to the working copies. True only if a list changed."""
+        if is_dir:
+            if kind != "removed":
+                return False  # files inside a new directory arrive as their own events
+            prefix = path.rstrip(os.sep) + os.sep
+            changed = False
+            for tracks in (regular, holiday):
+                kept = [t for t in tracks if not t.startswith(prefix)]
+                if len(kept) != len(tracks):
+                    tracks[:] = kept
+                    changed = True
+            return changed
+        if not path.endswith(".mp3"):
+            return False
+        tracks = self._list_for(path, regular, holiday)
+        if tracks is None:
+            return False
+        i = bisect.bisect_left(tracks, path)
+        present = i < len(tracks) and tracks[i] == path
+        if kind == "added":
+            if present:
+                return False  # already listed (e.g. rewritten in place)
+            tracks.insert(i, path)
+            return True
+        if kind == "removed" and present:
+            del tracks[i]
+            return True
+        return False
+
+    def start_background_validation(self, on_change: Optional[Callable[["MediaLibrary"], None]] = None) -> Optional[threading.Thread]:
+        """
+        Revalidate a library served from the index without blocking startup.
+
+        Args:
+            on_change: Called with this library if the track lists changed
+
+        Returns:
+            The validation thread, or None if no validation is needed
+        """
+        if not self.needs_validation:
+            return None
 
+        def _validate():
+            try:
+                if self.revalidate() and on_change:
+                    on_change(self)
+            except Exception as e:
+                logger.error(f"[MediaLibrary] Background validation failed: {e}", exc_info=True)
 
+        thread = threading.Thread(target=_validate, name="library-validate", daemon=True)
+        thread.start()
+        return thread
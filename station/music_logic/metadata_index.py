@@ -0,0 +1,372 @@
+"""
+Persistent media metadata index for Appalachia Radio 3.1.
+
+Caches per-file metadata (duration, tags, sample rate, channel count) keyed by
+path + size + mtime so THINK and playout never fork ffprobe for a file that
+has already been probed. Entries are held in memory for O(1) lookups and
+persisted to SQLite so the index survives restarts.
+
+The index is filled lazily on lookup and by a background warm-up pass over the
+library started by Station.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import subprocess
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from station.music_logic.mp3_probe import probe_mp3
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_PATH = "/tmp/appalachia_media_metadata.db"
+
+# Bumped when the stored fields change; older databases are rebuilt
+SCHEMA_VERSION = 1
+
+# Warm-up commits to SQLite every N probed files
+WARMUP_COMMIT_EVERY = 100
+
+METADATA_FIELDS = ("title", "artist", "album", "duration", "sample_rate", "channels")
+
+
+def empty_metadata() -> Dict[str, Any]:
+    """Metadata dict with every field set to None."""
+    return {field: None for field in METADATA_FIELDS}
+
+
+def probe_ffprobe(file_path: str, timeout: float = 1.0) -> Optional[Dict[str, Any]]:
+    """
+    Probe a file with a single ffprobe call.
+
+    Returns:
+        Metadata dict (missing fields None), or None if ffprobe failed
+    """
+    cmd = [
+        "ffprobe",
+        "-v", "error",
+        "-select_streams", "a:0",
+        "-show_entries",
+        "format=duration:format_tags=title,artist,album:stream=sample_rate,channels",
+        "-of", "json",
+        file_path,
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+        return None
+    if result.returncode != 0 or not result.stdout.strip():
+        return None
+
+    try:
+        data = json.loads(result.stdout)
+    except (json.JSONDecodeError, ValueError):
+        return None
+
+    metadata = empty_metadata()
+    format_info = data.get("format", {})
+    try:
+        if format_info.get("duration"):
+            metadata["duration"] = float(format_info["duration"])
+    except ValueError:
+        pass
+    tags = format_info.get("tags", {})
+    for field in ("title", "artist", "album"):
+        if field in tags:
+            metadata[field] = tags[field]
+    streams = data.get("streams") or []
+    if streams:
+        stream = streams[0]
+        try:
+            if stream.get("sample_rate"):
+                metadata["sample_rate"] = int(stream["sample_rate"])
+            if stream.get("channels"):
+                metadata["channels"] = int(stream["channels"])
+        except ValueError:
+            pass
+    return metadata
+
+
+def probe_media(file_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Probe a file in-process when possible (MP3 headers/tags), else with ffprobe.
+
+    ffprobe runs only for non-MP3 files and MP3s that fail header validation.
+    """
+    if file_path.lower().endswith(".mp3"):
+        metadata = probe_mp3(file_path)
+        if metadata is not None:
+            return metadata
+        logger.debug(f"[METADATA-INDEX] In-process probe failed, falling back to ffprobe: {file_path}")
+    return probe_ffprobe(file_path)
+
+
+class MediaMetadataIndex:
+    """
+    Metadata cache keyed by (path, size, mtime_ns), persisted to SQLite.
+
+    get() is an in-memory dict lookup plus one stat(); lookup() falls back to
+    probing (and records the result) on a miss. A stale entry (file replaced or
+    touched) counts as a miss. Failed probes are not cached so they are retried.
+
+    Thread-safe: THINK, playout and the warm-up worker share one instance.
+    """
+
+    def __init__(self, path: Optional[str] = None, prober=probe_media):
+        """
+        Initialize the index and load persisted entries.
+
+        Args:
+            path: SQLite database path, or None for an in-memory index
+            prober: Callable(path) -> metadata dict or None (default: probe_media)
+        """
+        self.path = path
+        self._prober = prober
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+        self._conn: Optional[sqlite3.Connection] = None
+        self._warmup_thread: Optional[threading.Thread] = None
+        self._warmup_stop = threading.Event()
+        self._warmup_lock = threading.Lock()
+        self._warmup_running = False
+        # Paths queued for the warm-up thread (dict as an ordered set)
+        self._warmup_pending: Dict[str, None] = {}
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+        self.probes = 0
+        self.probe_failures = 0
+        self.probe_ms_total = 0.0
+
+        if path:
+            self._open(path)
+
+    @classmethod
+    def from_env(cls) -> "MediaMetadataIndex":
+        """Build an index persisted at MEDIA_METADATA_INDEX_PATH (default under /tmp)."""
+        return cls(path=os.getenv("MEDIA_METADATA_INDEX_PATH", DEFAULT_INDEX_PATH))
+
+    def _open(self, path: str) -> None:
+        start = time.monotonic()
+        try:
+            conn = sqlite3.connect(path, check_same_thread=False)
+            if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS metadata")
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS metadata ("
+                "path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, "
+                "title TEXT, artist TEXT, album TEXT, duration REAL, "
+                "sample_rate INTEGER, channels INTEGER)"
+            )
+            conn.commit()
+            rows = conn.execute(
+                "SELECT path, size, mtime_ns, title, artist, album, duration, sample_rate, channels FROM metadata"
+            ).fetchall()
+        except sqlite3.Error as e:
+            # Index is an optimisation - fall back to memory-only
+            logger.warning(f"[METADATA-INDEX] Cannot open {path}: {e} - using in-memory index")
+            self.path = None
+            return
+
+        self._conn = conn
+        for path_, size, mtime_ns, title, artist, album, duration, sample_rate, channels in rows:
+            self._entries[path_] = (size, mtime_ns, {
+                "title": title,
+                "artist": artist,
+                "album": album,
+                "duration": duration,
+                "sample_rate": sample_rate,
+                "channels": channels,
+            })
+        logger.info(
+            f"[METADATA-INDEX] Loaded {len(rows)} entries from {path} "
+            f"in {(time.monotonic() - start) * 1000.0:.1f}ms"
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _stat_key(file_path: str) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        return st.st_size, st.st_mtime_ns
+
+    def get(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """Return cached metadata if the file is unchanged since it was indexed, else None."""
+        entry = self._entries.get(file_path)
+        if entry is None:
+            return None
+        key = self._stat_key(file_path)
+        if key is None or key != entry[:2]:
+            return None
+        return dict(entry[2])
+
+    def lookup(self, file_path: str) -> Dict[str, Any]:
+        """
+        Return metadata for file_path, probing and indexing it on a miss.
+
+        Returns:
+            Metadata dict (fields None when unknown; never raises)
+        """
+        cached = self.get(file_path)
+        if cached is not None:
+            self.hits += 1
+            return cached
+        self.misses += 1
+        metadata = self._probe_and_store(file_path, commit=True)
+        return metadata if metadata is not None else empty_metadata()
+
+    def _probe_and_store(self, file_path: str, commit: bool) -> Optional[Dict[str, Any]]:
+        key = self._stat_key(file_path)
+        if key is None:
+            return None
+        start = time.monotonic()
+        metadata = self._prober(file_path)
+        self.probe_ms_total += (time.monotonic() - start) * 1000.0
+        self.probes += 1
+        if metadata is None:
+            self.probe_failures += 1
+            return None
+        self.put(file_path, key[0], key[1], metadata, commit=commit)
+        return dict(metadata)
+
+    def put(self, file_path: str, size: int, mtime_ns: int, metadata: Dict[str, Any], commit: bool = True) -> None:
+        """Record metadata for file_path at (size, mtime_ns)."""
+        record = {field: metadata.get(field) for field in METADATA_FIELDS}
+        with self._lock:
+            self._entries[file_path] = (size, mtime_ns, record)
+            if self._conn is None:
+                return
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO metadata VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (file_path, size, mtime_ns, record["title"], record["artist"], record["album"],
+                     record["duration"], record["sample_rate"], record["channels"]),
+                )
+                if commit:
+                    self._conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"[METADATA-INDEX] Failed to persist {file_path}: {e}")
+
+    def _commit(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"[METADATA-INDEX] Commit failed: {e}")
+
+    def warm(self, paths: Iterable[str]) -> int:
+        """
+        Probe every path that is missing or stale (runs on the caller's thread).
+
+        Returns:
+            Number of files probed
+        """
+        start = time.monotonic()
+        probed = 0
+        for file_path in paths:
+            if self._warmup_stop.is_set():
+                break
+            if self.get(file_path) is not None:
+                continue
+            self._probe_and_store(file_path, commit=False)
+            probed += 1
+            if probed % WARMUP_COMMIT_EVERY == 0:
+                self._commit()
+        self._commit()
+        logger.info(
+            f"[METADATA-INDEX] Warm-up complete: probed={probed}, entries={len(self)}, "
+            f"elapsed={time.monotonic() - start:.1f}s"
+        )
+        return probed
+
+    def start_warmup(self, paths: Iterable[str]) -> None:
+        """
+        Warm the index on a background thread (never blocks THINK or playout).
+
+        While a warm-up is running, the paths are queued for it rather than
+        dropped, so files added to the library meanwhile are still warmed.
+        """
+        with self._warmup_lock:
+            self._warmup_pending.update(dict.fromkeys(paths))
+            if self._warmup_running:
+                return
+            self._warmup_running = True
+            self._warmup_stop.clear()
+            self._warmup_thread = threading.Thread(
+                target=self._run_warmup, name="metadata-warmup", daemon=True
+            )
+            self._warmup_thread.start()
+
+    def _run_warmup(self) -> None:
+        while True:
+            with self._warmup_lock:
+                paths = list(self._warmup_pending)
+                self._warmup_pending.clear()
+                if not paths or self._warmup_stop.is_set():
+                    # Under the lock: start_warmup() either queued before this
+                    # check or sees the thread finishing and starts a new one
+                    self._warmup_running = False
+                    return
+            self.warm(paths)
+
+    def close(self) -> None:
+        """Stop warm-up and close the database. Idempotent."""
+        self._warmup_stop.set()
+        with self._warmup_lock:
+            thread = self._warmup_thread
+        if thread and thread is not threading.current_thread():
+            thread.join(timeout=5.0)
+        self._warmup_thread = None
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.commit()
+                    self._conn.close()
+                except sqlite3.Error:
+                    pass
+                self._conn = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count, hit/miss counts and probe cost."""
+        return {
+            "entries": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "probes": self.probes,
+            "probe_failures": self.probe_failures,
+            "probe_ms_avg": (self.probe_ms_total / self.probes) if self.probes else 0.0,
+        }
+
+
+_default_index: Optional[MediaMetadataIndex] = None
+_default_index_lock = threading.Lock()
+
+
+def get_metadata_index() -> MediaMetadataIndex:
+    """Process-wide index (in-memory until Station installs a persistent one)."""
+    global _default_index
+    if _default_index is None:
+        with _default_index_lock:
+            if _default_index is None:
+                _default_index = MediaMetadataIndex()
+    return _default_index
+
+
+def set_metadata_index(index: Optional[MediaMetadataIndex]) -> None:
+    """Install the process-wide index (None resets to a fresh in-memory index on next use)."""
+    global _default_index
+    with _default_index_lock:
+        _default_index = index
@@ -0,0 +1,288 @@
+"""
+In-process MP3 probe for Appalachia Radio 3.1.
+
+Reads the head and tail of an MP3 with positioned reads (no decoding, no
+subprocess) and derives the same metadata MediaMetadataIndex gets from
+ffprobe: duration, title/artist/album, sample rate and channel count.
+
+- ID3v2 (2.2/2.3/2.4) text frames at the head, ID3v1 at the tail
+- First MPEG audio frame header for version/layer/sample rate/channels
+- Xing/Info or VBRI header for an exact frame count; otherwise CBR from
+  audio byte length and bitrate
+
+Files that do not validate (no sync, inconsistent second frame, empty VBR
+header) return None so the caller can fall back to ffprobe.
+"""
+
+import os
+import struct
+from typing import Any, Dict, Optional, Tuple
+
+HEAD_BYTES = 16 * 1024
+TAIL_BYTES = 128  # ID3v1
+ID3V1_SIZE = 128
+
+# How far past the ID3v2 tag to search for the first frame sync
+SYNC_SEARCH_BYTES = 8 * 1024
+
+_MPEG1, _MPEG2, _MPEG25 = 3, 2, 0
+_LAYER1, _LAYER2, _LAYER3 = 3, 2, 1
+
+_SAMPLE_RATES = {
+    _MPEG1: (44100, 48000, 32000),
+    _MPEG2: (22050, 24000, 16000),
+    _MPEG25: (11025, 12000, 8000),
+}
+
+# kbps, indexed by bitrate index (0 = free format, 15 = invalid)
+_BITRATES_V1 = {
+    _LAYER1: (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    _LAYER2: (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    _LAYER3: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+}
+_BITRATES_V2 = {
+    _LAYER1: (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    _LAYER2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    _LAYER3: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+
+_ID3V2_TEXT_FRAMES = {
+    b"TIT2": "title", b"TPE1": "artist", b"TALB": "album",
+    b"TT2": "title", b"TP1": "artist", b"TAL": "album",
+}
+
+
+class FrameHeader:
+    """Decoded 4-byte MPEG audio frame header."""
+
+    __slots__ = ("version", "layer", "bitrate_kbps", "sample_rate", "padding", "channels", "mono")
+
+    def __init__(self, version: int, layer: int, bitrate_kbps: int, sample_rate: int, padding: int, mono: bool):
+        self.version = version
+        self.layer = layer
+        self.bitrate_kbps = bitrate_kbps
+        self.sample_rate = sample_rate
+        self.padding = padding
+        self.mono = mono
+        self.channels = 1 if mono else 2
+
+    @property
+    def samples_per_frame(self) -> int:
+        if self.layer == _LAYER1:
+            return 384
+        if self.layer == _LAYER3 and self.version != _MPEG1:
+            return 576
+        return 1152
+
+    @property
+    def frame_length(self) -> int:
+        if self.layer == _LAYER1:
+            return (12 * self.bitrate_kbps * 1000 // self.sample_rate + self.padding) * 4
+        return self.samples_per_frame // 8 * self.bitrate_kbps * 1000 // self.sample_rate + self.padding
+
+    @property
+    def side_info_length(self) -> int:
+        """Layer III side info size (Xing header follows it)."""
+        if self.version == _MPEG1:
+            return 17 if self.mono else 32
+        return 9 if self.mono else 17
+
+
+def parse_frame_header(data: bytes, offset: int) -> Optional[FrameHeader]:
+    """Decode the frame header at offset, or None if it is not a valid header."""
+    if offset + 4 > len(data):
+        return None
+    b0, b1, b2, b3 = data[offset], data[offset + 1], data[offset + 2], data[offset + 3]
+    if b0 != 0xFF or (b1 & 0xE0) != 0xE0:
+        return None
+    version = (b1 >> 3) & 0x3
+    layer = (b1 >> 1) & 0x3
+    bitrate_index = (b2 >> 4) & 0xF
+    sample_rate_index = (b2 >> 2) & 0x3
+    if version == 1 or layer == 0 or bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None  # reserved, free format or invalid
+    table = _BITRATES_V1 if version == _MPEG1 else _BITRATES_V2
+    return FrameHeader(
+        version=version,
+        layer=layer,
+        bitrate_kbps=table[layer][bitrate_index],
+        sample_rate=_SAMPLE_RATES[version][sample_rate_index],
+        padding=(b2 >> 1) & 0x1,
+        mono=((b3 >> 6) & 0x3) == 3,
+    )
+
+
+def _syncsafe(data: bytes) -> int:
+    return (data[0] << 21) | (data[1] << 14) | (data[2] << 7) | data[3]
+
+
+def _decode_text(payload: bytes) -> Optional[str]:
+    if not payload:
+        return None
+    encoding, raw = payload[0], payload[1:]
+    try:
+        if encoding == 0:
+            text = raw.decode("latin-1")
+        elif encoding == 1:
+            text = raw.decode("utf-16")
+        elif encoding == 2:
+            text = raw.decode("utf-16-be")
+        elif encoding == 3:
+            text = raw.decode("utf-8")
+        else:
+            return None
+    except UnicodeDecodeError:
+        return None
+    # Multiple values are NUL-separated; keep the first
+    text = text.split("\x00", 1)[0].strip()
+    return text or None
+
+
+def parse_id3v2(head: bytes) -> Tuple[int, Dict[str, str]]:
+    """
+    Parse an ID3v2 tag at the start of head.
+
+    Returns:
+        (total tag length in bytes, tags found). Frames beyond head are skipped.
+    """
+    if len(head) < 10 or head[:3] != b"ID3":
+        return 0, {}
+    major, flags = head[3], head[5]
+    tag_size = 10 + _syncsafe(head[6:10]) + (10 if flags & 0x10 else 0)
+    if major not in (2, 3, 4) or flags & 0x80:
+        # Unknown version or unsynchronised tag: skip it, use ID3v1 tags if present
+        return tag_size, {}
+
+    tags: Dict[str, str] = {}
+    pos = 10
+    if flags & 0x40 and major in (3, 4):
+        ext = head[10:14]
+        if len(ext) < 4:
+            return tag_size, tags
+        pos += _syncsafe(ext) if major == 4 else 4 + struct.unpack(">I", ext)[0]
+
+    end = min(tag_size, len(head))
+    id_len, header_len = (3, 6) if major == 2 else (4, 10)
+    while pos + header_len <= end:
+        frame_id = head[pos:pos + id_len]
+        if frame_id[0] == 0:
+            break  # padding
+        size_bytes = head[pos + id_len:pos + id_len + (3 if major == 2 else 4)]
+        if major == 2:
+            size = (size_bytes[0] << 16) | (size_bytes[1] << 8) | size_bytes[2]
+        elif major == 4:
+            size = _syncsafe(size_bytes)
+        else:
+            size = struct.unpack(">I", size_bytes)[0]
+        payload_start = pos + header_len
+        if size <= 0 or payload_start + size > end:
+            break
+        field = _ID3V2_TEXT_FRAMES.get(frame_id)
+        if field and field not in tags:
+            value = _decode_text(head[payload_start:payload_start + size])
+            if value:
+                tags[field] = value
+        pos = payload_start + size
+    return tag_size, tags
+
+
+def parse_id3v1(tail: bytes) -> Dict[str, str]:
+    """Parse a 128-byte ID3v1 tag (title/artist/album)."""
+    if len(tail) < ID3V1_SIZE or tail[-ID3V1_SIZE:-ID3V1_SIZE + 3] != b"TAG":
+        return {}
+    tag = tail[-ID3V1_SIZE:]
+    tags = {}
+    for field, start in (("title", 3), ("artist", 33), ("album", 63)):
+        value = tag[start:start + 30].split(b"\x00", 1)[0].decode("latin-1").strip()
+        if value:
+            tags[field] = value
+    return tags
+
+
+def _vbr_frame_count(data: bytes, offset: int, header: FrameHeader) -> Optional[int]:
+    """Frame count from a Xing/Info or VBRI header in the first frame, if present."""
+    xing = offset + 4 + header.side_info_length
+    if data[xing:xing + 4] in (b"Xing", b"Info") and len(data) >= xing + 12:
+        flags = struct.unpack(">I", data[xing + 4:xing + 8])[0]
+        if flags & 0x1:
+            return struct.unpack(">I", data[xing + 8:xing + 12])[0]
+    vbri = offset + 4 + 32
+    if data[vbri:vbri + 4] == b"VBRI" and len(data) >= vbri + 18:
+        return struct.unpack(">I", data[vbri + 14:vbri + 18])[0]
+    return None
+
+
+def _find_first_frame(data: bytes, start: int) -> Optional[Tuple[int, FrameHeader]]:
+    """First offset >= start with a valid header whose successor (if in data) agrees."""
+    limit = min(len(data) - 4, start + SYNC_SEARCH_BYTES)
+    pos = data.find(b"\xff", start)
+    while 0 <= pos <= limit:
+        header = parse_frame_header(data, pos)
+        if header is not None:
+            nxt = pos + header.frame_length
+            following = parse_frame_header(data, nxt) if nxt + 4 <= len(data) else header
+            if following is not None and (
+                following.version, following.layer, following.sample_rate
+            ) == (header.version, header.layer, header.sample_rate):
+                return pos, header
+        pos = data.find(b"\xff", pos + 1)
+    return None
+
+
+def probe_mp3(file_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Probe an MP3 without decoding.
+
+    Returns:
+        Metadata dict (title, artist, album, duration, sample_rate, channels),
+        or None if the file cannot be read or does not validate as MPEG audio
+    """
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        file_size = os.fstat(fd).st_size
+        head = os.pread(fd, HEAD_BYTES, 0)
+        tag_size, tags = parse_id3v2(head)
+        if tag_size + 4 > len(head):
+            # Large ID3v2 (embedded art): read the audio start separately
+            audio_head = os.pread(fd, HEAD_BYTES, tag_size)
+            base = tag_size
+        else:
+            audio_head = head
+            base = 0
+        tail = os.pread(fd, TAIL_BYTES, max(0, file_size - TAIL_BYTES)) if file_size >= TAIL_BYTES else b""
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
+    found = _find_first_frame(audio_head, tag_size - base)
+    if found is None:
+        return None
+    offset, header = found
+
+    id3v1 = parse_id3v1(tail)
+    for field, value in id3v1.items():
+        tags.setdefault(field, value)
+
+    frames = _vbr_frame_count(audio_head, offset, header)
+    if frames is not None:
+        if frames <= 0:
+            return None
+        duration = frames * header.samples_per_frame / header.sample_rate
+    else:
+        audio_bytes = file_size - (base + offset) - (ID3V1_SIZE if id3v1 else 0)
+        if audio_bytes <= 0:
+            return None
+        duration = audio_bytes * 8 / (header.bitrate_kbps * 1000)
+
+    return {
+        "title": tags.get("title"),
+        "artist": tags.get("artist"),
+        "album": tags.get("album"),
+        "duration": duration,
+        "sample_rate": header.sample_rate,
+        "channels": header.channels,
+    }
@@ -11,19 +11,29 @@ Uses weighted selection algorithm based on legacy playlist manager:
 - Play count balance
 - Holiday season weighting
 
+Per-track features (play count, position/time of last play within history,
+holiday flag) are kept in numpy arrays aligned with a track table and updated
+in O(1) per play, so weighting every candidate is one vectorized expression
+and the draw is a cumulative-sum search. _calculate_weights() is the scalar
+reference the vectorized path must match.
+
 Architecture 3.1 Reference:
 - Section 2.1: The DJ Is the Brain (selects songs)
 - Section 4.3: DJ Prep Window Behavior (chooses next song)
 """
 
-import json
 import logging
 import os
 import random
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from station.state.state_journal import StateJournal
 
 logger = logging.getLogger(__name__)
 
@@ -55,19 +65,48 @@ class RotationManager:
             regular_tracks: List of regular song filepaths (optional, can be set later)
             holiday_tracks: List of holiday song filepaths (optional, can be set later)
             state_file: Optional path to JSON file for saving/loading state
+                        (snapshot; plays are journaled to state_file + ".journal")
         """
-        # Store track lists for reference (used when selecting from all available tracks)
-        self._regular_tracks: List[str] = list(regular_tracks or [])
-        self._holiday_tracks: List[str] = list(holiday_tracks or [])
+        self._lock = threading.RLock()
+        self._holiday_flags: Dict[str, bool] = {}  # filepath -> cached _is_holiday_track()
+        
+        # Track table: per-track feature arrays aligned with _table_paths
+        self._table_paths: List[str] = []
+        self._table_index: Dict[str, int] = {}
+        self._table_is_holiday = np.zeros(0, dtype=bool)
+        self._table_plays = np.zeros(0, dtype=np.float64)
+        self._table_last_seq = np.zeros(0, dtype=np.int64)  # -1 = not in history
+        self._table_last_time = np.zeros(0, dtype=np.float64)
+        self._table_regular_idx = np.zeros(0, dtype=np.int64)
+        self._table_holiday_idx = np.zeros(0, dtype=np.int64)
+        
+        # History bookkeeping: entries are numbered by _history_seq; a track's
+        # position in history is _history_seq - 1 - last_played_index[path]
+        self.last_played_index: Dict[str, int] = {}
+        self._history_seq = 0
+        self._play_total = 0
+        self._holiday_play_total = 0
         
         # History tracking: (filepath, timestamp, is_holiday) tuples
-        self.history: List[Tuple[str, float, bool]] = []
+        self._history: List[Tuple[str, float, bool]] = []
         
         # Play counts: track filepath -> play count
-        self.play_counts: dict[str, int] = {}  # Regular songs
-        self.holiday_play_counts: dict[str, int] = {}  # Holiday songs
+        self._play_counts: Dict[str, int] = {}  # Regular songs
+        self._holiday_play_counts: Dict[str, int] = {}  # Holiday songs
+        
+        # Store track lists for reference (used when selecting from all available tracks)
+        self._regular_tracks: List[str] = list(regular_tracks or [])
+        self._holiday_tracks: List[str] = list(holiday_tracks or [])
+        self._build_table(self._regular_tracks + self._holiday_tracks)
+        
+        # Called with the path after each recorded play, or None when the track
+        # lists, history or play counts are replaced (see add_listener())
+        self._listeners: List[Callable[[Optional[str]], None]] = []
         
         self.state_file: Optional[str] = state_file
+        self._journal: Optional[StateJournal] = (
+            StateJournal(state_file, apply_record=self._apply_journal_record) if state_file else None
+        )
         
         # Load saved state if available
         if self.state_file:
@@ -75,6 +114,104 @@ class RotationManager:
         
         logger.info(f"RotationManager initialized with {len(self._regular_tracks)} regular and {len(self._holiday_tracks)} holiday tracks")
     
+    def set_tracks(self, regular_tracks: List[str], holiday_tracks: List[str]) -> None:
+        """
+        Replace the track lists (e.g. after the media library is revalidated).
+        
+        History and play counts are kept; removed tracks simply stop being selectable.
+        
+        Args:
+            regular_tracks: List of regular song filepaths
+            holiday_tracks: List of holiday song filepaths
+        """
+        with self._lock:
+            self._regular_tracks = list(regular_tracks)
+            self._holiday_tracks = list(holiday_tracks)
+            self._build_table(self._regular_tracks + self._holiday_tracks)
+            self._notify(None)
+        logger.info(f"RotationManager track lists updated: {len(self._regular_tracks)} regular, {len(self._holiday_tracks)} holiday")
+    
+    # History and play counts may be replaced wholesale (load_state, DJEngine
+    # warm start); the setters rebuild the derived per-track features.
+    
+    @property
+    def history(self) -> List[Tuple[str, float, bool]]:
+        return self._history
+    
+    @history.setter
+    def history(self, value: List[Tuple[str, float, bool]]) -> None:
+        with self._lock:
+            self._history = list(value)
+            self._rebuild_history_features()
+            self._notify(None)
+    
+    @property
+    def play_counts(self) -> Dict[str, int]:
+        return self._play_counts
+    
+    @play_counts.setter
+    def play_counts(self, value: Dict[str, int]) -> None:
+        with self._lock:
+            self._play_counts = dict(value)
+            self._rebuild_play_features()
+            self._notify(None)
+    
+    @property
+    def holiday_play_counts(self) -> Dict[str, int]:
+        return self._holiday_play_counts
+    
+    @holiday_play_counts.setter
+    def holiday_play_counts(self, value: Dict[str, int]) -> None:
+        with self._lock:
+            self._holiday_play_counts = dict(value)
+            self._rebuild_play_features()
+            self._notify(None)
+    
+    def _build_table(self, paths: List[str]) -> None:
+        """Rebuild the track table and every per-track feature for these paths."""
+        unique = list(dict.fromkeys(paths))
+        self._table_paths = unique
+        self._table_index = {path: i for i, path in enumerate(unique)}
+        self._table_is_holiday = np.fromiter(
+            (self._is_holiday_track(path) for path in unique), dtype=bool, count=len(unique)
+        )
+        self._table_regular_idx = np.flatnonzero(~self._table_is_holiday)
+        self._table_holiday_idx = np.flatnonzero(self._table_is_holiday)
+        self._rebuild_play_features()
+        self._rebuild_history_features()
+    
+    def _rebuild_play_features(self) -> None:
+        self._play_total = sum(self._play_counts.values())
+        self._holiday_play_total = sum(self._holiday_play_counts.values())
+        self._table_plays = np.fromiter(
+            (
+                (self._holiday_play_counts if is_holiday else self._play_counts).get(path, 0)
+                for path, is_holiday in zip(self._table_paths, self._table_is_holiday)
+            ),
+            dtype=np.float64,
+            count=len(self._table_paths),
+        )
+    
+    def _rebuild_history_features(self) -> None:
+        count = len(self._table_paths)
+        self._table_last_seq = np.full(count, -1, dtype=np.int64)
+        self._table_last_time = np.zeros(count, dtype=np.float64)
+        self.last_played_index = {}
+        self._history_seq = len(self._history)
+        for seq, (path, timestamp, is_holiday) in enumerate(self._history):
+            self._note_history_entry(seq, path, timestamp, is_holiday)
+    
+    def _note_history_entry(self, seq: int, path: str, timestamp: float, is_holiday: bool) -> None:
+        # Weighting matches history entries on (path, is_holiday) against the
+        # track's own classification; entries under the other flag never count
+        if is_holiday != self._is_holiday_track(path):
+            return
+        self.last_played_index[path] = seq
+        i = self._table_index.get(path)
+        if i is not None:
+            self._table_last_seq[i] = seq
+            self._table_last_time[i] = timestamp
+    
     def is_holiday_season(self) -> bool:
         """
         Check if current date is within holiday season.
@@ -137,9 +274,12 @@ class RotationManager:
         Returns:
             True if track appears to be holiday music
         """
-        filepath_lower = filepath.lower()
-        # Check if path contains "holiday" (case-insensitive)
-        return 'holiday' in filepath_lower
+        flag = self._holiday_flags.get(filepath)
+        if flag is None:
+            # Check if path contains "holiday" (case-insensitive)
+            flag = 'holiday' in filepath.lower()
+            self._holiday_flags[filepath] = flag
+        return flag
     
     def _calculate_weights(
         self, regular_tracks: List[str], holiday_tracks: List[str]
@@ -147,6 +287,9 @@ class RotationManager:
         """
         Calculate weighted probabilities for song selection.
         
+        Scalar reference implementation (O(N·H)); selection uses the vectorized
+        _candidate_weights(), which must produce the same weights.
+        
         Implements sophisticated weighting algorithm that considers:
         1. Recent Play Penalty: Songs played recently get reduced weight
         2. Time-Based Bonus: Songs not played in a while get bonus weight
@@ -219,7 +362,55 @@ class RotationManager:
         
         return weights, [t for t, _ in all_tracks], [h for _, h in all_tracks]
     
-    def select_next_song(self, available_tracks: Optional[List[str]] = None) -> str:
+    def _candidate_weights(self, rows: np.ndarray) -> np.ndarray:
+        """
+        Vectorized equivalent of _calculate_weights() for track table rows.
+        
+        All rows must belong to one pool (all regular or all holiday).
+        """
+        current_time = time.time()
+        weights = np.ones(len(rows), dtype=np.float64)
+        if not len(rows):
+            return weights
+        
+        last_seq = self._table_last_seq[rows]
+        position = (self._history_seq - 1) - last_seq  # 0 = most recent
+        played = (last_seq >= 0) & (position < len(self._history))
+        
+        # Queue-like recent play penalty
+        weights[played & (position == 0)] *= IMMEDIATE_REPEAT_PENALTY
+        recent = played & (position > 0) & (position < RECENT_PLAY_WINDOW)
+        recovery = position[recent] / RECENT_PLAY_WINDOW
+        weights[recent] *= np.clip(RECENT_PLAY_BASE_PENALTY + (1.0 - RECENT_PLAY_BASE_PENALTY) * recovery, 0.05, 1.0)
+        
+        # Time-based bonus for songs not played in a while (age weighting)
+        last_time = self._table_last_time[rows]
+        hours_since_played = (current_time - last_time) / 3600
+        aged = played & (last_time != 0) & (hours_since_played > 1)
+        weights[aged] *= np.minimum(MAX_TIME_BONUS, np.sqrt(hours_since_played[aged] / 24))
+        
+        # Song never played - give it a bonus
+        weights[~played] *= NEVER_PLAYED_BONUS
+        
+        # Play count balance - ensure all songs get fair play
+        is_holiday = bool(self._table_is_holiday[rows[0]])
+        total_plays = self._holiday_play_total if is_holiday else self._play_total
+        counted_tracks = len(self._holiday_play_counts if is_holiday else self._play_counts)
+        if total_plays > 0 and counted_tracks > 0:
+            expected_plays = total_plays / counted_tracks
+            weights *= (expected_plays + 1) / (self._table_plays[rows] + 1)
+        
+        return weights
+    
+    def _rows_for(self, tracks: List[str]) -> np.ndarray:
+        """Track table rows for tracks (order and duplicates kept); unknown tracks are added."""
+        unknown = [t for t in dict.fromkeys(tracks) if t not in self._table_index]
+        if unknown:
+            self._build_table(self._table_paths + unknown)
+        index = self._table_index
+        return np.fromiter((index[t] for t in tracks), dtype=np.int64, count=len(tracks))
+    
+    def select_next_song(self, available_tracks: Optional[List[str]] = None, exclude: Optional[str] = None) -> str:
         """
         Select the next song from available tracks using weighted probabilities.
         
@@ -231,6 +422,8 @@ class RotationManager:
         Args:
             available_tracks: Optional list of full filepaths to available MP3 files.
                             If None, uses all tracks from constructor (regular + holiday).
+            exclude: Optional track to leave out (e.g. the current song), unless
+                     it is the only track available
             
         Returns:
             Full filepath to selected song
@@ -238,87 +431,65 @@ class RotationManager:
         Raises:
             ValueError: If no tracks available
         """
-        # If no tracks provided, use all tracks from constructor
-        if available_tracks is None:
-            available_tracks = self._regular_tracks + self._holiday_tracks
-        
-        if not available_tracks:
-            raise ValueError("No tracks available for selection")
-        
-        # Separate regular and holiday tracks
-        regular_tracks = []
-        holiday_tracks = []
-        
-        for track in available_tracks:
-            if self._is_holiday_track(track):
-                holiday_tracks.append(track)
+        with self._lock:
+            # Separate regular and holiday tracks (cached classification)
+            if available_tracks is None:
+                regular_rows = self._table_regular_idx
+                holiday_rows = self._table_holiday_idx
             else:
-                regular_tracks.append(track)
-        
-        # Check holiday season and calculate holiday probability
-        holiday_prob = 0.0
-        if self.is_holiday_season():
-            holiday_prob = self.get_holiday_selection_probability()
-        
-        # Decide if we should select from holiday files
-        use_holiday = False
-        if holiday_tracks and random.random() < holiday_prob:
-            use_holiday = True
-        
-        # Select from appropriate pool
-        if use_holiday:
-            candidate_tracks = holiday_tracks
-        else:
-            candidate_tracks = regular_tracks
-        
-        # If no candidates in selected pool, fall back to other pool
-        # BUT: Only fall back to holiday tracks if it's actually holiday season
-        if not candidate_tracks:
+                rows = self._rows_for(available_tracks)
+                holiday_mask = self._table_is_holiday[rows]
+                regular_rows = rows[~holiday_mask]
+                holiday_rows = rows[holiday_mask]
+            
+            if exclude is not None and exclude in self._table_index:
+                excluded_row = self._table_index[exclude]
+                kept_regular = regular_rows[regular_rows != excluded_row]
+                kept_holiday = holiday_rows[holiday_rows != excluded_row]
+                if len(kept_regular) or len(kept_holiday):
+                    regular_rows, holiday_rows = kept_regular, kept_holiday
+            
+            if not len(regular_rows) and not len(holiday_rows):
+                raise ValueError("No tracks available for selection")
+            
+            # Check holiday season and calculate holiday probability
+            holiday_prob = 0.0
             if self.is_holiday_season():
-                # During holiday season, fallback to holiday tracks if regular empty
-                candidate_tracks = holiday_tracks if not use_holiday else regular_tracks
-            else:
-                # Outside holiday season, NEVER fall back to holiday tracks
-                # If regular tracks are empty, raise error (shouldn't happen in normal operation)
-                if not regular_tracks:
+                holiday_prob = self.get_holiday_selection_probability()
+            
+            # Decide if we should select from holiday files
+            use_holiday = False
+            if len(holiday_rows) and random.random() < holiday_prob:
+                use_holiday = True
+            
+            # Select from appropriate pool
+            pool_rows = holiday_rows if use_holiday else regular_rows
+            
+            # If no candidates in selected pool, fall back to other pool (uniformly)
+            # BUT: Only fall back to holiday tracks if it's actually holiday season
+            if not len(pool_rows):
+                if not self.is_holiday_season():
+                    # Outside holiday season, NEVER fall back to holiday tracks
                     raise ValueError("No regular tracks available and not holiday season - cannot select holiday tracks")
-                candidate_tracks = regular_tracks
-        
-        # Calculate weights for candidate tracks only (exclude holiday tracks outside holiday season)
-        # Per contract: Holiday tracks MUST NOT be selected outside holiday season
-        if use_holiday:
-            # Selecting from holiday pool - calculate weights for holiday tracks only
-            weights, all_tracks, is_holiday_list = self._calculate_weights(
-                regular_tracks=[],
-                holiday_tracks=holiday_tracks
-            )
-        else:
-            # Selecting from regular pool - calculate weights for regular tracks only
-            # Outside holiday season, holiday tracks are completely excluded
-            weights, all_tracks, is_holiday_list = self._calculate_weights(
-                regular_tracks=regular_tracks,
-                holiday_tracks=[]
-            )
-        
-        # Normalize weights to probabilities
-        total_weight = sum(weights)
-        if total_weight > 0:
-            probabilities = [w / total_weight for w in weights]
-        else:
-            probabilities = [1.0 / len(all_tracks)] * len(all_tracks) if all_tracks else []
-        
-        # Select using weighted random
-        if not all_tracks:
-            # Fallback: random selection from candidate pool
-            if not candidate_tracks:
-                raise ValueError("No tracks available for selection")
-            return random.choice(candidate_tracks)
-        
-        selected_index = random.choices(range(len(all_tracks)), weights=probabilities)[0]
-        selected_track = all_tracks[selected_index]
+                fallback_rows = regular_rows if use_holiday else holiday_rows
+                return self._table_paths[int(fallback_rows[random.randrange(len(fallback_rows))])]
+            
+            # Weights for the selected pool only
+            # Per contract: Holiday tracks MUST NOT be selected outside holiday season
+            weights = self._candidate_weights(pool_rows)
+            
+            # Weighted draw: cumulative-sum search (uniform if every weight is zero)
+            cumulative = np.cumsum(weights)
+            total_weight = float(cumulative[-1])
+            if total_weight > 0:
+                k = int(np.searchsorted(cumulative, random.random() * total_weight, side="right"))
+                k = min(k, len(pool_rows) - 1)
+            else:
+                k = random.randrange(len(pool_rows))
+            selected_track = self._table_paths[int(pool_rows[k])]
         
         logger.debug(f"[ROTATION] Selected: {os.path.basename(selected_track)} "
-                    f"(holiday={is_holiday_list[selected_index]}, weight={weights[selected_index]:.3f})")
+                    f"(holiday={use_holiday}, weight={weights[k]:.3f})")
         
         return selected_track
     
@@ -334,23 +505,82 @@ class RotationManager:
         current_time = time.time()
         is_holiday = self._is_holiday_track(song_path)
         
-        # Add to history
-        self.history.append((song_path, current_time, is_holiday))
-        if len(self.history) > HISTORY_SIZE:
-            self.history.pop(0)
-        
-        # Update play counts
-        if is_holiday:
-            self.holiday_play_counts[song_path] = self.holiday_play_counts.get(song_path, 0) + 1
-        else:
-            self.play_counts[song_path] = self.play_counts.get(song_path, 0) + 1
+        with self._lock:
+            # Add to history
+            self._history.append((song_path, current_time, is_holiday))
+            self._note_history_entry(self._history_seq, song_path, current_time, is_holiday)
+            self._history_seq += 1
+            if len(self._history) > HISTORY_SIZE:
+                self._history.pop(0)
+            
+            # Update play counts
+            if is_holiday:
+                self._holiday_play_counts[song_path] = self._holiday_play_counts.get(song_path, 0) + 1
+                self._holiday_play_total += 1
+            else:
+                self._play_counts[song_path] = self._play_counts.get(song_path, 0) + 1
+                self._play_total += 1
+            row = self._table_index.get(song_path)
+            if row is not None:
+                self._table_plays[row] += 1
+            
+            # Journal the play (one small record, fsynced in batches off this thread)
+            if self._journal:
+                self._journal.append({"type": "play", "path": song_path, "ts": current_time, "holiday": is_holiday})
+            
+            # Under the lock, so a fork() never holds a play its listeners have not seen
+            self._notify(song_path)
         
         logger.debug(f"[ROTATION] Recorded play: {os.path.basename(song_path)} "
                     f"(holiday={is_holiday}, total plays={self.play_counts.get(song_path, self.holiday_play_counts.get(song_path, 0))})")
+    
+    def add_listener(self, callback: Callable[[Optional[str]], None]) -> None:
+        """
+        Register a callback for state changes that move the weights.
         
-        # Auto-save state after each update
-        if self.state_file:
-            self.save_state()
+        The callback receives the path after each record_song_played(), or None
+        when track lists, history or play counts are replaced wholesale. It runs
+        on the caller's thread under the rotation lock, so code holding the lock
+        has seen every notification for the state it reads. A callback must not
+        wait for a lock whose holder may in turn wait for the rotation lock.
+        """
+        self._listeners.append(callback)
+    
+    @property
+    def lock(self) -> threading.RLock:
+        """Rotation lock; holding it keeps plays and listener notifications out."""
+        return self._lock
+    
+    def _notify(self, song_path: Optional[str]) -> None:
+        for callback in list(self._listeners):
+            try:
+                callback(song_path)
+            except Exception as e:
+                logger.warning(f"[ROTATION] State listener failed: {e}")
+    
+    def fork(self) -> "RotationManager":
+        """
+        Detached copy for what-if selection (e.g. planning songs ahead).
+        
+        The copy shares nothing mutable with this manager, has no state file,
+        journal or listeners, and can record plays without affecting it.
+        """
+        with self._lock:
+            clone = RotationManager.__new__(RotationManager)
+            clone.__dict__.update(self.__dict__)
+            clone._lock = threading.RLock()
+            clone._holiday_flags = dict(self._holiday_flags)
+            clone._table_plays = self._table_plays.copy()
+            clone._table_last_seq = self._table_last_seq.copy()
+            clone._table_last_time = self._table_last_time.copy()
+            clone.last_played_index = dict(self.last_played_index)
+            clone._history = list(self._history)
+            clone._play_counts = dict(self._play_counts)
+            clone._holiday_play_counts = dict(self._holiday_play_counts)
+            clone._listeners = []
+            clone.state_file = None
+            clone._journal = None
+        return clone
     
     def get_last_played_songs(self, count: int = 10) -> List[str]:
         """
@@ -367,30 +597,38 @@ class RotationManager:
         # Reverse to get most recent first
         return [path for path, _, _ in reversed(recent)]
     
+    @staticmethod
+    def _apply_journal_record(state: dict, record: dict) -> None:
+        """Fold one journaled play into a saved-state dict (snapshot replay/compaction)."""
+        if record.get("type") != "play":
+            return
+        path, is_holiday = record["path"], bool(record.get("holiday"))
+        history = state.setdefault("history", [])
+        history.append([path, record["ts"], is_holiday])
+        del history[:-HISTORY_SIZE]
+        counts = state.setdefault("holiday_play_counts" if is_holiday else "play_counts", {})
+        counts[path] = counts.get(path, 0) + 1
+    
     def save_state(self) -> None:
         """
         Save rotation state (history and play counts) to JSON file.
         
         Preserves weighted playlist state across restarts to prevent
-        immediate repeats after graceful restart.
+        immediate repeats after graceful restart. Writes a full snapshot
+        (atomic rename) and truncates the play journal; individual plays
+        are journaled by record_song_played().
         """
-        if not self.state_file:
+        if not self._journal:
             return
         
         try:
-            state = {
-                "history": self.history,
-                "play_counts": self.play_counts,
-                "holiday_play_counts": self.holiday_play_counts,
-            }
-            
-            # Write to temp file first, then rename (atomic operation)
-            temp_file = self.state_file + ".tmp"
-            with open(temp_file, "w") as f:
-                json.dump(state, f, indent=2)
-            
-            # Atomic rename
-            os.replace(temp_file, self.state_file)
+            with self._lock:
+                state = {
+                    "history": [list(entry) for entry in self.history],
+                    "play_counts": dict(self.play_counts),
+                    "holiday_play_counts": dict(self.holiday_play_counts),
+                }
+                self._journal.snapshot(state)
             
             logger.debug(f"[ROTATION] Saved state to {self.state_file}")
         except Exception as e:
@@ -398,17 +636,18 @@ class RotationManager:
     
     def load_state(self) -> bool:
         """
-        Load rotation state (history and play counts) from JSON file.
+        Load rotation state (history and play counts): snapshot plus journal replay.
         
         Returns:
             True if state was loaded successfully, False otherwise
         """
-        if not self.state_file or not os.path.exists(self.state_file):
+        if not self._journal:
             return False
         
         try:
-            with open(self.state_file, "r") as f:
-                state = json.load(f)
+            state = self._journal.load()
+            if state is None:
+                return False
             
             # Restore state
             self.history = [
@@ -424,3 +663,8 @@ class RotationManager:
         except Exception as e:
             logger.warning(f"[ROTATION] Failed to load state: {e}")
             return False
+    
+    def close(self) -> None:
+        """Flush journaled plays to disk and stop the journal writer."""
+        if self._journal:
+            self._journal.close()
@@ -11,6 +11,8 @@ from .file_sink import FileSink
 from .ffmpeg_sink import FFMPEGSink
 from .tower_pcm_sink import TowerPCMSink
 from .tower_control import TowerControlClient
+from .tower_telemetry import TowerBufferTelemetry
+from .tower_event_sender import TowerEventSender
 from .factory import create_output_sink
 
 __all__ = [
@@ -20,6 +22,8 @@ __all__ = [
     "FFMPEGSink",
     "TowerPCMSink",
     "TowerControlClient",
+    "TowerBufferTelemetry",
+    "TowerEventSender",
     "create_output_sink",
 ]
 
@@ -2,17 +2,30 @@
 Tower Control API Client for Retrowaves Station.
 
 Sends control commands to Tower's HTTP control API (e.g., source switching).
+
+All requests share one pooled keep-alive httpx.Client, so frequent telemetry
+polls and events reuse open connections instead of a TCP handshake each.
 """
 
 import json
 import logging
 import os
-from typing import Optional, Dict, Any
+import threading
+import time
+from typing import Optional, Dict, Any, List
 
 import httpx
 
 logger = logging.getLogger(__name__)
 
+# Connection pool shared by every request of one client
+POOL_MAX_CONNECTIONS = 4
+POOL_KEEPALIVE_EXPIRY_SEC = 30.0
+
+# After falling back to single event posts, try the batch endpoint again this
+# often (Tower may have been upgraded and restarted)
+BATCH_REPROBE_SEC = 300.0
+
 
 class TowerControlClient:
     """
@@ -26,6 +39,9 @@ class TowerControlClient:
     This client is stateless and transport-only. It makes no decisions about
     when to send events - it simply sends whatever it's asked to send.
     Lifecycle state management is handled by Station, not this client.
+    
+    The underlying connection pool is created on first use and is safe to
+    share between threads; close() releases it.
     """
     
     def __init__(self, tower_host: str = "127.0.0.1", tower_port: int = 8005):
@@ -42,12 +58,47 @@ class TowerControlClient:
         self.timeout = 5.0  # 5 second timeout for API calls
         self.buffer_timeout = 0.15  # Short timeout for /tower/buffer telemetry
         
+        # Pooled keep-alive connections (created lazily, see _http())
+        self._client: Optional[httpx.Client] = None
+        self._client_lock = threading.Lock()
+        self.requests = 0
+        
+        # When set (TowerEventSender), send_event() only queues the event
+        self.event_sender = None
+        self.batch_supported = True  # cleared while Tower has no batch ingest endpoint
+        self._batch_reprobe_at = 0.0
+        
         # Suppress httpx INFO level logging (reduce noise from frequent buffer polling)
         httpx_logger = logging.getLogger("httpx")
         httpx_logger.setLevel(logging.WARNING)
         
         logger.info(f"TowerControlClient initialized (url={self.base_url})")
     
+    def _http(self) -> httpx.Client:
+        """Shared pooled client; per-request timeouts override its default."""
+        client = self._client
+        if client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        timeout=self.timeout,
+                        limits=httpx.Limits(
+                            max_connections=POOL_MAX_CONNECTIONS,
+                            max_keepalive_connections=POOL_MAX_CONNECTIONS,
+                            keepalive_expiry=POOL_KEEPALIVE_EXPIRY_SEC,
+                        ),
+                    )
+                client = self._client
+        self.requests += 1
+        return client
+    
+    def close(self) -> None:
+        """Close pooled connections. The client reopens them if used again."""
+        with self._client_lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+    
     def switch_source(self, mode: str, file_path: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Switch Tower's source mode.
@@ -66,7 +117,7 @@ class TowerControlClient:
             payload["file_path"] = file_path
         
         try:
-            response = httpx.post(url, json=payload, timeout=self.timeout)
+            response = self._http().post(url, json=payload, timeout=self.timeout)
             response.raise_for_status()
             return response.json()
         except httpx.HTTPError as e:
@@ -86,7 +137,7 @@ class TowerControlClient:
         url = f"{self.base_url}/status"
         
         try:
-            response = httpx.get(url, timeout=self.timeout)
+            response = self._http().get(url, timeout=self.timeout)
             response.raise_for_status()
             return response.json()
         except httpx.HTTPError as e:
@@ -106,7 +157,7 @@ class TowerControlClient:
         url = f"{self.base_url}/tower/buffer"
         
         try:
-            response = httpx.get(url, timeout=self.buffer_timeout)
+            response = self._http().get(url, timeout=self.buffer_timeout)
             response.raise_for_status()
             buffer_data = response.json()
             
@@ -139,6 +190,9 @@ class TowerControlClient:
         Per contract T-EVENTS1: Events are sent via HTTP POST to /tower/events/ingest.
         Per contract T-EVENTS6: Event sending MUST be non-blocking (< 1ms typical, < 10ms maximum).
         
+        With an event_sender attached the event is queued and sent in a batch by
+        the sender's thread, so the caller never waits on the network.
+        
         This method is stateless and transport-only. It always attempts to send the event
         if called. Lifecycle event de-duplication is handled by Station, not this client.
         
@@ -148,8 +202,69 @@ class TowerControlClient:
             metadata: Event metadata dictionary
             
         Returns:
-            True if event was sent successfully, False otherwise
+            True if event was sent (or queued) successfully, False otherwise
+        """
+        sender = self.event_sender
+        if sender is not None:
+            return sender.submit(event_type, timestamp, metadata)
+        return self.post_event(event_type, timestamp, metadata)
+    
+    def send_events(self, events: List[Dict[str, Any]]) -> bool:
         """
+        Send several events in one POST to /tower/events/ingest/batch.
+        
+        Falls back to one POST per event if Tower does not have the endpoint,
+        and tries it again after BATCH_REPROBE_SEC. Towers without it answer
+        404/405, or 400 "WebSocket upgrade required" because /tower/events/*
+        is routed to their WebSocket handler; the batch itself is never dropped
+        on them. Any other 400 (e.g. a body cut short in transit) sends that
+        batch one event at a time but keeps batching.
+        
+        Args:
+            events: Event dicts with event_type, timestamp and metadata, in emission order
+            
+        Returns:
+            True if Tower accepted the request, False otherwise
+        """
+        if not events:
+            return True
+        if not self.batch_supported:
+            if time.monotonic() < self._batch_reprobe_at:
+                return self._post_each(events)
+            self.batch_supported = True  # re-probe the batch endpoint
+        
+        url = f"{self.base_url}/tower/events/ingest/batch"
+        try:
+            response = self._http().post(url, json={"events": events}, timeout=self.timeout)
+            if self._batch_unsupported(response):
+                logger.info("[TOWER] Tower has no batch event endpoint; sending events one by one")
+                self.batch_supported = False
+                self._batch_reprobe_at = time.monotonic() + BATCH_REPROBE_SEC
+                return self._post_each(events)
+            if response.status_code == 400:
+                logger.warning(f"[TOWER] Tower rejected a batch of {len(events)} events (400); sending them one by one")
+                return self._post_each(events)
+            response.raise_for_status()
+            return True
+        except httpx.HTTPError as e:
+            logger.debug(f"[TOWER] Failed to send {len(events)} events: {e}")
+            return False
+        except Exception as e:
+            logger.debug(f"[TOWER] Unexpected error sending {len(events)} events: {e}")
+            return False
+    
+    @staticmethod
+    def _batch_unsupported(response: httpx.Response) -> bool:
+        """True if the response says Tower has no batch endpoint (not that this batch was bad)."""
+        if response.status_code in (404, 405):
+            return True
+        return response.status_code == 400 and b"WebSocket upgrade required" in response.content
+    
+    def _post_each(self, events: List[Dict[str, Any]]) -> bool:
+        return all([self.post_event(e["event_type"], e["timestamp"], e["metadata"]) for e in events])
+    
+    def post_event(self, event_type: str, timestamp: float, metadata: Dict[str, Any]) -> bool:
+        """Send one event to /tower/events/ingest on the calling thread (see send_event())."""
         url = f"{self.base_url}/tower/events/ingest"
         
         payload = {
@@ -160,7 +275,7 @@ class TowerControlClient:
         
         try:
             # Use a very short timeout to ensure non-blocking behavior per T-EVENTS6
-            response = httpx.post(url, json=payload, timeout=0.1)  # 100ms timeout for non-blocking
+            response = self._http().post(url, json=payload, timeout=0.1)  # 100ms timeout for non-blocking
             response.raise_for_status()
             return True
         except (httpx.HTTPError, httpx.TimeoutException) as e:
@@ -0,0 +1,176 @@
+"""
+Asynchronous batched event delivery from Station to Tower.
+
+TowerControlClient.send_event() used to POST each event from whatever thread
+emitted it (DJ THINK/DO, playout, lifecycle), so every emitter could wait up
+to the request timeout on Tower. With a TowerEventSender attached, emitters
+only append to a bounded in-memory queue; one background thread drains it,
+coalescing the events that arrive within a short linger window into one
+POST to /tower/events/ingest/batch over the pooled keep-alive connection.
+
+- Order: events are sent in emission order (batches are FIFO slices)
+- Bound: when the queue is full the oldest queued event is dropped, so a
+  stalled Tower costs memory proportional to max_queue, never blocking
+- Failure: a batch Tower does not accept is dropped, as single events were
+- flush() waits for everything queued so far, e.g. before shutdown
+
+Contract reference: Tower Runtime Contract T-EVENTS1, T-EVENTS6
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EVENT_QUEUE_SIZE = 1000
+DEFAULT_EVENT_BATCH_SIZE = 64
+DEFAULT_EVENT_LINGER_SEC = 0.02
+
+
+class TowerEventSender:
+    """
+    Bounded event queue drained into batched POSTs by one background thread.
+
+    Usage:
+        sender = TowerEventSender(tower_control)
+        sender.start()
+        tower_control.event_sender = sender   # send_event() now queues
+        sender.flush(timeout=2.0)
+        sender.stop()
+    """
+
+    def __init__(
+        self,
+        tower_control,
+        max_queue: int = DEFAULT_EVENT_QUEUE_SIZE,
+        max_batch: int = DEFAULT_EVENT_BATCH_SIZE,
+        linger_sec: float = DEFAULT_EVENT_LINGER_SEC,
+    ):
+        """
+        Args:
+            tower_control: TowerControlClient whose send_events() delivers the batches
+            max_queue: Queued events beyond which the oldest is dropped
+            max_batch: Most events per POST
+            linger_sec: How long the first queued event waits for others to join its batch
+        """
+        self.tower_control = tower_control
+        self.max_queue = max(1, int(max_queue))
+        self.max_batch = max(1, int(max_batch))
+        self.linger_sec = max(0.0, float(linger_sec))
+        self._queue: Deque[Dict[str, Any]] = deque()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self._in_flight = 0
+
+        self.queued = 0
+        self.sent = 0
+        self.batches = 0
+        self.dropped = 0  # queue overflow
+        self.failed = 0  # events in batches Tower did not accept
+
+    def start(self) -> None:
+        """Start the sender thread."""
+        with self._cond:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="tower-events", daemon=True)
+            self._thread.start()
+        logger.info(
+            f"[EVENTS] Tower event sender started (batch={self.max_batch}, "
+            f"linger={self.linger_sec * 1000:.0f}ms, queue={self.max_queue})"
+        )
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Send what is queued (up to timeout), then stop the thread. Idempotent."""
+        self.flush(timeout)
+        with self._cond:
+            self._stopping = True
+            thread, self._thread = self._thread, None
+            self._cond.notify_all()
+        if thread and thread is not threading.current_thread():
+            thread.join(timeout=timeout)
+
+    def submit(self, event_type: str, timestamp: float, metadata: Dict[str, Any]) -> bool:
+        """
+        Queue an event without blocking on Tower.
+
+        Returns:
+            True (queued); False if the sender is stopped
+        """
+        event = {"event_type": event_type, "timestamp": timestamp, "metadata": metadata}
+        with self._cond:
+            if self._stopping or self._thread is None:
+                return False
+            if len(self._queue) >= self.max_queue:
+                dropped = self._queue.popleft()
+                self.dropped += 1
+                logger.debug(f"[EVENTS] Queue full, dropped oldest event {dropped['event_type']}")
+            self._queue.append(event)
+            self.queued += 1
+            self._cond.notify_all()
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every event queued so far has been sent (or failed). True if drained."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while (self._queue or self._in_flight) and self._thread is not None:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return not self._queue and not self._in_flight
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            depth = len(self._queue)
+        return {
+            "queue_depth": depth,
+            "queued": self.queued,
+            "sent": self.sent,
+            "batches": self.batches,
+            "avg_batch": round(self.sent / self.batches, 1) if self.batches else 0.0,
+            "dropped": self.dropped,
+            "failed": self.failed,
+        }
+
+    def _next_batch(self) -> Optional[List[Dict[str, Any]]]:
+        with self._cond:
+            while not self._queue:
+                if self._stopping:
+                    return None
+                self._cond.wait()
+            # Linger briefly so events emitted together share one request
+            deadline = time.monotonic() + self.linger_sec
+            while len(self._queue) < self.max_batch and not self._stopping:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            batch = [self._queue.popleft() for _ in range(min(self.max_batch, len(self._queue)))]
+            self._in_flight = len(batch)
+            return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            try:
+                ok = self.tower_control.send_events(batch)
+            except Exception as e:
+                logger.debug(f"[EVENTS] Batch send error: {e}")
+                ok = False
+            with self._cond:
+                self.batches += 1
+                if ok:
+                    self.sent += len(batch)
+                else:
+                    self.failed += len(batch)
+                self._in_flight = 0
+                self._cond.notify_all()
@@ -16,6 +16,7 @@ import numpy as np
 
 from station.outputs.base_sink import BaseSink
 from station.outputs.tower_control import TowerControlClient
+from station.outputs.tower_telemetry import TowerBufferTelemetry
 
 logger = logging.getLogger(__name__)
 
@@ -60,7 +61,8 @@ class TowerPCMSink(BaseSink):
     
     def __init__(self, socket_path: str = "/var/run/retrowaves/pcm.sock", 
                  sample_rate: int = 48000, channels: int = 2, frame_size: int = 1024,
-                 tower_control: Optional[TowerControlClient] = None):
+                 tower_control: Optional[TowerControlClient] = None,
+                 telemetry: Optional[TowerBufferTelemetry] = None):
         """
         Initialize Tower PCM sink.
         
@@ -70,6 +72,8 @@ class TowerPCMSink(BaseSink):
             channels: Number of audio channels (default: 2)
             frame_size: Samples per frame (default: 1024)
             tower_control: Optional TowerControlClient for buffer status queries and event emission
+            telemetry: Optional shared TowerBufferTelemetry; when given, buffer health is
+                checked on each telemetry sample instead of by a polling thread of our own
         """
         self.socket_path = socket_path
         self.sample_rate = sample_rate
@@ -105,6 +109,9 @@ class TowerPCMSink(BaseSink):
         self._last_buffer_at_capacity = False  # Track if buffer was at capacity to detect overflow transitions
         self._health_stop = threading.Event()
         self._health_thread: Optional[threading.Thread] = None
+        self._telemetry = telemetry
+        if telemetry is not None:
+            telemetry.add_listener(lambda snapshot: self._apply_buffer_status(snapshot.data))
         
         logger.info(f"TowerPCMSink initialized (socket={socket_path}, frame_size={frame_size} samples, frame_bytes={self.frame_bytes})")
         self._start_buffer_health_monitor()
@@ -206,20 +213,27 @@ class TowerPCMSink(BaseSink):
                 self._connection_start_time = None
                 return
     
-    def _send_frame_bytes(self, pcm_bytes: bytes, max_wait_sec: float = 0.5) -> bool:
-        """Send a complete frame over the non-blocking socket; retry until sent or timeout."""
+    def _send_frame_bytes(self, pcm_bytes, max_wait_sec: float = 0.5) -> bool:
+        """
+        Send a complete frame over the non-blocking socket; retry until sent or timeout.
+
+        pcm_bytes may be any bytes-like object; partial sends resume from a
+        memoryview slice instead of copying the remainder.
+        """
         if not self._socket:
             return False
         deadline = time.monotonic() + max_wait_sec
+        total = len(pcm_bytes)
+        view = pcm_bytes if isinstance(pcm_bytes, memoryview) else memoryview(pcm_bytes)
         offset = 0
-        while offset < len(pcm_bytes):
+        while offset < total:
             if time.monotonic() >= deadline:
                 logger.warning(
-                    f"[PCM] Frame send timeout ({offset}/{len(pcm_bytes)} bytes sent)"
+                    f"[PCM] Frame send timeout ({offset}/{total} bytes sent)"
                 )
                 return False
             try:
-                sent = self._socket.send(pcm_bytes[offset:])
+                sent = self._socket.send(view[offset:] if offset else view)
                 if sent == 0:
                     return False
                 offset += sent
@@ -274,7 +288,11 @@ class TowerPCMSink(BaseSink):
             return
 
         try:
-            pcm_bytes = frame.astype(np.int16).tobytes()
+            if frame.dtype == np.int16 and frame.flags.c_contiguous:
+                # Zero-copy: send the frame's own buffer
+                pcm_bytes = memoryview(frame).cast("B")
+            else:
+                pcm_bytes = frame.astype(np.int16).tobytes()
         except Exception as e:
             logger.error(f"[PCM] Error converting frame to bytes: {e}")
             return
@@ -287,7 +305,7 @@ class TowerPCMSink(BaseSink):
             self._last_write_time = time.time()
     
     def _start_buffer_health_monitor(self) -> None:
-        if not self._tower_control:
+        if not self._tower_control or self._telemetry is not None:
             return
         if self._health_thread and self._health_thread.is_alive():
             return
@@ -537,9 +555,16 @@ class TowerPCMSink(BaseSink):
         # Query Tower's buffer status (non-blocking with short timeout)
         try:
             buffer_data = self._tower_control.get_buffer()
-            if buffer_data is None:
-                return
-            
+        except Exception as e:
+            # Non-blocking: silently ignore buffer check failures
+            logger.debug(f"Error checking buffer health: {e}")
+            return
+        if buffer_data is not None:
+            self._apply_buffer_status(buffer_data)
+    
+    def _apply_buffer_status(self, buffer_data: dict) -> None:
+        """Detect underflow/overflow transitions from one /tower/buffer reading."""
+        try:
             # Extract buffer depth and capacity
             buffer_depth = buffer_data.get("count", 0)
             buffer_capacity = buffer_data.get("capacity", 0)
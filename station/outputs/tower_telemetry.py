@@ -0,0 +1,285 @@
+"""
+Tower buffer telemetry service for Retrowaves Station.
+
+Keeps the latest Tower PCM buffer snapshot for the PCM sink's buffer health
+monitor, the PID controller and pre-fill, which read that snapshot (and its
+age) instead of each polling Tower on its own schedule with its own
+connections.
+
+Samples come from Tower's buffer push socket when it is available: Tower
+sends a compact record on every depth change and on a heartbeat, so the
+snapshot is at most one check interval old. While no pushed sample is fresh
+(Tower without push support, socket not connected yet, Tower restarting) one
+background poller reads /tower/buffer over the pooled TowerControlClient at
+a fixed rate instead.
+
+Contract reference: Tower Runtime Contract T-BUF, PCM Ingest Contract I58-I62
+"""
+
+import logging
+import os
+import socket
+import struct
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TELEMETRY_INTERVAL_SEC = 0.1
+
+# Snapshots older than this are treated as unavailable by get_buffer()
+DEFAULT_MAX_SNAPSHOT_AGE_SEC = 0.5
+
+# Tower push record: magic, seq, sent_at (Tower monotonic), capacity, count, overflow_count
+PUSH_SAMPLE_MAGIC = b"TBUF"
+PUSH_SAMPLE_STRUCT = struct.Struct("<4sIdIIQ")
+
+PUSH_RECONNECT_SEC = 1.0
+
+
+def default_push_socket_path(pcm_socket_path: str) -> str:
+    """Tower's buffer push socket next to its PCM socket (pcm.sock -> pcm-buffer.sock)."""
+    root, ext = os.path.splitext(pcm_socket_path)
+    return f"{root}-buffer{ext or '.sock'}"
+
+
+@dataclass(frozen=True)
+class BufferSnapshot:
+    """One /tower/buffer reading."""
+    data: Dict[str, Any]  # response body, with 'ratio' filled in when Tower omits it
+    received_at: float  # time.monotonic()
+    seq: int
+    source: str = "poll"  # "poll" (/tower/buffer) or "push" (buffer push socket)
+
+    def age(self, now: Optional[float] = None) -> float:
+        """Seconds since the snapshot was received."""
+        return (time.monotonic() if now is None else now) - self.received_at
+
+
+def _with_ratio(data: Dict[str, Any]) -> Dict[str, Any]:
+    if "ratio" not in data:
+        capacity = data.get("capacity") or 0
+        fill = data.get("count", data.get("fill", 0)) or 0
+        data = dict(data, ratio=(fill / capacity) if capacity > 0 else 0.0)
+    return data
+
+
+class TowerBufferTelemetry:
+    """
+    Station-wide Tower buffer telemetry serving the latest snapshot.
+
+    Usage:
+        telemetry = TowerBufferTelemetry(tower_control, interval_sec=0.1,
+                                         push_socket_path="/var/run/retrowaves/pcm-buffer.sock")
+        telemetry.start()
+        snapshot = telemetry.latest()       # lock-free; None until the first sample
+        data = telemetry.get_buffer()       # snapshot body if fresh, else None
+        telemetry.stop()
+    """
+
+    def __init__(
+        self,
+        tower_control,
+        interval_sec: float = DEFAULT_TELEMETRY_INTERVAL_SEC,
+        max_age_sec: float = DEFAULT_MAX_SNAPSHOT_AGE_SEC,
+        push_socket_path: Optional[str] = None,
+    ):
+        """
+        Args:
+            tower_control: TowerControlClient used for the polls
+            interval_sec: Poll interval (fallback while no pushed sample is fresh)
+            max_age_sec: Age beyond which get_buffer() reports no data
+            push_socket_path: Tower buffer push socket (None = poll only)
+        """
+        self.tower_control = tower_control
+        self.interval_sec = max(0.01, float(interval_sec))
+        self.max_age_sec = max_age_sec
+        self.push_socket_path = push_socket_path
+        self._latest: Optional[BufferSnapshot] = None  # replaced whole; readers take no lock
+        self._latest_push: Optional[BufferSnapshot] = None
+        self._listeners: List[Callable[[BufferSnapshot], None]] = []
+        self._publish_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._push_thread: Optional[threading.Thread] = None
+        self._push_sock: Optional[socket.socket] = None
+        self._seq = 0
+        self._tower_seq: Optional[int] = None
+
+        self.polls = 0
+        self.failures = 0
+        self.pushed = 0
+        self.push_gaps = 0  # samples Tower sent that never arrived (seq gaps)
+        self.push_connects = 0
+        self.push_latency_ms = 0.0  # Tower sample time to receipt, last sample
+
+    def start(self) -> None:
+        """Start the poller thread (and the push subscriber, if configured)."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="tower-telemetry", daemon=True)
+        self._thread.start()
+        if self.push_socket_path:
+            self._push_thread = threading.Thread(target=self._run_push, name="tower-telemetry-push", daemon=True)
+            self._push_thread.start()
+        logger.info(
+            f"[TELEMETRY] Tower buffer telemetry started (interval={self.interval_sec * 1000:.0f}ms, "
+            f"push={self.push_socket_path or 'off'})"
+        )
+
+    def stop(self) -> None:
+        """Stop the poller and push threads. Idempotent."""
+        self._stop.set()
+        sock = self._push_sock
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        for thread in (self._thread, self._push_thread):
+            if thread and thread is not threading.current_thread():
+                thread.join(timeout=2.0)
+        self._thread = None
+        self._push_thread = None
+
+    def add_listener(self, callback: Callable[[BufferSnapshot], None]) -> None:
+        """Call callback(snapshot) on the poller thread for every new sample."""
+        self._listeners.append(callback)
+
+    def latest(self) -> Optional[BufferSnapshot]:
+        """Most recent snapshot (any age), or None before the first sample."""
+        return self._latest
+
+    def get_buffer(self, max_age_sec: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Latest buffer status, shaped like TowerControlClient.get_buffer().
+
+        Returns None if there is no snapshot younger than max_age_sec
+        (default: the service's max_age_sec).
+        """
+        snapshot = self._latest
+        limit = self.max_age_sec if max_age_sec is None else max_age_sec
+        if snapshot is None or snapshot.age() > limit:
+            return None
+        return snapshot.data
+
+    def push_active(self) -> bool:
+        """True while a pushed sample younger than max_age_sec is available."""
+        snapshot = self._latest_push
+        return snapshot is not None and snapshot.age() <= self.max_age_sec
+
+    def poll_once(self) -> Optional[BufferSnapshot]:
+        """Poll Tower now and publish the result (used by the poller thread)."""
+        self.polls += 1
+        data = self.tower_control.get_buffer()
+        if not isinstance(data, dict):
+            self.failures += 1
+            return None
+        return self._publish(_with_ratio(data), "poll")
+
+    def handle_push_record(self, record: bytes) -> Optional[BufferSnapshot]:
+        """Publish one Tower push record (used by the push thread)."""
+        magic, tower_seq, sent_at, capacity, count, overflow_count = PUSH_SAMPLE_STRUCT.unpack(record)
+        if magic != PUSH_SAMPLE_MAGIC:
+            raise ValueError(f"bad push record magic {magic!r}")
+        if self._tower_seq is not None:
+            self.push_gaps += max(0, ((tower_seq - self._tower_seq) & 0xFFFFFFFF) - 1)
+        self._tower_seq = tower_seq
+        self.pushed += 1
+        # Both ends are on one host, so Tower's monotonic clock is ours
+        self.push_latency_ms = max(0.0, (time.monotonic() - sent_at) * 1000.0)
+        data = {
+            "capacity": capacity,
+            "count": count,
+            "overflow_count": overflow_count,
+            "ratio": (count / capacity) if capacity > 0 else 0.0,
+            "tower_seq": tower_seq,
+            "tower_timestamp": sent_at,
+        }
+        snapshot = self._publish(data, "push")
+        self._latest_push = snapshot
+        return snapshot
+
+    def _publish(self, data: Dict[str, Any], source: str) -> BufferSnapshot:
+        # Poll and push threads may both publish while push takes over
+        with self._publish_lock:
+            self._seq += 1
+            snapshot = BufferSnapshot(data=data, received_at=time.monotonic(), seq=self._seq, source=source)
+            self._latest = snapshot
+        for callback in list(self._listeners):
+            try:
+                callback(snapshot)
+            except Exception as e:
+                logger.debug(f"[TELEMETRY] Listener error: {e}")
+        return snapshot
+
+    def stats(self) -> Dict[str, Any]:
+        snapshot = self._latest
+        return {
+            "interval_ms": round(self.interval_sec * 1000.0, 1),
+            "polls": self.polls,
+            "failures": self.failures,
+            "seq": snapshot.seq if snapshot else 0,
+            "source": snapshot.source if snapshot else None,
+            "age_ms": round(snapshot.age() * 1000.0, 1) if snapshot else None,
+            "tower_requests": getattr(self.tower_control, "requests", None),
+            "pushed": self.pushed,
+            "push_gaps": self.push_gaps,
+            "push_connects": self.push_connects,
+            "push_latency_ms": round(self.push_latency_ms, 2),
+        }
+
+    def _run(self) -> None:
+        next_poll = time.monotonic()
+        while not self._stop.is_set():
+            try:
+                if not self.push_active():
+                    self.poll_once()
+            except Exception as e:
+                self.failures += 1
+                logger.debug(f"[TELEMETRY] Poll failed: {e}")
+            # Fixed rate, without bursts to catch up after a slow poll
+            next_poll = max(next_poll + self.interval_sec, time.monotonic())
+            self._stop.wait(max(0.0, next_poll - time.monotonic()))
+
+    def _run_push(self) -> None:
+        size = PUSH_SAMPLE_STRUCT.size
+        while not self._stop.is_set():
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                sock.connect(self.push_socket_path)
+            except OSError as e:
+                sock.close()
+                logger.debug(f"[TELEMETRY] Push socket unavailable ({e}); polling")
+                self._stop.wait(PUSH_RECONNECT_SEC)
+                continue
+            self._push_sock = sock
+            self._tower_seq = None
+            self.push_connects += 1
+            logger.info(f"[TELEMETRY] Subscribed to Tower buffer push ({self.push_socket_path})")
+            pending = bytearray()
+            try:
+                while not self._stop.is_set():
+                    chunk = sock.recv(size * 64)
+                    if not chunk:
+                        break
+                    pending.extend(chunk)
+                    usable = len(pending) - len(pending) % size
+                    for offset in range(0, usable, size):
+                        self.handle_push_record(bytes(pending[offset:offset + size]))
+                    del pending[:usable]
+            except (OSError, ValueError, struct.error) as e:
+                if not self._stop.is_set():
+                    logger.debug(f"[TELEMETRY] Push stream error: {e}")
+            finally:
+                self._push_sock = None
+                try:
+                    sock.close()
+                except OSError:
+                    pass
+            if not self._stop.is_set():
+                logger.info("[TELEMETRY] Tower buffer push disconnected; polling until it returns")
+                self._stop.wait(PUSH_RECONNECT_SEC)
@@ -5,6 +5,7 @@ Provides persistent storage for DJ state, rotation history, and ticklers.
 """
 
 from .dj_state_store import DJStateStore
+from .state_journal import StateJournal
 
-__all__ = ["DJStateStore"]
+__all__ = ["DJStateStore", "StateJournal"]
 
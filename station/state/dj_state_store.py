@@ -2,11 +2,17 @@
 DJ State Storage for Appalachia Radio 3.1.
 
 Provides atomic, crash-resistant JSON storage for DJ state persistence.
+
+With a record reducer (apply_record), per-event records (plays, talk, IDs)
+are journaled between full saves and replayed on load; see StateJournal.
 """
 
 import json
 import os
 import logging
+from typing import Callable, Optional
+
+from station.state.state_journal import DEFAULT_BATCH_INTERVAL_SEC, StateJournal
 
 logger = logging.getLogger(__name__)
 
@@ -18,14 +24,26 @@ class DJStateStore:
     Uses a temporary file + atomic rename to ensure crash resistance.
     """
     
-    def __init__(self, path: str = "/tmp/appalachia_dj_state.json"):
+    def __init__(
+        self,
+        path: str = "/tmp/appalachia_dj_state.json",
+        apply_record: Optional[Callable[[dict, dict], None]] = None,
+        batch_interval_sec: float = DEFAULT_BATCH_INTERVAL_SEC,
+    ):
         """
         Initialize state store.
         
         Args:
             path: Path to JSON state file
+            apply_record: Reducer folding one journal record into a saved-state dict;
+                          enables record() and journal replay in load()
+            batch_interval_sec: Maximum time a journaled record waits for fsync
         """
         self.path = path
+        self._journal: Optional[StateJournal] = (
+            StateJournal(path, apply_record=apply_record, batch_interval_sec=batch_interval_sec)
+            if apply_record else None
+        )
         logger.debug(f"DJStateStore initialized with path: {path}")
     
     def save(self, data: dict) -> None:
@@ -33,11 +51,22 @@ class DJStateStore:
         Save state to JSON file atomically.
         
         Writes to a temporary file first, then atomically replaces
-        the target file to prevent corruption on crashes.
+        the target file to prevent corruption on crashes. With a journal,
+        this is a snapshot: records journaled so far are covered by data
+        and the journal is truncated.
         
         Args:
             data: Dictionary of state data to save
         """
+        if self._journal:
+            try:
+                self._journal.snapshot(data)
+                logger.debug(f"DJ state saved to {self.path}")
+            except Exception as e:
+                logger.error(f"Failed to save DJ state: {e}")
+                raise
+            return
+        
         tmp = self.path + ".tmp"
         try:
             with open(tmp, "w") as f:
@@ -54,13 +83,40 @@ class DJStateStore:
                 pass
             raise
     
+    def record(self, record: dict) -> None:
+        """
+        Journal one state event (O(1); written and fsynced in background batches).
+        
+        Args:
+            record: JSON-serialisable event understood by the store's apply_record
+        """
+        if self._journal:
+            self._journal.append(record)
+    
+    def close(self) -> None:
+        """Flush journaled records and stop the journal writer."""
+        if self._journal:
+            self._journal.close()
+    
     def load(self) -> dict | None:
         """
         Load state from JSON file.
         
+        With a journal, records written after the last save are replayed on top.
+        
         Returns:
             Dictionary of state data, or None if file doesn't exist or is invalid
         """
+        if self._journal:
+            try:
+                data = self._journal.load()
+            except Exception as e:
+                logger.warning(f"Failed to load DJ state: {e}")
+                return None
+            if data is not None:
+                logger.debug(f"DJ state loaded from {self.path}")
+            return data
+        
         if not os.path.exists(self.path):
             logger.debug(f"No state file found at {self.path}")
             return None
@@ -73,4 +129,3 @@ class DJStateStore:
         except Exception as e:
             logger.warning(f"Failed to load DJ state: {e}")
             return None
-
@@ -0,0 +1,262 @@
+"""
+Append-only state journal for Appalachia Radio 3.1.
+
+Instead of rewriting a whole JSON state file on every play, callers append one
+small record per event. A background writer appends pending records to
+<snapshot>.journal as JSON lines and fsyncs once per batch interval, so a
+crash loses at most the last batch. Every compact_every records the writer
+folds the journal into the snapshot file (temp file + atomic rename) and
+truncates the journal. Warm start loads the snapshot and replays the records
+written after it.
+
+Records are applied to a plain dict state by an owner-supplied reducer
+(apply_record), both when replaying and when compacting, so compaction never
+touches live objects.
+"""
+
+import copy
+import json
+import logging
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_INTERVAL_SEC = 1.0
+DEFAULT_COMPACT_EVERY = 1000
+
+# Snapshot key holding the sequence number of the last record folded into it
+SNAPSHOT_SEQ_KEY = "journal_seq"
+
+
+class StateJournal:
+    """
+    Snapshot + append-only journal with batched fsync.
+
+    Usage:
+        journal = StateJournal("/tmp/state.json", apply_record=reducer)
+        state = journal.load()             # snapshot + replay (None if nothing saved)
+        journal.append({"type": "song", "path": p, "ts": now})   # O(1)
+        journal.snapshot(full_state)       # authoritative rewrite, truncates journal
+        journal.close()                    # flush pending records
+    """
+
+    def __init__(
+        self,
+        snapshot_path: str,
+        apply_record: Callable[[dict, dict], None],
+        batch_interval_sec: float = DEFAULT_BATCH_INTERVAL_SEC,
+        compact_every: int = DEFAULT_COMPACT_EVERY,
+    ):
+        """
+        Initialize the journal (no I/O until load/append).
+
+        Args:
+            snapshot_path: Snapshot JSON file; the journal lives at snapshot_path + ".journal"
+            apply_record: Reducer applying one record to a state dict in place
+            batch_interval_sec: Maximum time a record waits before being fsynced
+            compact_every: Records between automatic compactions
+        """
+        self.snapshot_path = snapshot_path
+        self.journal_path = snapshot_path + ".journal"
+        self.batch_interval_sec = batch_interval_sec
+        self.compact_every = compact_every
+        self._apply = apply_record
+
+        self._lock = threading.Lock()  # pending records and sequence numbers
+        self._cond = threading.Condition(self._lock)
+        self._io_lock = threading.Lock()  # journal/snapshot files and folded state
+        self._pending: List[dict] = []
+        self._seq = 0
+        self._state: dict = {}  # snapshot folded with every record written
+        self._snapshot_seq = 0
+        self._written_seq = 0  # last record appended to the journal file
+        self._since_compaction = 0
+        self._file = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+
+        self.records_written = 0
+        self.batches = 0
+        self.compactions = 0
+        self.last_batch_ms = 0.0
+
+    def load(self) -> Optional[dict]:
+        """
+        Load the snapshot and replay journal records written after it.
+
+        A torn final line (crash mid-write) ends the replay.
+
+        Returns:
+            The recovered state, or None if neither snapshot nor journal exists
+        """
+        snapshot = None
+        if os.path.exists(self.snapshot_path):
+            try:
+                with open(self.snapshot_path, "r") as f:
+                    snapshot = json.load(f)
+            except Exception as e:
+                logger.warning(f"[STATE-JOURNAL] Failed to load snapshot {self.snapshot_path}: {e}")
+        state = snapshot if isinstance(snapshot, dict) else {}
+        snapshot_seq = int(state.pop(SNAPSHOT_SEQ_KEY, 0) or 0)
+
+        last_seq = snapshot_seq
+        replayed = 0
+        if os.path.exists(self.journal_path):
+            with open(self.journal_path, "r") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        logger.warning(f"[STATE-JOURNAL] Torn record in {self.journal_path} - replay stops there")
+                        break
+                    seq = record.get("seq", 0)
+                    if seq <= snapshot_seq:
+                        continue  # already folded into the snapshot
+                    self._apply(state, record)
+                    last_seq = seq
+                    replayed += 1
+
+        with self._io_lock:
+            self._state = copy.deepcopy(state)
+            self._snapshot_seq = snapshot_seq
+            self._written_seq = last_seq
+            self._since_compaction = replayed
+        with self._lock:
+            self._seq = max(self._seq, last_seq)
+
+        if snapshot is None and not replayed:
+            return None
+        logger.info(f"[STATE-JOURNAL] Loaded {self.snapshot_path} (snapshot_seq={snapshot_seq}, replayed={replayed})")
+        return state
+
+    def append(self, record: dict) -> None:
+        """Queue one record for the background writer (O(1), no I/O)."""
+        with self._lock:
+            self._seq += 1
+            entry = dict(record)
+            entry["seq"] = self._seq
+            self._pending.append(entry)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="state-journal", daemon=True)
+                self._thread.start()
+
+    def snapshot(self, state: dict) -> None:
+        """
+        Write an authoritative snapshot and truncate the journal.
+
+        state must already reflect every record appended so far; pending records
+        are dropped because the snapshot covers them.
+
+        Raises:
+            OSError: If the snapshot cannot be written
+        """
+        with self._io_lock:
+            with self._lock:
+                seq = self._seq
+                self._pending = []
+            self._write_snapshot(state, seq)
+            self._state = copy.deepcopy(state)
+            self._snapshot_seq = seq
+            self._since_compaction = 0
+
+    def flush(self) -> None:
+        """Write and fsync pending records now (compacting if due)."""
+        with self._io_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+            if batch:
+                self._write_batch(batch)
+            if self._since_compaction >= self.compact_every:
+                self._compact_locked()
+
+    def close(self) -> None:
+        """Stop the writer, flush pending records and close the journal. Idempotent."""
+        with self._lock:
+            self._stopping = True
+            thread = self._thread
+            self._cond.notify_all()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5.0)
+        self.flush()
+        with self._io_lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        with self._lock:
+            self._thread = None
+            self._stopping = False
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            pending = len(self._pending)
+        return {
+            "records_written": self.records_written,
+            "batches": self.batches,
+            "compactions": self.compactions,
+            "pending": pending,
+            "last_batch_ms": round(self.last_batch_ms, 3),
+        }
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._stopping:
+                    self._cond.wait(self.batch_interval_sec)
+                stopping = self._stopping
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"[STATE-JOURNAL] Write failed: {e}", exc_info=True)
+            if stopping:
+                return
+
+    def _write_batch(self, batch: List[dict]) -> None:
+        start = time.monotonic()
+        if self._file is None:
+            self._file = open(self.journal_path, "a")
+        self._file.write("".join(json.dumps(r, separators=(",", ":")) + "\n" for r in batch))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        for record in batch:
+            # Records covered by a snapshot taken while this batch waited are already in _state
+            if record["seq"] > self._snapshot_seq:
+                self._apply(self._state, record)
+                self._since_compaction += 1
+        self._written_seq = batch[-1]["seq"]
+        self.records_written += len(batch)
+        self.batches += 1
+        self.last_batch_ms = (time.monotonic() - start) * 1000.0
+
+    def _compact_locked(self) -> None:
+        seq = max(self._snapshot_seq, self._written_seq)
+        self._write_snapshot(self._state, seq)
+        self._snapshot_seq = seq
+        self._since_compaction = 0
+        self.compactions += 1
+        logger.debug(f"[STATE-JOURNAL] Compacted {self.journal_path} into {self.snapshot_path} (seq={seq})")
+
+    def _write_snapshot(self, state: dict, seq: int) -> None:
+        payload = dict(state)
+        payload[SNAPSHOT_SEQ_KEY] = seq
+        tmp = self.snapshot_path + ".tmp"
+        try:
+            with open(tmp, "w") as f:
+                json.dump(payload, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.snapshot_path)
+        except Exception:
+            try:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+            except Exception:
+                pass
+            raise
+        # Records up to seq now live in the snapshot
+        if self._file is not None:
+            self._file.truncate(0)
+        elif os.path.exists(self.journal_path):
+            os.truncate(self.journal_path, 0)
@@ -0,0 +1,126 @@
+"""
+Tests for the asset selection index: per-category arrays, heap-backed
+cooldowns, and DJ intro/outro/ID selection served from the asset cache
+without per-THINK history scans or filesystem checks.
+"""
+
+import random
+import time
+
+import pytest
+
+from station.dj_logic.asset_index import CooldownIndex
+from station.dj_logic.dj_engine import DJEngine
+from station.dj_logic.id_logic import IDLogic
+from station.dj_logic.intro_logic import IntroLogic
+from station.tests.contracts.test_doubles import FakeRotationManager
+
+
+class TestCooldownIndex:
+    def test_cooling_members_are_released_when_they_expire(self):
+        index = CooldownIndex()
+        index.sync("generic", ["a", "b", "c"])
+        index.use("a", until=10)
+        index.use("b", until=20)
+        assert sorted(index.available("generic", now=5)) == ["c"]
+        assert index.is_cooling("a", 5) and not index.is_cooling("c", 5)
+        assert sorted(index.available("generic", now=10)) == ["a", "c"]
+        assert sorted(index.available("generic", now=20)) == ["a", "b", "c"]
+
+    def test_reuse_extends_cooldown(self):
+        index = CooldownIndex()
+        index.sync("generic", ["a", "b"])
+        index.use("a", until=10)
+        index.use("a", until=30)
+        # The superseded heap entry must not release "a" early
+        assert index.available("generic", now=15) == ["b"]
+        assert index.oldest("generic") == "b"
+        index.use("b", until=20)
+        assert index.oldest("generic") == "b"
+
+    def test_choose_falls_back_to_any_member(self):
+        index = CooldownIndex()
+        index.sync("generic", ["a", "b"])
+        index.use("a", until=10)
+        assert index.choose("generic", now=0, rng=random.Random(1)) == "b"
+        index.use("b", until=10)
+        assert index.choose("generic", now=0) in ("a", "b")
+        assert index.choose("missing", now=0) is None
+
+    def test_sync_keeps_cooldowns_and_skips_same_version(self):
+        index = CooldownIndex()
+        index.sync("generic", ["a", "b"], version=1)
+        index.use("a", until=10)
+        index.sync("generic", ["b"], version=2)
+        assert index.members("generic") == ["b"] and not index.categories_of("a")
+        index.sync("generic", ["a", "b"], version=3)
+        assert index.available("generic", now=0) == ["b"]
+        index.sync("generic", [], version=3)  # same version: not re-read
+        assert index.size("generic") == 2
+
+
+class TestLogicCooldowns:
+    def test_intro_logic_uses_index(self, tmp_path):
+        logic = IntroLogic(assets_root=tmp_path)
+        for path in logic.generic_intros:
+            logic.record_intro_usage(path)
+        assert all(logic._is_on_cooldown(p) for p in logic.generic_intros)
+        assert logic._get_available_intros("generic") == []
+        assert logic._get_generic_intro() == logic.generic_intros[0]
+
+    def test_id_logic_legal_ids_cool_longer(self, tmp_path, monkeypatch):
+        logic = IDLogic(assets_root=tmp_path)
+        legal, generic = logic.legal_ids[0], logic.generic_ids[0]
+        logic.record_id_usage(legal, is_legal=True)
+        logic.record_id_usage(generic)
+        now = time.time()
+        monkeypatch.setattr("station.dj_logic.id_logic.time.time", lambda: now + 20 * 60)
+        assert logic._is_on_cooldown(legal) and not logic._is_on_cooldown(generic)
+
+
+@pytest.fixture
+def dj(tmp_path):
+    for name in ("generic/generic_intro_1.mp3", "generic/generic_intro_2.mp3",
+                 "intros/Song_intro1.mp3", "outros/Song_outro1.mp3",
+                 "ids/legal/legal_1.mp3", "ids/generic/id_1.mp3", "ids/generic/id_2.mp3"):
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"x")
+    return DJEngine(rotation_manager=FakeRotationManager(), dj_asset_path=str(tmp_path))
+
+
+class TestDJSelection:
+    def test_ids_come_from_asset_cache(self, dj, tmp_path):
+        assert dj._select_station_ids(legal=True) == [str(tmp_path / "ids/legal/legal_1.mp3")]
+        assert dj._select_station_ids(count=3)[0] in dj.asset_manager.generic_ids
+        assert sorted(dj.available_generic_ids) == sorted(dj.asset_manager.generic_ids)
+
+    def test_intro_cooldown_follows_last_uses(self, dj, tmp_path):
+        first, second = sorted(dj.asset_manager.generic_intros)
+        dj._record_asset_use("intro", first)
+        assert dj._select_intro("/music/Other.mp3") == second
+        for _ in range(dj.cooldown_len - 1):
+            dj._record_asset_use("intro", second)
+        # first is still within the last 5 uses
+        assert dj.asset_index.is_cooling(first, dj._asset_uses["intro"])
+        assert not dj._cooldown_ok(first, dj.intro_history)
+        dj._record_asset_use("intro", second)
+        assert dj._cooldown_ok(first, dj.intro_history)
+        assert first in dj.asset_index.available("generic_intro", now=dj._asset_uses["intro"])
+
+    def test_per_song_pool_preferred(self, dj, tmp_path):
+        assert dj._select_intro("/music/Song.mp3") == str(tmp_path / "intros/Song_intro1.mp3")
+        assert dj._select_outro("/music/Song.mp3") == str(tmp_path / "outros/Song_outro1.mp3")
+
+    def test_watcher_changes_reindex_without_stat(self, dj, tmp_path, monkeypatch):
+        dj.asset_manager.set_watching(True)
+        added = tmp_path / "outros" / "generic_outro_9.mp3"
+        dj.asset_manager.apply_change("added", str(added))
+        monkeypatch.setattr("station.dj_logic.dj_engine.os.path.exists", lambda p: pytest.fail("stat during THINK"))
+        assert dj._select_outro("/music/Other.mp3") == str(added)
+        assert dj._asset_exists(str(added))
+
+    def test_restored_history_restores_cooldowns(self, dj):
+        first, second = sorted(dj.asset_manager.generic_intros)
+        dj.from_dict({"intro_history": [first]})
+        assert dj._select_intro("/music/Other.mp3") == second
@@ -41,9 +41,10 @@ class FakeRotationManager:
         self.state_file: Optional[str] = None
         self._selection_index = 0
     
-    def select_next_song(self) -> str:
+    def select_next_song(self, available_tracks: Optional[List[str]] = None, exclude: Optional[str] = None) -> str:
         """Deterministically select next song (cycles through tracks)."""
-        all_tracks = self._regular_tracks + self._holiday_tracks
+        all_tracks = available_tracks if available_tracks is not None else self._regular_tracks + self._holiday_tracks
+        all_tracks = [t for t in all_tracks if t != exclude] or all_tracks
         if not all_tracks:
             return "/fake/default.mp3"
         track = all_tracks[self._selection_index % len(all_tracks)]
@@ -109,6 +110,12 @@ class FakeAssetDiscoveryManager:
         self.startup_announcements: List[str] = []
         self.shutdown_announcements: List[str] = []
         
+        # Station ID pools
+        self.legal_ids: List[str] = []
+        self.generic_ids: List[str] = []
+        self.watching = False
+        self.version = None  # no change tracking: consumers re-index on every lookup
+        
         # Simulate initial scan
         import time
         self.last_scan_time = time.time()
@@ -222,6 +229,14 @@ class FakeDJStateStore:
     def load(self) -> Optional[dict]:
         """Load state from memory."""
         return self._state.copy() if self._state else None
+    
+    def record(self, record: dict) -> None:
+        """Journal records are not kept by the fake."""
+        pass
+    
+    def close(self) -> None:
+        """Fake close (no-op)."""
+        pass
 
 
 def create_fake_audio_event(file_path: str = "/fake/test.mp3", event_type: str = "song", gain: float = 0.0) -> AudioEvent:
@@ -0,0 +1,101 @@
+"""
+Tests for FFmpegDecoderPool (warm decoder processes fed via stdin).
+
+See docs/contracts/FFMPEG_DECODER_CONTRACT.md (Implementation Notes).
+
+`cat` stands in for ffmpeg: it copies stdin to stdout, so the "decoded" PCM is
+the source file's bytes and frame boundaries can be checked exactly.
+"""
+
+import os
+import shutil
+import time
+
+import numpy as np
+import pytest
+
+from station.broadcast_core.ffmpeg_decoder_pool import FFmpegDecoderPool
+
+pytestmark = pytest.mark.skipif(shutil.which("cat") is None, reason="requires cat")
+
+FRAME_BYTES = 1024 * 2 * 2
+
+
+def _wait_idle(pool, count, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while pool.idle_count() < count and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return pool.idle_count()
+
+
+@pytest.fixture
+def pcm_file(tmp_path):
+    data = np.arange(3 * FRAME_BYTES // 2, dtype=np.int16).tobytes()
+    path = tmp_path / "segment.raw"
+    path.write_bytes(data)
+    return str(path), data
+
+
+class TestDecoderPool:
+    def test_warm_process_decodes_file_via_stdin(self, pcm_file):
+        path, data = pcm_file
+        pool = FFmpegDecoderPool(size=1, command=["cat"])
+        pool.start()
+        try:
+            assert _wait_idle(pool, 1) == 1
+            decoder = pool.acquire(path)
+            frames = list(decoder.read_frames())
+            assert len(frames) == 3
+            assert b"".join(f.tobytes() for f in frames) == data
+            assert pool.stats()["hits"] == 1
+            assert pool.stats()["misses"] == 0
+        finally:
+            pool.shutdown()
+
+    def test_replacement_spawned_after_acquire(self, pcm_file):
+        path, _ = pcm_file
+        pool = FFmpegDecoderPool(size=2, command=["cat"])
+        pool.start()
+        try:
+            assert _wait_idle(pool, 2) == 2
+            decoder = pool.acquire(path)
+            assert _wait_idle(pool, 2) == 2, "pool must refill in the background"
+            decoder.close()
+            assert pool.stats()["spawns"] == 3
+            assert pool.stats()["spawn_ms_max"] > 0.0
+        finally:
+            pool.shutdown()
+
+    def test_empty_pool_is_a_miss(self, pcm_file):
+        path, data = pcm_file
+        pool = FFmpegDecoderPool(size=1, command=["cat"])
+        try:
+            decoder = pool.acquire(path)
+            assert b"".join(f.tobytes() for f in decoder.read_frames()) == data
+            assert pool.stats()["misses"] == 1
+        finally:
+            pool.shutdown()
+
+    def test_kill_terminates_acquired_process_group(self, pcm_file):
+        path, _ = pcm_file
+        pool = FFmpegDecoderPool(size=1, command=["cat"])
+        pool.start()
+        try:
+            _wait_idle(pool, 1)
+            decoder = pool.acquire(path)
+            proc = decoder.proc
+            assert os.getpgid(proc.pid) == proc.pid, "warm process must lead its own process group"
+            decoder.kill(grace_period_seconds=0.5)
+            assert decoder.proc is None
+            assert proc.poll() is not None
+        finally:
+            pool.shutdown()
+
+    def test_shutdown_kills_idle_processes(self):
+        pool = FFmpegDecoderPool(size=2, command=["cat"])
+        pool.start()
+        _wait_idle(pool, 2)
+        procs = list(pool._idle)
+        pool.shutdown()
+        assert pool.idle_count() == 0
+        assert all(p.poll() is not None for p in procs)
@@ -0,0 +1,229 @@
+"""
+Tests for incremental filesystem updates: the inotify watcher, and
+AssetDiscoveryManager / MediaLibrary applying add/remove changes without a rescan.
+"""
+
+import os
+import threading
+import time
+
+import pytest
+
+from station.app.fs_watcher import InotifyWatcher, is_network_filesystem
+from station.dj_logic.asset_discovery import AssetDiscoveryManager
+from station.music_logic.media_library import MediaLibrary
+
+
+def _touch(path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(b"x")
+
+
+class _Collector:
+    def __init__(self):
+        self.events = []
+        self._cond = threading.Condition()
+
+    def __call__(self, batch):
+        with self._cond:
+            self.events.extend(batch)
+            self._cond.notify_all()
+
+    def wait_for(self, event, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while event not in self.events:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+
+@pytest.fixture
+def watcher_factory():
+    watchers = []
+
+    def make(*roots):
+        collector = _Collector()
+        watcher = InotifyWatcher(on_events=collector)
+        for root in roots:
+            watcher.add_root(str(root))
+        watcher.start()
+        watchers.append(watcher)
+        return watcher, collector
+
+    yield make
+    for watcher in watchers:
+        watcher.stop()
+
+
+@pytest.mark.skipif(not InotifyWatcher.available(), reason="inotify not available")
+class TestInotifyWatcher:
+    def test_file_added_and_removed(self, tmp_path, watcher_factory):
+        (tmp_path / "sub").mkdir()
+        watcher, events = watcher_factory(tmp_path)
+        assert watcher.watch_count() == 2
+
+        path = str(tmp_path / "sub" / "song.mp3")
+        _touch(path)
+        assert events.wait_for(("added", path, False))
+        os.remove(path)
+        assert events.wait_for(("removed", path, False))
+
+    def test_rename_is_remove_plus_add(self, tmp_path, watcher_factory):
+        old = str(tmp_path / "old.mp3")
+        _touch(old)
+        _, events = watcher_factory(tmp_path)
+        new = str(tmp_path / "new.mp3")
+        os.rename(old, new)
+        assert events.wait_for(("removed", old, False))
+        assert events.wait_for(("added", new, False))
+
+    def test_new_directory_is_watched_and_contents_reported(self, tmp_path, watcher_factory):
+        root = tmp_path / "music"
+        root.mkdir()
+        watcher, events = watcher_factory(root)
+        _touch(str(tmp_path / "staging" / "album" / "one.mp3"))
+        # Moved in whole: files already inside must be reported
+        os.rename(str(tmp_path / "staging" / "album"), str(root / "album"))
+        assert events.wait_for(("added", str(root / "album" / "one.mp3"), False))
+
+        two = str(root / "album" / "two.mp3")
+        _touch(two)
+        assert events.wait_for(("added", two, False))
+        assert watcher.watch_count() == 2
+
+    def test_directory_removal_reported(self, tmp_path, watcher_factory):
+        _touch(str(tmp_path / "album" / "one.mp3"))
+        watcher, events = watcher_factory(tmp_path)
+        os.remove(str(tmp_path / "album" / "one.mp3"))
+        os.rmdir(str(tmp_path / "album"))
+        assert events.wait_for(("removed", str(tmp_path / "album"), True))
+        assert watcher.watch_count() == 1
+
+    def test_hidden_directories_skipped(self, tmp_path, watcher_factory):
+        (tmp_path / ".cache").mkdir()
+        watcher, _ = watcher_factory(tmp_path)
+        assert watcher.watch_count() == 1
+
+
+class TestAssetDiscoveryApplyChange:
+    @pytest.fixture
+    def manager(self, tmp_path):
+        _touch(str(tmp_path / "intros" / "SongA_intro1.mp3"))
+        _touch(str(tmp_path / "generic" / "generic_intro_1.mp3"))
+        _touch(str(tmp_path / "station_starting_up" / "hello.mp3"))
+        return AssetDiscoveryManager(tmp_path)
+
+    def test_per_song_assets_added_and_removed(self, manager, tmp_path):
+        intro = str(tmp_path / "intros" / "SongB_intro.mp3")
+        outro = str(tmp_path / "outros" / "SongB_outtro2.mp3")
+        assert manager.apply_change("added", intro)
+        assert manager.apply_change("added", outro)
+        assert manager.intros_per_song["SongB"] == [intro]
+        assert manager.outtros_per_song["SongB"] == [outro]
+
+        assert manager.apply_change("removed", intro)
+        assert "SongB" not in manager.intros_per_song
+
+    def test_generic_and_lifecycle_assets(self, manager, tmp_path):
+        outro = str(tmp_path / "generic" / "generic_outro_1.mp3")
+        goodbye = str(tmp_path / "station_shutting_down" / "bye.mp3")
+        nested = str(tmp_path / "station_shutting_down" / "old" / "bye.mp3")
+        assert manager.apply_change("added", outro)
+        assert manager.apply_change("added", goodbye)
+        assert not manager.apply_change("added", nested)
+        assert manager.generic_outros == [outro]
+        assert manager.shutdown_announcements == [goodbye]
+
+    def test_non_assets_ignored(self, manager, tmp_path):
+        assert not manager.apply_change("added", str(tmp_path / "intros" / "notes.txt"))
+        assert not manager.apply_change("added", str(tmp_path / "JulieScene_01.mp3"))
+        assert not manager.apply_change("added", str(tmp_path / ".trash" / "SongC_intro.mp3"))
+
+    def test_directory_removal_drops_assets_under_it(self, manager, tmp_path):
+        assert manager.apply_change("removed", str(tmp_path / "intros"), is_dir=True)
+        assert manager.intros_per_song == {}
+        assert manager.generic_intros  # other directories untouched
+
+    def test_changes_during_scan_survive_the_swap(self, manager, tmp_path):
+        late = str(tmp_path / "intros" / "SongZ_intro.mp3")
+        original_classify = manager._classify
+
+        def classify_and_race(full_path):
+            # A change lands while the walk is in progress
+            if full_path.endswith("SongA_intro1.mp3"):
+                manager.apply_change("added", late)
+            return original_classify(full_path)
+
+        manager._classify = classify_and_race
+        manager._scan()
+        assert manager.intros_per_song["SongZ"] == [late]
+
+    def test_watching_moves_rescan_off_think_path(self, manager):
+        manager.set_watching(True)
+        manager.watched_scan_interval_seconds = 0
+        scanned_on = []
+        manager._scan = lambda: scanned_on.append(threading.current_thread().name)
+        manager.maybe_rescan()
+        manager._scan_thread.join(timeout=5.0)
+        assert scanned_on == ["asset-rescan"]
+
+
+class TestMediaLibraryApplyChanges:
+    @pytest.fixture
+    def library(self, tmp_path):
+        regular, holiday = str(tmp_path / "regular"), str(tmp_path / "holiday")
+        tracks = [os.path.join(regular, "b.mp3"), os.path.join(regular, "d.mp3")]
+        return MediaLibrary(
+            regular_tracks=list(tracks),
+            holiday_tracks=[],
+            all_tracks=list(tracks),
+            regular_root=regular,
+            holiday_root=holiday,
+        )
+
+    def test_sorted_insert_and_remove_publish_new_lists(self, library):
+        held = library.regular_tracks
+        c = os.path.join(library.regular_root, "c.mp3")
+        jingle = os.path.join(library.holiday_root, "xmas", "jingle.mp3")
+        assert library.apply_changes([("added", c, False), ("added", jingle, False)])
+        assert c not in held  # a reader's snapshot never changes under it
+        assert library.regular_tracks == sorted(held + [c])
+        assert library.holiday_tracks == [jingle]
+        assert library.all_tracks == library.regular_tracks + library.holiday_tracks
+
+        assert library.apply_changes([("removed", c, False)])
+        assert c not in library.all_tracks
+
+    def test_ignores_non_tracks_and_duplicates(self, library):
+        root = library.regular_root
+        assert not library.apply_changes([
+            ("added", os.path.join(root, "b.mp3"), False),
+            ("added", os.path.join(root, "cover.jpg"), False),
+            ("added", os.path.join(root, ".hidden", "x.mp3"), False),
+            ("added", "/elsewhere/x.mp3", False),
+        ])
+
+    def test_directory_removal(self, library):
+        album = os.path.join(library.regular_root, "album")
+        library.apply_changes([("added", os.path.join(album, "one.mp3"), False)])
+        assert library.apply_changes([("removed", album, True)])
+        assert len(library.regular_tracks) == 2
+
+
+def test_network_filesystem_detected_by_longest_mount_point(tmp_path):
+    mounts = tmp_path / "mounts"
+    mounts.write_text(
+        "/dev/sda1 / ext4 rw 0 0\n"
+        "nas:/music /srv/music nfs4 rw 0 0\n"
+        "/dev/sdb1 /srv/music/local xfs rw 0 0\n"
+        "//nas/dj /srv/dj\\040cache cifs rw 0 0\n"
+    )
+    assert is_network_filesystem("/srv/music/album/a.mp3", str(mounts))
+    assert is_network_filesystem("/srv/dj cache", str(mounts))
+    assert not is_network_filesystem("/srv/music/local/a.mp3", str(mounts))
+    assert not is_network_filesystem("/srv/musicbox", str(mounts))
+    assert not is_network_filesystem("/srv/music", str(tmp_path / "missing"))
@@ -0,0 +1,115 @@
+"""
+Tests for MediaLibrary's persisted, incrementally revalidated LibraryIndex.
+"""
+
+import os
+
+import pytest
+
+from station.music_logic.library_index import LibraryIndex
+from station.music_logic.media_library import MediaLibrary
+from station.music_logic.rotation import RotationManager
+
+
+def _touch(path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(b"x")
+
+
+@pytest.fixture
+def roots(tmp_path, monkeypatch):
+    regular = tmp_path / "regular"
+    holiday = tmp_path / "holiday"
+    for rel in ("a/one.mp3", "a/b/two.mp3", "three.mp3", "a/notes.txt", ".hidden.mp3", "a/UPPER.MP3"):
+        _touch(str(regular / rel))
+    _touch(str(holiday / "xmas/jingle.mp3"))
+    monkeypatch.setenv("REGULAR_MUSIC_PATH", str(regular))
+    monkeypatch.setenv("HOLIDAY_MUSIC_PATH", str(holiday))
+    return str(regular), str(holiday)
+
+
+def _index_path(tmp_path):
+    return str(tmp_path / "library.json")
+
+
+class TestColdStart:
+    def test_scan_matches_recursive_glob(self, roots, tmp_path):
+        regular, holiday = roots
+        library = MediaLibrary.from_env(index=LibraryIndex(_index_path(tmp_path)))
+        assert library.regular_tracks == sorted([
+            os.path.join(regular, "a", "b", "two.mp3"),
+            os.path.join(regular, "a", "one.mp3"),
+            os.path.join(regular, "three.mp3"),
+        ])
+        assert library.holiday_tracks == [os.path.join(holiday, "xmas", "jingle.mp3")]
+        assert library.all_tracks == library.regular_tracks + library.holiday_tracks
+        assert not library.needs_validation
+        assert os.path.exists(_index_path(tmp_path))
+
+    def test_missing_root_raises(self, roots, monkeypatch, tmp_path):
+        monkeypatch.setenv("HOLIDAY_MUSIC_PATH", str(tmp_path / "nope"))
+        with pytest.raises(RuntimeError):
+            MediaLibrary.from_env(index=LibraryIndex(_index_path(tmp_path)))
+
+
+class TestWarmStart:
+    def test_served_from_index_then_revalidated(self, roots, tmp_path):
+        regular, _ = roots
+        MediaLibrary.from_env(index=LibraryIndex(_index_path(tmp_path)))
+        new_track = os.path.join(regular, "a", "b", "four.mp3")
+        _touch(new_track)
+
+        library = MediaLibrary.from_env(index=LibraryIndex(_index_path(tmp_path)))
+        assert library.needs_validation
+        assert new_track not in library.regular_tracks
+
+        held = library.regular_tracks
+        assert library.revalidate()
+        assert new_track not in held  # new lists are published; a held snapshot never changes
+        assert new_track in library.regular_tracks
+        assert new_track in library.all_tracks
+
+    def test_only_changed_directories_are_listed(self, roots, tmp_path):
+        regular, _ = roots
+        index = LibraryIndex(_index_path(tmp_path))
+        first = index.scan(regular)
+        assert first.dirs_listed == first.dirs_checked == 3
+
+        unchanged = index.scan(regular)
+        assert unchanged.dirs_listed == 0
+
+        _touch(os.path.join(regular, "a", "b", "five.mp3"))
+        changed = index.scan(regular)
+        assert changed.dirs_checked == 3 and changed.dirs_listed == 1
+
+    def test_removed_directory_drops_its_tracks(self, roots, tmp_path):
+        regular, _ = roots
+        index = LibraryIndex(_index_path(tmp_path))
+        index.scan(regular)
+        two = os.path.join(regular, "a", "b", "two.mp3")
+        os.remove(two)
+        os.rmdir(os.path.join(regular, "a", "b"))
+        index.scan(regular)
+        assert two not in index.tracks(regular)
+
+    def test_background_validation_notifies_rotation(self, roots, tmp_path):
+        regular, holiday = roots
+        MediaLibrary.from_env(index=LibraryIndex(_index_path(tmp_path)))
+        new_track = os.path.join(holiday, "xmas", "bells.mp3")
+        _touch(new_track)
+
+        library = MediaLibrary.from_env(index=LibraryIndex(_index_path(tmp_path)))
+        rotation = RotationManager(library.regular_tracks, library.holiday_tracks)
+        thread = library.start_background_validation(
+            on_change=lambda lib: rotation.set_tracks(lib.regular_tracks, lib.holiday_tracks)
+        )
+        thread.join(timeout=5.0)
+        assert new_track in rotation._holiday_tracks
+
+    def test_corrupt_index_rebuilds(self, roots, tmp_path):
+        with open(_index_path(tmp_path), "w") as f:
+            f.write("{not json")
+        library = MediaLibrary.from_env(index=LibraryIndex(_index_path(tmp_path)))
+        assert len(library.regular_tracks) == 3
+        assert not library.needs_validation
@@ -0,0 +1,142 @@
+"""
+Tests for MediaMetadataIndex (persistent path+size+mtime keyed metadata cache).
+
+A counting fake prober stands in for ffprobe so the tests can assert exactly
+when a probe (a subprocess spawn in production) happens.
+"""
+
+import os
+import threading
+
+import pytest
+
+from station.broadcast_core.playout_engine import _get_audio_duration, _get_mp3_metadata
+from station.music_logic.metadata_index import MediaMetadataIndex, set_metadata_index
+
+
+class CountingProber:
+    def __init__(self, duration=123.0):
+        self.calls = []
+        self.duration = duration
+
+    def __call__(self, path):
+        self.calls.append(path)
+        if path.endswith("bad.mp3"):
+            return None
+        return {
+            "title": os.path.basename(path),
+            "artist": "Artist",
+            "album": None,
+            "duration": self.duration,
+            "sample_rate": 44100,
+            "channels": 2,
+        }
+
+
+@pytest.fixture
+def track(tmp_path):
+    path = tmp_path / "song.mp3"
+    path.write_bytes(b"\xff\xfb" + b"\x00" * 256)
+    return str(path)
+
+
+class TestLookup:
+    def test_miss_probes_then_hits(self, track):
+        prober = CountingProber()
+        index = MediaMetadataIndex(prober=prober)
+        assert index.lookup(track)["duration"] == 123.0
+        assert index.lookup(track)["title"] == "song.mp3"
+        assert len(prober.calls) == 1
+        assert index.stats()["hits"] == 1 and index.stats()["misses"] == 1
+
+    def test_changed_file_is_reprobed(self, track):
+        prober = CountingProber()
+        index = MediaMetadataIndex(prober=prober)
+        index.lookup(track)
+        with open(track, "ab") as f:
+            f.write(b"\x00" * 10)
+        assert index.get(track) is None
+        index.lookup(track)
+        assert len(prober.calls) == 2
+
+    def test_failed_probe_not_cached(self, tmp_path):
+        bad = tmp_path / "bad.mp3"
+        bad.write_bytes(b"junk")
+        prober = CountingProber()
+        index = MediaMetadataIndex(prober=prober)
+        assert index.lookup(str(bad))["duration"] is None
+        index.lookup(str(bad))
+        assert len(prober.calls) == 2
+        assert index.stats()["probe_failures"] == 2
+
+    def test_missing_file_returns_empty_metadata(self, tmp_path):
+        prober = CountingProber()
+        index = MediaMetadataIndex(prober=prober)
+        metadata = index.lookup(str(tmp_path / "nope.mp3"))
+        assert metadata["duration"] is None and metadata["title"] is None
+        assert prober.calls == []
+
+
+class TestPersistence:
+    def test_entries_survive_reopen(self, track, tmp_path):
+        db = str(tmp_path / "index.db")
+        first = MediaMetadataIndex(path=db, prober=CountingProber())
+        first.lookup(track)
+        first.close()
+
+        prober = CountingProber()
+        second = MediaMetadataIndex(path=db, prober=prober)
+        assert len(second) == 1
+        assert second.lookup(track)["sample_rate"] == 44100
+        assert prober.calls == []
+        second.close()
+
+    def test_warmup_probes_only_missing(self, tmp_path):
+        paths = []
+        for i in range(5):
+            p = tmp_path / f"t{i}.mp3"
+            p.write_bytes(b"x" * (i + 1))
+            paths.append(str(p))
+        prober = CountingProber()
+        index = MediaMetadataIndex(path=str(tmp_path / "index.db"), prober=prober)
+        index.lookup(paths[0])
+        index.start_warmup(paths)
+        index._warmup_thread.join(timeout=5.0)
+        assert sorted(prober.calls) == sorted(paths)
+        index.close()
+
+    def test_paths_added_during_warmup_are_queued(self, tmp_path):
+        paths = []
+        for name in ("a.mp3", "b.mp3", "c.mp3"):
+            p = tmp_path / name
+            p.write_bytes(b"x")
+            paths.append(str(p))
+        release = threading.Event()
+        counting = CountingProber()
+
+        def prober(path):
+            release.wait(5.0)  # hold the first warm-up while more paths arrive
+            return counting(path)
+
+        index = MediaMetadataIndex(path=str(tmp_path / "index.db"), prober=prober)
+        index.start_warmup(paths[:1])
+        first = index._warmup_thread
+        index.start_warmup(paths[:2])  # a.mp3 again: queued once, probed once
+        index.start_warmup(paths[2:])
+        assert index._warmup_thread is first  # queued, not a second thread
+        release.set()
+        first.join(timeout=5.0)
+        assert sorted(counting.calls) == sorted(paths)
+        index.close()
+
+
+class TestModuleHelpers:
+    def test_playout_helpers_use_process_index(self, track):
+        prober = CountingProber(duration=42.5)
+        set_metadata_index(MediaMetadataIndex(prober=prober))
+        try:
+            assert _get_mp3_metadata(track)["duration"] == 42.5
+            assert _get_audio_duration(track) == 42.5
+            assert len(prober.calls) == 1
+        finally:
+            set_metadata_index(None)
@@ -0,0 +1,142 @@
+"""
+Tests for the in-process MP3 probe (ID3v2/ID3v1, Xing/Info/VBRI, CBR).
+
+MP3s are synthesised frame by frame (valid headers, silent payload) so the
+expected durations are exact.
+"""
+
+import struct
+
+import pytest
+
+from station.music_logic import metadata_index
+from station.music_logic.mp3_probe import parse_frame_header, probe_mp3
+
+# MPEG-1 Layer III, 128 kbps, 44.1 kHz, no CRC: 417/418 byte frames, 1152 samples
+MPEG1_L3_128K = bytes([0xFF, 0xFB, 0x90, 0x00])
+MPEG1_L3_128K_MONO = bytes([0xFF, 0xFB, 0x90, 0xC0])
+FRAME_LEN = 417
+
+
+def _frames(count, header=MPEG1_L3_128K):
+    frame = header + b"\x00" * (FRAME_LEN - 4)
+    return frame * count
+
+
+def _syncsafe(n):
+    return bytes([(n >> 21) & 0x7F, (n >> 14) & 0x7F, (n >> 7) & 0x7F, n & 0x7F])
+
+
+def _id3v2(frames, major=3, padding=64):
+    body = b""
+    for frame_id, text in frames:
+        payload = b"\x03" + text.encode("utf-8") if major == 4 else b"\x00" + text.encode("latin-1")
+        size = _syncsafe(len(payload)) if major == 4 else struct.pack(">I", len(payload))
+        body += frame_id + size + b"\x00\x00" + payload
+    body += b"\x00" * padding
+    return b"ID3" + bytes([major, 0, 0]) + _syncsafe(len(body)) + body
+
+
+def _id3v1(title, artist, album):
+    def field(s):
+        return s.encode("latin-1").ljust(30, b"\x00")
+    return b"TAG" + field(title) + field(artist) + field(album) + b"2001" + b"\x00" * 30 + b"\x00"
+
+
+def _xing_frame(frame_count, header=MPEG1_L3_128K, tag=b"Xing"):
+    side_info = 17 if header[3] & 0xC0 == 0xC0 else 32
+    body = b"\x00" * side_info + tag + struct.pack(">II", 0x1, frame_count)
+    return header + body + b"\x00" * (FRAME_LEN - 4 - len(body))
+
+
+def _vbri_frame(frame_count):
+    body = b"\x00" * 32 + b"VBRI" + struct.pack(">HHHII", 1, 0, 75, 0, frame_count)
+    return MPEG1_L3_128K + body + b"\x00" * (FRAME_LEN - 4 - len(body))
+
+
+def _write(tmp_path, data, name="t.mp3"):
+    path = tmp_path / name
+    path.write_bytes(data)
+    return str(path)
+
+
+class TestFrameHeader:
+    def test_mpeg1_layer3(self):
+        header = parse_frame_header(MPEG1_L3_128K, 0)
+        assert header.sample_rate == 44100
+        assert header.bitrate_kbps == 128
+        assert header.channels == 2
+        assert header.samples_per_frame == 1152
+        assert header.frame_length == FRAME_LEN
+
+    def test_reserved_values_rejected(self):
+        assert parse_frame_header(bytes([0xFF, 0xFB, 0xF0, 0x00]), 0) is None  # bitrate 15
+        assert parse_frame_header(bytes([0xFF, 0xFB, 0x9C, 0x00]), 0) is None  # sample rate 3
+        assert parse_frame_header(b"\x00\x00\x00\x00", 0) is None
+
+
+class TestProbe:
+    def test_cbr_duration_from_size(self, tmp_path):
+        path = _write(tmp_path, _frames(100))
+        metadata = probe_mp3(path)
+        assert metadata["duration"] == pytest.approx(100 * FRAME_LEN * 8 / 128000)
+        assert metadata["sample_rate"] == 44100
+        assert metadata["channels"] == 2
+
+    def test_xing_frame_count_is_exact(self, tmp_path):
+        path = _write(tmp_path, _xing_frame(1000) + _frames(20))
+        assert probe_mp3(path)["duration"] == pytest.approx(1000 * 1152 / 44100)
+
+    def test_info_tag_mono(self, tmp_path):
+        data = _xing_frame(500, header=MPEG1_L3_128K_MONO, tag=b"Info") + _frames(5, MPEG1_L3_128K_MONO)
+        metadata = probe_mp3(_write(tmp_path, data))
+        assert metadata["duration"] == pytest.approx(500 * 1152 / 44100)
+        assert metadata["channels"] == 1
+
+    def test_vbri_frame_count(self, tmp_path):
+        path = _write(tmp_path, _vbri_frame(250) + _frames(5))
+        assert probe_mp3(path)["duration"] == pytest.approx(250 * 1152 / 44100)
+
+    @pytest.mark.parametrize("major", [3, 4])
+    def test_id3v2_tags(self, tmp_path, major):
+        tag = _id3v2([(b"TIT2", "Song"), (b"TPE1", "Band"), (b"TALB", "Record")], major=major)
+        metadata = probe_mp3(_write(tmp_path, tag + _frames(50)))
+        assert (metadata["title"], metadata["artist"], metadata["album"]) == ("Song", "Band", "Record")
+        assert metadata["duration"] == pytest.approx(50 * FRAME_LEN * 8 / 128000)
+
+    def test_id3v1_tags_and_length_excluded(self, tmp_path):
+        data = _frames(50) + _id3v1("Old Song", "Old Band", "Old Record")
+        metadata = probe_mp3(_write(tmp_path, data))
+        assert metadata["title"] == "Old Song"
+        assert metadata["album"] == "Old Record"
+        assert metadata["duration"] == pytest.approx(50 * FRAME_LEN * 8 / 128000)
+
+    def test_id3v2_wins_over_id3v1(self, tmp_path):
+        data = _id3v2([(b"TIT2", "New")]) + _frames(10) + _id3v1("Old", "Band", "Record")
+        metadata = probe_mp3(_write(tmp_path, data))
+        assert metadata["title"] == "New"
+        assert metadata["artist"] == "Band"
+
+    def test_large_id3v2_tag_beyond_head(self, tmp_path):
+        tag = _id3v2([(b"TIT2", "Art")], padding=40 * 1024)
+        metadata = probe_mp3(_write(tmp_path, tag + _frames(10)))
+        assert metadata["title"] == "Art"
+        assert metadata["duration"] == pytest.approx(10 * FRAME_LEN * 8 / 128000)
+
+    def test_garbage_fails_validation(self, tmp_path):
+        assert probe_mp3(_write(tmp_path, b"not really audio" * 100)) is None
+        # Lone false sync: the frame it implies is not followed by another header
+        assert probe_mp3(_write(tmp_path, MPEG1_L3_128K + b"junk" * 200, "sync.mp3")) is None
+        assert probe_mp3(str(tmp_path / "missing.mp3")) is None
+
+
+class TestProbeMediaFallback:
+    def test_ffprobe_only_when_validation_fails(self, tmp_path, monkeypatch):
+        calls = []
+        monkeypatch.setattr(metadata_index, "probe_ffprobe", lambda path: calls.append(path) or None)
+        good = _write(tmp_path, _frames(10), "good.mp3")
+        bad = _write(tmp_path, b"junk" * 100, "bad.mp3")
+        assert metadata_index.probe_media(good)["duration"] is not None
+        assert calls == []
+        assert metadata_index.probe_media(bad) is None
+        assert calls == [bad]
@@ -0,0 +1,144 @@
+"""
+Tests for the pooled zero-copy PCM path (PCMFramePool → FFmpegDecoder →
+Mixer → TowerPCMSink → PCMOutputPipeline recycle).
+
+Gain semantics follow MIXER_CONTRACT MX1.1; frame format follows FD1.1.
+"""
+
+import os
+import shutil
+import socket
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from station.broadcast_core.ffmpeg_decoder_pool import FFmpegDecoderPool
+from station.broadcast_core.frame_pool import PCMFramePool
+from station.broadcast_core.pcm_output_pipeline import PCMOutputPipeline
+from station.mixer.mixer import Mixer
+from station.outputs.tower_pcm_sink import TowerPCMSink
+from station.tests.contracts.conftest import CANONICAL_FRAME_BYTES, CANONICAL_FRAME_SIZE_SAMPLES
+
+
+def _legacy_gain(frame, gain):
+    out = frame.astype(np.float32) * float(gain)
+    np.clip(out, -32768.0, 32767.0, out=out)
+    return out.astype(np.int16)
+
+
+class TestFramePool:
+    def test_recycles_frames_without_allocating(self):
+        pool = PCMFramePool(prealloc=2)
+        a = pool.acquire()
+        b = pool.acquire()
+        pool.release(a)
+        pool.release(b)
+        assert pool.acquire() is b
+        assert pool.allocations == 0
+
+    def test_grows_when_exhausted(self):
+        pool = PCMFramePool(prealloc=1)
+        pool.acquire()
+        extra = pool.acquire()
+        assert pool.allocations == 1
+        assert pool.owns(extra)
+
+    def test_drops_frames_beyond_max_frames_on_release(self):
+        pool = PCMFramePool(prealloc=2, max_frames=3)
+        burst = [pool.acquire() for _ in range(6)]
+        assert pool.allocations == 4 and pool.size() == 6
+        for frame in burst:
+            pool.release(frame)
+        assert pool.size() == 3 and pool.free_count() == 3
+        assert pool.dropped == 3
+        assert not pool.owns(burst[0]) and pool.owns(burst[-1])
+
+    def test_ignores_foreign_frames(self):
+        pool = PCMFramePool(prealloc=0)
+        pool.release(np.zeros((CANONICAL_FRAME_SIZE_SAMPLES, 2), dtype=np.int16))
+        assert pool.free_count() == 0
+
+
+class TestMixerInPlace:
+    @pytest.mark.parametrize("gain", [0.5, 1.7, 4.0])
+    def test_in_place_gain_matches_legacy(self, gain):
+        """MX1.1: in-place gain is bit-identical to the float32/int16 temporaries path."""
+        rng = np.random.default_rng(1)
+        frame = rng.integers(-32768, 32767, size=(CANONICAL_FRAME_SIZE_SAMPLES, 2), dtype=np.int16)
+        expected = _legacy_gain(frame, gain)
+        out = Mixer().mix(frame, gain=gain)
+        assert out is frame
+        assert np.array_equal(out, expected)
+
+    def test_read_only_frame_gets_new_array(self):
+        data = np.full((CANONICAL_FRAME_SIZE_SAMPLES, 2), 100, dtype=np.int16).tobytes()
+        frame = np.frombuffer(data, dtype=np.int16).reshape(-1, 2)
+        out = Mixer().mix(frame, gain=0.5)
+        assert out is not frame
+        assert int(out[0, 0]) == 50
+
+
+@pytest.mark.skipif(shutil.which("cat") is None, reason="requires cat")
+class TestDecoderReadsIntoPool:
+    def test_frames_come_from_pool_and_partial_tail_dropped(self, tmp_path):
+        data = os.urandom(CANONICAL_FRAME_BYTES * 2 + 100)
+        path = tmp_path / "segment.raw"
+        path.write_bytes(data)
+        frame_pool = PCMFramePool(prealloc=4)
+        decoder = FFmpegDecoderPool(size=0, command=["cat"]).acquire(str(path))
+
+        out = []
+        for frame in decoder.read_frames(frame_pool):
+            assert frame_pool.owns(frame)
+            out.append(frame.tobytes())
+            frame_pool.release(frame)
+
+        assert b"".join(out) == data[: CANONICAL_FRAME_BYTES * 2]
+        assert frame_pool.allocations == 0
+
+
+class TestZeroCopySendAndRecycle:
+    def test_pipeline_sends_pooled_frames_and_recycles_them(self, tmp_path):
+        sock_path = str(tmp_path / "pcm.sock")
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(sock_path)
+        server.listen(1)
+        received = bytearray()
+
+        def _reader():
+            conn, _ = server.accept()
+            with conn:
+                while len(received) < CANONICAL_FRAME_BYTES * 3:
+                    chunk = conn.recv(65536)
+                    if not chunk:
+                        break
+                    received.extend(chunk)
+
+        reader = threading.Thread(target=_reader, daemon=True)
+        reader.start()
+
+        sink = TowerPCMSink(socket_path=sock_path)
+        frame_pool = PCMFramePool(prealloc=3)
+        pipeline = PCMOutputPipeline(sink, frame_pool=frame_pool)
+        frames = []
+        for value in (1, 2, 3):
+            frame = frame_pool.acquire()
+            frame.fill(value)
+            frames.append(frame.tobytes())
+            assert pipeline.push(frame)
+
+        pipeline.start()
+        try:
+            reader.join(timeout=2.0)
+            deadline = time.monotonic() + 1.0
+            while frame_pool.free_count() < 3 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            pipeline.stop()
+            sink.close()
+            server.close()
+
+        assert bytes(received[: CANONICAL_FRAME_BYTES * 3]) == b"".join(frames)
+        assert frame_pool.free_count() == 3, "sent frames must be recycled"
@@ -0,0 +1,144 @@
+"""
+Tests for PCMOutputPipeline backpressure and waitable queue levels.
+
+The pump cadence itself (one frame per ~21.333ms, silence when empty) is
+covered by STATION_TOWER_PCM_BRIDGE_CONTRACT tests; these cover producer
+blocking, push_many(), wait_for_depth()/wait_drained() and counters.
+"""
+
+import threading
+import time
+
+import pytest
+
+from station.broadcast_core.pcm_output_pipeline import (
+    FRAME_DURATION_SEC,
+    PCMOutputPipeline,
+    capacity_frames_for_ms,
+)
+from station.tests.contracts.test_doubles import StubOutputSink, create_canonical_pcm_frame
+
+MIN_CAPACITY_MS = 8 * FRAME_DURATION_SEC * 1000.0
+
+
+def _frames(n, start=1):
+    out = []
+    for i in range(n):
+        f = create_canonical_pcm_frame()
+        f.fill(start + i)
+        out.append(f)
+    return out
+
+
+class TestCapacity:
+    def test_capacity_expressed_in_ms(self):
+        pipeline = PCMOutputPipeline(StubOutputSink(), capacity_ms=500.0)
+        assert pipeline.capacity == capacity_frames_for_ms(500.0) == 23
+        assert pipeline.capacity_ms == pytest.approx(23 * FRAME_DURATION_SEC * 1000.0)
+
+    def test_minimum_capacity(self):
+        assert capacity_frames_for_ms(1.0) == 8
+
+
+class TestPushMany:
+    def test_push_many_enqueues_in_order(self):
+        sink = StubOutputSink()
+        pipeline = PCMOutputPipeline(sink, capacity_ms=MIN_CAPACITY_MS)
+        assert pipeline.push_many(_frames(5)) == 5
+        assert pipeline.depth() == 5
+
+    def test_non_blocking_push_many_returns_partial_count(self):
+        pipeline = PCMOutputPipeline(StubOutputSink(), capacity_ms=MIN_CAPACITY_MS)
+        assert pipeline.push_many(_frames(10), block=False) == 8
+        assert pipeline.stats()["dropped_push"] == 2
+
+    def test_blocked_producer_wakes_when_pump_frees_space(self):
+        sink = StubOutputSink()
+        pipeline = PCMOutputPipeline(sink, capacity_ms=MIN_CAPACITY_MS)
+        pipeline.push_many(_frames(8))
+        result = {}
+
+        def producer():
+            result["pushed"] = pipeline.push_many(_frames(2, start=100), timeout=5.0)
+
+        t = threading.Thread(target=producer)
+        t.start()
+        pipeline.start()
+        try:
+            t.join(timeout=2.0)
+        finally:
+            pipeline.stop()
+        assert result.get("pushed") == 2
+        stats = pipeline.stats()
+        assert stats["producer_block_count"] >= 1
+        assert stats["producer_block_ms"] > 0.0
+
+    def test_stop_releases_blocked_producer(self):
+        pipeline = PCMOutputPipeline(StubOutputSink(), capacity_ms=MIN_CAPACITY_MS)
+        pipeline.push_many(_frames(8))
+        result = {}
+        t = threading.Thread(target=lambda: result.setdefault("ok", pipeline.push(_frames(1)[0], timeout=10.0)))
+        t.start()
+        time.sleep(0.05)
+        pipeline.stop()
+        t.join(timeout=1.0)
+        assert not t.is_alive()
+        assert result["ok"] is False
+
+
+class TestWaitableLevels:
+    def test_wait_for_depth_wakes_on_push(self):
+        pipeline = PCMOutputPipeline(StubOutputSink())
+        threading.Timer(0.05, lambda: pipeline.push_many(_frames(3))).start()
+        start = time.monotonic()
+        assert pipeline.wait_for_depth(3, timeout=2.0) == 3
+        assert time.monotonic() - start < 1.0
+
+    def test_wait_for_depth_times_out(self):
+        pipeline = PCMOutputPipeline(StubOutputSink())
+        assert pipeline.wait_for_depth(1, timeout=0.05) == 0
+
+    def test_wait_drained_after_frames_written(self):
+        sink = StubOutputSink()
+        pipeline = PCMOutputPipeline(sink)
+        pipeline.push_many(_frames(3))
+        pipeline.start()
+        try:
+            assert pipeline.wait_drained(timeout=2.0) is True
+            # Drained means written to the sink, not merely dequeued
+            program = [f for f in sink.written_frames if f[0, 0] != 0]
+            assert [int(f[0, 0]) for f in program] == [1, 2, 3]
+        finally:
+            pipeline.stop()
+
+    def test_abort_predicate_with_interrupt(self):
+        pipeline = PCMOutputPipeline(StubOutputSink())
+        pipeline.push_many(_frames(1))
+        aborted = threading.Event()
+
+        def trigger():
+            aborted.set()
+            pipeline.interrupt()
+
+        threading.Timer(0.05, trigger).start()
+        start = time.monotonic()
+        assert pipeline.wait_drained(timeout=5.0, abort=aborted.is_set) is False
+        assert time.monotonic() - start < 1.0
+
+
+class TestStarveCounters:
+    def test_starve_event_counted_once_per_transition(self):
+        sink = StubOutputSink()
+        pipeline = PCMOutputPipeline(sink)
+        pipeline.start()
+        try:
+            time.sleep(FRAME_DURATION_SEC * 4)
+            pipeline.push_many(_frames(2))
+            pipeline.wait_drained(timeout=1.0)
+            time.sleep(FRAME_DURATION_SEC * 4)
+        finally:
+            pipeline.stop()
+        stats = pipeline.stats()
+        assert stats["starve_events"] == 2
+        assert stats["program_frames_sent"] == 2
+        assert stats["silence_frames_sent"] >= 4
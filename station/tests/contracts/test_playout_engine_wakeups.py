@@ -0,0 +1,109 @@
+"""
+Tests for the event-driven PlayoutEngine loop.
+
+The playout thread blocks on a single wakeup event (queue arrival, segment
+decode completion, DRAINING/shutdown transitions, stop) instead of polling.
+`cat` stands in for ffmpeg: segments are raw s16le files streamed through the
+same stdin/stdout pipe a warm decoder uses.
+"""
+
+import threading
+import time
+import uuid
+
+import numpy as np
+import pytest
+
+from station.broadcast_core.audio_event import AudioEvent
+from station.broadcast_core.ffmpeg_decoder_pool import FFmpegDecoderPool
+from station.broadcast_core.playout_engine import PlayoutEngine
+from station.broadcast_core.playout_queue import PlayoutQueue
+from station.broadcast_core.segment_decoder import SegmentDecoder
+from station.broadcast_core.pcm_output_pipeline import PCMOutputPipeline
+from station.mixer.mixer import Mixer
+from station.tests.contracts.test_doubles import StubOutputSink
+
+FRAME_BYTES = 1024 * 2 * 2
+
+
+@pytest.fixture
+def raw_segment(tmp_path):
+    path = tmp_path / "segment.raw"
+    path.write_bytes(np.ones(12 * FRAME_BYTES // 2, dtype=np.int16).tobytes())
+    return str(path)
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    monkeypatch.setenv("DECODER_POOL_SIZE", "0")
+    engine = PlayoutEngine(output_sink=StubOutputSink())
+    engine._decoder_pool = FFmpegDecoderPool(size=0, command=["cat"])
+    yield engine
+    engine.stop()
+
+
+def _event(path):
+    return AudioEvent(path=path, type="song", intent_id=uuid.uuid4())
+
+
+class TestPlayoutQueueSignal:
+    def test_enqueue_invokes_callback(self):
+        calls = []
+        queue = PlayoutQueue(on_enqueue=lambda: calls.append(1))
+        queue.enqueue_multiple([_event("/a.mp3"), _event("/b.mp3")])
+        assert len(calls) == 2
+
+
+class TestSegmentDecoderCompletion:
+    def test_wait_and_on_done_fire_at_eof(self, raw_segment):
+        done = threading.Event()
+        pipeline = PCMOutputPipeline(StubOutputSink())
+        task = SegmentDecoder(
+            path=raw_segment,
+            gain=1.0,
+            mixer=Mixer(),
+            pipeline=pipeline,
+            decoder_factory=FFmpegDecoderPool(size=0, command=["cat"]).acquire,
+            on_done=done.set,
+        )
+        task.start()
+        assert task.wait(timeout=5.0)
+        assert done.is_set()
+        assert task.exhausted
+        assert task.frames_pushed == 12
+
+
+class TestEventDrivenLoop:
+    def test_idle_loop_does_not_poll(self, engine):
+        engine.run()
+        time.sleep(1.5)
+        # Safety timeout is 1s — the old loop woke every 50ms (~30 wakeups here)
+        assert engine.stats()["wakeups"] <= 3
+
+    def test_queue_arrival_wakes_loop(self, engine, raw_segment):
+        engine.run()
+        time.sleep(0.2)
+        queued_at = time.monotonic()
+        engine.queue_audio([_event(raw_segment)])
+        deadline = time.monotonic() + 2.0
+        while engine.get_current_segment() is None and time.monotonic() < deadline:
+            time.sleep(0.001)
+        assert engine._segment_start_time - queued_at < 0.1
+
+    def test_back_to_back_segments_record_transition_latency(self, engine, raw_segment):
+        engine.queue_audio([_event(raw_segment), _event(raw_segment)])
+        engine.run()
+        deadline = time.monotonic() + 10.0
+        while engine.stats()["transitions"] < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        stats = engine.stats()
+        assert stats["transitions"] == 1
+        assert stats["transition_ms_last"] < 100.0
+
+    def test_terminal_playout_wait_returns_on_completion(self, engine):
+        engine.run()
+        engine.set_draining(True)
+        # No DJ callback: terminal DO is marked executed and playout completes
+        assert engine.wait_for_terminal_playout(timeout=2.0)
+        assert engine._terminal_playout_complete
+        assert engine.wait_for_playout_stopped(timeout=2.0)
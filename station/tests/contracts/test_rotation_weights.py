@@ -0,0 +1,137 @@
+"""
+Tests for RotationManager's vectorized weighting.
+
+The scalar _calculate_weights() is the reference: the vectorized path must
+produce the same weights (up to the clock moving between the two calls) and,
+for the same random stream, the same picks.
+"""
+
+import random
+import time
+
+import numpy as np
+import pytest
+
+from station.music_logic.rotation import HISTORY_SIZE, RotationManager
+
+
+def _tracks(count, prefix="/music/regular"):
+    return [f"{prefix}/track_{i:04d}.mp3" for i in range(count)]
+
+
+@pytest.fixture
+def no_holiday_season(monkeypatch):
+    monkeypatch.setattr(RotationManager, "is_holiday_season", lambda self: False)
+
+
+def _played_manager(regular, holiday=(), plays=120, seed=7):
+    manager = RotationManager(regular, list(holiday))
+    rng = random.Random(seed)
+    now = time.time()
+    # Spread plays over the last few days so every weighting rule is exercised
+    history = []
+    for i in range(plays):
+        path = rng.choice(regular + list(holiday))
+        history.append((path, now - (plays - i) * 3600 * rng.random(), manager._is_holiday_track(path)))
+    manager.history = history[-HISTORY_SIZE:]
+    counts, holiday_counts = {}, {}
+    for path, _, is_holiday in history:
+        target = holiday_counts if is_holiday else counts
+        target[path] = target.get(path, 0) + 1
+    manager.play_counts = counts
+    manager.holiday_play_counts = holiday_counts
+    return manager
+
+
+class TestVectorizedWeights:
+    def test_matches_scalar_reference(self):
+        regular = _tracks(200)
+        holiday = _tracks(30, prefix="/music/holiday")
+        manager = _played_manager(regular, holiday)
+
+        expected, _, _ = manager._calculate_weights(regular, [])
+        actual = manager._candidate_weights(manager._rows_for(regular))
+        np.testing.assert_allclose(actual, expected, rtol=1e-6)
+
+        expected, _, _ = manager._calculate_weights([], holiday)
+        actual = manager._candidate_weights(manager._rows_for(holiday))
+        np.testing.assert_allclose(actual, expected, rtol=1e-6)
+
+    def test_record_updates_features_incrementally(self):
+        regular = _tracks(60)
+        manager = _played_manager(regular, plays=10)
+        for path in regular[:HISTORY_SIZE + 5]:
+            manager.record_song_played(path)
+        assert len(manager.history) == HISTORY_SIZE
+        assert manager.last_played_index[regular[0]] == manager._history_seq - (HISTORY_SIZE + 5)
+
+        expected, _, _ = manager._calculate_weights(regular, [])
+        actual = manager._candidate_weights(manager._rows_for(regular))
+        np.testing.assert_allclose(actual, expected, rtol=1e-6)
+
+    def test_history_entry_with_other_flag_does_not_count(self):
+        manager = RotationManager(["/music/a.mp3", "/music/b.mp3"], [])
+        manager.history = [("/music/a.mp3", time.time(), True)]
+        expected, _, _ = manager._calculate_weights(["/music/a.mp3", "/music/b.mp3"], [])
+        actual = manager._candidate_weights(manager._rows_for(["/music/a.mp3", "/music/b.mp3"]))
+        np.testing.assert_allclose(actual, expected)
+
+
+class TestSelection:
+    def test_same_picks_as_reference_for_same_random_stream(self, no_holiday_season):
+        regular = _tracks(300)
+        holiday = _tracks(20, prefix="/music/holiday")
+        vectorized = _played_manager(regular, holiday)
+        reference = _played_manager(regular, holiday)
+
+        random.seed(1234)
+        picks = []
+        for _ in range(200):
+            picks.append(vectorized.select_next_song())
+            vectorized.record_song_played(picks[-1])
+
+        random.seed(1234)
+        for pick in picks:
+            random.random()  # holiday pool draw (probability 0 outside the season)
+            weights, tracks, _ = reference._calculate_weights(regular, [])
+            total = sum(weights)
+            expected = tracks[random.choices(range(len(tracks)), weights=[w / total for w in weights])[0]]
+            assert pick == expected
+            reference.record_song_played(expected)
+
+    def test_exclude_skips_current_song_unless_only_one(self):
+        manager = RotationManager(["/music/a.mp3", "/music/b.mp3"], [])
+        for _ in range(20):
+            assert manager.select_next_song(exclude="/music/a.mp3") == "/music/b.mp3"
+        single = RotationManager(["/music/a.mp3"], [])
+        assert single.select_next_song(exclude="/music/a.mp3") == "/music/a.mp3"
+
+    def test_holiday_tracks_never_selected_outside_season(self, no_holiday_season):
+        manager = RotationManager(_tracks(5), _tracks(5, prefix="/music/holiday"))
+        for _ in range(50):
+            assert "holiday" not in manager.select_next_song()
+        with pytest.raises(ValueError):
+            RotationManager([], _tracks(3, prefix="/music/holiday")).select_next_song()
+
+    def test_unknown_available_tracks_are_added(self):
+        manager = RotationManager(_tracks(3), [])
+        assert manager.select_next_song(["/elsewhere/only.mp3"]) == "/elsewhere/only.mp3"
+
+    def test_set_tracks_keeps_history(self):
+        regular = _tracks(10)
+        manager = RotationManager(regular[:5], [])
+        manager.record_song_played(regular[0])
+        manager.set_tracks(regular, [])
+        weights = manager._candidate_weights(manager._rows_for(regular))
+        assert weights[0] < weights[1]
+        assert manager.play_counts == {regular[0]: 1}
+
+    def test_load_state_rebuilds_features(self, tmp_path):
+        regular = _tracks(5)
+        state_file = str(tmp_path / "rotation.json")
+        first = RotationManager(regular, [], state_file=state_file)
+        first.record_song_played(regular[2])
+        first.close()
+        second = RotationManager(regular, [], state_file=state_file)
+        assert second.last_played_index == {regular[2]: 0}
+        assert second._play_total == 1
@@ -0,0 +1,178 @@
+"""
+Tests for the lookahead SongPlanner: plans follow the rotation's history,
+invalidate when the weights move off the plan, and feed DJ THINK.
+"""
+
+import threading
+import time
+
+import pytest
+
+from station.dj_logic.song_planner import SongPlanner
+from station.music_logic.rotation import RotationManager
+
+
+@pytest.fixture
+def tracks(tmp_path):
+    paths = []
+    for i in range(30):
+        path = tmp_path / "music" / f"Song{i:02d}.mp3"
+        path.parent.mkdir(exist_ok=True)
+        path.write_bytes(b"\xff\xfb" + b"\x00" * 64)
+        paths.append(str(path))
+    return paths
+
+
+@pytest.fixture
+def rotation(tracks, monkeypatch):
+    monkeypatch.setattr(RotationManager, "is_holiday_season", lambda self: False)
+    return RotationManager(tracks, [])
+
+
+def _play(rotation, planner, current):
+    """One THINK/DO cycle: take (or select + rebase) the song after current, then DO records current."""
+    planned = planner.take(current)
+    if planned is None:
+        selected = rotation.select_next_song(exclude=current)
+        planner.rebase(current, selected)
+    else:
+        selected = planned.path
+    rotation.record_song_played(current)
+    planner._refill()
+    return selected, planned is not None
+
+
+class TestSongPlanner:
+    def test_fills_to_depth_after_rebase(self, rotation, tracks):
+        planner = SongPlanner(rotation, depth=4)
+        assert planner.take(tracks[0]) is None
+        planner.rebase(tracks[0], tracks[1])
+        planner._refill()
+        ahead = planner.peek()
+        assert len(ahead) == 4
+        assert planner.stats()["lag"] == 0
+        assert all(a.path != b.path for a, b in zip([planner._slots[0]] + ahead, ahead))
+
+    def test_takes_are_hits_while_history_follows_plan(self, rotation, tracks):
+        planner = SongPlanner(rotation, depth=3)
+        current, hit = _play(rotation, planner, tracks[0])
+        assert not hit
+        for _ in range(20):
+            expected = planner.peek()[0].path
+            current, hit = _play(rotation, planner, current)
+            assert hit and current == expected
+        stats = planner.stats()
+        assert stats["hits"] == 20 and stats["misses"] == 1 and stats["invalidations"] == 0
+        assert len(planner._chain) <= 5  # consumed prefix is trimmed
+
+    def test_planned_picks_see_pending_plays(self, rotation, tracks):
+        # Plays DO has not recorded yet must already weigh on the plan
+        planner = SongPlanner(rotation, depth=5)
+        planner.rebase(tracks[0], tracks[1])
+        planner._refill()
+        chain = [tracks[0], tracks[1]] + [p.path for p in planner.peek()]
+        for previous, following in zip(chain, chain[1:]):
+            assert previous != following
+
+    def test_unplanned_play_invalidates(self, rotation, tracks):
+        planner = SongPlanner(rotation, depth=3)
+        planner.rebase(tracks[0], tracks[1])
+        planner._refill()
+        rotation.record_song_played(tracks[5])  # not the song the plan hangs off
+        assert planner.stats()["invalidations"] == 1
+        assert planner.take(tracks[1]) is None
+
+    def test_state_replacement_replans_uncommitted_picks(self, rotation, tracks):
+        planner = SongPlanner(rotation, depth=3)
+        planner.rebase(tracks[0], tracks[1])
+        planner._refill()
+        rotation.set_tracks(tracks[:10], [])
+        assert planner.stats()["invalidations"] == 1
+        assert planner.peek() == []
+        planner._refill()
+        assert all(p.path in tracks[:10] for p in planner.peek())
+
+        # The committed song still advances the chain
+        rotation.record_song_played(tracks[0])
+        assert planner.take(tracks[1]) is not None
+
+    def test_skips_unreadable(self, rotation, tracks, monkeypatch):
+        rotation.set_tracks(tracks[:3], [])
+        unreadable = tracks[1]
+        monkeypatch.setattr("station.dj_logic.song_planner.os.access", lambda p, mode: p != unreadable)
+
+        planner = SongPlanner(rotation, depth=6)
+        planner.rebase(tracks[0], tracks[2])
+        planner._refill()
+        planned = planner.peek()
+        assert planned and unreadable not in [p.path for p in planned]
+
+    def test_fork_never_holds_an_uncounted_play(self, rotation, tracks, monkeypatch):
+        # A play whose notification is still in flight must not be applied twice
+        notifying, release = threading.Event(), threading.Event()
+        rotation.add_listener(lambda path: (notifying.set(), release.wait(5.0)))
+        planner = SongPlanner(rotation, depth=3)
+        planner.rebase(tracks[0], tracks[1])
+        forks = []
+        original_fork = rotation.fork
+        monkeypatch.setattr(rotation, "fork", lambda: forks.append(original_fork()) or forks[-1])
+        monkeypatch.setattr(planner, "_plan_after", lambda fork, previous: None)
+
+        player = threading.Thread(target=rotation.record_song_played, args=(tracks[0],))
+        player.start()
+        assert notifying.wait(5.0)
+        refill = threading.Thread(target=planner._refill)
+        refill.start()
+        time.sleep(0.1)
+        release.set()
+        player.join(5.0)
+        refill.join(5.0)
+
+        assert not refill.is_alive() and forks
+        assert [path for path, _, _ in forks[0].history].count(tracks[0]) == 1
+
+    def test_worker_refills_in_background(self, rotation, tracks):
+        planner = SongPlanner(rotation, depth=3)
+        planner.start()
+        try:
+            planner.rebase(tracks[0], tracks[1])
+            deadline = time.monotonic() + 5.0
+            while planner.stats()["ready"] < 3 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert planner.stats()["ready"] == 3
+        finally:
+            planner.stop()
+
+
+class TestRotationFork:
+    def test_fork_is_detached(self, rotation, tracks):
+        calls = []
+        rotation.add_listener(calls.append)
+        rotation.record_song_played(tracks[0])
+        fork = rotation.fork()
+        fork.record_song_played(tracks[1])
+        assert rotation.play_counts == {tracks[0]: 1}
+        assert rotation._table_last_seq[rotation._table_index[tracks[1]]] == -1
+        assert fork.play_counts == {tracks[0]: 1, tracks[1]: 1}
+        assert calls == [tracks[0]]
+        rotation.history = []
+        assert calls == [tracks[0], None]
+
+
+class TestDJUsesPlan:
+    def test_think_pops_planned_song(self, rotation, tracks, tmp_path):
+        from station.dj_logic.dj_engine import DJEngine
+        from station.tests.contracts.test_doubles import create_fake_audio_event
+
+        dj = DJEngine(rotation_manager=rotation, dj_asset_path=str(tmp_path / "dj"))
+        planner = SongPlanner(rotation, depth=2)
+        dj.song_planner = planner
+        planner.rebase(tracks[0], tracks[1])
+        rotation.record_song_played(tracks[0])
+        planner._refill()
+        expected = planner.peek()[0]
+
+        dj.on_segment_started(create_fake_audio_event(tracks[1], "song"))
+        assert dj.current_intent.next_song.path == expected.path
+        assert dj.current_intent.next_song.metadata == expected.metadata
+        assert planner.stats()["hits"] == 1
@@ -0,0 +1,154 @@
+"""
+Tests for the append-only state journal (StateJournal) and its use by
+DJStateStore and RotationManager: O(1) appends, batched fsync, snapshot
+compaction and warm start by snapshot + replay.
+"""
+
+import json
+import os
+import time
+
+import pytest
+
+from station.dj_logic.dj_engine import DJEngine
+from station.music_logic.rotation import RotationManager
+from station.state.dj_state_store import DJStateStore
+from station.state.state_journal import SNAPSHOT_SEQ_KEY, StateJournal
+
+
+def _count(state, record):
+    state["count"] = state.get("count", 0) + record["n"]
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    return str(tmp_path / "state.json")
+
+
+def _journal(path, **kwargs):
+    return StateJournal(path, apply_record=_count, **kwargs)
+
+
+class TestStateJournal:
+    def test_nothing_saved_loads_none(self, snapshot_path):
+        assert _journal(snapshot_path).load() is None
+
+    def test_replay_after_close(self, snapshot_path):
+        journal = _journal(snapshot_path)
+        for _ in range(3):
+            journal.append({"n": 2})
+        journal.close()
+        assert not os.path.exists(snapshot_path)
+        assert _journal(snapshot_path).load() == {"count": 6}
+
+    def test_background_writer_batches_and_fsyncs(self, snapshot_path):
+        journal = _journal(snapshot_path, batch_interval_sec=0.05)
+        for _ in range(50):
+            journal.append({"n": 1})
+        deadline = time.monotonic() + 5.0
+        while journal.records_written < 50 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert journal.records_written == 50
+        assert journal.batches < 50
+        # Durable without close(): a crash now loses nothing already batched
+        assert _journal(snapshot_path).load() == {"count": 50}
+        journal.close()
+
+    def test_snapshot_truncates_journal_and_is_not_replayed_twice(self, snapshot_path):
+        journal = _journal(snapshot_path)
+        journal.append({"n": 1})
+        journal.flush()
+        journal.snapshot({"count": 1})
+        assert os.path.getsize(journal.journal_path) == 0
+        journal.append({"n": 5})
+        journal.close()
+        assert _journal(snapshot_path).load() == {"count": 6}
+
+    def test_records_before_snapshot_seq_are_skipped(self, snapshot_path):
+        # Crash between snapshot rename and journal truncation
+        with open(snapshot_path, "w") as f:
+            json.dump({"count": 3, SNAPSHOT_SEQ_KEY: 2}, f)
+        with open(snapshot_path + ".journal", "w") as f:
+            for seq in (1, 2, 3):
+                f.write(json.dumps({"n": 1, "seq": seq}) + "\n")
+        assert _journal(snapshot_path).load() == {"count": 4}
+
+    def test_torn_tail_ends_replay(self, snapshot_path):
+        with open(snapshot_path + ".journal", "w") as f:
+            f.write(json.dumps({"n": 1, "seq": 1}) + "\n" + '{"n": 1, "se')
+        assert _journal(snapshot_path).load() == {"count": 1}
+
+    def test_compaction_folds_journal_into_snapshot(self, snapshot_path):
+        journal = _journal(snapshot_path, compact_every=10)
+        for _ in range(25):
+            journal.append({"n": 1})
+            journal.flush()
+        assert journal.compactions == 2
+        with open(snapshot_path) as f:
+            assert json.load(f) == {"count": 20, SNAPSHOT_SEQ_KEY: 20}
+        journal.close()
+        assert _journal(snapshot_path).load() == {"count": 25}
+
+    def test_loaded_sequence_continues(self, snapshot_path):
+        journal = _journal(snapshot_path)
+        journal.append({"n": 1})
+        journal.close()
+        reopened = _journal(snapshot_path)
+        reopened.load()
+        reopened.append({"n": 1})
+        reopened.close()
+        with open(reopened.journal_path) as f:
+            assert [json.loads(line)["seq"] for line in f] == [1, 2]
+
+
+class TestDJStateStoreJournal:
+    def test_dj_events_replay_into_to_dict_shape(self, snapshot_path):
+        store = DJStateStore(path=snapshot_path, apply_record=DJEngine.apply_journal_record)
+        store.save({"last_played_songs": ["/m/a.mp3"], "rotation": {"play_counts": {"/m/a.mp3": 1}}})
+        store.record({"type": "song", "path": "/m/b.mp3", "ts": 100.0, "holiday": False})
+        store.record({"type": "intro", "path": "/dj/b_intro.mp3"})
+        store.record({"type": "talk", "outro": "/dj/b_outro.mp3", "ts": 101.0})
+        store.record({"type": "id", "legal": True, "ts": 102.0})
+        store.close()
+
+        data = DJStateStore(path=snapshot_path, apply_record=DJEngine.apply_journal_record).load()
+        assert data["last_played_songs"] == ["/m/a.mp3", "/m/b.mp3"]
+        assert data["rotation"]["play_counts"] == {"/m/a.mp3": 1, "/m/b.mp3": 1}
+        assert data["rotation"]["last_played"] == ["/m/b.mp3"]
+        assert data["intro_history"] == ["/dj/b_intro.mp3"]
+        assert data["outro_history"] == ["/dj/b_outro.mp3"]
+        assert data["last_talk_time"] == 101.0
+        assert data["last_legal_id_time"] == 102.0
+
+    def test_plain_store_unchanged(self, snapshot_path):
+        store = DJStateStore(path=snapshot_path)
+        store.record({"type": "song", "path": "/m/a.mp3", "ts": 1.0})
+        store.save({"x": 1})
+        assert DJStateStore(path=snapshot_path).load() == {"x": 1}
+        assert not os.path.exists(snapshot_path + ".journal")
+
+
+class TestRotationJournal:
+    def test_play_does_not_rewrite_state_file(self, tmp_path):
+        state_file = str(tmp_path / "rotation.json")
+        manager = RotationManager(["/m/a.mp3", "/m/b.mp3"], [], state_file=state_file)
+        manager.record_song_played("/m/a.mp3")
+        assert not os.path.exists(state_file)
+        manager.close()
+        assert not os.path.exists(state_file)  # journal only until a snapshot
+
+        restored = RotationManager(["/m/a.mp3", "/m/b.mp3"], [], state_file=state_file)
+        assert restored.play_counts == {"/m/a.mp3": 1}
+        assert [entry[0] for entry in restored.history] == ["/m/a.mp3"]
+
+    def test_save_state_snapshot_then_more_plays(self, tmp_path):
+        state_file = str(tmp_path / "rotation.json")
+        manager = RotationManager(["/m/a.mp3", "/m/b.mp3"], [], state_file=state_file)
+        manager.record_song_played("/m/a.mp3")
+        manager.save_state()
+        manager.record_song_played("/m/b.mp3")
+        manager.close()
+
+        restored = RotationManager(["/m/a.mp3", "/m/b.mp3"], [], state_file=state_file)
+        assert restored.play_counts == {"/m/a.mp3": 1, "/m/b.mp3": 1}
+        assert restored.get_last_played_songs(2) == ["/m/b.mp3", "/m/a.mp3"]
@@ -0,0 +1,192 @@
+"""
+Tests for deadline-bounded THINK on the THINK worker (DJ2.3): song THINK
+leaves the playout thread, optional break elements are dropped when the
+deadline is at risk, and DO degrades to a song-only intent rather than wait.
+"""
+
+import threading
+import time
+
+import pytest
+
+from station.dj_logic.dj_engine import DJEngine
+from station.dj_logic.song_planner import PlannedSong
+from station.dj_logic.think_worker import PhaseTimer, ThinkPhaseHistogram, ThinkWorker
+from station.tests.contracts.test_doubles import FakeRotationManager, create_fake_audio_event
+
+
+@pytest.fixture
+def worker():
+    w = ThinkWorker(lead_sec=1.0)
+    w.start()
+    yield w
+    w.stop()
+
+
+@pytest.fixture
+def dj(tmp_path, worker):
+    engine = DJEngine(rotation_manager=FakeRotationManager(), dj_asset_path=str(tmp_path))
+    engine.think_worker = worker
+    return engine
+
+
+class _CountingPlanner:
+    """Song planner stand-in handing out /fake/planned-N.mp3 and counting takes."""
+
+    def __init__(self):
+        self.taken = []
+
+    def take(self, current_path):
+        planned = PlannedSong(path=f"/fake/planned-{len(self.taken)}.mp3", metadata=None)
+        self.taken.append(planned.path)
+        return planned
+
+    def rebase(self, current_path, selected_path):
+        pass
+
+
+def _song(path="/fake/current.mp3", duration=None):
+    segment = create_fake_audio_event(path, "song")
+    if duration is not None:
+        segment.metadata = {"duration": duration}
+    return segment
+
+
+class TestThinkPhaseHistogram:
+    def test_percentiles_from_buckets(self):
+        histogram = ThinkPhaseHistogram(buckets_ms=(1.0, 10.0, 100.0))
+        for ms in [0.5] * 90 + [5.0] * 9 + [400.0]:
+            histogram.record("song", ms)
+        stats = histogram.stats()["song"]
+        assert stats["count"] == 100
+        assert stats["p50_ms"] == 1.0
+        assert stats["p99_ms"] == 10.0
+        assert stats["max_ms"] == 400.0
+        assert histogram.percentile("missing", 50) is None
+
+    def test_phase_timer_records_each_phase(self):
+        histogram = ThinkPhaseHistogram()
+        timer = PhaseTimer(histogram)
+        timer.mark("rescan")
+        timer.mark("song")
+        assert set(histogram.stats()) == {"rescan", "song"}
+        assert "rescan=" in timer.summary()
+
+
+class TestThinkWorker:
+    def test_deadline_leaves_lead_before_segment_end(self, worker):
+        assert worker.deadline_for(180.0, started_at=100.0) == 279.0
+        assert worker.deadline_for(0.5, started_at=100.0) == 100.0
+
+    def test_failed_job_is_marked_and_counted(self, worker):
+        def boom(job):
+            raise RuntimeError("stat timed out")
+
+        job = worker.submit(boom, deadline=time.monotonic() + 5)
+        assert job.wait(5.0)
+        assert isinstance(job.error, RuntimeError)
+        assert worker.stats()["failed"] == 1
+
+
+class TestDeadlineBoundedThink:
+    def test_song_think_runs_off_the_calling_thread(self, dj):
+        seen = []
+        original = dj._think
+        dj._think = lambda segment, job=None: (seen.append(threading.current_thread().name), original(segment, job))
+
+        dj.on_segment_started(_song(duration=60.0))
+        assert dj._think_job.wait(5.0)
+        assert seen == ["dj-think"]
+        assert dj.current_intent is not None and dj.current_intent.next_song is not None
+
+    def test_at_risk_deadline_produces_song_only_intent(self, dj, monkeypatch):
+        monkeypatch.setattr(dj, "_should_talk", lambda now: True)
+        monkeypatch.setattr(dj, "_should_use_intro", lambda: True)
+        # Shorter than the lead: deadline already at risk when THINK starts
+        dj.on_segment_started(_song(duration=0.5))
+        assert dj._think_job.wait(5.0)
+        intent = dj.current_intent
+        assert intent.next_song is not None
+        assert intent.outro is None and intent.intro is None and not intent.station_ids
+        assert dj.think_phases.stats()["total"]["count"] == 1
+
+    def test_do_degrades_when_think_has_not_committed(self, dj):
+        release = threading.Event()
+        original = dj._run_ticklers
+        dj._run_ticklers = lambda: (release.wait(5.0), original())
+
+        current = _song(duration=60.0)
+        dj.on_segment_started(current)
+        job = dj._think_job
+        queued = []
+        dj.playout_engine = type("Engine", (), {"queue_audio": lambda self, events: queued.extend(events)})()
+
+        started = time.monotonic()
+        dj.on_segment_finished(current)
+        assert time.monotonic() - started < 1.0
+        assert dj.degraded_intents == 1
+        assert [e.type for e in queued] == ["song"]
+
+        # The slow THINK finishes later and must not overwrite anything
+        release.set()
+        assert job.wait(5.0)
+        assert job.cancelled and not job.committed
+
+    def test_draining_cancels_in_flight_think(self, dj):
+        release = threading.Event()
+        original = dj._run_ticklers
+        dj._run_ticklers = lambda: (release.wait(5.0), original())
+        dj.on_segment_started(_song(duration=60.0))
+        job = dj._think_job
+
+        dj.set_lifecycle_state(is_draining=True)
+        dj.on_segment_started(_song("/fake/next.mp3", duration=60.0))
+        release.set()
+        assert job.wait(5.0)
+        assert job.cancelled
+        assert dj.current_intent is not None and dj.current_intent.is_terminal
+
+    def test_cancelled_think_leaves_ticklers_and_plan_alone(self, dj):
+        dj.song_planner = _CountingPlanner()
+        ran = []
+        tickler = type("Tickler", (), {"run": lambda self, engine: ran.append(1)})()
+        dj.ticklers.append(tickler)
+        release = threading.Event()
+        original = dj.asset_manager.maybe_rescan
+        dj.asset_manager.maybe_rescan = lambda: (release.wait(5.0), original())
+
+        current = _song(duration=60.0)
+        dj.on_segment_started(current)
+        job = dj._think_job
+        queued = []
+        dj.playout_engine = type("Engine", (), {"queue_audio": lambda self, events: queued.extend(events)})()
+        dj.on_segment_finished(current)
+        release.set()
+        assert job.wait(5.0)
+
+        assert job.cancelled and not job.committed
+        assert dj.song_planner.taken == ["/fake/planned-0.mp3"]  # DO's take only
+        assert ran == [] and tickler in dj.ticklers
+        assert [e.path for e in queued] == ["/fake/planned-0.mp3"]
+
+    def test_degrade_reuses_song_taken_by_late_think(self, dj, monkeypatch):
+        dj.song_planner = _CountingPlanner()
+        monkeypatch.setattr(dj, "_needs_legal_id", lambda now: False)
+        monkeypatch.setattr(dj, "_should_talk", lambda now: True)
+        selected = threading.Event()
+        release = threading.Event()
+        dj._select_outro = lambda *args, **kwargs: (selected.set(), release.wait(5.0))[1] and None
+
+        current = _song(duration=60.0)
+        dj.on_segment_started(current)
+        job = dj._think_job
+        assert selected.wait(5.0)
+        queued = []
+        dj.playout_engine = type("Engine", (), {"queue_audio": lambda self, events: queued.extend(events)})()
+        dj.on_segment_finished(current)
+        release.set()
+        assert job.wait(5.0)
+
+        assert job.cancelled and not job.committed
+        assert dj.song_planner.taken == ["/fake/planned-0.mp3"]  # THINK's take, reused by DO
+        assert [e.path for e in queued] == ["/fake/planned-0.mp3"]
@@ -0,0 +1,140 @@
+"""
+Tests for the background TicklerExecutor: priority/deadline ordering,
+deduplication, cancellation, expiry, and DJEngine submitting from DO.
+"""
+
+import threading
+import time
+
+import pytest
+
+from station.dj_logic.dj_engine import DJEngine
+from station.dj_logic.intent_model import DJIntent
+from station.dj_logic.tickler_executor import TicklerExecutor
+from station.dj_logic.ticklers import GenerateIntroTickler, RefillGenericIDTickler, Tickler
+from station.tests.contracts.test_doubles import FakeRotationManager, create_fake_audio_event
+
+
+class _Recording(Tickler):
+    def __init__(self, name, log, priority=50, gate=None):
+        self.name = name
+        self.log = log
+        self.priority = priority
+        self.gate = gate
+
+    def run(self, dj_engine):
+        if self.gate is not None:
+            self.gate.wait(5.0)
+        self.log.append(self.name)
+
+    def __repr__(self):
+        return f"_Recording({self.name})"
+
+
+@pytest.fixture
+def executor():
+    created = []
+
+    def make(workers=1):
+        ex = TicklerExecutor(dj_engine=None, workers=workers)
+        created.append(ex)
+        return ex
+
+    yield make
+    for ex in created:
+        ex.stop()
+
+
+def _block_worker(ex, log):
+    """Occupy the single worker so later submissions queue up."""
+    gate = threading.Event()
+    blocker = ex.submit(_Recording("blocker", log, priority=0, gate=gate))
+    ex.start()
+    deadline = time.monotonic() + 5.0
+    while ex.stats()["running"] == 0 and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return gate, blocker
+
+
+class TestTicklerExecutor:
+    def test_priority_then_deadline_order(self, executor):
+        ex, log = executor(), []
+        gate, _ = _block_worker(ex, log)
+        now = time.monotonic()
+        ex.submit(_Recording("refill", log, priority=90))
+        ex.submit(_Recording("late", log, priority=10), deadline=now + 60)
+        ex.submit(_Recording("soon", log, priority=10), deadline=now + 30)
+        gate.set()
+        ex.stop(cancel_pending=False)  # workers drain the queue before exiting
+        assert log == ["blocker", "soon", "late", "refill"]
+
+    def test_identical_pending_ticklers_run_once(self, executor):
+        ex, log = executor(), []
+        gate, _ = _block_worker(ex, log)
+        first = ex.submit(_Recording("intro", log))
+        second = ex.submit(_Recording("intro", log))
+        assert first is second
+        gate.set()
+        assert first.wait(5.0)
+        assert log.count("intro") == 1
+        assert ex.stats()["deduplicated"] == 1
+
+    def test_cancel_by_handle_and_key(self, executor):
+        ex, log = executor(), []
+        gate, blocker = _block_worker(ex, log)
+        a = ex.submit(_Recording("a", log))
+        ex.submit(_Recording("b", log))
+        assert a.cancel()
+        assert ex.cancel("_Recording(b)")
+        assert not blocker.cancel()  # already running
+        gate.set()
+        assert blocker.wait(5.0)
+        ex.stop(cancel_pending=False)
+        assert log == ["blocker"]
+        assert ex.stats()["cancelled"] == 2 and ex.stats()["queue_depth"] == 0
+
+    def test_expired_work_is_dropped(self, executor):
+        ex, log = executor(), []
+        gate, _ = _block_worker(ex, log)
+        stale = ex.submit(_Recording("stale", log), deadline=time.monotonic() + 0.01)
+        time.sleep(0.05)
+        gate.set()
+        assert stale.wait(5.0)
+        assert stale.state == "expired" and "stale" not in log
+
+    def test_failures_do_not_stop_workers(self, executor):
+        class Boom(Tickler):
+            def run(self, dj_engine):
+                raise RuntimeError("tts down")
+
+            def __repr__(self):
+                return "Boom()"
+
+        ex, log = executor(), []
+        ex.start()
+        failed = ex.submit(Boom())
+        ok = ex.submit(_Recording("after", log))
+        assert failed.wait(5.0) and ok.wait(5.0)
+        stats = ex.stats()
+        assert stats["failed"] == 1 and stats["completed"] == 1
+        assert stats["run_ms"]["count"] == 2
+
+
+class TestDJSubmitsTicklers:
+    def test_do_submits_instead_of_deferring_to_think(self, tmp_path, executor):
+        dj = DJEngine(rotation_manager=FakeRotationManager(), dj_asset_path=str(tmp_path))
+        ex = executor()
+        dj.tickler_executor = ex
+
+        song = create_fake_audio_event("/fake/next.mp3", "song")
+        song.metadata = {"duration": 200.0}
+        intent = DJIntent(next_song=song, intro=create_fake_audio_event("/fake/intro.mp3", "intro"))
+        dj._schedule_ticklers_for_intent(intent)
+
+        assert dj.ticklers == []
+        pending = ex.pending()
+        assert pending[0] == repr(GenerateIntroTickler("/fake/next.mp3"))
+        assert repr(RefillGenericIDTickler()) in pending  # no generic IDs under tmp_path
+        handle = ex._pending[repr(GenerateIntroTickler("/fake/next.mp3"))]
+        assert 190.0 < handle.deadline - time.monotonic() <= 200.0
+        assert dj.to_dict()["ticklers"] == pending
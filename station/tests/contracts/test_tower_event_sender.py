@@ -0,0 +1,181 @@
+"""
+Tests for asynchronous batched Station -> Tower events: emitters only queue,
+one sender thread coalesces events into batch POSTs over a keep-alive
+connection, and Towers without the batch endpoint still get every event.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock
+
+import pytest
+
+from station.outputs.tower_control import TowerControlClient
+from station.outputs.tower_event_sender import TowerEventSender
+
+
+@pytest.fixture
+def event_tower():
+    """Minimal Tower event ingest recording requests and TCP connections."""
+    state = {"connections": 0, "batches": [], "singles": [], "batch_supported": True, "delay": 0.0,
+             "unsupported_reply": (404, b""), "batch_reply": None}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            super().setup()
+            state["connections"] += 1
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            time.sleep(state["delay"])
+            if self.path == "/tower/events/ingest/batch" and state["batch_reply"]:
+                self._reply(*state["batch_reply"])
+            elif self.path == "/tower/events/ingest/batch" and state["batch_supported"]:
+                state["batches"].append([e["event_type"] for e in body["events"]])
+                self._reply(200, b'{"accepted": 1, "rejected": 0}')
+            elif self.path == "/tower/events/ingest":
+                state["singles"].append(body["event_type"])
+                self._reply(204, b"")
+            else:
+                self._reply(*state["unsupported_reply"])
+
+        def _reply(self, status, body):
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address[1], state
+    server.shutdown()
+    server.server_close()
+
+
+def _attach(port, **kwargs):
+    control = TowerControlClient(tower_port=port)
+    sender = TowerEventSender(control, **kwargs)
+    sender.start()
+    control.event_sender = sender
+    return control, sender
+
+
+def test_events_are_coalesced_in_order_over_one_connection(event_tower):
+    port, state = event_tower
+    control, sender = _attach(port, linger_sec=0.05)
+    try:
+        for i in range(10):
+            assert control.send_event("song_playing", time.monotonic(), {"n": i})
+        assert sender.flush(timeout=5.0)
+        control.send_event("station_shutdown", time.monotonic(), {})
+        sender.stop()
+    finally:
+        control.close()
+    sent = [event for batch in state["batches"] for event in batch]
+    assert sent == ["song_playing"] * 10 + ["station_shutdown"]
+    assert len(state["batches"]) < 11
+    assert state["connections"] == 1
+    assert sender.stats()["sent"] == 11
+
+
+def test_emitter_does_not_wait_for_slow_tower(event_tower):
+    port, state = event_tower
+    state["delay"] = 0.3
+    control, sender = _attach(port, linger_sec=0.0)
+    try:
+        started = time.monotonic()
+        for _ in range(5):
+            control.send_event("segment_playing", time.monotonic(), {})
+        assert time.monotonic() - started < 0.05
+        assert sender.flush(timeout=5.0)
+    finally:
+        sender.stop()
+        control.close()
+    assert sum(len(batch) for batch in state["batches"]) == 5
+
+
+@pytest.mark.parametrize("unsupported_reply", [
+    (404, b""),
+    # Towers without the batch endpoint route /tower/events/* to the WebSocket handler
+    (400, b"WebSocket upgrade required\r\n"),
+])
+def test_falls_back_to_single_posts_without_batch_endpoint(event_tower, unsupported_reply):
+    port, state = event_tower
+    state["batch_supported"] = False
+    state["unsupported_reply"] = unsupported_reply
+    control, sender = _attach(port)
+    try:
+        control.send_event("station_startup", time.monotonic(), {})
+        control.send_event("song_playing", time.monotonic(), {})
+        assert sender.flush(timeout=5.0)
+    finally:
+        sender.stop()
+        control.close()
+    assert state["singles"] == ["station_startup", "song_playing"]
+    assert control.batch_supported is False
+
+
+def test_rejected_batch_is_resent_singly_without_disabling_batching(event_tower):
+    port, state = event_tower
+    control = TowerControlClient(tower_port=port)
+    try:
+        # The batch endpoint exists but refused this request (e.g. truncated body)
+        state["batch_reply"] = (400, b'{"error": "Invalid JSON"}')
+        assert control.send_events([{"event_type": "song_playing", "timestamp": 1.0, "metadata": {}}])
+        assert state["singles"] == ["song_playing"] and control.batch_supported is True
+
+        state["batch_reply"] = None
+        assert control.send_events([{"event_type": "segment_playing", "timestamp": 2.0, "metadata": {}}])
+        assert state["batches"] == [["segment_playing"]]
+    finally:
+        control.close()
+
+
+def test_batch_endpoint_is_reprobed_after_fallback(event_tower):
+    port, state = event_tower
+    state["batch_supported"] = False
+    control = TowerControlClient(tower_port=port)
+    event = {"event_type": "song_playing", "timestamp": 1.0, "metadata": {}}
+    try:
+        assert control.send_events([event])
+        assert control.batch_supported is False
+        assert control.send_events([event])  # within the re-probe interval: no batch attempt
+        assert state["singles"] == ["song_playing"] * 2
+
+        state["batch_supported"] = True  # Tower upgraded
+        control._batch_reprobe_at = 0.0  # re-probe interval elapsed
+        assert control.send_events([event])
+        assert control.batch_supported is True and state["batches"] == [["song_playing"]]
+    finally:
+        control.close()
+
+
+def test_full_queue_drops_oldest():
+    release = threading.Event()
+    control = Mock()
+    control.send_events = Mock(side_effect=lambda batch: release.wait(5.0))
+    sender = TowerEventSender(control, max_queue=3, max_batch=1, linger_sec=0.0)
+    sender.start()
+    try:
+        sender.submit("song_playing", 0.0, {"n": 0})
+        deadline = time.monotonic() + 2.0
+        while not control.send_events.called and time.monotonic() < deadline:
+            time.sleep(0.005)
+        for i in range(1, 6):
+            sender.submit("song_playing", 0.0, {"n": i})
+        assert sender.stats()["dropped"] == 2
+        release.set()
+        assert sender.flush(timeout=5.0)
+    finally:
+        sender.stop()
+    delivered = [call.args[0][0]["metadata"]["n"] for call in control.send_events.call_args_list]
+    assert delivered == [0, 3, 4, 5]
+    assert not sender.submit("song_playing", 0.0, {})  # stopped
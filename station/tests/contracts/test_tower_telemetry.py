@@ -0,0 +1,207 @@
+"""
+Tests for the pooled TowerControlClient and the Station-wide Tower buffer
+telemetry service: one keep-alive connection serves repeated requests, the
+sink health monitor, PID controller and pre-fill read the shared snapshot
+instead of polling Tower themselves, and samples pushed by Tower replace
+polling while they are fresh.
+"""
+
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock
+
+import pytest
+
+from station.broadcast_core.buffer_pid_controller import BufferPIDController
+from station.outputs.tower_control import TowerControlClient
+from station.outputs.tower_pcm_sink import TowerPCMSink
+from station.outputs.tower_telemetry import PUSH_SAMPLE_MAGIC, PUSH_SAMPLE_STRUCT, TowerBufferTelemetry
+
+
+@pytest.fixture
+def keepalive_tower():
+    """Minimal HTTP/1.1 /tower/buffer endpoint counting TCP connections."""
+    stats = {"connections": 0, "requests": 0}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            super().setup()
+            stats["connections"] += 1
+
+        def do_GET(self):
+            stats["requests"] += 1
+            body = json.dumps({"capacity": 50, "count": 20, "overflow_count": 0, "ratio": 0.4}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address[1], stats
+    server.shutdown()
+    server.server_close()
+
+
+def _fake_control(samples):
+    control = Mock()
+    control.get_buffer = Mock(side_effect=lambda: samples.pop(0) if samples else None)
+    return control
+
+
+class TestPooledClient:
+    def test_requests_reuse_one_connection(self, keepalive_tower):
+        port, stats = keepalive_tower
+        client = TowerControlClient(tower_port=port)
+        try:
+            for _ in range(20):
+                assert client.get_buffer()["count"] == 20
+        finally:
+            client.close()
+        assert stats["requests"] == 20
+        assert stats["connections"] == 1
+        assert client.requests == 20
+
+
+class TestTowerBufferTelemetry:
+    def test_snapshot_has_seq_age_and_ratio(self):
+        telemetry = TowerBufferTelemetry(_fake_control([{"count": 10, "capacity": 40}, None]))
+        assert telemetry.latest() is None and telemetry.get_buffer() is None
+        first = telemetry.poll_once()
+        assert first.seq == 1 and first.data["ratio"] == 0.25
+        assert telemetry.poll_once() is None  # failed poll keeps the last snapshot
+        assert telemetry.latest() is first
+        assert telemetry.stats()["failures"] == 1
+
+    def test_stale_snapshot_is_not_served(self):
+        telemetry = TowerBufferTelemetry(_fake_control([{"count": 10, "capacity": 40}]), max_age_sec=0.5)
+        snapshot = telemetry.poll_once()
+        assert telemetry.get_buffer() == snapshot.data
+        object.__setattr__(snapshot, "received_at", time.monotonic() - 1.0)
+        assert telemetry.get_buffer() is None
+        assert telemetry.get_buffer(max_age_sec=5.0) == snapshot.data
+
+    def test_poller_runs_at_configured_rate(self, keepalive_tower):
+        port, stats = keepalive_tower
+        control = TowerControlClient(tower_port=port)
+        telemetry = TowerBufferTelemetry(control, interval_sec=0.02)
+        telemetry.start()
+        try:
+            deadline = time.monotonic() + 5.0
+            while telemetry.stats()["seq"] < 5 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            telemetry.stop()
+            control.close()
+        assert telemetry.stats()["seq"] >= 5
+        assert stats["connections"] == 1
+
+
+class TestConsumersShareSnapshot:
+    def test_sink_checks_health_on_each_sample(self):
+        samples = [{"count": 10, "capacity": 50}, {"count": 0, "capacity": 50}]
+        telemetry = TowerBufferTelemetry(_fake_control(samples))
+        sink = TowerPCMSink(socket_path="/fake/socket", tower_control=Mock(), telemetry=telemetry)
+        try:
+            assert sink._health_thread is None  # no polling thread of its own
+            telemetry.poll_once()
+            assert sink._last_buffer_depth == 10
+            telemetry.poll_once()
+            assert sink._last_buffer_depth == 0
+        finally:
+            sink.close()
+
+    def test_pid_reads_telemetry_without_request(self):
+        telemetry = TowerBufferTelemetry(_fake_control([{"count": 30, "capacity": 50}]))
+        telemetry.poll_once()
+        pid = BufferPIDController(tower_port=1, telemetry=telemetry)
+        status = pid.poll_buffer_status()
+        assert status["ratio"] == pytest.approx(0.6)
+        assert pid._client is None
+        assert pid.get_metrics()["query_failures"] == 0
+
+    def test_prefill_reads_telemetry(self):
+        from station.broadcast_core.playout_engine import PlayoutEngine
+
+        telemetry = TowerBufferTelemetry(_fake_control([{"count": 5, "capacity": 50}]))
+        control = Mock()
+        engine = PlayoutEngine(tower_control=control, tower_telemetry=telemetry)
+        assert engine._get_tower_buffer_status() is None  # no sample yet: pre-fill skipped
+        telemetry.poll_once()
+        assert engine._get_tower_buffer_status()["count"] == 5
+        control.get_buffer.assert_not_called()
+
+
+def _record(seq, count, capacity=50, overflow=0):
+    return PUSH_SAMPLE_STRUCT.pack(PUSH_SAMPLE_MAGIC, seq, time.monotonic(), capacity, count, overflow)
+
+
+@pytest.fixture
+def push_server(tmp_path):
+    """Unix socket standing in for Tower's buffer push socket."""
+    path = str(tmp_path / "pcm-buffer.sock")
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen(1)
+    server.settimeout(5.0)
+    yield path, server
+    server.close()
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return predicate()
+
+
+class TestPushedSamples:
+    def test_push_record_publishes_snapshot_and_counts_gaps(self):
+        telemetry = TowerBufferTelemetry(_fake_control([]))
+        seen = []
+        telemetry.add_listener(seen.append)
+        snapshot = telemetry.handle_push_record(_record(7, 10))
+        assert snapshot.source == "push" and snapshot.data["ratio"] == pytest.approx(0.2)
+        assert snapshot.data["tower_seq"] == 7
+        telemetry.handle_push_record(_record(10, 12))  # 8 and 9 never arrived
+        assert telemetry.push_gaps == 2
+        assert telemetry.get_buffer()["count"] == 12 and len(seen) == 2
+        assert telemetry.push_active()
+        with pytest.raises(ValueError):
+            telemetry.handle_push_record(b"XXXX" + _record(11, 1)[4:])
+
+    def test_push_replaces_polling_and_polling_resumes_when_it_stops(self, push_server):
+        path, server = push_server
+        control = _fake_control([{"count": 1, "capacity": 50} for _ in range(1000)])
+        telemetry = TowerBufferTelemetry(control, interval_sec=0.01, max_age_sec=0.1, push_socket_path=path)
+        telemetry.start()
+        try:
+            conn, _ = server.accept()
+            # Split a record across writes: the reader reassembles it
+            record = _record(1, 25)
+            conn.sendall(record[:5])
+            time.sleep(0.02)
+            conn.sendall(record[5:] + _record(2, 26))
+            assert _wait_for(lambda: telemetry.stats()["pushed"] == 2)
+            polls = telemetry.polls
+            for seq in range(3, 8):
+                conn.sendall(_record(seq, 26))
+                time.sleep(0.02)
+            assert telemetry.latest().source == "push" and telemetry.get_buffer()["count"] == 26
+            assert telemetry.polls <= polls + 1  # fresh pushed samples: no HTTP polls (one may be in flight)
+            conn.close()
+            assert _wait_for(lambda: telemetry.latest().source == "poll")
+            assert telemetry.get_buffer()["count"] == 1
+        finally:
+            telemetry.stop()
+        assert telemetry.stats()["push_connects"] == 1
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Benchmark: GET /tower/buffer on Tower's main listener vs the control-plane listener.
+
+"before": the main HTTPServer, which closes the connection after the request,
+so every poll is a TCP connect, a new handler thread and a close.
+"after": ControlPlaneServer, with each client reusing one keep-alive connection.
+
+Both run in-process on loopback with a static buffer stats provider. Each of
+--concurrency client threads issues --requests requests back to back and
+records per-request latency.
+
+Reports requests per second and p50/p99 latency for each listener.
+
+This tool is purely diagnostic and MUST NOT be imported by Tower runtime.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import socket
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tower.http.control_server import ControlPlaneServer
+from tower.http.server import HTTPServer
+
+REQUEST = b"GET /tower/buffer HTTP/1.1\r\nHost: tower\r\n\r\n"
+
+
+class _StaticBuffer:
+    def stats(self):
+        return SimpleNamespace(capacity=100, count=50, overflow_count=0)
+
+
+def _read_response(sock, pending: bytes) -> bytes:
+    """Read one response (Content-Length framed, or until close); returns leftover bytes."""
+    data = pending
+    while b"\r\n\r\n" not in data:
+        chunk = sock.recv(65536)
+        if not chunk:
+            return b""
+        data += chunk
+    head, _, rest = data.partition(b"\r\n\r\n")
+    length = None
+    for line in head.split(b"\r\n")[1:]:
+        if line.lower().startswith(b"content-length:"):
+            length = int(line.split(b":", 1)[1])
+    if length is None:
+        while sock.recv(65536):
+            pass
+        return b""
+    while len(rest) < length:
+        rest += sock.recv(65536)
+    return rest[length:]
+
+
+def _client_new_connection(port: int, count: int, latencies: list) -> None:
+    for _ in range(count):
+        started = time.perf_counter()
+        with socket.create_connection(("127.0.0.1", port)) as sock:
+            sock.sendall(REQUEST)
+            _read_response(sock, b"")
+        latencies.append(time.perf_counter() - started)
+
+
+def _client_keep_alive(port: int, count: int, latencies: list) -> None:
+    with socket.create_connection(("127.0.0.1", port)) as sock:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        pending = b""
+        for _ in range(count):
+            started = time.perf_counter()
+            sock.sendall(REQUEST)
+            pending = _read_response(sock, pending)
+            latencies.append(time.perf_counter() - started)
+
+
+def _run(client, port: int, requests: int, concurrency: int) -> dict:
+    latencies: list = []
+    threads = [
+        threading.Thread(target=client, args=(port, requests, latencies)) for _ in range(concurrency)
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000.0,
+        "p99_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=2000, help="requests per client thread")
+    parser.add_argument("--concurrency", type=int, default=4, help="client threads")
+    parser.add_argument("--workers", type=int, default=2, help="control-plane worker threads")
+    args = parser.parse_args()
+
+    http_server = HTTPServer(host="127.0.0.1", port=0, frame_source=None, buffer_stats_provider=_StaticBuffer())
+    threading.Thread(target=http_server.serve_forever, daemon=True).start()
+    while http_server._server_sock is None:
+        time.sleep(0.01)
+    time.sleep(0.05)
+    main_port = http_server._server_sock.getsockname()[1]
+
+    control = ControlPlaneServer(http_server.handle_control_request, "127.0.0.1", 0, workers=args.workers)
+    control.start()
+
+    try:
+        results = {
+            "before (main listener, connection per request)": _run(
+                _client_new_connection, main_port, args.requests, args.concurrency
+            ),
+            "after (control plane, keep-alive)": _run(
+                _client_keep_alive, control.bound_port, args.requests, args.concurrency
+            ),
+        }
+    finally:
+        control.stop()
+        http_server.stop()
+
+    print(f"GET /tower/buffer: {args.concurrency} clients x {args.requests} requests")
+    for name, r in results.items():
+        print(f"  {name:48s} {r['rps']:9.0f} req/s   p50 {r['p50_ms']:7.3f} ms   p99 {r['p99_ms']:7.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
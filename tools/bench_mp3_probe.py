@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark: files probed per second, in-process MP3 probe vs ffprobe.
+
+Probes every .mp3 under --dir (recursively), or a set of synthesised MP3s
+(ID3v2 tag, Xing header, silent MPEG-1 Layer III frames) when no directory
+is given. ffprobe is skipped if it is not on PATH.
+
+This tool is purely diagnostic and MUST NOT be imported by Station runtime.
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from station.music_logic.metadata_index import probe_ffprobe
+from station.music_logic.mp3_probe import probe_mp3
+
+FRAME_HEADER = bytes([0xFF, 0xFB, 0x90, 0x00])  # MPEG-1 L3 128k 44.1k stereo
+FRAME_LEN = 417
+
+
+def _synthesise(directory: str, count: int, frames: int) -> list[str]:
+    title = b"\x00Benchmark Song"
+    body = b"TIT2" + struct.pack(">I", len(title)) + b"\x00\x00" + title + b"\x00" * 1024
+    size = len(body)
+    id3 = b"ID3\x03\x00\x00" + bytes([(size >> 21) & 0x7F, (size >> 14) & 0x7F, (size >> 7) & 0x7F, size & 0x7F]) + body
+    xing_body = b"\x00" * 32 + b"Xing" + struct.pack(">II", 1, frames)
+    xing = FRAME_HEADER + xing_body + b"\x00" * (FRAME_LEN - 4 - len(xing_body))
+    audio = (FRAME_HEADER + b"\x00" * (FRAME_LEN - 4)) * frames
+    paths = []
+    for i in range(count):
+        path = os.path.join(directory, f"track_{i:05d}.mp3")
+        with open(path, "wb") as f:
+            f.write(id3 + xing + audio)
+        paths.append(path)
+    return paths
+
+
+def _rate(probe, paths: list[str]) -> tuple[float, int]:
+    start = time.perf_counter()
+    ok = sum(1 for path in paths if probe(path) is not None)
+    elapsed = time.perf_counter() - start
+    return (len(paths) / elapsed if elapsed > 0 else float("inf")), ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--dir", help="probe real MP3s under this directory")
+    parser.add_argument("--files", type=int, default=2000, help="synthesised files (no --dir)")
+    parser.add_argument("--ffprobe-files", type=int, default=200, help="cap on files given to ffprobe")
+    args = parser.parse_args()
+
+    tmpdir = None
+    if args.dir:
+        paths = sorted(glob.glob(os.path.join(args.dir, "**", "*.mp3"), recursive=True))
+    else:
+        tmpdir = tempfile.mkdtemp()
+        paths = _synthesise(tmpdir, args.files, frames=8000)  # ~3.5 min, ~3.3 MB each
+    try:
+        rate, ok = _rate(probe_mp3, paths)
+        print(f"in-process: {rate:10.0f} files/s  ({ok}/{len(paths)} validated)")
+        if shutil.which("ffprobe"):
+            subset = paths[:args.ffprobe_files]
+            rate_ff, ok_ff = _rate(probe_ffprobe, subset)
+            print(f"   ffprobe: {rate_ff:10.0f} files/s  ({ok_ff}/{len(subset)} probed)")
+            print(f"   speedup: {rate / rate_ff:10.0f}x")
+        else:
+            print("   ffprobe: not on PATH - skipped")
+    finally:
+        if tmpdir:
+            shutil.rmtree(tmpdir)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-frame allocations on Station's decode → mix → send PCM path.
+
+Compares the legacy path (bytes copy + np.frombuffer in the decoder, float32/int16
+temporaries in the mixer, astype().tobytes() in the sink) with the pooled
+zero-copy path (readinto pooled frames, in-place gain, memoryview send, recycle).
+
+`cat` stands in for ffmpeg so the benchmark needs no codec: it streams a raw
+s16le file through the same stdin/stdout pipe a warm decoder uses. Frames are
+sent over a real Unix socket to a draining reader.
+
+Reports per frame: peak transient bytes allocated (tracemalloc) and wall time.
+
+This tool is purely diagnostic and MUST NOT be imported by Station runtime.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from station.broadcast_core.ffmpeg_decoder_pool import FFmpegDecoderPool
+from station.broadcast_core.frame_pool import PCMFramePool
+from station.mixer.mixer import Mixer
+from station.outputs.tower_pcm_sink import TowerPCMSink
+
+FRAME_SAMPLES = 1024
+FRAME_BYTES = FRAME_SAMPLES * 2 * 2
+GAIN = 0.8
+
+
+def _start_drain_server(path: str) -> threading.Thread:
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen(1)
+
+    def _drain():
+        conn, _ = server.accept()
+        buf = bytearray(65536)  # recv_into: keep the reader out of the allocation numbers
+        with conn:
+            while conn.recv_into(buf):
+                pass
+        server.close()
+
+    t = threading.Thread(target=_drain, daemon=True)
+    t.start()
+    return t
+
+
+def _legacy_frames(stdout):
+    """Pre-pool FFmpegDecoder.read_frames (bytes copy + frombuffer)."""
+    buffer = bytearray()
+    while True:
+        data = stdout.read(FRAME_BYTES * 2)
+        if not data:
+            break
+        buffer.extend(data)
+        while len(buffer) >= FRAME_BYTES:
+            frame_data = bytes(buffer[:FRAME_BYTES])
+            buffer = buffer[FRAME_BYTES:]
+            yield np.frombuffer(frame_data, dtype=np.int16).reshape(-1, 2)
+
+
+def _legacy_mix(frame: np.ndarray, gain: float) -> np.ndarray:
+    out = frame.astype(np.float32) * float(gain)
+    np.clip(out, -32768.0, 32767.0, out=out)
+    return out.astype(np.int16)
+
+
+def _legacy_send(sock: socket.socket, frame: np.ndarray) -> None:
+    pcm_bytes = frame.astype(np.int16).tobytes()
+    offset = 0
+    while offset < len(pcm_bytes):
+        try:
+            offset += sock.send(pcm_bytes[offset:])
+        except BlockingIOError:
+            time.sleep(0.001)
+
+
+def _run(mode: str, pcm_path: str, frames: int) -> dict:
+    tmpdir = tempfile.mkdtemp()
+    sock_path = os.path.join(tmpdir, "pcm.sock")
+    drain = _start_drain_server(sock_path)
+    sink = TowerPCMSink(socket_path=sock_path)
+    assert sink._connect(), "could not connect to drain socket"
+
+    decoder_pool = FFmpegDecoderPool(size=0, command=["cat"])
+    decoder = decoder_pool.acquire(pcm_path)
+    mixer = Mixer()
+    frame_pool = PCMFramePool(prealloc=8) if mode == "pooled" else None
+
+    if mode == "pooled":
+        source = decoder.read_frames(frame_pool)
+    else:
+        source = _legacy_frames(decoder.proc.stdout)
+
+    peaks = []
+    count = 0
+    tracemalloc.start()
+    start = time.perf_counter()
+    it = iter(source)
+    while count < frames:
+        base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        try:
+            frame = next(it)
+        except StopIteration:
+            break
+        if mode == "pooled":
+            frame = mixer.mix(frame, gain=GAIN)
+            sink.write_paced(frame)
+            frame_pool.release(frame)
+        else:
+            frame = _legacy_mix(frame, GAIN)
+            _legacy_send(sink._socket, frame)
+        _, peak = tracemalloc.get_traced_memory()
+        peaks.append(max(0, peak - base))
+        count += 1
+    elapsed = time.perf_counter() - start
+    tracemalloc.stop()
+
+    decoder.close()
+    sink.close()
+    drain.join(timeout=2.0)
+    if os.path.exists(sock_path):
+        os.unlink(sock_path)
+    os.rmdir(tmpdir)
+
+    # Skip warm-up frames (first-touch of scratch buffers / views)
+    steady = peaks[8:] or peaks
+    return {
+        "mode": mode,
+        "frames": count,
+        "peak_bytes_per_frame": sum(steady) / len(steady) if steady else 0.0,
+        "us_per_frame": elapsed / count * 1e6 if count else 0.0,
+        "pool_allocations": frame_pool.allocations if frame_pool else None,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--frames", type=int, default=2000, help="frames per run")
+    args = parser.parse_args()
+
+    samples = np.random.default_rng(0).integers(
+        -20000, 20000, size=(args.frames + 16) * FRAME_SAMPLES * 2, dtype=np.int16
+    )
+    with tempfile.NamedTemporaryFile(suffix=".raw", delete=False) as f:
+        f.write(samples.tobytes())
+        pcm_path = f.name
+
+    try:
+        for mode in ("legacy", "pooled"):
+            r = _run(mode, pcm_path, args.frames)
+            print(
+                f"{r['mode']:>7}: frames={r['frames']}  "
+                f"transient_alloc={r['peak_bytes_per_frame']:.0f} B/frame  "
+                f"time={r['us_per_frame']:.1f} us/frame"
+                + (f"  pool_allocations={r['pool_allocations']}" if r["pool_allocations"] is not None else "")
+            )
+    finally:
+        os.unlink(pcm_path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
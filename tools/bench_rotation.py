@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark: RotationManager selection time at 1k/10k/100k tracks.
+
+Compares the vectorized select_next_song() with the scalar reference path
+(per-path holiday classification + _calculate_weights() + random.choices),
+with a full history and play counts for a few thousand plays.
+
+This tool is purely diagnostic and MUST NOT be imported by Station runtime.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from station.music_logic.rotation import HISTORY_SIZE, RotationManager
+
+
+def _manager(count: int, plays: int) -> RotationManager:
+    tracks = [f"/music/regular/artist_{i // 12:05d}/track_{i:06d}.mp3" for i in range(count)]
+    manager = RotationManager(tracks, [])
+    rng = random.Random(0)
+    now = time.time()
+    history = [(rng.choice(tracks), now - i * 200.0, False) for i in range(plays)]
+    counts: dict[str, int] = {}
+    for path, _, _ in history:
+        counts[path] = counts.get(path, 0) + 1
+    manager.history = history[:HISTORY_SIZE][::-1]
+    manager.play_counts = counts
+    return manager
+
+
+def _reference_select(manager: RotationManager, tracks: list[str]) -> str:
+    regular = [t for t in tracks if "holiday" not in t.lower()]
+    weights, all_tracks, _ = manager._calculate_weights(regular, [])
+    total = sum(weights)
+    return all_tracks[random.choices(range(len(all_tracks)), weights=[w / total for w in weights])[0]]
+
+
+def _per_call_ms(fn, reps: int) -> float:
+    start = time.perf_counter()
+    for _ in range(reps):
+        fn()
+    return (time.perf_counter() - start) * 1000.0 / reps
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="1000,10000,100000", help="comma-separated track counts")
+    parser.add_argument("--plays", type=int, default=2000, help="plays behind the play counts")
+    parser.add_argument("--reps", type=int, default=50, help="vectorized selections per size")
+    parser.add_argument("--reference-reps", type=int, default=3, help="scalar selections per size (0 = skip)")
+    args = parser.parse_args()
+
+    print(f"{'tracks':>8}  {'vectorized':>12}  {'reference':>12}  {'speedup':>8}")
+    for count in (int(size) for size in args.sizes.split(",")):
+        manager = _manager(count, args.plays)
+        current = manager._regular_tracks[0]
+        fast = _per_call_ms(lambda: manager.select_next_song(exclude=current), args.reps)
+        line = f"{count:>8}  {fast:>10.3f}ms"
+        if args.reference_reps:
+            tracks = [t for t in manager._regular_tracks if t != current]
+            slow = _per_call_ms(lambda: _reference_select(manager, tracks), args.reference_reps)
+            line += f"  {slow:>10.3f}ms  {slow / fast:>7.0f}x"
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,472 @@
+"""
+Disk-backed time-shift archive of the broadcast MP3 stream.
+
+Tower keeps only a few seconds of MP3 in memory. MP3Archive records every
+broadcast frame to disk, for compliance recording and for listening from an
+earlier point ("/stream?start=<epoch>").
+
+- Segments: one file per segment_sec of wall-clock time (hourly by default,
+  aligned to the top of the hour), named by their UTC start time, e.g.
+  20260101T130000Z.mp3. Files hold whole MP3 frames back to back.
+- Sparse index: next to each segment, a .idx file of INDEX_STRUCT records
+  (wall-clock time, byte offset of a frame start), one per index_interval_sec.
+  A start time maps to the last indexed frame at or before it.
+- Writer: append() runs on the broadcast thread and only queues the frame.
+  The "tower-archive-writer" thread writes batches through a buffered file
+  and flushes every flush_interval_sec. Readers only see flushed bytes
+  ("committed"), so they never read a partial frame. If the queue is full
+  (disk stalled), frames are dropped and counted, never waited on.
+- Retention: the oldest closed segments are deleted while the archive holds
+  more than max_bytes or a segment ended more than max_age_sec ago.
+- Recovery: after an unclean shutdown the newest segment may end in a torn
+  frame (and its index in a torn record). start() cuts both back to the last
+  whole frame before anything is appended.
+
+Each appended frame gets a sequence number. The last recent_frames frames
+stay in memory, so a reader that has caught up with the committed bytes
+can take the not-yet-committed tail and join the live stream without a gap.
+"""
+
+from __future__ import annotations
+
+import bisect
+import calendar
+import logging
+import os
+import struct
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+
+from tower.audio.mp3_framer import mp3_frame_size
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ARCHIVE_SEGMENT_SEC = 3600
+DEFAULT_ARCHIVE_MAX_BYTES = 12 * 1024 ** 3  # ~7 days at 128 kbps
+DEFAULT_ARCHIVE_MAX_AGE_SEC = 7 * 24 * 3600
+DEFAULT_ARCHIVE_INDEX_INTERVAL_SEC = 1.0
+DEFAULT_ARCHIVE_FLUSH_INTERVAL_SEC = 0.5
+DEFAULT_ARCHIVE_QUEUE_FRAMES = 4096  # ~100s of frames if the disk stalls
+DEFAULT_ARCHIVE_RECENT_FRAMES = 512
+ARCHIVE_WRITE_BUFFER_BYTES = 256 * 1024
+
+# Index record: wall-clock time of a frame (f64) and its byte offset in the segment (u64)
+INDEX_STRUCT = struct.Struct("<dQ")
+
+_SEGMENT_NAME_FORMAT = "%Y%m%dT%H%M%SZ"
+
+
+def segment_name(start: int) -> str:
+    """File stem for the segment starting at epoch second start (UTC)."""
+    return time.strftime(_SEGMENT_NAME_FORMAT, time.gmtime(start))
+
+
+def parse_segment_name(stem: str) -> Optional[int]:
+    try:
+        return calendar.timegm(time.strptime(stem, _SEGMENT_NAME_FORMAT))
+    except ValueError:
+        return None
+
+
+class _Segment:
+    """One segment file: committed size and sparse time -> offset index."""
+
+    __slots__ = ("start", "path", "index_path", "size", "times", "offsets")
+
+    def __init__(self, start: int, path: str, index_path: str):
+        self.start = start
+        self.path = path
+        self.index_path = index_path
+        self.size = 0
+        self.times: List[float] = []
+        self.offsets: List[int] = []
+
+
+class MP3Archive:
+    """
+    Rotating on-disk MP3 archive with a timestamp index.
+
+    Usage:
+        archive = MP3Archive("/var/lib/retrowaves/archive")
+        archive.start()
+        seq = archive.append(frame)             # broadcast thread; never blocks on disk
+        position = archive.locate(epoch)        # (segment_start, offset) or None = live
+        archive.stop()
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        segment_sec: int = DEFAULT_ARCHIVE_SEGMENT_SEC,
+        max_bytes: int = DEFAULT_ARCHIVE_MAX_BYTES,
+        max_age_sec: float = DEFAULT_ARCHIVE_MAX_AGE_SEC,
+        index_interval_sec: float = DEFAULT_ARCHIVE_INDEX_INTERVAL_SEC,
+        flush_interval_sec: float = DEFAULT_ARCHIVE_FLUSH_INTERVAL_SEC,
+        queue_frames: int = DEFAULT_ARCHIVE_QUEUE_FRAMES,
+        recent_frames: int = DEFAULT_ARCHIVE_RECENT_FRAMES,
+    ):
+        """
+        Args:
+            directory: Directory holding segment and index files (created if missing)
+            segment_sec: Wall-clock length of a segment; segments align to multiples of it
+            max_bytes: Archive size bound; 0 disables
+            max_age_sec: Segments that ended longer ago than this are deleted; 0 disables
+            index_interval_sec: Spacing of index entries (seek granularity)
+            flush_interval_sec: How often written frames are flushed and become readable
+            queue_frames: Frames that may wait for the writer before new ones are dropped
+            recent_frames: Frames kept in memory for readers joining the live stream
+        """
+        self.directory = directory
+        self.segment_sec = max(1, int(segment_sec))
+        self.max_bytes = max(0, int(max_bytes))
+        self.max_age_sec = max(0.0, float(max_age_sec))
+        self.index_interval_sec = index_interval_sec
+        self.flush_interval_sec = flush_interval_sec
+        self.queue_frames = max(1, int(queue_frames))
+
+        self._lock = threading.Lock()
+        self._committed_cond = threading.Condition(self._lock)
+        self._queue: List[Tuple[int, float, bytes]] = []
+        self._recent: deque = deque(maxlen=max(1, int(recent_frames)))
+        self._seq = 0
+        self._committed_seq = 0
+        self._committed_time: Optional[float] = None  # wall-clock time of the last committed frame
+        self._segments: Dict[int, _Segment] = {}
+        self._starts: List[int] = []  # sorted segment starts
+        self._current: Optional[_Segment] = None
+
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        # Writer-thread state
+        self._file = None
+        self._index_file = None
+        self._offset = 0
+        self._last_index_time = 0.0
+        self._pending_index: List[Tuple[float, int]] = []
+
+        self.frames_written = 0
+        self.bytes_written = 0
+        self.frames_dropped = 0
+        self.write_errors = 0
+        self.segments_deleted = 0
+        self.bytes_truncated = 0
+
+    # --- lifecycle ---
+
+    def start(self) -> None:
+        """Load existing segments, apply retention and start the writer thread. Raises OSError."""
+        os.makedirs(self.directory, exist_ok=True)
+        self._load_segments()
+        self._apply_retention(time.time())
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="tower-archive-writer", daemon=True)
+        self._thread.start()
+        logger.info(
+            f"MP3 archive recording to {self.directory} "
+            f"({len(self._segments)} existing segments, {self.segment_sec}s per segment)"
+        )
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Write out queued frames, close the current segment and stop the writer."""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=timeout)
+            if self._thread.is_alive():
+                logger.warning("Archive writer did not stop within timeout")
+            self._thread = None
+        logger.info("MP3 archive stopped")
+
+    # --- broadcast thread ---
+
+    def append(self, frame: bytes) -> int:
+        """
+        Queue one broadcast frame for writing; returns its sequence number.
+
+        Never blocks on disk. If the writer is queue_frames behind, the frame
+        is dropped from the archive (it is still broadcast).
+        """
+        now = time.time()
+        with self._lock:
+            self._seq += 1
+            self._recent.append((self._seq, frame))
+            if len(self._queue) < self.queue_frames:
+                self._queue.append((self._seq, now, frame))
+            else:
+                self.frames_dropped += 1
+            return self._seq
+
+    @property
+    def last_seq(self) -> int:
+        return self._seq
+
+    # --- readers ---
+
+    def locate(self, epoch: float) -> Optional[Tuple[int, int]]:
+        """
+        Find where to start playback for wall-clock time epoch.
+
+        Returns:
+            (segment_start, byte offset of a frame boundary), or None if epoch is
+            at or past the last committed frame (serve live). A time before the
+            oldest segment starts at the oldest audio retained.
+        """
+        with self._lock:
+            if not self._starts or self._committed_time is None or epoch >= self._committed_time:
+                return None
+            i = bisect.bisect_right(self._starts, epoch) - 1
+            if i < 0:
+                return self._starts[0], 0
+            segment = self._segments[self._starts[i]]
+            j = bisect.bisect_right(segment.times, epoch) - 1
+            return segment.start, segment.offsets[j] if j >= 0 else 0
+
+    def segment_path(self, start: int) -> str:
+        return os.path.join(self.directory, segment_name(start) + ".mp3")
+
+    def committed(self) -> Tuple[Optional[int], int, int]:
+        """(current segment start, its committed bytes, seq of the last committed frame)."""
+        with self._lock:
+            current = self._current
+            return (current.start if current else None), (current.size if current else 0), self._committed_seq
+
+    def segment_size(self, start: int) -> Optional[int]:
+        """Committed bytes of a segment, or None if it no longer exists."""
+        with self._lock:
+            segment = self._segments.get(start)
+            return segment.size if segment else None
+
+    def next_segment(self, start: int) -> Optional[int]:
+        """Start of the first retained segment after start, if any."""
+        with self._lock:
+            i = bisect.bisect_right(self._starts, start)
+            return self._starts[i] if i < len(self._starts) else None
+
+    def wait_for_commit(self, seq: int, timeout: float) -> bool:
+        """Wait until frames after seq are committed; returns False on timeout."""
+        with self._committed_cond:
+            return self._committed_cond.wait_for(lambda: self._committed_seq > seq, timeout=timeout)
+
+    def frames_after(self, seq: int) -> Optional[List[bytes]]:
+        """
+        Frames appended after seq, oldest first, from the in-memory tail.
+
+        Returns None if some of them are no longer held in memory.
+        """
+        with self._lock:
+            if seq >= self._seq:
+                return []
+            if not self._recent or self._recent[0][0] > seq + 1:
+                return None
+            return [frame for frame_seq, frame in self._recent if frame_seq > seq]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total_bytes = sum(segment.size for segment in self._segments.values())
+            oldest = self._starts[0] if self._starts else None
+            return {
+                "segments": len(self._segments),
+                "bytes": total_bytes,
+                "oldest_segment": segment_name(oldest) if oldest is not None else None,
+                "queued_frames": len(self._queue),
+                "frames_written": self.frames_written,
+                "bytes_written": self.bytes_written,
+                "frames_dropped": self.frames_dropped,
+                "write_errors": self.write_errors,
+                "segments_deleted": self.segments_deleted,
+                "bytes_truncated": self.bytes_truncated,
+            }
+
+    # --- writer thread ---
+
+    def _run(self) -> None:
+        try:
+            while not self._stop_event.wait(self.flush_interval_sec):
+                self._write_pending()
+            self._write_pending()
+        except Exception as e:
+            logger.error(f"Unexpected error in archive writer: {e}", exc_info=True)
+        finally:
+            self._close_current()
+
+    def _write_pending(self) -> None:
+        with self._lock:
+            batch, self._queue = self._queue, []
+        if not batch:
+            return
+        for seq, frame_time, frame in batch:
+            start = int(frame_time // self.segment_sec) * self.segment_sec
+            if self._current is None or start != self._current.start:
+                self._rotate(start, frame_time)
+            if self._file is None:
+                continue  # segment could not be opened; frame is lost
+            if self._offset == 0 or frame_time - self._last_index_time >= self.index_interval_sec:
+                self._pending_index.append((frame_time, self._offset))
+                self._last_index_time = frame_time
+            try:
+                self._file.write(frame)
+            except OSError as e:
+                self._write_failed(e)
+                continue
+            self._offset += len(frame)
+            self.frames_written += 1
+            self.bytes_written += len(frame)
+        self._commit(batch[-1][0], batch[-1][1])
+
+    def _commit(self, seq: int, frame_time: float) -> None:
+        """Flush written frames and the index, then make them visible to readers."""
+        if self._file is not None:
+            try:
+                self._file.flush()
+                if self._pending_index:
+                    self._index_file.write(b"".join(INDEX_STRUCT.pack(t, o) for t, o in self._pending_index))
+                    self._index_file.flush()
+            except OSError as e:
+                self._write_failed(e)
+                return
+        with self._committed_cond:
+            current = self._current
+            if current is not None and self._file is not None:
+                current.size = self._offset
+                for index_time, offset in self._pending_index:
+                    current.times.append(index_time)
+                    current.offsets.append(offset)
+            self._pending_index = []
+            self._committed_seq = seq
+            self._committed_time = frame_time
+            self._committed_cond.notify_all()
+            over_size = self.max_bytes and sum(s.size for s in self._segments.values()) > self.max_bytes
+        if over_size:
+            self._apply_retention(time.time())
+
+    def _rotate(self, start: int, frame_time: float) -> None:
+        """Close the current segment and open (or continue) the segment starting at start."""
+        self._close_current()
+        path = self.segment_path(start)
+        segment = _Segment(start, path, os.path.join(self.directory, segment_name(start) + ".idx"))
+        try:
+            self._file = open(path, "ab", buffering=ARCHIVE_WRITE_BUFFER_BYTES)
+            self._index_file = open(segment.index_path, "ab")
+        except OSError as e:
+            self._write_failed(e)
+            self._file = None
+            return
+        with self._lock:
+            existing = self._segments.get(start)
+            if existing is not None:
+                # Restarted within the same segment period: append after what is there
+                segment = existing
+            else:
+                self._segments[start] = segment
+                bisect.insort(self._starts, start)
+            segment.size = self._file.tell()
+            self._current = segment
+        self._offset = segment.size
+        self._last_index_time = 0.0
+        logger.info(f"Archive segment {os.path.basename(path)} opened")
+        self._apply_retention(frame_time)
+
+    def _close_current(self) -> None:
+        for f in (self._file, self._index_file):
+            if f is not None:
+                try:
+                    f.close()
+                except OSError as e:
+                    logger.warning(f"Error closing archive file: {e}")
+        self._file = None
+        self._index_file = None
+
+    def _write_failed(self, error: OSError) -> None:
+        self.write_errors += 1
+        if self.write_errors == 1 or self.write_errors % 100 == 0:
+            logger.warning(f"Archive write failed ({self.write_errors} errors): {error}")
+
+    # --- segments on disk ---
+
+    def _load_segments(self) -> None:
+        for name in sorted(os.listdir(self.directory)):
+            stem, ext = os.path.splitext(name)
+            start = parse_segment_name(stem) if ext == ".mp3" else None
+            if start is None:
+                continue
+            segment = _Segment(start, os.path.join(self.directory, name), os.path.join(self.directory, stem + ".idx"))
+            segment.size = os.path.getsize(segment.path)
+            try:
+                with open(segment.index_path, "rb") as f:
+                    data = f.read()
+                for i in range(0, len(data) - INDEX_STRUCT.size + 1, INDEX_STRUCT.size):
+                    index_time, offset = INDEX_STRUCT.unpack_from(data, i)
+                    if offset < segment.size:
+                        segment.times.append(index_time)
+                        segment.offsets.append(offset)
+            except OSError:
+                pass  # no index: the segment still plays from its start
+            self._segments[start] = segment
+            self._starts.append(start)
+        self._starts.sort()
+        if self._starts:
+            # Only the segment being written at shutdown can end in a torn frame
+            self._truncate_torn_tail(self._segments[self._starts[-1]])
+        for segment in self._segments.values():
+            if segment.times:
+                self._committed_time = max(self._committed_time or 0.0, segment.times[-1])
+
+    def _truncate_torn_tail(self, segment: _Segment) -> None:
+        """Cut segment (and its index) back to the end of its last whole frame."""
+        try:
+            while True:
+                # Frames follow each other from any indexed offset; walk from the last one
+                start = segment.offsets[-1] if segment.offsets else 0
+                with open(segment.path, "rb") as f:
+                    f.seek(start)
+                    data = f.read()
+                end = 0
+                while True:
+                    frame_size = mp3_frame_size(data, end)
+                    if frame_size is None or end + frame_size > len(data):
+                        break
+                    end += frame_size
+                if end > 0 or not segment.offsets:
+                    break
+                # The indexed frame itself is torn
+                segment.offsets.pop()
+                segment.times.pop()
+            valid = start + end
+            if valid < segment.size:
+                os.truncate(segment.path, valid)
+                self.bytes_truncated += segment.size - valid
+                logger.warning(
+                    f"Archive segment {os.path.basename(segment.path)} truncated by "
+                    f"{segment.size - valid} bytes to its last whole frame"
+                )
+                segment.size = valid
+            index_size = len(segment.offsets) * INDEX_STRUCT.size
+            if os.path.exists(segment.index_path) and os.path.getsize(segment.index_path) != index_size:
+                os.truncate(segment.index_path, index_size)
+        except OSError as e:
+            logger.warning(f"Could not repair archive segment {os.path.basename(segment.path)}: {e}")
+
+    def _apply_retention(self, now: float) -> None:
+        """Delete the oldest closed segments while over max_bytes or older than max_age_sec."""
+        while True:
+            with self._lock:
+                if not self._starts or self._segments[self._starts[0]] is self._current:
+                    return
+                oldest = self._segments[self._starts[0]]
+                total = sum(s.size for s in self._segments.values())
+                too_big = self.max_bytes and total > self.max_bytes
+                too_old = self.max_age_sec and oldest.start + self.segment_sec < now - self.max_age_sec
+                if not (too_big or too_old):
+                    return
+                del self._segments[oldest.start]
+                self._starts.pop(0)
+                self.segments_deleted += 1
+            for path in (oldest.path, oldest.index_path):
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    logger.warning(f"Could not delete archive file {path}: {e}")
+            logger.info(f"Archive segment {os.path.basename(oldest.path)} deleted (retention)")
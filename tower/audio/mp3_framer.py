@@ -0,0 +1,133 @@
+"""
+MP3 frame boundary detection.
+
+Splits an arbitrary MP3 byte stream into whole frames (contract F9), so MP3
+is only ever handed to the HTTP layer frame by frame. Used at both MP3 input
+boundaries: the encoder drain thread (FFmpeg stdout) and the relay (an
+origin Tower's /stream).
+"""
+
+from __future__ import annotations
+
+from typing import List, Optional
+
+# MPEG-1 Layer III lookup tables
+# Bitrate (kbps) by header bitrate index; 0 = free/invalid
+BITRATE_TABLE_KBPS = (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 0)
+# Sample rate (Hz) by header sample rate index; 0 = reserved
+SAMPLE_RATE_TABLE_HZ = (44100, 48000, 32000, 0)
+
+
+def find_mp3_sync(data, start: int = 0) -> Optional[int]:
+    """
+    Find the next MP3 sync word at or after start.
+
+    MP3 sync word: 0xFF followed by a byte with the top 3 bits set (0xE0).
+
+    Args:
+        data: Bytes/bytearray to search
+        start: Index to start searching from
+
+    Returns:
+        Index of sync word if found, None otherwise
+    """
+    end = len(data) - 1
+    i = data.find(b"\xff", start)
+    while 0 <= i < end:
+        if (data[i + 1] & 0xE0) == 0xE0:
+            return i
+        i = data.find(b"\xff", i + 1)
+    return None
+
+
+def mp3_frame_size(data, offset: int = 0) -> Optional[int]:
+    """
+    Parse the MP3 frame header at offset and return the frame size.
+
+    Frame size = (144 * bitrate_bps) / sample_rate + padding
+
+    Args:
+        data: Bytes/bytearray with a potential MP3 frame header at offset
+        offset: Index of the header
+
+    Returns:
+        Frame size in bytes if a valid header is present, None otherwise
+        (too few bytes, no sync word, or reserved bitrate/sample rate)
+    """
+    if len(data) - offset < 4:
+        return None  # Need at least 4 bytes for header
+    if data[offset] != 0xFF or (data[offset + 1] & 0xE0) != 0xE0:
+        return None  # Invalid sync word
+
+    # Byte 2: bitrate index (bits 4-7), sample rate index (bits 2-3), padding (bit 1)
+    header_byte2 = data[offset + 2]
+    bitrate_kbps = BITRATE_TABLE_KBPS[(header_byte2 >> 4) & 0x0F]
+    sample_rate = SAMPLE_RATE_TABLE_HZ[(header_byte2 >> 2) & 0x03]
+    padding = (header_byte2 >> 1) & 0x01
+    if bitrate_kbps == 0 or sample_rate == 0:
+        return None  # Invalid bitrate or sample rate
+
+    frame_size = (144 * bitrate_kbps * 1000) // sample_rate + padding
+    if frame_size < 4:
+        return None
+    return frame_size
+
+
+class MP3Framer:
+    """
+    Incremental MP3 framer: feed bytes in, get whole frames out.
+
+    Bytes before a sync word are discarded (counted in discarded_bytes). A
+    sync word whose header is invalid is skipped rather than waited on, so a
+    false sync in the data cannot stall the stream. A trailing partial frame
+    is kept until the rest arrives; reset() drops it (e.g. on reconnect).
+    """
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+        self.frames = 0
+        self.discarded_bytes = 0
+
+    def feed(self, data: bytes) -> List[bytes]:
+        """
+        Append data and return every complete frame now available, in order.
+        """
+        buf = self._buf
+        buf.extend(data)
+        frames = []
+        pos = 0
+        while True:
+            sync = find_mp3_sync(buf, pos)
+            if sync is None:
+                # Keep a trailing 0xFF: it may be the first half of a sync word
+                keep_from = len(buf) - 1 if buf and buf[-1] == 0xFF else len(buf)
+                self.discarded_bytes += max(0, keep_from - pos)
+                pos = max(pos, keep_from)
+                break
+            self.discarded_bytes += sync - pos
+            pos = sync
+            if len(buf) - pos < 4:
+                break  # header not complete yet
+            frame_size = mp3_frame_size(buf, pos)
+            if frame_size is None:
+                # False sync - skip it
+                self.discarded_bytes += 1
+                pos += 1
+                continue
+            if len(buf) - pos < frame_size:
+                break  # frame not complete yet
+            frames.append(bytes(buf[pos:pos + frame_size]))
+            pos += frame_size
+        if pos:
+            del buf[:pos]
+        self.frames += len(frames)
+        return frames
+
+    def reset(self) -> None:
+        """Drop any buffered partial frame."""
+        self.discarded_bytes += len(self._buf)
+        self._buf.clear()
+
+    @property
+    def pending_bytes(self) -> int:
+        return len(self._buf)
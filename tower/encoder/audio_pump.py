@@ -43,6 +43,9 @@ FRAME_DURATION_SEC = FRAME_SIZE_SAMPLES / SAMPLE_RATE  # 0.0213333333s (21.333ms
 # Standard PCM frame size: 1024 samples × 2 channels × 2 bytes = 4096 bytes
 SILENCE_FRAME_SIZE = FRAME_SIZE_SAMPLES * 2 * 2  # 4096 bytes
 
+# Smoothing for the tick lateness signal (EWMA weight of the newest tick)
+LATENESS_EWMA_ALPHA = 0.1
+
 
 class AudioPump:
     """
@@ -81,6 +84,17 @@ class AudioPump:
         self.downstream_buffer = downstream_buffer
         self.running = False
         self.thread = None
+        # Tick lateness telemetry: CPU pressure signal for admission control
+        self._lateness_ms = 0.0
+        self.overruns = 0
+
+    def tick_lateness_ms(self) -> float:
+        """Smoothed lateness of ticks behind their schedule, in ms (0 when on time)."""
+        return self._lateness_ms
+
+    def _record_lateness(self, late_sec: float) -> None:
+        late_ms = max(0.0, late_sec) * 1000.0
+        self._lateness_ms += LATENESS_EWMA_ALPHA * (late_ms - self._lateness_ms)
 
     def start(self):
         if self.running:
@@ -110,6 +124,9 @@ class AudioPump:
         tick_index = 0
 
         while self.running:
+            # Telemetry: how late this tick starts (sleep overshoot under CPU pressure)
+            self._record_lateness(time.monotonic() - next_tick)
+            
             # Telemetry: Log first PCM frame generated
             if tick_index == 0:
                 logger.info("AUDIO_PUMP: first PCM frame generated")
@@ -155,6 +172,8 @@ class AudioPump:
                 else:
                     # Behind schedule - resync per contract [A10]
                     logger.warning("AudioPump behind schedule after error, resyncing")
+                    self.overruns += 1
+                    self._record_lateness(-sleep_time)
                     next_tick = time.monotonic()
                 continue
 
@@ -167,4 +186,6 @@ class AudioPump:
             else:
                 # Per contract [A10]: Resync if behind schedule instead of accumulating delay
                 logger.warning("AudioPump behind schedule, resyncing")
+                self.overruns += 1
+                self._record_lateness(-sleep_time)
                 next_tick = time.monotonic()  # resync
@@ -14,6 +14,7 @@ import threading
 import time
 from typing import BinaryIO, Callable, Optional
 
+from tower.audio.mp3_framer import MP3Framer
 from tower.audio.ring_buffer import FrameRingBuffer
 
 logger = logging.getLogger(__name__)
@@ -65,9 +66,9 @@ class EncoderOutputDrainThread(threading.Thread):
         self._read_size = 4096  # Read ~4KB per poll
         
         # Per contract F9: MP3 frame boundary detection and accumulation
-        # MP3 frame size for 128kbps @ 48kHz: (144 * bitrate_bps) / sample_rate = (144 * 128000) / 48000 = 384 bytes
-        # Note: Actual MP3 frames can vary by 1 byte due to padding bit, so we use dynamic detection
-        self._accumulator = bytearray()
+        # Actual MP3 frames can vary by 1 byte due to padding bit, so frame sizes
+        # are parsed from each header (see tower.audio.mp3_framer)
+        self._framer = MP3Framer()
     
     def run(self) -> None:
         """
@@ -105,40 +106,11 @@ class EncoderOutputDrainThread(threading.Thread):
                         self.on_stall()
                         break
                     
-                    # Per contract F9: Accumulate bytes and detect frame boundaries
-                    # Append new bytes to accumulator
-                    self._accumulator.extend(data)
-                    
-                    # Process complete frames from accumulator
-                    frames_pushed = 0
-                    while True:
-                        # Find next MP3 frame by looking for sync word
-                        sync_pos = self._find_mp3_sync(self._accumulator)
-                        if sync_pos is None:
-                            # No sync word found - need more data
-                            break
-                        
-                        # Remove any data before sync word (garbage/incomplete data)
-                        if sync_pos > 0:
-                            self._accumulator = self._accumulator[sync_pos:]
-                        
-                        # Try to detect frame size starting at sync word
-                        frame_size = self._detect_mp3_frame_size(self._accumulator)
-                        if frame_size is None:
-                            # Can't determine frame size yet - need more data
-                            break
-                        
-                        if len(self._accumulator) < frame_size:
-                            # Not enough data for this frame yet
-                            break
-                        
-                        # Extract complete frame
-                        frame = bytes(self._accumulator[:frame_size])
-                        self._accumulator = self._accumulator[frame_size:]
-                        
-                        # Push complete frame to output buffer (per contract F9)
+                    # Per contract F9: Accumulate bytes and push whole frames only
+                    frames = self._framer.feed(data)
+                    for frame in frames:
                         self.mp3_buffer.push_frame(frame)
-                        frames_pushed += 1
+                    frames_pushed = len(frames)
                     
                     # Update last data timestamp if we pushed frames
                     if frames_pushed > 0:
@@ -174,85 +146,3 @@ class EncoderOutputDrainThread(threading.Thread):
             self.join(timeout=timeout)
             if self.is_alive():
                 logger.warning("Drain thread did not stop within timeout")
-    
-    def _find_mp3_sync(self, data: bytearray) -> Optional[int]:
-        """
-        Find MP3 sync word position in accumulator.
-        
-        MP3 sync word: 0xFF followed by byte with top 3 bits = 0xE0 (0xFB-0xFF).
-        
-        Args:
-            data: Bytearray to search for sync word
-            
-        Returns:
-            Index of sync word if found, None otherwise
-        """
-        if len(data) < 2:
-            return None
-        
-        # Search for sync word pattern: 0xFF followed by valid header byte
-        for i in range(len(data) - 1):
-            if data[i] == 0xFF and (data[i + 1] & 0xE0) == 0xE0:
-                return i
-        
-        return None
-    
-    def _detect_mp3_frame_size(self, data: bytearray) -> Optional[int]:
-        """
-        Detect MP3 frame size by parsing frame header.
-        
-        Per contract F9: Must detect frame boundaries correctly.
-        MP3 frame starts with sync word 0xFF followed by valid header byte (0xFB-0xFF).
-        Frame size = (144 * bitrate_bps) / sample_rate + padding
-        
-        Args:
-            data: Bytearray with potential MP3 frame starting at index 0
-            
-        Returns:
-            Frame size in bytes if valid frame detected, None otherwise
-        """
-        if len(data) < 4:
-            return None  # Need at least 4 bytes for header
-        
-        # Check for MP3 sync word: 0xFF followed by 0xFB-0xFF (top 3 bits must be 0xE0)
-        if data[0] != 0xFF:
-            return None
-        
-        second_byte = data[1]
-        if (second_byte & 0xE0) != 0xE0:
-            return None  # Invalid sync word
-        
-        # Parse header to get bitrate and sample rate
-        # Byte 2: bitrate index (bits 4-7), sample rate index (bits 2-3), padding (bit 1)
-        header_byte2 = data[2]
-        
-        # Extract bitrate index (bits 4-7)
-        bitrate_index = (header_byte2 >> 4) & 0x0F
-        # Extract sample rate index (bits 2-3)
-        sample_rate_index = (header_byte2 >> 2) & 0x03
-        # Extract padding bit (bit 1)
-        padding = (header_byte2 >> 1) & 0x01
-        
-        # Bitrate lookup table (kbps)
-        BITRATE_TABLE = [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 0]
-        # Sample rate lookup table (Hz)
-        SAMPLE_RATE_TABLE = [44100, 48000, 32000, 0]
-        
-        if bitrate_index >= len(BITRATE_TABLE) or sample_rate_index >= len(SAMPLE_RATE_TABLE):
-            return None
-        
-        bitrate_kbps = BITRATE_TABLE[bitrate_index]
-        sample_rate = SAMPLE_RATE_TABLE[sample_rate_index]
-        
-        if bitrate_kbps == 0 or sample_rate == 0:
-            return None  # Invalid bitrate or sample rate
-        
-        # Calculate frame size: (144 * bitrate_bps) / sample_rate + padding
-        bitrate_bps = bitrate_kbps * 1000
-        frame_size = int((144 * bitrate_bps) / sample_rate) + padding
-        
-        if frame_size < 4:
-            return None  # Invalid frame size
-        
-        return frame_size
-
@@ -19,6 +19,7 @@ import threading
 import time
 from typing import BinaryIO, Callable, List, Optional
 
+from tower.audio.mp3_framer import find_mp3_sync, mp3_frame_size
 from tower.audio.ring_buffer import FrameRingBuffer
 
 logger = logging.getLogger(__name__)
@@ -1288,9 +1289,7 @@ class FFmpegSupervisor:
     
     def _find_mp3_sync(self, data: bytearray) -> Optional[int]:
         """
-        Find MP3 sync word position in accumulator.
-        
-        MP3 sync word: 0xFF followed by byte with top 3 bits = 0xE0 (0xFB-0xFF).
+        Find MP3 sync word position in accumulator (see tower.audio.mp3_framer).
         
         Args:
             data: Bytearray to search for sync word
@@ -1298,23 +1297,13 @@ class FFmpegSupervisor:
         Returns:
             Index of sync word if found, None otherwise
         """
-        if len(data) < 2:
-            return None
-        
-        # Search for sync word pattern: 0xFF followed by valid header byte
-        for i in range(len(data) - 1):
-            if data[i] == 0xFF and (data[i + 1] & 0xE0) == 0xE0:
-                return i
-        
-        return None
+        return find_mp3_sync(data)
     
     def _detect_mp3_frame_size(self, data: bytearray) -> Optional[int]:
         """
-        Detect MP3 frame size by parsing frame header.
+        Detect MP3 frame size by parsing frame header (see tower.audio.mp3_framer).
         
         Per contract F9: Must detect frame boundaries correctly.
-        MP3 frame starts with sync word 0xFF followed by valid header byte (0xFB-0xFF).
-        Frame size = (144 * bitrate_bps) / sample_rate + padding
         
         Args:
             data: Bytearray with potential MP3 frame starting at index 0
@@ -1322,50 +1311,7 @@ class FFmpegSupervisor:
         Returns:
             Frame size in bytes if valid frame detected, None otherwise
         """
-        if len(data) < 4:
-            return None  # Need at least 4 bytes for header
-        
-        # Check for MP3 sync word: 0xFF followed by 0xFB-0xFF (top 3 bits must be 0xE0)
-        if data[0] != 0xFF:
-            return None
-        
-        second_byte = data[1]
-        if (second_byte & 0xE0) != 0xE0:
-            return None  # Invalid sync word
-        
-        # Parse header to get bitrate and sample rate
-        # Byte 2: bitrate index (bits 4-7), sample rate index (bits 2-3), padding (bit 1)
-        header_byte2 = data[2]
-        
-        # Extract bitrate index (bits 4-7)
-        bitrate_index = (header_byte2 >> 4) & 0x0F
-        # Extract sample rate index (bits 2-3)
-        sample_rate_index = (header_byte2 >> 2) & 0x03
-        # Extract padding bit (bit 1)
-        padding = (header_byte2 >> 1) & 0x01
-        
-        # Bitrate lookup table (kbps)
-        BITRATE_TABLE = [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 0]
-        # Sample rate lookup table (Hz)
-        SAMPLE_RATE_TABLE = [44100, 48000, 32000, 0]
-        
-        if bitrate_index >= len(BITRATE_TABLE) or sample_rate_index >= len(SAMPLE_RATE_TABLE):
-            return None
-        
-        bitrate_kbps = BITRATE_TABLE[bitrate_index]
-        sample_rate = SAMPLE_RATE_TABLE[sample_rate_index]
-        
-        if bitrate_kbps == 0 or sample_rate == 0:
-            return None  # Invalid bitrate or sample rate
-        
-        # Calculate frame size: (144 * bitrate_bps) / sample_rate + padding
-        bitrate_bps = bitrate_kbps * 1000
-        frame_size = int((144 * bitrate_bps) / sample_rate) + padding
-        
-        if frame_size < 4:
-            return None  # Invalid frame size
-        
-        return frame_size
+        return mp3_frame_size(data)
     
     def _check_stall(self) -> None:
         """
@@ -0,0 +1,197 @@
+"""
+Admission control for new /stream listeners.
+
+After a Tower restart every player reconnects within the same second. Without
+a gate each connection gets a handler thread, headers and a slot in the
+broadcast fan-out at once, and the burst competes with AudioPump for CPU.
+
+AdmissionController gates new /stream admissions:
+- Token bucket: `rate_per_sec` admissions per second on average, with bursts
+  of up to `burst`
+- Short wait queue: up to `queue_size` requests wait at most `queue_timeout_sec`
+  for a token; beyond that they are answered 503 with a Retry-After
+- Jitter: Retry-After is `retry_after_sec` plus a random 0..`jitter_sec`, so
+  rejected players do not come back in lockstep
+- Overload signal (optional): a callable returning AudioPump tick lateness
+  in ms; above `max_lateness_ms`, admissions halt for `halt_sec`
+
+Clients already streaming are never affected.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ADMIT_RATE_PER_SEC = 20.0
+DEFAULT_ADMIT_BURST = 40
+DEFAULT_ADMIT_QUEUE_SIZE = 32
+DEFAULT_ADMIT_QUEUE_TIMEOUT_SEC = 0.5
+DEFAULT_RETRY_AFTER_SEC = 2.0
+DEFAULT_RETRY_JITTER_SEC = 3.0
+DEFAULT_MAX_LATENESS_MS = 10.0
+DEFAULT_HALT_SEC = 2.0
+
+
+class AdmissionController:
+    """
+    Token bucket + bounded wait queue + overload halt for /stream admissions.
+
+    Usage:
+        admission = AdmissionController(rate_per_sec=20, burst=40,
+                                        overload_signal=audio_pump.tick_lateness_ms)
+        retry_after = admission.admit()
+        if retry_after is not None:
+            # answer 503 with "Retry-After: {retry_after}"
+    """
+
+    def __init__(
+        self,
+        rate_per_sec: float = DEFAULT_ADMIT_RATE_PER_SEC,
+        burst: int = DEFAULT_ADMIT_BURST,
+        queue_size: int = DEFAULT_ADMIT_QUEUE_SIZE,
+        queue_timeout_sec: float = DEFAULT_ADMIT_QUEUE_TIMEOUT_SEC,
+        retry_after_sec: float = DEFAULT_RETRY_AFTER_SEC,
+        jitter_sec: float = DEFAULT_RETRY_JITTER_SEC,
+        overload_signal: Optional[Callable[[], float]] = None,
+        max_lateness_ms: float = DEFAULT_MAX_LATENESS_MS,
+        halt_sec: float = DEFAULT_HALT_SEC,
+    ):
+        """
+        Args:
+            rate_per_sec: Average admissions per second (token refill rate)
+            burst: Bucket size; admissions possible at once after a quiet period
+            queue_size: Requests allowed to wait for a token at the same time
+            queue_timeout_sec: Longest a queued request waits for a token
+            retry_after_sec: Base Retry-After for rejected requests
+            jitter_sec: Random extra Retry-After (uniform 0..jitter_sec)
+            overload_signal: Returns current AudioPump tick lateness in ms (optional)
+            max_lateness_ms: Lateness above which admissions halt; 0 disables the signal
+            halt_sec: How long admissions stay halted after an overload reading
+        """
+        self.rate_per_sec = max(0.001, float(rate_per_sec))
+        self.burst = max(1, int(burst))
+        self.queue_size = max(0, int(queue_size))
+        self.queue_timeout_sec = max(0.0, float(queue_timeout_sec))
+        self.retry_after_sec = max(0.0, float(retry_after_sec))
+        self.jitter_sec = max(0.0, float(jitter_sec))
+        self.overload_signal = overload_signal
+        self.max_lateness_ms = max_lateness_ms
+        self.halt_sec = halt_sec
+
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._refilled_at = time.monotonic()
+        self._waiting = 0
+        self._halted_until = 0.0
+
+        self.admitted = 0
+        self.admitted_after_wait = 0
+        self.rejected_rate = 0  # no token within the queue timeout, or queue full
+        self.rejected_overload = 0
+        self.halts = 0
+
+    def admit(self) -> Optional[int]:
+        """
+        Take an admission, waiting briefly in the queue if the bucket is empty.
+
+        Returns:
+            None if admitted; otherwise the Retry-After seconds to send with a 503
+        """
+        now = time.monotonic()
+        if self._overloaded(now):
+            with self._lock:
+                self.rejected_overload += 1
+                remaining = self._halted_until - now
+            return self._retry_after(remaining)
+
+        deadline = now + self.queue_timeout_sec
+        with self._lock:
+            wait = self._take(now)
+            if wait == 0.0:
+                self.admitted += 1
+                return None
+            if self._waiting >= self.queue_size or wait > self.queue_timeout_sec:
+                self.rejected_rate += 1
+                return self._retry_after(wait)
+            self._waiting += 1
+        try:
+            while True:
+                time.sleep(min(wait, max(0.0, deadline - time.monotonic())))
+                now = time.monotonic()
+                with self._lock:
+                    wait = self._take(now)
+                    if wait == 0.0:
+                        self.admitted += 1
+                        self.admitted_after_wait += 1
+                        return None
+                    if now >= deadline:
+                        self.rejected_rate += 1
+                        return self._retry_after(wait)
+        finally:
+            with self._lock:
+                self._waiting -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            self._refill(now)
+            return {
+                "tokens": round(self._tokens, 2),
+                "waiting": self._waiting,
+                "halted": now < self._halted_until,
+                "admitted": self.admitted,
+                "admitted_after_wait": self.admitted_after_wait,
+                "rejected_rate": self.rejected_rate,
+                "rejected_overload": self.rejected_overload,
+                "halts": self.halts,
+            }
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._refilled_at
+        if elapsed > 0:
+            self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate_per_sec)
+            self._refilled_at = now
+
+    def _take(self, now: float) -> float:
+        """Take a token if one is available (returns 0.0), else the wait until the next one (lock held)."""
+        self._refill(now)
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return 0.0
+        return (1.0 - self._tokens) / self.rate_per_sec
+
+    def _overloaded(self, now: float) -> bool:
+        if now < self._halted_until:
+            return True
+        if self.overload_signal is None or self.max_lateness_ms <= 0:
+            return False
+        try:
+            lateness_ms = self.overload_signal()
+        except Exception:
+            return False
+        if lateness_ms <= self.max_lateness_ms:
+            return False
+        with self._lock:
+            if now >= self._halted_until:
+                self._halted_until = now + self.halt_sec
+                self.halts += 1
+                logger.warning(
+                    f"Stream admissions halted for {self.halt_sec:.1f}s: "
+                    f"AudioPump tick lateness {lateness_ms:.1f}ms > {self.max_lateness_ms:.1f}ms"
+                )
+        return True
+
+    def _retry_after(self, min_wait: float) -> int:
+        return retry_after_with_jitter(max(min_wait, self.retry_after_sec), self.jitter_sec)
+
+
+def retry_after_with_jitter(base_sec: float = DEFAULT_RETRY_AFTER_SEC, jitter_sec: float = DEFAULT_RETRY_JITTER_SEC) -> int:
+    """Retry-After seconds (integer, at least 1): base_sec plus uniform 0..jitter_sec."""
+    return max(1, math.ceil(base_sec + random.uniform(0.0, jitter_sec)))
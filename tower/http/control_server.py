@@ -0,0 +1,419 @@
+"""
+Keep-alive control-plane listener for Tower's non-streaming endpoints.
+
+The main HTTPServer accepts every connection on one thread and hands it to a
+new thread that does one recv(4096) and parses the request by hand; most
+endpoints then close the connection. /tower/buffer polls and event POSTs from
+Station paid that per request, on the same accept loop as /stream listeners.
+
+ControlPlaneServer listens on its own port (TOWER_CONTROL_PORT):
+- One I/O thread owns every socket (selectors): accepts, reads, writes
+- An incremental parser turns each connection's byte stream into requests;
+  HTTP/1.1 keep-alive is the default and pipelined requests are answered in
+  order (a connection has at most one request with the workers at a time)
+- A small fixed pool of worker threads runs the handler, so a slow request
+  never blocks the I/O thread and no thread is created per request
+- Connections idle longer than the idle timeout are closed
+
+The handler is HTTPServer.handle_control_request(); this module is transport
+only. Streaming endpoints (/stream, /tower/events WebSocket/SSE, long-poll)
+stay on the main listener.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import queue
+import selectors
+import socket
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONTROL_WORKERS = 2
+
+# Limits for one request
+MAX_HEADER_BYTES = 16 * 1024
+MAX_BODY_BYTES = 1024 * 1024
+
+# Idle keep-alive connections are closed after this long (matches HTTPServer)
+DEFAULT_IDLE_TIMEOUT_SEC = 35.0
+
+# Handling-time samples kept for the percentile window
+LATENCY_WINDOW = 4096
+
+REASONS = {
+    200: "OK", 204: "No Content", 400: "Bad Request", 404: "Not Found",
+    405: "Method Not Allowed", 413: "Payload Too Large", 500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+
+class ControlRequest:
+    """One parsed request; header names are lower-case."""
+    __slots__ = ("method", "path", "version", "headers", "body")
+
+    def __init__(self, method: str, path: str, version: str, headers: Dict[str, str], body: bytes):
+        self.method = method
+        self.path = path
+        self.version = version
+        self.headers = headers
+        self.body = body
+
+    @property
+    def keep_alive(self) -> bool:
+        connection = self.headers.get("connection", "").lower()
+        if self.version == "HTTP/1.0":
+            return connection == "keep-alive"
+        return connection != "close"
+
+
+class RequestParseError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def parse_request(buf: bytearray) -> Optional[Tuple[ControlRequest, int]]:
+    """
+    Parse one request from the front of buf.
+
+    Returns:
+        (request, bytes consumed), or None if buf does not hold a complete request yet
+
+    Raises:
+        RequestParseError: malformed or oversized request (the connection must close)
+    """
+    header_end = buf.find(b"\r\n\r\n")
+    if header_end < 0:
+        if len(buf) > MAX_HEADER_BYTES:
+            raise RequestParseError(413, "Headers too large")
+        return None
+    lines = bytes(buf[:header_end]).decode("latin-1").split("\r\n")
+    parts = lines[0].split()
+    if len(parts) != 3 or not parts[2].startswith("HTTP/"):
+        raise RequestParseError(400, "Malformed request line")
+    headers: Dict[str, str] = {}
+    for line in lines[1:]:
+        name, sep, value = line.partition(":")
+        if not sep:
+            raise RequestParseError(400, "Malformed header")
+        headers[name.strip().lower()] = value.strip()
+    if "transfer-encoding" in headers:
+        raise RequestParseError(400, "Transfer-Encoding not supported; send Content-Length")
+    try:
+        length = int(headers.get("content-length", "0"))
+    except ValueError:
+        raise RequestParseError(400, "Invalid Content-Length")
+    if length < 0:
+        raise RequestParseError(400, "Invalid Content-Length")
+    if length > MAX_BODY_BYTES:
+        raise RequestParseError(413, "Body too large")
+    body_start = header_end + 4
+    if len(buf) < body_start + length:
+        return None
+    body = bytes(buf[body_start:body_start + length])
+    return ControlRequest(parts[0], parts[1], parts[2], headers, body), body_start + length
+
+
+def build_response(status: int, body: Any, keep_alive: bool) -> bytes:
+    """Serialize a response; dict/list bodies are sent as JSON."""
+    if body is None:
+        payload = b""
+    elif isinstance(body, (bytes, bytearray)):
+        payload = bytes(body)
+    else:
+        payload = json.dumps(body).encode("utf-8")
+    head = f"HTTP/1.1 {status} {REASONS.get(status, 'Unknown')}\r\n"
+    if payload:
+        head += "Content-Type: application/json\r\n"
+    head += f"Content-Length: {len(payload)}\r\nConnection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    return head.encode("ascii") + payload
+
+
+class _Connection:
+    __slots__ = ("sock", "fd", "inbuf", "outbuf", "busy", "closing", "last_activity")
+
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.fd = sock.fileno()
+        self.inbuf = bytearray()
+        self.outbuf = bytearray()
+        self.busy = False  # a request is with the workers
+        self.closing = False  # close once outbuf is written
+        self.last_activity = time.monotonic()
+
+
+Handler = Callable[[ControlRequest], Tuple[int, Any]]
+
+
+class ControlPlaneServer:
+    """
+    Keep-alive, pipelining HTTP/1.1 listener served by a fixed worker pool.
+
+    Usage:
+        control = ControlPlaneServer(http_server.handle_control_request, "127.0.0.1", 8006)
+        control.start()
+        control.stop()
+    """
+
+    def __init__(
+        self,
+        handler: Handler,
+        host: str,
+        port: int,
+        workers: int = DEFAULT_CONTROL_WORKERS,
+        idle_timeout_sec: float = DEFAULT_IDLE_TIMEOUT_SEC,
+    ):
+        """
+        Args:
+            handler: Called on a worker thread with a ControlRequest; returns
+                (status code, body) where body is a dict/list (JSON), bytes or None
+            host: Address to bind
+            port: Port to bind (0 picks a free port; see bound_port)
+            workers: Worker threads running the handler
+            idle_timeout_sec: Keep-alive connections idle this long are closed
+        """
+        self.handler = handler
+        self.host = host
+        self.port = port
+        self.workers = max(1, int(workers))
+        self.idle_timeout_sec = idle_timeout_sec
+        self.bound_port: Optional[int] = None
+
+        self._sock: Optional[socket.socket] = None
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._connections: Dict[int, _Connection] = {}
+        self._work: "queue.Queue[Optional[Tuple[_Connection, ControlRequest]]]" = queue.Queue()
+        self._done_lock = threading.Lock()
+        self._done: List[Tuple[_Connection, bytes, bool]] = []
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        self._running = False
+        self._threads: List[threading.Thread] = []
+        self._latency_ms: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._next_idle_check = 0.0
+
+        self.connections_accepted = 0
+        self.requests_served = 0
+        self.parse_errors = 0
+
+    def start(self) -> None:
+        """Bind the listener and start the I/O and worker threads."""
+        if self._running:
+            return
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((self.host, self.port))
+        sock.listen(128)
+        sock.setblocking(False)
+        self._sock = sock
+        self.bound_port = sock.getsockname()[1]
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(sock, selectors.EVENT_READ)
+        self._selector.register(self._wake_r, selectors.EVENT_READ)
+        self._running = True
+        self._threads = [threading.Thread(target=self._run_io, name="tower-control-io", daemon=True)]
+        self._threads += [
+            threading.Thread(target=self._run_worker, name=f"tower-control-worker-{i}", daemon=True)
+            for i in range(self.workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+        logger.info(f"Control-plane listener on {self.host}:{self.bound_port} ({self.workers} workers)")
+
+    def stop(self) -> None:
+        """Stop the threads and close every connection. Idempotent."""
+        if not self._running:
+            return
+        self._running = False
+        for _ in range(self.workers):
+            self._work.put(None)
+        self._wake()
+        for thread in self._threads:
+            if thread is not threading.current_thread():
+                thread.join(timeout=1.0)
+        self._threads = []
+
+    def stats(self) -> Dict[str, Any]:
+        samples = sorted(self._latency_ms)
+
+        def pct(p: float) -> Optional[float]:
+            if not samples:
+                return None
+            return round(samples[min(len(samples) - 1, int(p * len(samples)))], 3)
+
+        return {
+            "connections": len(self._connections),
+            "connections_accepted": self.connections_accepted,
+            "requests_served": self.requests_served,
+            "requests_per_connection": round(self.requests_served / self.connections_accepted, 1)
+            if self.connections_accepted else 0.0,
+            "parse_errors": self.parse_errors,
+            "latency_ms": {"p50": pct(0.50), "p99": pct(0.99)},
+        }
+
+    def _wake(self) -> None:
+        try:
+            self._wake_w.send(b"\0")
+        except (BlockingIOError, OSError):
+            pass
+
+    def _run_worker(self) -> None:
+        while True:
+            item = self._work.get()
+            if item is None:
+                return
+            conn, request = item
+            started = time.monotonic()
+            keep_alive = request.keep_alive
+            try:
+                status, body = self.handler(request)
+            except Exception as e:
+                logger.warning(f"Control-plane handler error for {request.method} {request.path}: {e}")
+                status, body = 500, {"error": "Internal server error"}
+            response = build_response(status, body, keep_alive)
+            self._latency_ms.append((time.monotonic() - started) * 1000.0)
+            with self._done_lock:
+                self._done.append((conn, response, not keep_alive))
+            self._wake()
+
+    def _run_io(self) -> None:
+        selector = self._selector
+        try:
+            while self._running:
+                for key, events in selector.select(timeout=1.0):
+                    if key.fileobj is self._sock:
+                        self._accept()
+                    elif key.fileobj is self._wake_r:
+                        try:
+                            while self._wake_r.recv(4096):
+                                pass
+                        except (BlockingIOError, OSError):
+                            pass
+                    else:
+                        conn = key.data
+                        if events & selectors.EVENT_READ:
+                            self._read(conn)
+                        if events & selectors.EVENT_WRITE and conn.fd in self._connections:
+                            self._write(conn)
+                self._complete()
+                self._expire_idle()
+        except Exception as e:
+            logger.warning(f"Control-plane I/O loop error: {e}")
+        finally:
+            for conn in list(self._connections.values()):
+                self._close(conn)
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+            selector.close()
+
+    def _accept(self) -> None:
+        while True:
+            try:
+                sock, _ = self._sock.accept()
+            except (BlockingIOError, OSError):
+                return
+            sock.setblocking(False)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            conn = _Connection(sock)
+            self._connections[conn.fd] = conn
+            self._selector.register(sock, selectors.EVENT_READ, conn)
+            self.connections_accepted += 1
+
+    def _read(self, conn: _Connection) -> None:
+        try:
+            data = conn.sock.recv(65536)
+        except BlockingIOError:
+            return
+        except OSError:
+            self._close(conn)
+            return
+        if not data:
+            self._close(conn)
+            return
+        conn.last_activity = time.monotonic()
+        conn.inbuf += data
+        self._dispatch(conn)
+
+    def _dispatch(self, conn: _Connection) -> None:
+        """Hand the next complete request to the workers (one at a time per connection)."""
+        if conn.busy or conn.closing:
+            return
+        try:
+            parsed = parse_request(conn.inbuf)
+        except RequestParseError as e:
+            self.parse_errors += 1
+            conn.outbuf += build_response(e.status, {"error": str(e)}, keep_alive=False)
+            conn.closing = True
+            self._write(conn)
+            return
+        if parsed is None:
+            return
+        request, consumed = parsed
+        del conn.inbuf[:consumed]
+        conn.busy = True
+        self._work.put((conn, request))
+
+    def _complete(self) -> None:
+        with self._done_lock:
+            done, self._done = self._done, []
+        for conn, response, close_after in done:
+            if self._connections.get(conn.fd) is not conn:
+                continue  # closed while the request was with a worker
+            self.requests_served += 1
+            conn.busy = False
+            conn.outbuf += response
+            conn.closing = conn.closing or close_after
+            conn.last_activity = time.monotonic()
+            self._write(conn)
+            if self._connections.get(conn.fd) is conn:
+                self._dispatch(conn)  # next pipelined request, if already buffered
+
+    def _write(self, conn: _Connection) -> None:
+        while conn.outbuf:
+            try:
+                written = conn.sock.send(conn.outbuf)
+            except BlockingIOError:
+                break
+            except OSError:
+                self._close(conn)
+                return
+            del conn.outbuf[:written]
+        if not conn.outbuf and conn.closing:
+            self._close(conn)
+            return
+        events = selectors.EVENT_READ | (selectors.EVENT_WRITE if conn.outbuf else 0)
+        try:
+            self._selector.modify(conn.sock, events, conn)
+        except (KeyError, ValueError, OSError):
+            pass
+
+    def _expire_idle(self) -> None:
+        now = time.monotonic()
+        if now < self._next_idle_check:
+            return
+        self._next_idle_check = now + 1.0
+        cutoff = now - self.idle_timeout_sec
+        for conn in list(self._connections.values()):
+            if not conn.busy and not conn.outbuf and conn.last_activity < cutoff:
+                self._close(conn)
+
+    def _close(self, conn: _Connection) -> None:
+        if self._connections.pop(conn.fd, None) is None:
+            return
+        try:
+            self._selector.unregister(conn.sock)
+        except (KeyError, ValueError, OSError):
+            pass
+        try:
+            conn.sock.close()
+        except OSError:
+            pass
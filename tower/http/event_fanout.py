@@ -0,0 +1,470 @@
+"""
+Event fan-out stage for /tower/events (WebSocket) and /tower/events/sse.
+
+Per NEW_TOWER_RUNTIME_CONTRACT T-EXPOSE1, T-WS4, T-WS6, T-WS7:
+- publish() only hands the already-encoded frames to the fan-out thread, so
+  event ingestion never waits on WebSocket clients
+- Frames are encoded once per event (by the caller) and joined once per
+  (encoding, filter) group; every client in the group shares that payload
+- Clients are WebSocket ("ws") or Server-Sent Events ("sse") subscribers;
+  both go through the same queues and writer. Idle SSE clients get a
+  heartbeat comment every heartbeat interval to keep proxies from timing out
+- Each client has a bounded outbound queue; one selector loop writes to
+  whichever sockets are writable, so a stalled client delays nobody else
+- A client whose pending data makes no progress for the stall timeout, or
+  whose queue overflows, is dropped as a slow consumer (T-WS4)
+- A client may join with a replay payload queued ahead of the live tail; it
+  then only receives batches published after it joined, so a replay taken
+  atomically with add_client() has neither gaps nor duplicates
+
+Delivery latency (publish to fully written to a client socket) is exported
+as percentiles through stats(). An unexpected error in one pass of the loop
+is logged (loop_errors) and the loop carries on, so one failure never stops
+delivery to every client.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import selectors
+import socket
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+
+from tower.http.websocket import create_close_frame
+
+logger = logging.getLogger(__name__)
+
+# Outbound bytes a client may have queued before it is dropped as slow
+TOWER_WS_MAX_QUEUE_BYTES = 256 * 1024
+
+# Latency samples kept for the percentile window
+LATENCY_WINDOW = 2048
+
+# Idle time after which an SSE client is sent a heartbeat comment
+TOWER_SSE_HEARTBEAT_SEC = 15.0
+
+SSE_HEARTBEAT = b":\n\n"
+
+# Pause after an unexpected fan-out loop error before the next pass
+LOOP_ERROR_BACKOFF_SEC = 0.05
+
+
+class _Subscriber:
+    __slots__ = ("client_id", "sock", "fd", "event_type_filter", "queue", "queued_bytes",
+                 "offset", "stalled_since", "last_activity_time", "joined_after", "queue_limit", "encoding",
+                 "close_written")
+
+    def __init__(self, client_id: str, sock: socket.socket, event_type_filter: Optional[str],
+                 joined_after: int, queue_limit: int, encoding: str):
+        self.client_id = client_id
+        self.encoding = encoding  # "ws" or "sse"
+        self.sock = sock
+        self.fd = sock.fileno()
+        self.event_type_filter = event_type_filter
+        self.queue: Deque[Tuple[bytes, Optional[float]]] = deque()  # (payload, published_at or None for control)
+        self.queued_bytes = 0
+        self.offset = 0  # bytes of queue[0] already written
+        self.stalled_since: Optional[float] = None
+        self.last_activity_time = time.time()
+        self.joined_after = joined_after  # last publish() batch number before this client joined
+        self.queue_limit = queue_limit
+        # Set once close_client()'s close frame is queued: no more events; signalled once written
+        self.close_written: Optional[threading.Event] = None
+
+
+class EventFanout:
+    """
+    Single-threaded writer for event stream clients (WebSocket and SSE).
+
+    Usage:
+        fanout = EventFanout()
+        fanout.start()
+        fanout.add_client(client_id, sock, event_type_filter=None)
+        fanout.add_client(sse_id, sse_sock, encoding="sse")
+        fanout.publish([("song_playing", ws_frame, sse_message)])
+        fanout.stop()
+
+    Client sockets must have a timeout set (or be non-blocking): their file
+    descriptor is then non-blocking and writes never wait, while the
+    connection's handler thread keeps reading with its own timeout.
+    """
+
+    def __init__(
+        self,
+        stall_timeout_sec: float = 0.25,
+        max_queue_bytes: int = TOWER_WS_MAX_QUEUE_BYTES,
+        heartbeat_sec: float = TOWER_SSE_HEARTBEAT_SEC,
+    ):
+        """
+        Args:
+            stall_timeout_sec: Longest time pending data may make no progress (T-WS4)
+            max_queue_bytes: Queued bytes per client beyond which it is dropped
+            heartbeat_sec: Idle time after which SSE clients get a heartbeat comment
+        """
+        self.stall_timeout_sec = stall_timeout_sec
+        self.max_queue_bytes = max_queue_bytes
+        self.heartbeat_sec = heartbeat_sec
+        self._next_heartbeat = time.monotonic() + heartbeat_sec
+        self._lock = threading.Lock()
+        self._clients: Dict[str, _Subscriber] = {}
+        self._inbox: List[Tuple[List[Tuple[Optional[str], bytes]], float, int]] = []
+        self._batches_published = 0
+        self._control: List[Tuple[str, bytes, Optional[threading.Event]]] = []
+        self._removed: List[_Subscriber] = []
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self._latency_ms: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+        self.events_published = 0
+        self.payloads_delivered = 0
+        self.slow_consumers_dropped = 0
+        self.heartbeats_sent = 0
+        self.loop_errors = 0
+
+    def start(self) -> None:
+        """Start the fan-out thread."""
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._run, name="tower-ws-fanout", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the fan-out thread and close every client. Idempotent."""
+        with self._lock:
+            if not self._running:
+                return
+            self._running = False
+        self._wake()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+        self._thread = None
+        self.close_all()
+
+    def add_client(
+        self,
+        client_id: str,
+        sock: socket.socket,
+        event_type_filter: Optional[str] = None,
+        initial_payload: bytes = b"",
+        encoding: str = "ws",
+    ) -> None:
+        """
+        Register an upgraded WebSocket or SSE client (T-WS6: safe from any thread).
+
+        Args:
+            initial_payload: Frames (e.g. a history replay) written before any
+                event published after this call. The client's queue bound is
+                raised by its size so a replay alone never drops the client.
+            encoding: "ws" for WebSocket frames, "sse" for event-stream messages
+        """
+        with self._lock:
+            sub = _Subscriber(client_id, sock, event_type_filter, self._batches_published,
+                              self.max_queue_bytes + len(initial_payload), encoding)
+            if initial_payload:
+                sub.queue.append((initial_payload, None))
+                sub.queued_bytes = len(initial_payload)
+            self._clients[client_id] = sub
+        # Flush a replay now, and let an SSE client's heartbeat schedule the next wakeup
+        self._wake()
+
+    def remove_client(self, client_id: str) -> bool:
+        """Unregister a client without closing its socket. True if it was registered."""
+        with self._lock:
+            sub = self._clients.pop(client_id, None)
+            if sub is not None:
+                self._removed.append(sub)
+        if sub is not None:
+            if sub.close_written is not None:
+                sub.close_written.set()  # gone before the close frame went out
+            self._wake()
+        return sub is not None
+
+    def has_client(self, client_id: str) -> bool:
+        return client_id in self._clients
+
+    def client_count(self) -> int:
+        return len(self._clients)
+
+    def touch(self, client_id: str) -> None:
+        """Record activity received from a client (T-WS3)."""
+        sub = self._clients.get(client_id)
+        if sub is not None:
+            sub.last_activity_time = time.time()
+
+    def publish(self, frames: Iterable[Tuple[bytes, ...]]) -> None:
+        """
+        Queue encoded event frames for every client whose filter matches.
+
+        Args:
+            frames: (event_type, WebSocket frame[, SSE message]) in delivery
+                order; events without an SSE message are not sent to SSE clients
+        """
+        frames = list(frames)
+        if not frames:
+            return
+        with self._lock:
+            self._batches_published += 1
+            self._inbox.append((frames, time.monotonic(), self._batches_published))
+            self.events_published += len(frames)
+        self._wake()
+
+    def send_control(self, client_id: str, frame: bytes) -> None:
+        """Queue a control frame (e.g. pong) behind the client's pending data."""
+        with self._lock:
+            self._control.append((client_id, frame, None))
+        self._wake()
+
+    def close_client(self, client_id: str, timeout: float = 1.0) -> None:
+        """
+        Answer a WebSocket client's close frame and unregister it.
+
+        Event delivery to the client stops; the close frame is queued behind
+        its pending data and written by the fan-out thread, so it never
+        interleaves with a partially written frame. Waits up to timeout for
+        the write; the socket is left open for the caller to close.
+        """
+        written = threading.Event()
+        with self._lock:
+            if client_id not in self._clients:
+                return
+            self._control.append((client_id, create_close_frame(), written))
+        self._wake()
+        written.wait(timeout)
+        self.remove_client(client_id)
+
+    def close_all(self) -> None:
+        """Close every client socket (shutdown)."""
+        with self._lock:
+            subs = list(self._clients.values())
+            self._clients.clear()
+        for sub in subs:
+            self._close(sub.sock)
+
+    def stats(self) -> dict:
+        samples = sorted(self._latency_ms)
+
+        def pct(p: float) -> Optional[float]:
+            if not samples:
+                return None
+            return round(samples[min(len(samples) - 1, int(p * len(samples)))], 3)
+
+        with self._lock:
+            clients = list(self._clients.values())
+        return {
+            "clients": len(clients),
+            "queued_bytes": sum(sub.queued_bytes for sub in clients),
+            "events_published": self.events_published,
+            "payloads_delivered": self.payloads_delivered,
+            "slow_consumers_dropped": self.slow_consumers_dropped,
+            "sse_clients": sum(1 for sub in clients if sub.encoding == "sse"),
+            "heartbeats_sent": self.heartbeats_sent,
+            "loop_errors": self.loop_errors,
+            "latency_ms": {"p50": pct(0.50), "p95": pct(0.95), "p99": pct(0.99),
+                           "max": round(samples[-1], 3) if samples else None},
+        }
+
+    def _wake(self) -> None:
+        try:
+            self._wake_w.send(b"\0")
+        except (BlockingIOError, OSError):
+            pass  # already signalled, or shut down
+
+    def _run(self) -> None:
+        selector = self._new_selector()
+        registered: Dict[int, _Subscriber] = {}
+        while self._running:
+            try:
+                self._run_once(selector, registered)
+            except Exception as e:
+                # The only writer for every client: log, recover and keep going
+                self.loop_errors += 1
+                logger.error(f"WebSocket fan-out loop error (continuing): {e}", exc_info=True)
+                # Start from a fresh selector; a bad fd may still be registered.
+                # Clients with pending data are re-registered on the next pass.
+                selector.close()
+                selector = self._new_selector()
+                registered.clear()
+                time.sleep(LOOP_ERROR_BACKOFF_SEC)  # no hot loop if the error repeats
+                self._wake()  # batches the failed pass left behind go out now
+        selector.close()
+
+    def _new_selector(self) -> selectors.BaseSelector:
+        selector = selectors.DefaultSelector()
+        selector.register(self._wake_r, selectors.EVENT_READ)
+        return selector
+
+    def _run_once(self, selector: selectors.BaseSelector, registered: Dict[int, _Subscriber]) -> None:
+        """One pass: wait, fan out new batches, heartbeat, flush and (un)register writers."""
+        # Only clients with pending data wait for writability; SSE clients
+        # need a wakeup by the next heartbeat
+        timeout = self.stall_timeout_sec / 4 if registered else None
+        with self._lock:
+            has_sse = any(sub.encoding == "sse" for sub in self._clients.values())
+        if has_sse:
+            until_heartbeat = max(0.0, self._next_heartbeat - time.monotonic())
+            timeout = until_heartbeat if timeout is None else min(timeout, until_heartbeat)
+        for key, _ in selector.select(timeout):
+            if key.fileobj is self._wake_r:
+                try:
+                    while self._wake_r.recv(4096):
+                        pass
+                except (BlockingIOError, OSError):
+                    pass
+        self._fan_out()
+        now = time.monotonic()
+        if now >= self._next_heartbeat:
+            self._heartbeat(now)
+        with self._lock:
+            removed, self._removed = self._removed, []
+            clients = list(self._clients.values())
+        for sub in removed:
+            if registered.pop(sub.fd, None) is sub:
+                self._unregister(selector, sub)
+        for sub in clients:
+            if sub.queue:
+                self._flush(sub, now)
+            pending = bool(sub.queue) and self._clients.get(sub.client_id) is sub
+            if pending and sub.fd not in registered:
+                try:
+                    selector.register(sub.fd, selectors.EVENT_WRITE)
+                    registered[sub.fd] = sub
+                except (ValueError, KeyError, OSError):
+                    pass
+            elif not pending and registered.get(sub.fd) is sub:
+                del registered[sub.fd]
+                self._unregister(selector, sub)
+        for fd, sub in list(registered.items()):
+            if self._clients.get(sub.client_id) is not sub:
+                del registered[fd]
+                self._unregister(selector, sub)
+
+    def _fan_out(self) -> None:
+        with self._lock:
+            inbox, self._inbox = self._inbox, []
+            control, self._control = self._control, []
+            clients = list(self._clients.values())
+        for frames, published_at, batch in inbox:
+            # One joined payload per distinct (encoding, filter), shared by that group
+            payloads: Dict[Tuple[str, Optional[str]], bytes] = {}
+            for sub in clients:
+                if batch <= sub.joined_after or sub.close_written is not None:
+                    continue  # published before the client joined (covered by its replay), or closing
+                key = (sub.encoding, sub.event_type_filter)
+                if key not in payloads:
+                    index = 2 if sub.encoding == "sse" else 1
+                    wanted = sub.event_type_filter
+                    payloads[key] = b"".join(
+                        frame[index] for frame in frames
+                        if len(frame) > index and (not wanted or frame[0] == wanted)
+                    )
+                payload = payloads[key]
+                if payload:
+                    self._enqueue(sub, payload, published_at)
+        for client_id, frame, written in control:
+            sub = self._clients.get(client_id)
+            if sub is None or sub.close_written is not None:
+                continue  # nothing follows a close frame
+            if written is not None:
+                sub.close_written = written
+            self._enqueue(sub, frame, None)
+
+    def _heartbeat(self, now: float) -> None:
+        """Queue a heartbeat comment for SSE clients with nothing written recently."""
+        self._next_heartbeat = now + self.heartbeat_sec
+        idle_before = time.time() - self.heartbeat_sec
+        with self._lock:
+            clients = list(self._clients.values())
+        for sub in clients:
+            if sub.encoding == "sse" and not sub.queue and sub.last_activity_time <= idle_before:
+                self._enqueue(sub, SSE_HEARTBEAT, None)
+                self.heartbeats_sent += 1
+
+    def _enqueue(self, sub: _Subscriber, payload: bytes, published_at: Optional[float]) -> None:
+        if sub.queued_bytes + len(payload) > sub.queue_limit:
+            # Sends have not kept up (every write since queueing failed or stalled)
+            self._drop_slow(sub, "outbound queue full")
+            return
+        if not sub.queue:
+            sub.stalled_since = None
+        sub.queue.append((payload, published_at))
+        sub.queued_bytes += len(payload)
+
+    def _flush(self, sub: _Subscriber, now: float) -> None:
+        """Write as much of sub's queue as the socket accepts without blocking."""
+        if self._clients.get(sub.client_id) is not sub:
+            return  # removed since the snapshot; its fd may already be closed
+        progressed = False
+        while sub.queue:
+            payload, published_at = sub.queue[0]
+            try:
+                # The fd is non-blocking while the socket has a timeout; socket.send()
+                # would first wait for writability for up to that timeout
+                written = os.write(sub.fd, memoryview(payload)[sub.offset:])
+            except BlockingIOError:
+                break
+            except OSError:
+                # Connection broken; the handler thread sees it on its next read
+                self.remove_client(sub.client_id)
+                return
+            progressed = progressed or written > 0
+            sub.offset += written
+            sub.queued_bytes -= written
+            if sub.offset < len(payload):
+                break
+            sub.queue.popleft()
+            sub.offset = 0
+            sub.last_activity_time = time.time()
+            if published_at is not None:
+                self.payloads_delivered += 1
+                self._latency_ms.append((time.monotonic() - published_at) * 1000.0)
+        if not sub.queue:
+            sub.queue_limit = self.max_queue_bytes  # replay allowance used up
+            if sub.close_written is not None:
+                sub.close_written.set()  # the close frame was the last thing queued
+        if not sub.queue or progressed:
+            sub.stalled_since = None if not sub.queue else now
+        elif sub.stalled_since is None:
+            sub.stalled_since = now
+        elif now - sub.stalled_since >= self.stall_timeout_sec:
+            self._drop_slow(sub, f"send stalled {self.stall_timeout_sec * 1000:.0f}ms")
+
+    def _drop_slow(self, sub: _Subscriber, reason: str) -> None:
+        """Per T-WS4: disconnect a slow consumer without affecting other clients."""
+        if not self.remove_client(sub.client_id):
+            return
+        self.slow_consumers_dropped += 1
+        logger.debug(f"WebSocket slow consumer {sub.client_id} dropped: {reason}")
+        try:
+            # WebSocket close frame only if it would not split a partially written
+            # frame (best effort); SSE has no close message, the shutdown ends the stream
+            if sub.encoding == "ws" and sub.offset == 0:
+                os.write(sub.fd, create_close_frame())
+        except OSError:
+            pass
+        try:
+            sub.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _unregister(selector: selectors.BaseSelector, sub: _Subscriber) -> None:
+        try:
+            selector.unregister(sub.fd)
+        except (KeyError, ValueError, OSError):
+            pass
+
+    @staticmethod
+    def _close(sock: socket.socket) -> None:
+        try:
+            sock.close()
+        except Exception:
+            pass
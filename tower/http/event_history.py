@@ -0,0 +1,166 @@
+"""
+Bounded, indexed history of broadcast Station events for /tower/events replay.
+
+Per NEW_TOWER_RUNTIME_CONTRACT T-EVENTS2 (MAY: bounded replay history), T-EXPOSE7:
+- Every broadcast event gets a monotonically increasing sequence number
+- The newest `capacity` events are kept in memory (FIFO eviction); 0 keeps none
+- Each entry keeps its already-encoded WebSocket frame and SSE message, so
+  replay costs no re-serialization
+- since(seq) is an index computation: sequence numbers are contiguous
+- Type queries use a per-type list of sequence numbers; time-range queries
+  bisect the (non-decreasing) tower_received_at timestamps
+
+Live delivery never waits on the history: appending is O(1) amortized and
+happens on the broadcast path before the frames are handed to the fan-out.
+"""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, List, NamedTuple, Optional
+
+DEFAULT_EVENT_HISTORY_SIZE = 1000
+
+
+class HistoryEntry(NamedTuple):
+    seq: int
+    tower_received_at: float
+    event_type: str
+    event: Dict[str, Any]  # as delivered to WebSocket clients (includes seq)
+    frame: bytes  # encoded WebSocket text frame
+    sse_message: bytes = b""  # the same event as a text/event-stream message
+
+
+class EventHistory:
+    """
+    Ring of recent events addressable by sequence number, type and time.
+
+    Usage:
+        history = EventHistory(capacity=1000)
+        seq = history.append(event_type, received_at, event_dict, frame)
+        history.since(last_seen_seq, event_type="song_playing")
+        history.between(start_ts, end_ts)
+    """
+
+    def __init__(self, capacity: int = DEFAULT_EVENT_HISTORY_SIZE):
+        """
+        Args:
+            capacity: Most events kept; 0 disables storage (sequence numbers are still assigned)
+        """
+        self.capacity = max(0, int(capacity))
+        self._lock = threading.Lock()
+        self._next_seq = 1
+        # Parallel lists; entries before _head have been evicted and are trimmed in bulk
+        self._entries: List[HistoryEntry] = []
+        self._times: List[float] = []
+        self._head = 0
+        # event_type -> sequence numbers (ascending), trimmed lazily like the lists above
+        self._by_type: Dict[str, List[int]] = {}
+        self._evicted = 0
+
+    def next_seq(self) -> int:
+        """Sequence number the next appended event will get."""
+        with self._lock:
+            return self._next_seq
+
+    def append(
+        self,
+        event_type: str,
+        tower_received_at: float,
+        event: Dict[str, Any],
+        frame: bytes,
+        sse_message: bytes = b"",
+    ) -> int:
+        """Store an event and return its sequence number."""
+        with self._lock:
+            seq = self._next_seq
+            self._next_seq += 1
+            if self.capacity == 0:
+                return seq
+            # Keep timestamps sorted for bisect even if the wall clock steps back
+            if self._times and tower_received_at < self._times[-1]:
+                tower_received_at = self._times[-1]
+            self._entries.append(HistoryEntry(seq, tower_received_at, event_type, event, frame, sse_message))
+            self._times.append(tower_received_at)
+            self._by_type.setdefault(event_type, []).append(seq)
+            if len(self._entries) - self._head > self.capacity:
+                self._head += 1
+                self._evicted += 1
+                if self._head >= self.capacity:
+                    self._compact()
+            return seq
+
+    def oldest_seq(self) -> Optional[int]:
+        with self._lock:
+            return self._entries[self._head].seq if len(self._entries) > self._head else None
+
+    def latest_seq(self) -> int:
+        """Sequence number of the newest event (0 before any event)."""
+        with self._lock:
+            return self._next_seq - 1
+
+    def since(self, seq: int, event_type: Optional[str] = None, limit: Optional[int] = None) -> List[HistoryEntry]:
+        """Retained events with a sequence number greater than seq, oldest first."""
+        with self._lock:
+            if len(self._entries) == self._head:
+                return []
+            first_seq = self._entries[self._head].seq
+            if event_type is None:
+                start = self._head + max(0, seq + 1 - first_seq)
+                end = len(self._entries) if limit is None else min(len(self._entries), start + limit)
+                return self._entries[start:end]
+            return self._select_type(event_type, max(seq + 1, first_seq), None, limit)
+
+    def between(
+        self,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+        event_type: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[HistoryEntry]:
+        """Retained events with start_time <= tower_received_at <= end_time, oldest first."""
+        with self._lock:
+            lo = self._head if start_time is None else max(self._head, bisect_left(self._times, start_time))
+            hi = len(self._times) if end_time is None else bisect_right(self._times, end_time)
+            if lo >= hi:
+                return []
+            if event_type is None:
+                return self._entries[lo:hi if limit is None else min(hi, lo + limit)]
+            return self._select_type(event_type, self._entries[lo].seq, self._entries[hi - 1].seq, limit)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            retained = len(self._entries) - self._head
+            return {
+                "capacity": self.capacity,
+                "retained": retained,
+                "oldest_seq": self._entries[self._head].seq if retained else None,
+                "latest_seq": self._next_seq - 1,
+                "evicted": self._evicted,
+            }
+
+    def _select_type(self, event_type: str, min_seq: int, max_seq: Optional[int], limit: Optional[int]) -> List[HistoryEntry]:
+        """Entries of one type with min_seq <= seq <= max_seq (lock held)."""
+        seqs = self._by_type.get(event_type, [])
+        lo = bisect_left(seqs, min_seq)
+        hi = len(seqs) if max_seq is None else bisect_right(seqs, max_seq)
+        if limit is not None:
+            hi = min(hi, lo + limit)
+        first_seq = self._entries[self._head].seq
+        return [self._entries[self._head + (s - first_seq)] for s in seqs[lo:hi]]
+
+    def _compact(self) -> None:
+        """Drop evicted entries in one slice so eviction stays O(1) amortized (lock held)."""
+        del self._entries[:self._head]
+        del self._times[:self._head]
+        self._head = 0
+        first_seq = self._entries[0].seq if self._entries else self._next_seq
+        for event_type in list(self._by_type):
+            seqs = self._by_type[event_type]
+            cut = bisect_left(seqs, first_seq)
+            if cut == len(seqs):
+                del self._by_type[event_type]
+            elif cut:
+                del seqs[:cut]
+
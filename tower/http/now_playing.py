@@ -0,0 +1,248 @@
+"""
+Pre-serialized now-playing document for GET /tower/now-playing.
+
+Per NEW_TOWER_RUNTIME_CONTRACT T-EXPOSE10 (MAY):
+- Built from song_playing / segment_playing events (station_shutdown marks
+  the station off air) and regenerated only when its content changes
+- Each version is serialized once, together with its complete HTTP 200 and
+  304 responses; serving a request is a lookup plus a send
+- Strong ETag: a per-process nonce plus the version number, so a restarted
+  Tower never matches an ETag issued by a previous one
+- Long-poll: park() hands the client socket to a waiter registry instead of
+  blocking the request thread. One waiter thread answers every held request:
+  200 as soon as update() publishes a new version, 304 when its wait elapses.
+  At most max_waiters requests are held; beyond that the caller answers 304
+  at once
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Event types that change what is on air
+NOW_PLAYING_EVENT_TYPES = {"song_playing", "segment_playing", "station_shutdown"}
+
+# Longest long-poll wait a client may ask for (seconds)
+NOW_PLAYING_MAX_WAIT_SEC = 60.0
+
+# Most long-poll requests held at once; further ones are answered 304 at once
+NOW_PLAYING_MAX_WAITERS = 4096
+
+
+class _Version:
+    __slots__ = ("version", "etag", "body", "responses")
+
+    def __init__(self, version: int, etag: str, body: bytes):
+        self.version = version
+        self.etag = etag
+        self.body = body
+        # (status, keep_alive) -> complete response bytes
+        self.responses: Dict[Tuple[int, bool], bytes] = {}
+        for keep_alive in (True, False):
+            connection = f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+            common = f'ETag: "{etag}"\r\nCache-Control: no-cache\r\n{connection}'
+            self.responses[(200, keep_alive)] = (
+                "HTTP/1.1 200 OK\r\n"
+                "Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"{common}\r\n"
+            ).encode("ascii") + body
+            self.responses[(304, keep_alive)] = (
+                f"HTTP/1.1 304 Not Modified\r\n{common}\r\n"
+            ).encode("ascii")
+
+
+class _Waiter:
+    __slots__ = ("sock", "keep_alive", "on_answered")
+
+    def __init__(self, sock: socket.socket, keep_alive: bool, on_answered: Optional[Callable[[socket.socket], None]]):
+        self.sock = sock
+        self.keep_alive = keep_alive
+        self.on_answered = on_answered
+
+
+class NowPlaying:
+    """
+    Current now-playing document with ETag and change notification.
+
+    Usage:
+        now_playing = NowPlaying()
+        now_playing.update(event_dict)          # from the broadcast path
+        current = now_playing.current()         # .etag, .responses[(200, keep_alive)]
+        if not now_playing.park(sock, etag, timeout=30.0, keep_alive=True, on_answered=resume):
+            ...                                 # not held: answer now
+        now_playing.close()                     # on shutdown
+    """
+
+    def __init__(self, max_waiters: int = NOW_PLAYING_MAX_WAITERS):
+        self._nonce = os.urandom(4).hex()
+        self._cond = threading.Condition()
+        self._state: Dict[str, Any] = {}
+        self._current = self._build(0)
+        self.max_waiters = max_waiters
+        # Held requests for the current version, as a heap of (deadline, n, waiter);
+        # update() moves them all to _ready in one swap
+        self._waiters: List[Tuple[float, int, _Waiter]] = []
+        self._ready: List[Tuple[float, int, _Waiter]] = []
+        self._waiter_ids = itertools.count()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self.updates = 0
+        self.unchanged = 0
+        self.long_polls = 0
+        self.long_polls_rejected = 0
+
+    def current(self) -> _Version:
+        return self._current
+
+    def update(self, event: Dict[str, Any]) -> bool:
+        """
+        Apply a delivered event (as sent to WebSocket clients).
+
+        Returns:
+            True if the document changed and a new version was published
+        """
+        event_type = event.get("event_type")
+        if event_type not in NOW_PLAYING_EVENT_TYPES:
+            return False
+        if event_type == "station_shutdown":
+            state = {"on_air": False, "event_type": None, "metadata": {}}
+        else:
+            state = {"on_air": True, "event_type": event_type, "metadata": event.get("metadata", {})}
+        with self._cond:
+            if state == self._state:
+                # Repeated announcement of what is already on air
+                self.unchanged += 1
+                return False
+            self._state = state
+            state = dict(state, seq=event.get("seq"), tower_received_at=event.get("tower_received_at"))
+            self._current = self._build(self._current.version + 1, state)
+            self.updates += 1
+            if self._waiters:
+                self._ready.extend(self._waiters)
+                self._waiters = []
+                self._cond.notify_all()
+        return True
+
+    def park(
+        self,
+        sock: socket.socket,
+        etag: str,
+        timeout: float,
+        keep_alive: bool,
+        on_answered: Optional[Callable[[socket.socket], None]] = None,
+    ) -> bool:
+        """
+        Hold a long-poll request without blocking the calling thread.
+
+        The waiter thread answers it with the 200 response once the document
+        moves past etag, or with 304 when timeout elapses. A keep-alive
+        connection is then handed to on_answered(sock) for its next request;
+        otherwise the socket is closed.
+
+        Returns:
+            False if nothing was parked (the document already moved past etag,
+            max_waiters requests are held, or the registry is closed); the
+            caller answers the request itself
+        """
+        timeout = max(0.0, min(timeout, NOW_PLAYING_MAX_WAIT_SEC))
+        with self._cond:
+            if self._closed or self._current.etag != etag:
+                return False
+            if len(self._waiters) + len(self._ready) >= self.max_waiters:
+                self.long_polls_rejected += 1
+                return False
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run_waiters, name="tower-now-playing-waiters", daemon=True
+                )
+                self._thread.start()
+            waiter = _Waiter(sock, keep_alive, on_answered)
+            heapq.heappush(self._waiters, (time.monotonic() + timeout, next(self._waiter_ids), waiter))
+            self.long_polls += 1
+            self._cond.notify_all()
+        return True
+
+    def close(self) -> None:
+        """Stop the waiter thread and close every held connection."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout=2.0)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "version": self._current.version,
+            "updates": self.updates,
+            "unchanged": self.unchanged,
+            "long_polls": self.long_polls,
+            "long_polls_waiting": len(self._waiters) + len(self._ready),
+            "long_polls_rejected": self.long_polls_rejected,
+        }
+
+    def _run_waiters(self) -> None:
+        """Answer held requests on change (200) or deadline (304)."""
+        while True:
+            with self._cond:
+                while not (self._closed or self._ready or (self._waiters and self._waiters[0][0] <= time.monotonic())):
+                    self._cond.wait(self._waiters[0][0] - time.monotonic() if self._waiters else None)
+                if self._closed:
+                    abandoned = self._ready + self._waiters
+                    self._ready, self._waiters = [], []
+                    break
+                current = self._current
+                answers = [(waiter, 200) for _, _, waiter in self._ready]
+                self._ready = []
+                now = time.monotonic()
+                while self._waiters and self._waiters[0][0] <= now:
+                    # Still-held waiters always have the current version's ETag
+                    answers.append((heapq.heappop(self._waiters)[2], 304))
+            for waiter, status in answers:
+                self._answer(waiter, current.responses[(status, waiter.keep_alive)])
+        for _, _, waiter in abandoned:
+            try:
+                waiter.sock.close()
+            except OSError:
+                pass
+
+    @staticmethod
+    def _answer(waiter: _Waiter, response: bytes) -> None:
+        # A held connection has sent nothing since its request, so the small
+        # response fits its send buffer; a non-blocking send never stalls the
+        # waiter thread, and a short write drops the connection
+        sock = waiter.sock
+        keep_alive = waiter.keep_alive and waiter.on_answered is not None
+        try:
+            sock.setblocking(False)
+            keep_alive = sock.send(response) == len(response) and keep_alive
+            sock.setblocking(True)
+        except OSError:
+            keep_alive = False
+        if keep_alive:
+            try:
+                waiter.on_answered(sock)
+                return
+            except Exception as e:
+                logger.warning(f"Now-playing long-poll resume failed: {e}")
+        try:
+            sock.close()
+        except OSError:
+            pass
+
+    def _build(self, version: int, state: Optional[Dict[str, Any]] = None) -> _Version:
+        document = {"version": version, "on_air": False, "event_type": None, "metadata": {}}
+        document.update(state or {})
+        body = json.dumps(document).encode("utf-8")
+        return _Version(version, f"{self._nonce}-{version}", body)
@@ -2,7 +2,6 @@
 
 import os
 import socket
-import select
 import threading
 import time
 import logging
@@ -10,15 +9,19 @@ import uuid
 import json
 from collections import deque
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
+from tower.audio.mp3_archive import MP3Archive
+from tower.http.admission import AdmissionController, retry_after_with_jitter
 from tower.http.event_broadcaster import EventBroadcaster
+from tower.http.event_fanout import EventFanout
+from tower.http.event_history import DEFAULT_EVENT_HISTORY_SIZE, EventHistory
+from tower.http.now_playing import NowPlaying
 from tower.http.websocket import (
     parse_upgrade_request,
     create_upgrade_response,
     encode_websocket_frame,
     decode_websocket_frame,
-    create_close_frame,
     WebSocketError
 )
 
@@ -64,6 +67,18 @@ TOWER_WS_SEND_STALL_TIMEOUT_MS = 250  # 250ms timeout for send stall detection
 # Maximum queue size per client (frames)
 MAX_CLIENT_QUEUE_SIZE = 10
 
+# Time-shift (/stream?start=) clients are written with blocking sendfile while
+# they replay the archive; a client that accepts nothing for this long is dropped
+TOWER_TIMESHIFT_SEND_TIMEOUT_SEC = 30.0
+TIMESHIFT_SENDFILE_CHUNK_BYTES = 256 * 1024
+
+# Idle time after which a keep-alive connection (batch event ingest) is closed.
+# Longer than Station's pooled-connection expiry, so the client side closes first.
+TOWER_KEEPALIVE_IDLE_TIMEOUT_SEC = 35.0
+
+# Maximum number of events accepted in one /tower/events/ingest/batch request
+TOWER_EVENTS_MAX_BATCH = 500
+
 # Maximum number of connected clients (defensive measure)
 # Default: 100, configurable via TOWER_MAX_CLIENTS env var
 def _get_max_clients() -> int:
@@ -72,6 +87,17 @@ def _get_max_clients() -> int:
 
 MAX_CLIENTS = _get_max_clients()
 
+# Most events returned by one /tower/events/history request
+TOWER_EVENT_HISTORY_MAX_LIMIT = 1000
+
+
+def _get_event_history_size() -> int:
+    """Events kept for replay (TOWER_EVENT_HISTORY_SIZE, 0 disables storage)."""
+    try:
+        return max(0, int(os.getenv("TOWER_EVENT_HISTORY_SIZE", str(DEFAULT_EVENT_HISTORY_SIZE))))
+    except ValueError:
+        return DEFAULT_EVENT_HISTORY_SIZE
+
 
 @dataclass
 class _ClientState:
@@ -79,6 +105,7 @@ class _ClientState:
     sock: socket.socket
     queue: deque  # Queue of frames to send
     last_send_monotonic: float  # Last successful send time (monotonic)
+    skip_until_seq: int = 0  # Archive seq of the last frame prefilled when joining from time-shift
 
 
 class _ConnectionManagerProxy:
@@ -133,8 +160,25 @@ class HTTPServer:
         self.event_buffer = EventBroadcaster()
         
         # Event streaming clients (for /tower/events WebSocket endpoint) per contract T-EXPOSE1
-        self._event_clients: dict[str, dict] = {}
-        self._event_clients_lock = threading.Lock()
+        # The fan-out stage owns the registry (T-WS6) and all event writes (T-WS4, T-WS7)
+        self._event_fanout = EventFanout(stall_timeout_sec=TOWER_WS_SEND_STALL_TIMEOUT_MS / 1000.0)
+        
+        # Bounded replay history (T-EVENTS2 MAY). Publishing (history append + fan-out)
+        # and a replaying client's join are serialized so replay and live tail meet exactly.
+        self._event_history = EventHistory(capacity=_get_event_history_size())
+        self._event_publish_lock = threading.Lock()
+        
+        # Pre-serialized now-playing document for /tower/now-playing (T-EXPOSE10)
+        self._now_playing = NowPlaying()
+        
+        # Optional /stream admission control (token bucket, overload halt); set by TowerService
+        self.admission: Optional[AdmissionController] = None
+        self._stream_rejections = 0
+        
+        # Optional disk archive: records broadcast frames and serves /stream?start=; set by TowerService
+        self.archive: Optional[MP3Archive] = None
+        self._timeshift_clients = 0  # clients currently replaying the archive
+        self._timeshift_sessions = 0
         
         # Backwards compatibility: connection_manager proxy for tests
         # Per NEW_TOWER_RUNTIME_CONTRACT, HTTPServer replaced HTTPConnectionManager
@@ -162,6 +206,7 @@ class HTTPServer:
 
     def _run(self):
         """Main server loop - accepts connections."""
+        self._event_fanout.start()
         self._server_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self._server_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         self._server_sock.bind((self.host, self.port))
@@ -176,88 +221,27 @@ class HTTPServer:
                 # Socket closed during shutdown
                 break
 
-    def _handle_client(self, client):
+    def _handle_client(self, client, resumed: bool = False):
         """
         Handle a single client connection.
         
         Per contract T1: Only /stream endpoint outputs MP3.
         Other endpoints return appropriate responses (JSON for /tower/buffer, 404 for others).
+        
+        Endpoints that answer keep-alive (batch event ingest) leave the connection
+        open; the next request on it is read and dispatched the same way.
+        resumed is set for a keep-alive connection handed back after a parked
+        now-playing long-poll was answered.
         """
         # Generate unique client ID per contract [H4]
         client_id = str(uuid.uuid4())
         try:
-            request = client.recv(4096)  # read HTTP GET
-            if not request:
-                client.close()
-                return
-
-            # Parse HTTP request to extract path
-            # Format: "GET /path HTTP/1.1\r\n..."
-            request_str = request.decode('utf-8', errors='ignore')
-            lines = request_str.split('\r\n')
-            if not lines:
-                client.close()
-                return
-            
-            # Parse request line: "GET /path HTTP/1.1"
-            request_line = lines[0]
-            parts = request_line.split()
-            if len(parts) < 2:
-                client.close()
-                return
-            
-            method = parts[0]
-            path = parts[1]
-            
-            # Per contract T1: Only /stream endpoint outputs MP3
-            if path == "/stream":
-                self._handle_stream_endpoint(client, client_id)
-            elif path == "/tower/buffer":
-                self._handle_buffer_endpoint(client)
-            elif path == "/tower/events/ingest":
-                self._handle_events_ingest_endpoint(client, method, request)
-            elif path == "/__test__/broadcast" and os.getenv("TOWER_TEST_MODE") == "1":
-                # Test-only endpoint for triggering event broadcasts
-                # Only available when TOWER_TEST_MODE=1
-                self._handle_test_broadcast_endpoint(client, method, request)
-            elif path.startswith("/tower/events"):
-                # Check if this is a WebSocket upgrade request
-                request_str = request.decode('utf-8', errors='ignore')
-                ws_info = parse_upgrade_request(request_str)
-                
-                if ws_info:
-                    # WebSocket upgrade request
-                    path_parts = ws_info['path'].split("?")
-                    base_path = path_parts[0]
-                    query_params = {}
-                    if len(path_parts) > 1:
-                        # Parse query string
-                        for param in path_parts[1].split("&"):
-                            if "=" in param:
-                                key, value = param.split("=", 1)
-                                query_params[key] = value
-                    
-                    if base_path == "/tower/events":
-                        self._handle_websocket_events(client, client_id, ws_info['sec-websocket-key'], query_params)
-                    else:
-                        self._handle_404(client, path)
-                else:
-                    # Not a WebSocket upgrade - return 400 (WebSocket required)
-                    response = (
-                        "HTTP/1.1 400 Bad Request\r\n"
-                        "Content-Type: text/plain\r\n"
-                        "Connection: close\r\n"
-                        "\r\n"
-                        "WebSocket upgrade required\r\n"
-                    )
-                    try:
-                        client.sendall(response.encode("ascii"))
-                    except Exception:
-                        pass
-                    client.close()
-            else:
-                # Return 404 for unknown endpoints
-                self._handle_404(client, path)
+            request = self._read_next_request(client) if resumed else client.recv(4096)  # read HTTP GET
+            while request:
+                if not self._dispatch_request(client, client_id, request):
+                    return
+                request = self._read_next_request(client)
+            client.close()
                 
         except Exception as e:
             logger.warning(f"Client error: {e}")
@@ -266,12 +250,146 @@ class HTTPServer:
             if client_id in self._connected_clients:
                 self._remove_client(client_id)
     
-    def _handle_stream_endpoint(self, client, client_id):
+    def _resume_client(self, client) -> None:
+        """Serve the next request on a keep-alive connection whose long-poll was answered."""
+        threading.Thread(target=self._handle_client, args=(client, True), daemon=True).start()
+    
+    def _read_next_request(self, client) -> Optional[bytes]:
+        """Wait for the next request on a keep-alive connection (None when idle or closed)."""
+        try:
+            client.settimeout(TOWER_KEEPALIVE_IDLE_TIMEOUT_SEC)
+            return client.recv(4096) or None
+        except (socket.timeout, OSError):
+            return None
+    
+    def _dispatch_request(self, client, client_id, request: bytes) -> bool:
+        """
+        Route one request to its endpoint handler.
+        
+        Returns True if the handler kept the connection open for another request.
+        """
+        # Parse HTTP request to extract path
+        # Format: "GET /path HTTP/1.1\r\n..."
+        request_str = request.decode('utf-8', errors='ignore')
+        lines = request_str.split('\r\n')
+        if not lines:
+            client.close()
+            return False
+        
+        # Parse request line: "GET /path HTTP/1.1"
+        request_line = lines[0]
+        parts = request_line.split()
+        if len(parts) < 2:
+            client.close()
+            return False
+        
+        method = parts[0]
+        path = parts[1]
+        
+        # Per contract T1: Only /stream endpoint outputs MP3
+        if path.split("?", 1)[0] == "/stream":
+            self._handle_stream_endpoint(client, client_id, path)
+        elif path == "/tower/buffer":
+            self._handle_buffer_endpoint(client)
+        elif path == "/tower/events/ingest":
+            self._handle_events_ingest_endpoint(client, method, request)
+        elif path == "/tower/events/ingest/batch":
+            return self._handle_events_batch_ingest_endpoint(client, method, request)
+        elif path.split("?", 1)[0] == "/tower/events/history":
+            self._handle_events_history_endpoint(client, method, path)
+        elif path.split("?", 1)[0] == "/tower/events/sse":
+            self._handle_sse_events(client, client_id, method, path, request)
+        elif path.split("?", 1)[0] == "/tower/now-playing":
+            return self._handle_now_playing_endpoint(client, method, path, request)
+        elif path == "/__test__/broadcast" and os.getenv("TOWER_TEST_MODE") == "1":
+            # Test-only endpoint for triggering event broadcasts
+            # Only available when TOWER_TEST_MODE=1
+            self._handle_test_broadcast_endpoint(client, method, request)
+        elif path.startswith("/tower/events"):
+            # Check if this is a WebSocket upgrade request
+            request_str = request.decode('utf-8', errors='ignore')
+            ws_info = parse_upgrade_request(request_str)
+            
+            if ws_info:
+                # WebSocket upgrade request
+                path_parts = ws_info['path'].split("?")
+                base_path = path_parts[0]
+                query_params = {}
+                if len(path_parts) > 1:
+                    # Parse query string
+                    for param in path_parts[1].split("&"):
+                        if "=" in param:
+                            key, value = param.split("=", 1)
+                            query_params[key] = value
+                
+                if base_path == "/tower/events":
+                    self._handle_websocket_events(client, client_id, ws_info['sec-websocket-key'], query_params)
+                else:
+                    self._handle_404(client, path)
+            else:
+                # Not a WebSocket upgrade - return 400 (WebSocket required)
+                response = (
+                    "HTTP/1.1 400 Bad Request\r\n"
+                    "Content-Type: text/plain\r\n"
+                    "Connection: close\r\n"
+                    "\r\n"
+                    "WebSocket upgrade required\r\n"
+                )
+                try:
+                    client.sendall(response.encode("ascii"))
+                except Exception:
+                    pass
+                client.close()
+        else:
+            # Return 404 for unknown endpoints
+            self._handle_404(client, path)
+        return False
+    
+    def _handle_stream_endpoint(self, client, client_id, path="/stream"):
         """
         Handle /stream endpoint - streams MP3 per contract T1.
         
         Per contract T1: Returns HTTP 200 and streams MP3 frames continuously.
+        
+        Admission (T-CLIENTS5) is decided before any header is sent: over
+        MAX_CLIENTS, or refused by the admission controller, the client gets
+        503 with a jittered Retry-After instead of a stream.
+        
+        With ?start=<epoch> (T-CLIENTS6) audio is served from the archive,
+        starting at that time, until the client has caught up with the live
+        stream, which it then joins.
         """
+        start = None
+        if "?" in path:
+            for param in path.split("?", 1)[1].split("&"):
+                key, _, value = param.partition("=")
+                if key == "start":
+                    try:
+                        start = float(value)
+                    except ValueError:
+                        start = float("nan")
+                    if start != start or start < 0:
+                        self._send_json_response(client, "400 Bad Request", {"error": "start must be a Unix timestamp"})
+                        return
+        if start is not None and self.archive is None:
+            self._send_json_response(client, "404 Not Found", {"error": "Time-shift archive is not enabled"})
+            return
+        
+        # Check maximum client count before admitting
+        with self._clients_lock:
+            at_capacity = len(self._connected_clients) + self._timeshift_clients >= MAX_CLIENTS
+        if at_capacity:
+            logger.warning(
+                f"Rejecting new client {client_id}: maximum client count ({MAX_CLIENTS}) reached"
+            )
+            self._reject_stream_client(client, retry_after_with_jitter())
+            return
+        if self.admission is not None:
+            retry_after = self.admission.admit()
+            if retry_after is not None:
+                self._reject_stream_client(client, retry_after)
+                return
+        
         # --- REQUIRED HTTP RESPONSE HEADER ---
         headers = (
             "HTTP/1.1 200 OK\r\n"
@@ -280,19 +398,18 @@ class HTTPServer:
             "Cache-Control: no-cache, no-store, must-revalidate\r\n"
             "\r\n"
         )
+        position = self.archive.locate(start) if start is not None else None
         client.sendall(headers.encode("ascii"))
-
-        # Check maximum client count before adding
-        with self._clients_lock:
-            if len(self._connected_clients) >= MAX_CLIENTS:
-                logger.warning(
-                    f"Rejecting new client {client_id}: maximum client count ({MAX_CLIENTS}) reached"
-                )
-                client.close()
-                return
         
-        # Add client to internal registry per contract T-CLIENTS3
-        self._add_client(client, client_id)
+        if position is None:
+            # Add client to internal registry per contract T-CLIENTS3
+            self._add_client(client, client_id)
+        elif not self._serve_archive(client, client_id, position):
+            try:
+                client.close()
+            except Exception:
+                pass
+            return
 
         # Keep connection alive - wait for client to disconnect
         # The main_loop will broadcast frames to all clients via HTTPServer.broadcast()
@@ -312,6 +429,127 @@ class HTTPServer:
                 # Client disconnected
                 break
     
+    def _serve_archive(self, client, client_id, position: Tuple[int, int]) -> bool:
+        """
+        Replay the archive from position (segment start, byte offset) to a time-shift client.
+        
+        Committed archive bytes go out with sendfile, at the pace the client
+        reads. Once the client has everything committed in the live segment it
+        joins the live fan-out (see _join_live_from_archive).
+        
+        Returns:
+            True if the client joined the live stream; False if it went away or
+            the server is stopping
+        """
+        segment_start, offset = position
+        client.settimeout(TOWER_TIMESHIFT_SEND_TIMEOUT_SEC)
+        with self._clients_lock:
+            self._timeshift_clients += 1
+            self._timeshift_sessions += 1
+        logger.debug(f"Time-shift client {client_id} replaying from segment {segment_start} offset {offset}")
+        try:
+            while self.running:
+                current_start, committed_size, committed_seq = self.archive.committed()
+                end = committed_size if segment_start == current_start else self.archive.segment_size(segment_start)
+                if end is not None and offset < end:
+                    try:
+                        offset = self._send_archive_range(client, segment_start, offset, end)
+                        continue
+                    except FileNotFoundError:
+                        end = None  # deleted by retention while being replayed
+                if segment_start != current_start:
+                    next_start = self.archive.next_segment(segment_start)
+                    if next_start is not None:
+                        segment_start, offset = next_start, 0
+                        continue
+                # Caught up with everything committed
+                if self._join_live_from_archive(client, client_id, committed_seq, force=False):
+                    return True
+                if not self.archive.wait_for_commit(committed_seq, timeout=2.0):
+                    # Writer stalled: join live now rather than leave the client silent
+                    return self._join_live_from_archive(client, client_id, committed_seq, force=True)
+            return False
+        except (OSError, ConnectionError) as e:
+            logger.debug(f"Time-shift client {client_id} disconnected: {e}")
+            return False
+        finally:
+            with self._clients_lock:
+                self._timeshift_clients -= 1
+    
+    def _send_archive_range(self, client, segment_start: int, offset: int, end: int) -> int:
+        """sendfile archive bytes [offset, end) of a segment to client; returns the new offset."""
+        with open(self.archive.segment_path(segment_start), "rb") as f:
+            while offset < end and self.running:
+                sent = client.sendfile(f, offset, min(TIMESHIFT_SENDFILE_CHUNK_BYTES, end - offset))
+                if not sent:
+                    raise ConnectionError("client stopped reading")
+                offset += sent
+        return offset
+    
+    def _join_live_from_archive(self, client, client_id, committed_seq: int, force: bool) -> bool:
+        """
+        Move a caught-up time-shift client onto the live fan-out without a gap.
+        
+        Frames broadcast after committed_seq but not yet on disk are taken from
+        the archive's in-memory tail and queued ahead of the live frames.
+        Broadcast numbers frames under the registry lock, so joining under it
+        sees an exact live edge: the client's queue ends at the last numbered
+        frame, and later frames reach it through broadcast as usual. Unless
+        force is set, the join waits (returns False) while the tail is longer
+        than half a client queue.
+        """
+        limit = MAX_CLIENT_QUEUE_SIZE // 2
+        client.setblocking(False)
+        with self._clients_lock:
+            pending = self.archive.frames_after(committed_seq)
+            if pending is None or len(pending) > limit:
+                if not force:
+                    client.settimeout(TOWER_TIMESHIFT_SEND_TIMEOUT_SEC)
+                    return False
+                pending = self.archive.frames_after(max(0, self.archive.last_seq - limit)) or []
+            self._connected_clients[client_id] = _ClientState(
+                sock=client,
+                queue=deque(pending, maxlen=MAX_CLIENT_QUEUE_SIZE),
+                last_send_monotonic=time.monotonic(),
+                skip_until_seq=self.archive.last_seq,
+            )
+        logger.debug(f"Time-shift client {client_id} joined the live stream ({len(pending)} frames from memory)")
+        return True
+    
+    def get_archive_stats(self) -> dict:
+        """Time-shift archive statistics (empty when no archive is configured)."""
+        if self.archive is None:
+            return {}
+        stats = self.archive.stats()
+        stats.update(timeshift_clients=self._timeshift_clients, timeshift_sessions=self._timeshift_sessions)
+        return stats
+    
+    def _reject_stream_client(self, client, retry_after: int) -> None:
+        """Answer a /stream request with 503 and Retry-After (no stream headers were sent)."""
+        self._stream_rejections += 1
+        response = (
+            "HTTP/1.1 503 Service Unavailable\r\n"
+            f"Retry-After: {retry_after}\r\n"
+            "Content-Length: 0\r\n"
+            "Connection: close\r\n"
+            "\r\n"
+        )
+        try:
+            client.sendall(response.encode("ascii"))
+        except Exception:
+            pass
+        try:
+            client.close()
+        except Exception:
+            pass
+    
+    def get_admission_stats(self) -> dict:
+        """/stream admission statistics (rejections, plus controller state when enabled)."""
+        stats = {"rejected": self._stream_rejections}
+        if self.admission is not None:
+            stats.update(self.admission.stats())
+        return stats
+    
     def _handle_buffer_endpoint(self, client):
         """
         Handle /tower/buffer endpoint - returns JSON buffer stats per contract T-BUF.
@@ -334,28 +572,7 @@ class HTTPServer:
                 client.close()
                 return
             
-            # Get buffer stats per contract T-BUF5
-            # Use get_stats() if available (per contract), otherwise fall back to stats()
-            if hasattr(self.buffer_stats_provider, 'get_stats'):
-                stats = self.buffer_stats_provider.get_stats()
-            else:
-                stats = self.buffer_stats_provider.stats()
-            
-            # Build JSON response per contract T-BUF2
-            # Required fields: capacity, count, overflow_count, ratio
-            capacity = stats.capacity
-            count = stats.count
-            overflow_count = getattr(stats, 'overflow_count', 0)  # May not be available on all stats objects
-            ratio = count / capacity if capacity > 0 else 0.0
-            
-            response_data = {
-                "capacity": capacity,
-                "count": count,
-                "overflow_count": overflow_count,
-                "ratio": ratio
-            }
-            
-            response_json = json.dumps(response_data)
+            response_json = json.dumps(self._buffer_stats_body())
             response = (
                 "HTTP/1.1 200 OK\r\n"
                 "Content-Type: application/json\r\n"
@@ -382,6 +599,31 @@ class HTTPServer:
                 pass
             client.close()
     
+    def _buffer_stats_body(self) -> dict:
+        """
+        /tower/buffer response body per contract T-BUF2 (provider must be set).
+        
+        Per contract T-BUF5: Stats MUST originate from buffer stats provider
+        """
+        # Use get_stats() if available (per contract), otherwise fall back to stats()
+        if hasattr(self.buffer_stats_provider, 'get_stats'):
+            stats = self.buffer_stats_provider.get_stats()
+        else:
+            stats = self.buffer_stats_provider.stats()
+        
+        # Required fields: capacity, count, overflow_count, ratio
+        capacity = stats.capacity
+        count = stats.count
+        overflow_count = getattr(stats, 'overflow_count', 0)  # May not be available on all stats objects
+        ratio = count / capacity if capacity > 0 else 0.0
+        
+        return {
+            "capacity": capacity,
+            "count": count,
+            "overflow_count": overflow_count,
+            "ratio": ratio
+        }
+    
     def _handle_404(self, client, path):
         """
         Handle unknown endpoints - return 404 Not Found.
@@ -401,272 +643,284 @@ class HTTPServer:
             pass
         client.close()
     
-    def _handle_events_ingest_endpoint(self, client, method, request):
+    def _read_request_body(self, client, request: bytes) -> Optional[bytes]:
         """
-        Handle POST /tower/events/ingest endpoint for event ingestion.
+        Read the complete body of a POST request whose first bytes are request.
         
-        Per contract T-EVENTS1: Accepts Station heartbeat events via HTTP POST.
-        Per contract T-EVENTS6: Non-blocking reception.
-        Per contract T-EVENTS7: Validates events.
+        Returns the body bytes (exactly Content-Length), or None after having
+        answered 400/413 and closed the client.
         """
-        if method != "POST":
-            response = (
-                "HTTP/1.1 405 Method Not Allowed\r\n"
-                "Content-Type: application/json\r\n"
-                "Connection: close\r\n"
-                "\r\n"
-                '{"error": "Method not allowed. Use POST."}\n'
-            )
-            try:
-                client.sendall(response.encode("ascii"))
-            except Exception:
-                pass
-            client.close()
-            return
+        # ====================================================================
+        # Byte-precise HTTP POST body parsing
+        # Per contract T-EVENTS6: Non-blocking, complete body retrieval
+        # ====================================================================
+        
+        # Step 1: Operate on bytes, not decoded strings
+        data = request  # data is already bytes from client.recv()
         
+        # Step 2: Handle header fragmentation - find header/body separator
+        header_end = data.find(b"\r\n\r\n")
+        max_header_reads = 50  # Allow for slow network chunking (was 10, too low)
+        max_header_size = 65536  # 64 KB max header size to prevent DoS
+        header_reads = 0
+        
+        # Save original timeout to restore later (if socket supports it)
         try:
-            # ====================================================================
-            # Byte-precise HTTP POST body parsing
-            # Per contract T-EVENTS6: Non-blocking, complete body retrieval
-            # ====================================================================
-            
-            # Step 1: Operate on bytes, not decoded strings
-            data = request  # data is already bytes from client.recv()
-            
-            # Step 2: Handle header fragmentation - find header/body separator
-            header_end = data.find(b"\r\n\r\n")
-            max_header_reads = 50  # Allow for slow network chunking (was 10, too low)
-            max_header_size = 65536  # 64 KB max header size to prevent DoS
-            header_reads = 0
-            
-            # Save original timeout to restore later (if socket supports it)
-            try:
-                original_timeout = client.gettimeout()
-            except Exception:
-                original_timeout = None
-            
-            # Set timeout once for header reading section (not per iteration)
+            original_timeout = client.gettimeout()
+        except Exception:
+            original_timeout = None
+        
+        # Set timeout once for header reading section (not per iteration)
+        try:
+            client.settimeout(1.0)  # 1 second timeout (was 0.1s, too short for network/load)
+        except Exception:
+            pass  # Ignore if settimeout fails
+        
+        # If headers are incomplete, continue reading until \r\n\r\n is found
+        while header_end < 0 and header_reads < max_header_reads:
             try:
-                client.settimeout(1.0)  # 1 second timeout (was 0.1s, too short for network/load)
-            except Exception:
-                pass  # Ignore if settimeout fails
-            
-            # If headers are incomplete, continue reading until \r\n\r\n is found
-            while header_end < 0 and header_reads < max_header_reads:
-                try:
-                    chunk = client.recv(4096)
-                    if not chunk:
-                        # Connection closed before headers complete
-                        response = (
-                            "HTTP/1.1 400 Bad Request\r\n"
-                            "Content-Type: application/json\r\n"
-                            "Connection: close\r\n"
-                            "\r\n"
-                            '{"error": "Incomplete headers"}\n'
-                        )
-                        try:
-                            client.sendall(response.encode("ascii"))
-                        except Exception:
-                            pass
-                        client.close()
-                        return
-                    data += chunk
-                    
-                    # Problem 3: Enforce max header size to prevent DoS
-                    if len(data) > max_header_size:
-                        # Header too large, reject to prevent memory exhaustion
-                        response = (
-                            "HTTP/1.1 413 Payload Too Large\r\n"
-                            "Connection: close\r\n"
-                            "\r\n"
-                        )
-                        try:
-                            client.sendall(response.encode("ascii"))
-                        except Exception:
-                            pass
-                        client.close()
-                        return
-                    
-                    header_end = data.find(b"\r\n\r\n")
-                    header_reads += 1
-                except socket.timeout:
-                    # Timeout reading headers - reject request
+                chunk = client.recv(4096)
+                if not chunk:
+                    # Connection closed before headers complete
                     response = (
                         "HTTP/1.1 400 Bad Request\r\n"
                         "Content-Type: application/json\r\n"
                         "Connection: close\r\n"
                         "\r\n"
-                        '{"error": "Header read timeout"}\n'
+                        '{"error": "Incomplete headers"}\n'
                     )
                     try:
                         client.sendall(response.encode("ascii"))
                     except Exception:
                         pass
                     client.close()
-                    return
-                except Exception:
-                    break
-            
-            if header_end < 0:
-                # Headers never completed - restore timeout before closing
-                try:
-                    if original_timeout is not None:
-                        client.settimeout(original_timeout)
-                except Exception:
-                    pass
-                response = (
-                    "HTTP/1.1 400 Bad Request\r\n"
-                    "Content-Type: application/json\r\n"
-                    "Connection: close\r\n"
-                    "\r\n"
-                    '{"error": "Incomplete headers"}\n'
-                )
-                try:
-                    client.sendall(response.encode("ascii"))
-                except Exception:
-                    pass
-                client.close()
-                return
-            
-            # Step 3: Parse Content-Length from header bytes
-            header_bytes = data[:header_end]
-            content_length = None
-            
-            # Extract Content-Length header
-            for line in header_bytes.split(b"\r\n"):
-                if line.lower().startswith(b"content-length:"):
+                    return None
+                data += chunk
+        
+                # Problem 3: Enforce max header size to prevent DoS
+                if len(data) > max_header_size:
+                    # Header too large, reject to prevent memory exhaustion
+                    response = (
+                        "HTTP/1.1 413 Payload Too Large\r\n"
+                        "Connection: close\r\n"
+                        "\r\n"
+                    )
                     try:
-                        # Extract value after colon
-                        value = line.split(b":", 1)[1].strip()
-                        content_length = int(value)
-                        if content_length < 0:
-                            content_length = None  # Invalid negative value
-                        logger.debug(f"[EVENTS_INGEST] Parsed Content-Length: {content_length}")
-                        break
-                    except (ValueError, IndexError):
-                        # Invalid Content-Length format
-                        content_length = None
-                        logger.debug(f"[EVENTS_INGEST] Invalid Content-Length format: {line}")
-                        break
-            
-            if content_length is None:
-                # No Content-Length header - restore timeout and reject request
-                try:
-                    if original_timeout is not None:
-                        client.settimeout(original_timeout)
-                except Exception:
-                    pass
+                        client.sendall(response.encode("ascii"))
+                    except Exception:
+                        pass
+                    client.close()
+                    return None
+        
+                header_end = data.find(b"\r\n\r\n")
+                header_reads += 1
+            except socket.timeout:
+                # Timeout reading headers - reject request
                 response = (
                     "HTTP/1.1 400 Bad Request\r\n"
                     "Content-Type: application/json\r\n"
                     "Connection: close\r\n"
                     "\r\n"
-                    '{"error": "Content-Length header required"}\n'
+                    '{"error": "Header read timeout"}\n'
                 )
                 try:
                     client.sendall(response.encode("ascii"))
                 except Exception:
                     pass
                 client.close()
-                return
-            
-            # Step 4 & 5: Read body until exactly Content-Length bytes have been received
-            # Extract any body bytes already in the first recv()
-            body_start = header_end + 4  # Skip \r\n\r\n
-            body_bytes = data[body_start:]
-            
-            logger.debug(f"[EVENTS_INGEST] Initial body bytes from first recv: {len(body_bytes)}/{content_length}")
-            
-            # Set timeout once for body reading section (not per iteration)
+                return None
+            except Exception:
+                break
+        
+        if header_end < 0:
+            # Headers never completed - restore timeout before closing
             try:
-                client.settimeout(0.5)  # 0.5 second timeout (was 0.1s, too short under load)
+                if original_timeout is not None:
+                    client.settimeout(original_timeout)
             except Exception:
-                pass  # Ignore if settimeout fails
-            
-            # Read remaining body bytes if needed
-            max_body_reads = 100  # Prevent infinite loop
-            body_reads = 0
-            
-            while len(body_bytes) < content_length and body_reads < max_body_reads:
+                pass
+            response = (
+                "HTTP/1.1 400 Bad Request\r\n"
+                "Content-Type: application/json\r\n"
+                "Connection: close\r\n"
+                "\r\n"
+                '{"error": "Incomplete headers"}\n'
+            )
+            try:
+                client.sendall(response.encode("ascii"))
+            except Exception:
+                pass
+            client.close()
+            return None
+        
+        # Step 3: Parse Content-Length from header bytes
+        header_bytes = data[:header_end]
+        content_length = None
+        
+        # Extract Content-Length header
+        for line in header_bytes.split(b"\r\n"):
+            if line.lower().startswith(b"content-length:"):
                 try:
-                    remaining = content_length - len(body_bytes)
-                    chunk = client.recv(min(remaining, 4096))  # Don't read more than needed
-                    if not chunk:
-                        # Connection closed before body complete
-                        response = (
-                            "HTTP/1.1 400 Bad Request\r\n"
-                            "Content-Type: application/json\r\n"
-                            "Connection: close\r\n"
-                            "\r\n"
-                            '{"error": "Incomplete request body"}\n'
-                        )
-                        try:
-                            client.sendall(response.encode("ascii"))
-                        except Exception:
-                            pass
-                        client.close()
-                        return
-                    body_bytes += chunk
-                    body_reads += 1
-                except socket.timeout:
-                    # Timeout reading body - reject request
-                    response = (
-                        "HTTP/1.1 400 Bad Request\r\n"
-                        "Content-Type: application/json\r\n"
-                        "Connection: close\r\n"
-                        "\r\n"
-                        '{"error": "Body read timeout"}\n'
-                    )
-                    try:
-                        client.sendall(response.encode("ascii"))
-                    except Exception:
-                        pass
-                    client.close()
-                    return
-                except Exception as e:
-                    logger.warning(f"Error reading request body: {e}")
+                    # Extract value after colon
+                    value = line.split(b":", 1)[1].strip()
+                    content_length = int(value)
+                    if content_length < 0:
+                        content_length = None  # Invalid negative value
+                    logger.debug(f"[EVENTS_INGEST] Parsed Content-Length: {content_length}")
+                    break
+                except (ValueError, IndexError):
+                    # Invalid Content-Length format
+                    content_length = None
+                    logger.debug(f"[EVENTS_INGEST] Invalid Content-Length format: {line}")
+                    break
+        
+        if content_length is None:
+            # No Content-Length header - restore timeout and reject request
+            try:
+                if original_timeout is not None:
+                    client.settimeout(original_timeout)
+            except Exception:
+                pass
+            response = (
+                "HTTP/1.1 400 Bad Request\r\n"
+                "Content-Type: application/json\r\n"
+                "Connection: close\r\n"
+                "\r\n"
+                '{"error": "Content-Length header required"}\n'
+            )
+            try:
+                client.sendall(response.encode("ascii"))
+            except Exception:
+                pass
+            client.close()
+            return None
+        
+        # Step 4 & 5: Read body until exactly Content-Length bytes have been received
+        # Extract any body bytes already in the first recv()
+        body_start = header_end + 4  # Skip \r\n\r\n
+        body_bytes = data[body_start:]
+        
+        logger.debug(f"[EVENTS_INGEST] Initial body bytes from first recv: {len(body_bytes)}/{content_length}")
+        
+        # Set timeout once for body reading section (not per iteration)
+        try:
+            client.settimeout(0.5)  # 0.5 second timeout (was 0.1s, too short under load)
+        except Exception:
+            pass  # Ignore if settimeout fails
+        
+        # Read remaining body bytes if needed
+        max_body_reads = 100  # Prevent infinite loop
+        body_reads = 0
+        
+        while len(body_bytes) < content_length and body_reads < max_body_reads:
+            try:
+                remaining = content_length - len(body_bytes)
+                chunk = client.recv(min(remaining, 4096))  # Don't read more than needed
+                if not chunk:
+                    # Connection closed before body complete
                     response = (
                         "HTTP/1.1 400 Bad Request\r\n"
                         "Content-Type: application/json\r\n"
                         "Connection: close\r\n"
                         "\r\n"
-                        '{"error": "Error reading request body"}\n'
+                        '{"error": "Incomplete request body"}\n'
                     )
                     try:
                         client.sendall(response.encode("ascii"))
                     except Exception:
                         pass
                     client.close()
-                    return
-            
-            # Step 6: Verify we have exactly Content-Length bytes
-            if len(body_bytes) != content_length:
-                # Body length mismatch - restore timeout before closing
+                    return None
+                body_bytes += chunk
+                body_reads += 1
+            except socket.timeout:
+                # Timeout reading body - reject request
+                response = (
+                    "HTTP/1.1 400 Bad Request\r\n"
+                    "Content-Type: application/json\r\n"
+                    "Connection: close\r\n"
+                    "\r\n"
+                    '{"error": "Body read timeout"}\n'
+                )
                 try:
-                    if original_timeout is not None:
-                        client.settimeout(original_timeout)
+                    client.sendall(response.encode("ascii"))
                 except Exception:
                     pass
+                client.close()
+                return None
+            except Exception as e:
+                logger.warning(f"Error reading request body: {e}")
                 response = (
                     "HTTP/1.1 400 Bad Request\r\n"
                     "Content-Type: application/json\r\n"
                     "Connection: close\r\n"
                     "\r\n"
-                    f'{{"error": "Body length mismatch: expected {content_length}, got {len(body_bytes)}"}}\n'
+                    '{"error": "Error reading request body"}\n'
                 )
                 try:
                     client.sendall(response.encode("ascii"))
                 except Exception:
                     pass
                 client.close()
-                return
-            
-            # Restore original socket timeout before processing
+                return None
+        
+        # Step 6: Verify we have exactly Content-Length bytes
+        if len(body_bytes) != content_length:
+            # Body length mismatch - restore timeout before closing
             try:
                 if original_timeout is not None:
                     client.settimeout(original_timeout)
             except Exception:
-                pass  # Ignore errors restoring timeout
+                pass
+            response = (
+                "HTTP/1.1 400 Bad Request\r\n"
+                "Content-Type: application/json\r\n"
+                "Connection: close\r\n"
+                "\r\n"
+                f'{{"error": "Body length mismatch: expected {content_length}, got {len(body_bytes)}"}}\n'
+            )
+            try:
+                client.sendall(response.encode("ascii"))
+            except Exception:
+                pass
+            client.close()
+            return None
+        
+        # Restore original socket timeout before processing
+        try:
+            if original_timeout is not None:
+                client.settimeout(original_timeout)
+        except Exception:
+            pass  # Ignore errors restoring timeout
+        return body_bytes
+
+    def _handle_events_ingest_endpoint(self, client, method, request):
+        """
+        Handle POST /tower/events/ingest endpoint for event ingestion.
+        
+        Per contract T-EVENTS1: Accepts Station heartbeat events via HTTP POST.
+        Per contract T-EVENTS6: Non-blocking reception.
+        Per contract T-EVENTS7: Validates events.
+        """
+        if method != "POST":
+            response = (
+                "HTTP/1.1 405 Method Not Allowed\r\n"
+                "Content-Type: application/json\r\n"
+                "Connection: close\r\n"
+                "\r\n"
+                '{"error": "Method not allowed. Use POST."}\n'
+            )
+            try:
+                client.sendall(response.encode("ascii"))
+            except Exception:
+                pass
+            client.close()
+            return
+        
+        try:
+            body_bytes = self._read_request_body(client, request)
+            if body_bytes is None:
+                return
             
             # Step 7: Only after full body is received, decode as UTF-8 and JSON-parse
             logger.debug(f"[EVENTS_INGEST] Body complete: {len(body_bytes)} bytes, decoding UTF-8")
@@ -762,6 +1016,150 @@ class HTTPServer:
                 pass
             client.close()
     
+    def _handle_events_batch_ingest_endpoint(self, client, method, request) -> bool:
+        """
+        Handle POST /tower/events/ingest/batch: many Station events in one request.
+        
+        Body: {"events": [{"event_type", "timestamp", "metadata"}, ...]} in
+        emission order. Each event is validated as for /tower/events/ingest
+        (T-EVENTS7); valid ones are fanned out to WebSocket clients in one pass
+        and invalid ones are counted and skipped. Answers 200 with
+        {"accepted": n, "rejected": m} and keeps the connection open unless
+        the request asked for Connection: close.
+        
+        Returns:
+            True if the connection stays open for the next request
+        """
+        if method != "POST":
+            self._send_json_response(client, "405 Method Not Allowed", {"error": "Method not allowed. Use POST."})
+            return False
+        
+        try:
+            body_bytes = self._read_request_body(client, request)
+            if body_bytes is None:
+                return False
+            
+            try:
+                batch = json.loads(body_bytes.decode("utf-8", errors="strict"))
+            except (UnicodeDecodeError, json.JSONDecodeError) as e:
+                logger.warning(f"[EVENTS_INGEST] Invalid batch body: {e}")
+                self._send_json_response(client, "400 Bad Request", {"error": "Invalid JSON"})
+                return False
+            
+            events = batch.get("events") if isinstance(batch, dict) else None
+            if not isinstance(events, list):
+                self._send_json_response(client, "400 Bad Request", {"error": "Body must be {\"events\": [...]}"})
+                return False
+            if len(events) > TOWER_EVENTS_MAX_BATCH:
+                self._send_json_response(client, "413 Payload Too Large", {"error": f"At most {TOWER_EVENTS_MAX_BATCH} events per batch"})
+                return False
+            
+            accepted, rejected = self._ingest_events(events)
+            
+            keep_alive = b"connection: close" not in request.split(b"\r\n\r\n", 1)[0].lower()
+            self._send_json_response(
+                client, "200 OK", {"accepted": accepted, "rejected": rejected}, keep_alive=keep_alive
+            )
+            return keep_alive
+            
+        except Exception as e:
+            logger.warning(f"Error handling /tower/events/ingest/batch: {e}")
+            self._send_json_response(client, "500 Internal Server Error", {"error": "Internal server error"})
+            return False
+    
+    def _ingest_events(self, events) -> Tuple[int, int]:
+        """
+        Validate a sequence of event dicts and broadcast the valid ones in order.
+        
+        Returns:
+            (accepted, rejected) counts
+        """
+        accepted = []
+        rejected = 0
+        for event_data in events:
+            if not isinstance(event_data, dict):
+                rejected += 1
+                continue
+            event_type = event_data.get("event_type")
+            timestamp = event_data.get("timestamp")
+            metadata = event_data.get("metadata", {})
+            # Validate event per contract T-EVENTS7
+            if not self.event_buffer.validate_event(event_type, timestamp, metadata):
+                rejected += 1
+                continue
+            # Update shutdown state for critical events (per contract T-EVENTS5 exception)
+            if event_type in ("station_startup", "station_shutdown"):
+                self.event_buffer.update_shutdown_state(event_type)
+            accepted.append((event_type, timestamp, metadata))
+        
+        # Broadcast immediately to connected clients (per contract T-EXPOSE1.7)
+        self._broadcast_events_to_streaming_clients(accepted)
+        return len(accepted), rejected
+    
+    def handle_control_request(self, request) -> Tuple[int, Any]:
+        """
+        Serve one request from the control-plane listener (ControlPlaneServer).
+        
+        Same endpoints and bodies as the main listener's /tower/buffer,
+        /tower/events/ingest, /tower/events/ingest/batch and
+        /tower/events/history; runs on a control-plane worker thread.
+        
+        Args:
+            request: tower.http.control_server.ControlRequest
+            
+        Returns:
+            (status code, body) - body is a dict (sent as JSON) or None
+        """
+        path, _, query = request.path.partition("?")
+        if path == "/tower/buffer":
+            if request.method != "GET":
+                return 405, {"error": "Method not allowed. Use GET."}
+            if self.buffer_stats_provider is None:
+                return 503, {"error": "Buffer stats not available"}
+            return 200, self._buffer_stats_body()
+        if path == "/tower/events/history":
+            if request.method != "GET":
+                return 405, {"error": "Method not allowed. Use GET."}
+            return self._events_history_body(query)
+        if path in ("/tower/events/ingest", "/tower/events/ingest/batch"):
+            if request.method != "POST":
+                return 405, {"error": "Method not allowed. Use POST."}
+            try:
+                data = json.loads(request.body.decode("utf-8", errors="strict"))
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                return 400, {"error": "Invalid JSON"}
+            if path == "/tower/events/ingest":
+                accepted, _ = self._ingest_events([data])
+                return (204, None) if accepted else (400, {"error": "Invalid event type"})
+            events = data.get("events") if isinstance(data, dict) else None
+            if not isinstance(events, list):
+                return 400, {"error": "Body must be {\"events\": [...]}"}
+            if len(events) > TOWER_EVENTS_MAX_BATCH:
+                return 413, {"error": f"At most {TOWER_EVENTS_MAX_BATCH} events per batch"}
+            accepted, rejected = self._ingest_events(events)
+            return 200, {"accepted": accepted, "rejected": rejected}
+        return 404, {"error": f"Not found on control plane: {path}"}
+    
+    def _send_json_response(self, client, status: str, body: dict, keep_alive: bool = False) -> None:
+        """Send a JSON response with Content-Length; closes the client unless keep_alive."""
+        payload = json.dumps(body).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+            "\r\n"
+        )
+        try:
+            client.sendall(head.encode("ascii") + payload)
+        except Exception:
+            keep_alive = False
+        if not keep_alive:
+            try:
+                client.close()
+            except Exception:
+                pass
+    
     def _handle_test_broadcast_endpoint(self, client, method, request):
         """
         Handle POST /__test__/broadcast endpoint for test-only event broadcasting.
@@ -900,7 +1298,17 @@ class HTTPServer:
         """
         # Parse query parameters
         event_type_filter = query_params.get("event_type")
-        # Note: 'since' parameter removed per contract - events are not stored
+        # since=<seq>: replay retained events after seq, then continue with the live tail
+        since = None
+        if "since" in query_params:
+            try:
+                since = int(query_params["since"])
+            except ValueError:
+                since = -1
+            if since < 0:
+                # Per T-EXPOSE8: invalid query parameters reject the upgrade
+                self._send_json_response(client, "400 Bad Request", {"error": "since must be a non-negative sequence number"})
+                return
         
         # Perform WebSocket upgrade
         try:
@@ -922,12 +1330,10 @@ class HTTPServer:
             # If setting buffer size fails, continue anyway (some systems may not allow it)
             pass
         
-        with self._event_clients_lock:
-            self._event_clients[client_id] = {
-                'socket': client,
-                'event_type_filter': event_type_filter,
-                'last_activity_time': time.time()
-            }
+        # Reads below poll with a 1s timeout; with a timeout set the fd is non-blocking,
+        # which the fan-out stage relies on for its writes (T-WS7)
+        client.settimeout(1.0)
+        self._join_event_stream(client_id, client, event_type_filter, since, "ws")
         
         # Keep connection alive and handle incoming frames (ping/pong, close)
         # Per T-WS2: Idle connections MUST NOT be disconnected based solely on lack of data transfer
@@ -956,33 +1362,18 @@ class HTTPServer:
                         buffer = buffer[consumed:]
                         
                         # Update last_activity_time when data is received from client (any opcode)
-                        with self._event_clients_lock:
-                            if client_id in self._event_clients:
-                                self._event_clients[client_id]['last_activity_time'] = time.time()
+                        self._event_fanout.touch(client_id)
                         
                         if opcode == 0x8:  # Close frame
-                            # Send close frame response
-                            try:
-                                close_frame = create_close_frame()
-                                client.sendall(close_frame)
-                                # Update last_activity_time when frame is successfully sent
-                                with self._event_clients_lock:
-                                    if client_id in self._event_clients:
-                                        self._event_clients[client_id]['last_activity_time'] = time.time()
-                            except Exception:
-                                pass
+                            # Close frame response, written by the fan-out stage after
+                            # any pending event data (never concurrently with it)
+                            self._event_fanout.close_client(client_id)
                             break
                         elif opcode == 0x9:  # Ping frame
-                            # Respond with pong
-                            try:
-                                pong_frame = encode_websocket_frame(payload, opcode=0xA)  # Pong
-                                client.sendall(pong_frame)
-                                # Update last_activity_time when frame is successfully sent
-                                with self._event_clients_lock:
-                                    if client_id in self._event_clients:
-                                        self._event_clients[client_id]['last_activity_time'] = time.time()
-                            except Exception:
-                                pass
+                            # Respond with pong, written by the fan-out stage so it
+                            # never interleaves with a partially written event frame
+                            pong_frame = encode_websocket_frame(payload, opcode=0xA)  # Pong
+                            self._event_fanout.send_control(client_id, pong_frame)
                         # Ignore other opcodes (text/binary from client)
                     
                 except socket.timeout:
@@ -996,13 +1387,98 @@ class HTTPServer:
             logger.warning(f"Error in WebSocket connection to client {client_id}: {e}")
         finally:
             # Remove client
-            with self._event_clients_lock:
-                self._event_clients.pop(client_id, None)
+            self._event_fanout.remove_client(client_id)
+            try:
+                client.close()
+            except Exception:
+                pass
+    
+    def _handle_sse_events(self, client, client_id, method, path, request):
+        """
+        Handle GET /tower/events/sse: the /tower/events stream as Server-Sent Events.
+        
+        Same events, event_type filter, history replay and fan-out stage as the
+        WebSocket endpoint; each message is "id: <seq>" plus the event JSON as
+        "data:". Resume point: the Last-Event-ID header (sent by EventSource on
+        reconnect), else ?since=<seq>. Idle streams get heartbeat comments.
+        """
+        if method != "GET":
+            self._send_json_response(client, "405 Method Not Allowed", {"error": "Method not allowed. Use GET."})
+            return
+        query_params = {}
+        if "?" in path:
+            for param in path.split("?", 1)[1].split("&"):
+                if "=" in param:
+                    key, value = param.split("=", 1)
+                    query_params[key] = value
+        event_type_filter = query_params.get("event_type")
+        since = query_params.get("since")
+        for line in request.split(b"\r\n\r\n", 1)[0].split(b"\r\n")[1:]:
+            name, _, value = line.partition(b":")
+            if name.strip().lower() == b"last-event-id":
+                since = value.strip().decode("latin-1")
+        if since is not None:
+            try:
+                since = int(since)
+            except ValueError:
+                since = -1
+            if since < 0:
+                self._send_json_response(client, "400 Bad Request", {"error": "Last-Event-ID/since must be a non-negative sequence number"})
+                return
+        
+        try:
+            client.sendall(
+                b"HTTP/1.1 200 OK\r\n"
+                b"Content-Type: text/event-stream\r\n"
+                b"Cache-Control: no-cache\r\n"
+                b"Connection: keep-alive\r\n"
+                b"X-Accel-Buffering: no\r\n"
+                b"\r\n"
+                b": connected\n\n"
+            )
+            client.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 8192)
+        except Exception as e:
+            logger.debug(f"Error starting SSE stream for client {client_id}: {e}")
+            client.close()
+            return
+        
+        # With a timeout set the fd is non-blocking, as the fan-out stage requires
+        client.settimeout(1.0)
+        self._join_event_stream(client_id, client, event_type_filter, since, "sse")
+        try:
+            # SSE clients send nothing; reading only detects the disconnect
+            while self.running:
+                try:
+                    if not client.recv(4096):
+                        break
+                except socket.timeout:
+                    continue
+                except (OSError, ConnectionError):
+                    break
+        finally:
+            self._event_fanout.remove_client(client_id)
             try:
                 client.close()
             except Exception:
                 pass
     
+    def _join_event_stream(self, client_id, client, event_type_filter, since, encoding):
+        """
+        Register a WebSocket ("ws") or SSE ("sse") client with the fan-out stage.
+        
+        With since=<seq>, retained events after seq are queued ahead of the live
+        tail. Joining under the publish lock means every event is either in the
+        replay or published after the join, never both and never neither.
+        """
+        if since is None:
+            self._event_fanout.add_client(client_id, client, event_type_filter, encoding=encoding)
+            return
+        with self._event_publish_lock:
+            replay = self._event_history.since(since, event_type=event_type_filter)
+            payload = b"".join(entry.sse_message if encoding == "sse" else entry.frame for entry in replay)
+            self._event_fanout.add_client(client_id, client, event_type_filter, initial_payload=payload, encoding=encoding)
+        logger.debug(f"Event stream client {client_id} ({encoding}) replaying {len(replay)} events after seq {since}")
+    
     def _broadcast_event_to_streaming_clients(self, event_type: str, timestamp: float, metadata: Dict[str, Any]):
         """
         Broadcast event to all connected WebSocket clients.
@@ -1015,138 +1491,156 @@ class HTTPServer:
             timestamp: Station Clock A timestamp
             metadata: Event metadata
         """
-        import time as time_module
-        import uuid
-        
-        # Create event dict with tower_received_at timestamp
-        event_dict = {
-            "event_type": event_type,
-            "timestamp": timestamp,
-            "tower_received_at": time_module.time(),  # Tower wall-clock time
-            "event_id": str(uuid.uuid4()),
-            "metadata": metadata
-        }
-        
-        event_json = json.dumps(event_dict)
+        self._broadcast_events_to_streaming_clients([(event_type, timestamp, metadata)])
+    
+    def _broadcast_events_to_streaming_clients(self, events):
+        """
+        Broadcast a batch of events to all connected WebSocket clients.
         
-        # Create WebSocket text frame
-        ws_frame = encode_websocket_frame(event_json.encode('utf-8'), opcode=0x1)
+        Each event is given the next sequence number and serialized once; the
+        JSON is wrapped as a WebSocket frame and as an SSE message, recorded in
+        the replay history, then handed to the fan-out stage, which delivers
+        it to every client whose encoding and filter match. This
+        returns without waiting on any client (T-EVENTS6, T-WS4).
         
-        # Broadcast to all streaming clients
-        dead_clients = []
+        Args:
+            events: Sequence of (event_type, timestamp, metadata) tuples
+        """
+        received_at = time.time()  # Tower wall-clock time
+        frames = []
+        with self._event_publish_lock:
+            for event_type, timestamp, metadata in events:
+                event_dict = {
+                    "seq": self._event_history.next_seq(),
+                    "event_type": event_type,
+                    "timestamp": timestamp,
+                    "tower_received_at": received_at,
+                    "event_id": str(uuid.uuid4()),
+                    "metadata": metadata
+                }
+                event_json = json.dumps(event_dict).encode('utf-8')
+                # Create WebSocket text frame and SSE message from the same JSON
+                frame = encode_websocket_frame(event_json, opcode=0x1)
+                sse_message = b"id: %d\ndata: %s\n\n" % (event_dict["seq"], event_json)
+                self._event_history.append(event_type, received_at, event_dict, frame, sse_message)
+                self._now_playing.update(event_dict)
+                frames.append((event_type, frame, sse_message))
+            self._event_fanout.publish(frames)
+    
+    def get_event_fanout_stats(self) -> dict:
+        """WebSocket event fan-out statistics, including delivery latency percentiles."""
+        return self._event_fanout.stats()
+    
+    def _handle_now_playing_endpoint(self, client, method, path, request) -> bool:
+        """
+        Handle GET /tower/now-playing: the current now-playing document (T-EXPOSE10).
         
-        with self._event_clients_lock:
-            clients_copy = dict(self._event_clients)
+        The document and its 200/304 responses are serialized once per change,
+        so a request costs a header scan, a lookup and a send. If-None-Match
+        matching the current ETag answers 304. With ?wait=<seconds> and a
+        matching If-None-Match, the request is held (long-poll) until the
+        document changes (200) or the wait elapses (304). Held requests are
+        parked in NowPlaying's waiter registry, so this thread returns at once;
+        once the registry is full they are answered 304 immediately.
         
-        for client_id, client_info in clients_copy.items():
-            if isinstance(client_info, dict) and 'socket' in client_info:
-                client_sock = client_info['socket']
-                
-                # Check filters
-                event_type_filter = client_info.get('event_type_filter')
-                
-                # Apply filters
-                if event_type_filter and event_type != event_type_filter:
-                    continue
-                
-                # Per T-WS4: Slow-consumer drop applies only when an actual send operation stalls
-                # Per T-WS7: WebSocket write operations MUST be non-blocking
-                # Bounded send semantics: Use select.select() to check writability before send
-                # select() is required to make T-WS4 enforceable and testable (detects send stalls deterministically)
-                try:
-                    # Check if socket is writable within bounded timeout (per T-WS4)
-                    send_timeout = TOWER_WS_SEND_STALL_TIMEOUT_MS / 1000.0
-                    readable, writable, exceptional = select.select([], [client_sock], [], send_timeout)
-                    
-                    if client_sock not in writable:
-                        # Socket not writable within timeout - send would stall
-                        # Per T-WS4: disconnect slow consumer when send stalls
-                        logger.debug(f"WebSocket send stall (not writable) for client {client_id} - disconnecting slow consumer")
-                        dead_clients.append(client_id)
-                        try:
-                            # Send close frame (best effort, non-blocking)
-                            close_frame = create_close_frame()
-                            try:
-                                client_sock.setblocking(False)
-                                client_sock.send(close_frame)
-                            except Exception:
-                                pass
-                            client_sock.close()
-                        except Exception:
-                            pass
-                    else:
-                        # Socket is writable - attempt send
-                        # Save original blocking mode
-                        was_blocking = client_sock.getblocking()
-                        # Set non-blocking mode for send operation (secondary guard)
-                        client_sock.setblocking(False)
-                        
-                        try:
-                            # Attempt non-blocking send
-                            # If buffer is full, send() raises BlockingIOError immediately
-                            # Partial send indicates failed frame send - disconnect client
-                            sent = client_sock.send(ws_frame)
-                            if sent < len(ws_frame):
-                                # Partial send - failed frame send, disconnect client
-                                logger.debug(f"WebSocket partial send (failed frame) for client {client_id} - disconnecting")
-                                dead_clients.append(client_id)
-                                try:
-                                    # Send close frame (best effort)
-                                    close_frame = create_close_frame()
-                                    try:
-                                        client_sock.send(close_frame)
-                                    except Exception:
-                                        pass
-                                    client_sock.close()
-                                except Exception:
-                                    pass
-                            else:
-                                # Full frame sent successfully
-                                client_sock.setblocking(was_blocking)  # Restore blocking mode
-                                # Update activity time on successful send
-                                client_info['last_activity_time'] = time.time()
-                        except BlockingIOError:
-                            # Socket buffer is full - send would block
-                            # Per T-WS4: disconnect slow consumer when send stalls
-                            logger.debug(f"WebSocket send stall (BlockingIOError) for client {client_id} - disconnecting slow consumer")
-                            dead_clients.append(client_id)
-                            try:
-                                # Send close frame (best effort, may also block)
-                                close_frame = create_close_frame()
-                                try:
-                                    client_sock.send(close_frame)
-                                except Exception:
-                                    pass
-                                client_sock.close()
-                            except Exception:
-                                pass
-                        except (OSError, BrokenPipeError, ConnectionError):
-                            # Send failed - connection broken
-                            dead_clients.append(client_id)
-                            try:
-                                client_sock.close()
-                            except Exception:
-                                pass
-                        finally:
-                            # Restore original blocking mode if socket still open
-                            try:
-                                if client_id not in dead_clients:
-                                    client_sock.setblocking(was_blocking)
-                            except Exception:
-                                pass
-                except (OSError, BrokenPipeError, ConnectionError, ValueError):
-                    # Socket error or invalid file descriptor
-                    dead_clients.append(client_id)
+        Returns:
+            True if the connection stays open for the next request
+        """
+        if method != "GET":
+            self._send_json_response(client, "405 Method Not Allowed", {"error": "Method not allowed. Use GET."})
+            return False
+        wait = 0.0
+        if "?" in path:
+            for param in path.split("?", 1)[1].split("&"):
+                key, _, value = param.partition("=")
+                if key == "wait":
                     try:
-                        client_sock.close()
-                    except Exception:
-                        pass
+                        wait = float(value)
+                    except ValueError:
+                        self._send_json_response(client, "400 Bad Request", {"error": "wait must be a number of seconds"})
+                        return False
         
-        # Remove dead clients
-        if dead_clients:
-            with self._event_clients_lock:
-                for client_id in dead_clients:
-                    self._event_clients.pop(client_id, None)
+        head = request.split(b"\r\n\r\n", 1)[0]
+        keep_alive = b"connection: close" not in head.lower()
+        client_etags = set()
+        for line in head.split(b"\r\n")[1:]:
+            name, _, value = line.partition(b":")
+            if name.strip().lower() == b"if-none-match":
+                for tag in value.decode("latin-1").split(","):
+                    tag = tag.strip()
+                    if tag.startswith("W/"):
+                        tag = tag[2:]
+                    client_etags.add(tag.strip('"'))
+        
+        current = self._now_playing.current()
+        if wait > 0 and current.etag in client_etags and "*" not in client_etags:
+            # Held by the now-playing waiter thread, not this one; a keep-alive
+            # connection resumes on a new handler thread once answered
+            if self._now_playing.park(client, current.etag, wait, keep_alive, self._resume_client):
+                return False
+            current = self._now_playing.current()
+        status = 304 if current.etag in client_etags or "*" in client_etags else 200
+        try:
+            client.sendall(current.responses[(status, keep_alive)])
+        except Exception:
+            keep_alive = False
+        if not keep_alive:
+            try:
+                client.close()
+            except Exception:
+                pass
+        return keep_alive
+    
+    def get_event_history_stats(self) -> dict:
+        """Replay history statistics (retained events, oldest/latest sequence numbers)."""
+        return self._event_history.stats()
+    
+    def _handle_events_history_endpoint(self, client, method, path):
+        """
+        Handle GET /tower/events/history: retained events as JSON (T-EVENTS2 MAY).
+        
+        Query parameters (all optional):
+        - since: sequence number; return events after it (takes precedence over from/to)
+        - from, to: Tower wall-clock range on tower_received_at (inclusive)
+        - event_type: only events of this type
+        - limit: most events returned (default 100, at most TOWER_EVENT_HISTORY_MAX_LIMIT)
+        
+        Response: {"events": [...], "count", "oldest_seq", "latest_seq"}. A client
+        that finds oldest_seq > its cursor + 1 has missed evicted events.
+        """
+        if method != "GET":
+            self._send_json_response(client, "405 Method Not Allowed", {"error": "Method not allowed. Use GET."})
+            return
+        status, body = self._events_history_body(path.split("?", 1)[1] if "?" in path else "")
+        self._send_json_response(client, "200 OK" if status == 200 else "400 Bad Request", body)
+    
+    def _events_history_body(self, query: str) -> Tuple[int, dict]:
+        """Run a /tower/events/history query string; returns (status code, body)."""
+        query_params = {}
+        for param in query.split("&"):
+            if "=" in param:
+                key, value = param.split("=", 1)
+                query_params[key] = value
+        try:
+            since = int(query_params["since"]) if "since" in query_params else None
+            start_time = float(query_params["from"]) if "from" in query_params else None
+            end_time = float(query_params["to"]) if "to" in query_params else None
+            limit = int(query_params.get("limit", "100"))
+        except ValueError:
+            return 400, {"error": "Invalid query parameter"}
+        limit = max(0, min(limit, TOWER_EVENT_HISTORY_MAX_LIMIT))
+        event_type = query_params.get("event_type")
+        if since is not None:
+            entries = self._event_history.since(since, event_type=event_type, limit=limit)
+        else:
+            entries = self._event_history.between(start_time, end_time, event_type=event_type, limit=limit)
+        stats = self._event_history.stats()
+        return 200, {
+            "events": [entry.event for entry in entries],
+            "count": len(entries),
+            "oldest_seq": stats["oldest_seq"],
+            "latest_seq": stats["latest_seq"],
+        }
 
     def broadcast(self, frame: bytes):
         """
@@ -1164,6 +1658,13 @@ class HTTPServer:
         timeout_sec = TOWER_CLIENT_TIMEOUT_MS / 1000.0
         dead_clients = []
         
+        # Record the frame; numbering it under the registry lock gives
+        # time-shift clients an exact point to join the live stream
+        seq = 0
+        if self.archive is not None:
+            with self._clients_lock:
+                seq = self.archive.append(frame)
+        
         # Take snapshot of client IDs (under lock) per T-CLIENTS3
         with self._clients_lock:
             client_ids = list(self._connected_clients.keys())
@@ -1174,6 +1675,8 @@ class HTTPServer:
                 state = self._connected_clients.get(client_id)
                 if not state:
                     continue  # Client was removed
+                if seq and seq <= state.skip_until_seq:
+                    continue  # Already queued when the client joined from the archive
                 
                 # Enqueue frame if queue not full
                 if len(state.queue) < MAX_CLIENT_QUEUE_SIZE:
@@ -1235,6 +1738,10 @@ class HTTPServer:
         
         # Per contract [I27] #3: Close all client connections
         self._close_all_clients()
+        
+        # Close held now-playing long-polls
+        logger.info(f"Now-playing: {self._now_playing.stats()}")
+        self._now_playing.close()
     
     def _add_client(self, client_socket: socket.socket, client_id: str) -> None:
         """
@@ -1313,15 +1820,8 @@ class HTTPServer:
                 self._drop_client_locked(client_id, "shutdown")
         
         # Close event streaming clients
-        with self._event_clients_lock:
-            event_client_ids = list(self._event_clients.keys())
-            for client_id in event_client_ids:
-                client_sock = self._event_clients.pop(client_id, None)
-                if client_sock:
-                    try:
-                        client_sock.close()
-                    except Exception:
-                        pass
+        logger.info(f"WebSocket event fan-out: {self._event_fanout.stats()}")
+        self._event_fanout.stop()
         
         logger.info("All client connections closed")
     
@@ -9,6 +9,7 @@ validates frame size and delivers frames without transformations, routing,
 or timing decisions.
 """
 
+from tower.ingest.buffer_push import BufferTelemetryPublisher
 from tower.ingest.pcm_ingestor import PCMIngestor
 from tower.ingest.transport import IngestTransport, UnixSocketIngestTransport
 
@@ -16,6 +17,7 @@ __all__ = [
     "PCMIngestor",
     "IngestTransport",
     "UnixSocketIngestTransport",
+    "BufferTelemetryPublisher",
 ]
 
 
@@ -0,0 +1,245 @@
+"""
+Push channel for upstream PCM buffer telemetry.
+
+Per NEW_PCM_INGEST_CONTRACT I58/I62: upstream providers pace against the fill
+level of Tower's upstream PCM buffer. Polling /tower/buffer costs a TCP
+connection and a handler thread per sample and the answer is stale on
+arrival, so Tower also pushes compact samples to subscribers on a dedicated
+Unix socket next to the PCM ingest socket.
+
+Wire format: fixed-size little-endian records (SAMPLE_STRUCT), one per sample:
+
+    magic     4s   b"TBUF"
+    seq       u32  increments per sample sent (wraps at 2**32)
+    sent_at   f64  time.monotonic() on Tower when the sample was taken
+    capacity  u32  buffer capacity in frames
+    count     u32  frames currently buffered
+    overflow  u64  frames dropped because the buffer was full
+
+A sample is sent whenever count, capacity or overflow changes (checked every
+interval_sec) and at least every heartbeat_sec otherwise. Subscribers are
+written non-blocking: a subscriber that is not reading misses samples
+(visible as a seq gap) and never delays ingestion or AudioPump.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import select
+import socket
+import struct
+import threading
+import time
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_MAGIC = b"TBUF"
+SAMPLE_STRUCT = struct.Struct("<4sIdIIQ")
+
+DEFAULT_PUSH_INTERVAL_SEC = 0.01
+DEFAULT_PUSH_HEARTBEAT_SEC = 0.25
+
+
+def default_push_socket_path(pcm_socket_path: str) -> str:
+    """Push socket path derived from the PCM socket path (pcm.sock -> pcm-buffer.sock)."""
+    root, ext = os.path.splitext(pcm_socket_path)
+    return f"{root}-buffer{ext or '.sock'}"
+
+
+def pack_sample(seq: int, sent_at: float, capacity: int, count: int, overflow_count: int) -> bytes:
+    return SAMPLE_STRUCT.pack(SAMPLE_MAGIC, seq & 0xFFFFFFFF, sent_at, capacity, count, overflow_count)
+
+
+class BufferTelemetryPublisher:
+    """
+    Pushes buffer depth samples to subscribers on a Unix socket.
+
+    Usage:
+        publisher = BufferTelemetryPublisher(pcm_buffer, "/run/retrowaves/pcm-buffer.sock")
+        publisher.start()
+        publisher.stop()
+    """
+
+    def __init__(
+        self,
+        buffer,
+        socket_path: str,
+        interval_sec: float = DEFAULT_PUSH_INTERVAL_SEC,
+        heartbeat_sec: float = DEFAULT_PUSH_HEARTBEAT_SEC,
+    ):
+        """
+        Args:
+            buffer: Object with stats() returning capacity, count, overflow_count (FrameRingBuffer)
+            socket_path: Unix socket path subscribers connect to
+            interval_sec: How often the buffer is checked for changes
+            heartbeat_sec: Longest gap between samples when nothing changes
+        """
+        self.buffer = buffer
+        self.socket_path = socket_path
+        self.interval_sec = max(0.001, float(interval_sec))
+        self.heartbeat_sec = max(self.interval_sec, float(heartbeat_sec))
+        self._server_sock: Optional[socket.socket] = None
+        self._subscribers: List[socket.socket] = []
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self._seq = 0
+        self._last_state: Optional[tuple] = None
+        self._last_sent_at = 0.0
+
+        self.samples_sent = 0
+        self.samples_dropped = 0
+
+    def start(self) -> None:
+        """Bind the push socket and start the publisher thread."""
+        if self._running:
+            return
+        socket_dir = os.path.dirname(self.socket_path)
+        if socket_dir:
+            os.makedirs(socket_dir, mode=0o755, exist_ok=True)
+        try:
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+        except OSError as e:
+            logger.warning(f"Could not remove existing socket file {self.socket_path}: {e}")
+
+        self._server_sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server_sock.bind(self.socket_path)
+        self._server_sock.listen(5)
+        self._server_sock.setblocking(False)
+        try:
+            os.chmod(self.socket_path, 0o660)
+        except OSError as e:
+            logger.warning(f"Could not set socket permissions: {e}")
+
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="tower-buffer-push", daemon=True)
+        self._thread.start()
+        logger.info(
+            f"Buffer telemetry push listening on {self.socket_path} "
+            f"(interval={self.interval_sec * 1000:.0f}ms, heartbeat={self.heartbeat_sec * 1000:.0f}ms)"
+        )
+
+    def stop(self) -> None:
+        """Stop the publisher, disconnect subscribers and remove the socket. Idempotent."""
+        if not self._running:
+            return
+        self._running = False
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+        self._thread = None
+        for sock in self._subscribers:
+            self._close(sock)
+        self._subscribers = []
+        if self._server_sock:
+            self._close(self._server_sock)
+            self._server_sock = None
+        try:
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+        except OSError:
+            pass
+        logger.info("Buffer telemetry push stopped")
+
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def get_stats(self) -> dict:
+        return {
+            "subscribers": len(self._subscribers),
+            "samples_sent": self.samples_sent,
+            "samples_dropped": self.samples_dropped,
+            "seq": self._seq,
+        }
+
+    def publish_once(self, force: bool = False) -> bool:
+        """
+        Send a sample if the buffer changed or the heartbeat is due (or force).
+
+        Returns True if a sample was taken and offered to subscribers.
+        """
+        stats = self.buffer.stats()
+        state = (stats.capacity, stats.count, stats.overflow_count)
+        now = time.monotonic()
+        if not force and state == self._last_state and now - self._last_sent_at < self.heartbeat_sec:
+            return False
+        self._last_state = state
+        self._last_sent_at = now
+        self._seq += 1
+        record = pack_sample(self._seq, now, *state)
+        for sock in list(self._subscribers):
+            try:
+                sent = sock.send(record)
+            except BlockingIOError:
+                # Subscriber is not reading: drop this sample for it only
+                self.samples_dropped += 1
+                continue
+            except OSError:
+                self._drop_subscriber(sock)
+                continue
+            if sent != len(record):
+                # A torn record would desynchronize the stream; make it reconnect
+                self._drop_subscriber(sock)
+                continue
+            self.samples_sent += 1
+        return True
+
+    def _run(self) -> None:
+        next_tick = time.monotonic()
+        while self._running:
+            try:
+                timeout = max(0.0, next_tick - time.monotonic())
+                readable, _, _ = select.select([self._server_sock] + self._subscribers, [], [], timeout)
+                for sock in readable:
+                    if sock is self._server_sock:
+                        self._accept()
+                    else:
+                        self._read_subscriber(sock)
+                if time.monotonic() >= next_tick:
+                    self.publish_once()
+                    next_tick = max(next_tick + self.interval_sec, time.monotonic())
+            except (OSError, ValueError) as e:
+                # Socket closed during shutdown
+                if self._running:
+                    logger.debug(f"Buffer telemetry push error: {e}")
+                    time.sleep(self.interval_sec)
+            except Exception as e:
+                if self._running:
+                    logger.warning(f"Unexpected error in buffer telemetry push: {e}")
+                    time.sleep(self.interval_sec)
+
+    def _accept(self) -> None:
+        try:
+            client_sock, _ = self._server_sock.accept()
+        except BlockingIOError:
+            return
+        client_sock.setblocking(False)
+        self._subscribers.append(client_sock)
+        logger.info(f"Buffer telemetry subscriber connected ({len(self._subscribers)} total)")
+        # New subscribers get the current state immediately rather than at the next change
+        self.publish_once(force=True)
+
+    def _read_subscriber(self, sock: socket.socket) -> None:
+        # Subscribers never send; readable means EOF or error
+        try:
+            data = sock.recv(64)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+        if not data:
+            self._drop_subscriber(sock)
+
+    def _drop_subscriber(self, sock: socket.socket) -> None:
+        if sock in self._subscribers:
+            self._subscribers.remove(sock)
+            logger.info(f"Buffer telemetry subscriber disconnected ({len(self._subscribers)} remaining)")
+        self._close(sock)
+
+    @staticmethod
+    def _close(sock: socket.socket) -> None:
+        try:
+            sock.close()
+        except Exception:
+            pass
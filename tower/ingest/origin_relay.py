@@ -0,0 +1,401 @@
+"""
+Relay (edge) mode: source MP3 from an upstream ("origin") Tower.
+
+A relay Tower takes audio that is already encoded, instead of Station PCM. It
+reads the origin's /stream and hands whole MP3 frames to its own
+HTTPServer.broadcast. PCMIngestor, AudioPump and FFmpegSupervisor never
+start. Listeners can then be spread across several Towers while one Station
+and one encoder feed them all.
+
+OriginRelay runs two threads:
+- "tower-relay-stream": GET /stream from the origin, MP3Framer re-establishes
+  frame boundaries (TCP reads split frames), each whole frame is broadcast
+  locally. Reconnects on EOF, socket error or stream_idle_sec without audio.
+- "tower-relay-events": GET /tower/events/sse from the origin. Each event is
+  re-published through the local ingest path, so it is validated and updates
+  the shutdown state exactly like an event a Station posts (T-EVENTS7,
+  T-EVENTS5), then reaches history, now-playing and WS/SSE fan-out. Events
+  failing validation are counted in events_rejected and dropped. Reconnects
+  resume with Last-Event-ID, so events the origin still retains are not lost
+  across a reconnect. Relayed events get the relay's own seq,
+  tower_received_at and event_id; event_type, timestamp and metadata are the
+  origin's.
+
+Both reconnect with exponential backoff and jitter (backoff_initial_sec
+doubling up to backoff_max_sec). A 503 from the origin's admission control
+is honoured: the relay waits at least the Retry-After it was given.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import random
+import socket
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from tower.audio.mp3_framer import MP3Framer
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ORIGIN_PORT = 8005
+DEFAULT_RELAY_CONNECT_TIMEOUT_SEC = 5.0
+# No MP3 bytes from the origin for this long means the stream is dead
+DEFAULT_RELAY_STREAM_IDLE_SEC = 5.0
+# The origin sends an SSE heartbeat every TOWER_SSE_HEARTBEAT_SEC (15s)
+DEFAULT_RELAY_EVENTS_IDLE_SEC = 45.0
+DEFAULT_RELAY_BACKOFF_INITIAL_SEC = 0.5
+DEFAULT_RELAY_BACKOFF_MAX_SEC = 30.0
+RELAY_READ_SIZE = 16384
+MAX_RESPONSE_HEAD_BYTES = 16384
+
+
+def parse_origin(value: str) -> Tuple[str, int]:
+    """Parse TOWER_RELAY_ORIGIN ("host" or "host:port") into (host, port)."""
+    host, sep, port = value.strip().rpartition(":")
+    if not sep:
+        return port, DEFAULT_ORIGIN_PORT
+    return host.strip("[]"), int(port)
+
+
+class _Backoff:
+    """Exponential backoff with jitter: the n-th delay is uniform in [d/2, d], d = initial * 2**n, capped."""
+
+    def __init__(self, initial_sec: float, max_sec: float):
+        self.initial_sec = initial_sec
+        self.max_sec = max_sec
+        self.attempt = 0
+
+    def next_delay(self, floor_sec: float = 0.0) -> float:
+        delay = min(self.max_sec, self.initial_sec * (2 ** min(self.attempt, 16)))
+        self.attempt += 1
+        return max(floor_sec, random.uniform(delay / 2.0, delay))
+
+    def reset(self) -> None:
+        self.attempt = 0
+
+
+class _OriginResponse:
+    """Status and headers of an origin response; body holds bytes read past the header."""
+
+    def __init__(self, status: int, headers: Dict[str, str], body: bytes):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    def retry_after(self) -> float:
+        try:
+            return max(0.0, float(self.headers.get("retry-after", "0")))
+        except ValueError:
+            return 0.0
+
+
+class OriginRelay:
+    """
+    Feeds a local HTTPServer from an origin Tower's /stream and event stream.
+
+    Usage:
+        relay = OriginRelay("origin.local", 8005, http_server)
+        relay.start()
+        relay.stop()
+    """
+
+    def __init__(
+        self,
+        origin_host: str,
+        origin_port: int,
+        http_server,
+        relay_events: bool = True,
+        connect_timeout_sec: float = DEFAULT_RELAY_CONNECT_TIMEOUT_SEC,
+        stream_idle_sec: float = DEFAULT_RELAY_STREAM_IDLE_SEC,
+        events_idle_sec: float = DEFAULT_RELAY_EVENTS_IDLE_SEC,
+        backoff_initial_sec: float = DEFAULT_RELAY_BACKOFF_INITIAL_SEC,
+        backoff_max_sec: float = DEFAULT_RELAY_BACKOFF_MAX_SEC,
+    ):
+        """
+        Args:
+            origin_host: Origin Tower host
+            origin_port: Origin Tower HTTP port (its TOWER_PORT)
+            http_server: Local HTTPServer; receives broadcast(frame) and relayed events
+            relay_events: Also subscribe to the origin's events (now-playing etc.)
+            connect_timeout_sec: TCP connect and response header timeout
+            stream_idle_sec: Reconnect /stream after this long without MP3 bytes
+            events_idle_sec: Reconnect the event stream after this long without data or heartbeat
+            backoff_initial_sec: First reconnect delay
+            backoff_max_sec: Longest reconnect delay
+        """
+        self.origin_host = origin_host
+        self.origin_port = origin_port
+        self.http_server = http_server
+        self.relay_events = relay_events
+        self.connect_timeout_sec = connect_timeout_sec
+        self.stream_idle_sec = stream_idle_sec
+        self.events_idle_sec = events_idle_sec
+        self.backoff_initial_sec = backoff_initial_sec
+        self.backoff_max_sec = backoff_max_sec
+
+        self._stop_event = threading.Event()
+        self._threads: list = []
+        self._sockets_lock = threading.Lock()
+        self._open_sockets: set = set()
+        self._framer = MP3Framer()
+
+        self.stream_state = "stopped"
+        self.stream_connects = 0
+        self.stream_failures = 0
+        self.origin_rejections = 0
+        self.frames_relayed = 0
+        self.bytes_relayed = 0
+        self._last_frame_at: Optional[float] = None
+
+        self.events_state = "stopped" if relay_events else "disabled"
+        self.events_connects = 0
+        self.events_failures = 0
+        self.events_relayed = 0
+        self.events_rejected = 0
+        self.last_event_id: Optional[int] = None
+
+    def start(self) -> None:
+        """Start the stream (and event) relay threads."""
+        self._stop_event.clear()
+        targets = [("tower-relay-stream", self._run_stream)]
+        if self.relay_events:
+            targets.append(("tower-relay-events", self._run_events))
+        self._threads = [threading.Thread(target=t, name=name, daemon=True) for name, t in targets]
+        for thread in self._threads:
+            thread.start()
+        logger.info(f"Relaying from origin Tower {self.origin_host}:{self.origin_port}")
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Stop relaying: close origin connections and join the threads."""
+        self._stop_event.set()
+        with self._sockets_lock:
+            for sock in self._open_sockets:
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+            if thread.is_alive():
+                logger.warning(f"{thread.name} did not stop within timeout")
+        self._threads = []
+        self.stream_state = "stopped"
+        if self.relay_events:
+            self.events_state = "stopped"
+        logger.info("Origin relay stopped")
+
+    def stats(self) -> Dict[str, Any]:
+        last_frame_at = self._last_frame_at
+        return {
+            "origin": f"{self.origin_host}:{self.origin_port}",
+            "stream_state": self.stream_state,
+            "stream_connects": self.stream_connects,
+            "stream_failures": self.stream_failures,
+            "origin_rejections": self.origin_rejections,
+            "frames_relayed": self.frames_relayed,
+            "bytes_relayed": self.bytes_relayed,
+            "discarded_bytes": self._framer.discarded_bytes,
+            "last_frame_age_sec": (
+                round(time.monotonic() - last_frame_at, 3) if last_frame_at is not None else None
+            ),
+            "events_state": self.events_state,
+            "events_connects": self.events_connects,
+            "events_failures": self.events_failures,
+            "events_relayed": self.events_relayed,
+            "events_rejected": self.events_rejected,
+            "last_event_id": self.last_event_id,
+        }
+
+    # --- origin connections ---
+
+    def _connect(self, path: str, headers: Dict[str, str]) -> Tuple[socket.socket, _OriginResponse]:
+        """Send GET path to the origin and read the response head. Raises OSError on failure."""
+        sock = socket.create_connection((self.origin_host, self.origin_port), timeout=self.connect_timeout_sec)
+        with self._sockets_lock:
+            self._open_sockets.add(sock)
+        try:
+            lines = [f"GET {path} HTTP/1.1", f"Host: {self.origin_host}:{self.origin_port}",
+                     "User-Agent: retrowaves-tower-relay"]
+            lines += [f"{name}: {value}" for name, value in headers.items()]
+            sock.sendall(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+            data = b""
+            while b"\r\n\r\n" not in data:
+                if len(data) > MAX_RESPONSE_HEAD_BYTES:
+                    raise OSError("response header too large")
+                chunk = sock.recv(4096)
+                if not chunk:
+                    raise OSError("origin closed the connection before responding")
+                data += chunk
+            head, _, body = data.partition(b"\r\n\r\n")
+            head_lines = head.decode("latin-1").split("\r\n")
+            try:
+                status = int(head_lines[0].split()[1])
+            except (IndexError, ValueError):
+                raise OSError(f"malformed status line: {head_lines[0]!r}")
+            response_headers = {}
+            for line in head_lines[1:]:
+                name, sep, value = line.partition(":")
+                if sep:
+                    response_headers[name.strip().lower()] = value.strip()
+            return sock, _OriginResponse(status, response_headers, body)
+        except BaseException:
+            self._close(sock)
+            raise
+
+    def _close(self, sock: socket.socket) -> None:
+        with self._sockets_lock:
+            self._open_sockets.discard(sock)
+        try:
+            sock.close()
+        except OSError:
+            pass
+
+    def _reconnect_loop(self, name: str, path: str, headers_fn, relay_fn) -> None:
+        """
+        Connect, relay until the connection ends, back off, repeat until stop().
+
+        relay_fn(sock, response, backoff) runs while connected and resets the
+        backoff once data is flowing. Failures and rejections only grow it.
+        """
+        backoff = _Backoff(self.backoff_initial_sec, self.backoff_max_sec)
+        while not self._stop_event.is_set():
+            floor_sec = 0.0
+            self._set_state(name, "connecting")
+            try:
+                sock, response = self._connect(path, headers_fn())
+            except OSError as e:
+                self._count_failure(name)
+                reason = f"connect failed: {e}"
+            else:
+                try:
+                    if response.status == 200:
+                        self._set_state(name, "connected")
+                        reason = relay_fn(sock, response, backoff)
+                    else:
+                        if response.status == 503:
+                            self.origin_rejections += 1
+                            floor_sec = response.retry_after()
+                        self._count_failure(name)
+                        reason = f"origin answered {response.status}"
+                except OSError as e:
+                    reason = f"connection lost: {e}"
+                finally:
+                    self._close(sock)
+            if self._stop_event.is_set():
+                break
+            delay = backoff.next_delay(floor_sec)
+            self._set_state(name, "backoff")
+            logger.warning(f"Relay {name} from {self.origin_host}:{self.origin_port}: {reason}; retrying in {delay:.1f}s")
+            self._stop_event.wait(delay)
+
+    def _set_state(self, name: str, state: str) -> None:
+        if name == "stream":
+            self.stream_state = state
+        else:
+            self.events_state = state
+
+    def _count_failure(self, name: str) -> None:
+        if name == "stream":
+            self.stream_failures += 1
+        else:
+            self.events_failures += 1
+
+    # --- /stream ---
+
+    def _run_stream(self) -> None:
+        self._reconnect_loop("stream", "/stream", lambda: {}, self._relay_stream)
+
+    def _relay_stream(self, sock: socket.socket, response: _OriginResponse, backoff: _Backoff) -> str:
+        """Broadcast whole MP3 frames from an open origin /stream; returns why it ended."""
+        self.stream_connects += 1
+        # A partial frame from the previous connection can never be completed
+        self._framer.reset()
+        sock.settimeout(self.stream_idle_sec)
+        data = response.body
+        while not self._stop_event.is_set():
+            if data:
+                frames = self._framer.feed(data)
+                if frames:
+                    backoff.reset()
+                    self._last_frame_at = time.monotonic()
+                    for frame in frames:
+                        self.http_server.broadcast(frame)
+                        self.bytes_relayed += len(frame)
+                    self.frames_relayed += len(frames)
+            try:
+                data = sock.recv(RELAY_READ_SIZE)
+            except socket.timeout:
+                return f"no audio for {self.stream_idle_sec:.1f}s"
+            if not data:
+                return "origin closed the stream"
+        return "stopped"
+
+    # --- /tower/events/sse ---
+
+    def _run_events(self) -> None:
+        self._reconnect_loop("events", "/tower/events/sse", self._events_headers, self._relay_events)
+
+    def _events_headers(self) -> Dict[str, str]:
+        headers = {"Accept": "text/event-stream"}
+        if self.last_event_id is not None:
+            headers["Last-Event-ID"] = str(self.last_event_id)
+        return headers
+
+    def _relay_events(self, sock: socket.socket, response: _OriginResponse, backoff: _Backoff) -> str:
+        """Re-publish origin SSE events locally; returns why the stream ended."""
+        self.events_connects += 1
+        sock.settimeout(self.events_idle_sec)
+        buf = bytearray(response.body)
+        while not self._stop_event.is_set():
+            events = []
+            while True:
+                end = buf.find(b"\n\n")
+                if end < 0:
+                    break
+                message = bytes(buf[:end])
+                del buf[:end + 2]
+                event = self._parse_sse_message(message)
+                if event is not None:
+                    events.append(event)
+            if events:
+                backoff.reset()
+                # Same validation and shutdown-state handling as local ingest
+                accepted, rejected = self.http_server._ingest_events(events)
+                self.events_relayed += accepted
+                self.events_rejected += rejected
+            try:
+                data = sock.recv(RELAY_READ_SIZE)
+            except socket.timeout:
+                return f"no events or heartbeat for {self.events_idle_sec:.1f}s"
+            if not data:
+                return "origin closed the event stream"
+            buf.extend(data)
+        return "stopped"
+
+    def _parse_sse_message(self, message: bytes) -> Optional[Dict[str, Any]]:
+        """Parse one SSE message into an ingest event dict; comments/heartbeats give None."""
+        data_lines = []
+        for line in message.split(b"\n"):
+            if line.startswith(b"id:"):
+                try:
+                    self.last_event_id = int(line[3:].strip())
+                except ValueError:
+                    pass
+            elif line.startswith(b"data:"):
+                data_lines.append(line[5:].strip())
+        if not data_lines:
+            return None
+        try:
+            event = json.loads(b"\n".join(data_lines))
+            return {
+                "event_type": event["event_type"],
+                "timestamp": event.get("timestamp"),
+                "metadata": event.get("metadata") or {},
+            }
+        except (ValueError, KeyError, TypeError) as e:
+            logger.debug(f"Ignoring malformed event from origin: {e}")
+            self.events_rejected += 1
+            return None
@@ -8,11 +8,31 @@ from typing import Optional, Dict, Any
 
 from tower.encoder.encoder_manager import EncoderManager, EncoderState
 from tower.encoder.ffmpeg_supervisor import SupervisorState
+from tower.audio.mp3_archive import (
+    DEFAULT_ARCHIVE_MAX_AGE_SEC,
+    DEFAULT_ARCHIVE_MAX_BYTES,
+    DEFAULT_ARCHIVE_SEGMENT_SEC,
+    MP3Archive,
+)
 from tower.audio.ring_buffer import FrameRingBuffer
 from tower.audio.input_router import AudioInputRouter
 from tower.encoder.audio_pump import AudioPump
 from tower.fallback.generator import FallbackGenerator
+from tower.http.admission import (
+    DEFAULT_ADMIT_BURST,
+    DEFAULT_ADMIT_QUEUE_SIZE,
+    DEFAULT_ADMIT_RATE_PER_SEC,
+    DEFAULT_MAX_LATENESS_MS,
+    AdmissionController,
+)
+from tower.http.control_server import DEFAULT_CONTROL_WORKERS, ControlPlaneServer
 from tower.http.server import HTTPServer
+from tower.ingest.buffer_push import (
+    DEFAULT_PUSH_INTERVAL_SEC,
+    BufferTelemetryPublisher,
+    default_push_socket_path,
+)
+from tower.ingest.origin_relay import OriginRelay, parse_origin
 from tower.ingest.pcm_ingestor import PCMIngestor
 from tower.ingest.transport import UnixSocketIngestTransport
 
@@ -109,6 +129,42 @@ class TowerService:
             buffer_stats_provider=self.pcm_buffer  # PCM buffer has .stats() method
         )
         
+        # Gate new /stream listeners so a reconnect storm cannot starve AudioPump:
+        # token bucket + short wait queue, halted while ticks run late.
+        # TOWER_STREAM_ADMIT_RATE=0 disables admission control
+        admit_rate = float(os.getenv("TOWER_STREAM_ADMIT_RATE", str(DEFAULT_ADMIT_RATE_PER_SEC)))
+        if admit_rate > 0:
+            self.http_server.admission = AdmissionController(
+                rate_per_sec=admit_rate,
+                burst=int(os.getenv("TOWER_STREAM_ADMIT_BURST", str(DEFAULT_ADMIT_BURST))),
+                queue_size=int(os.getenv("TOWER_STREAM_ADMIT_QUEUE", str(DEFAULT_ADMIT_QUEUE_SIZE))),
+                overload_signal=self.audio_pump.tick_lateness_ms,
+                max_lateness_ms=float(os.getenv("TOWER_STREAM_MAX_LATENESS_MS", str(DEFAULT_MAX_LATENESS_MS))),
+            )
+        
+        # Disk archive of the broadcast stream (compliance recording, /stream?start=<epoch>);
+        # TOWER_ARCHIVE_DIR unset disables it
+        archive_dir = os.getenv("TOWER_ARCHIVE_DIR", "").strip()
+        if archive_dir:
+            self.http_server.archive = MP3Archive(
+                archive_dir,
+                segment_sec=int(os.getenv("TOWER_ARCHIVE_SEGMENT_SEC", str(DEFAULT_ARCHIVE_SEGMENT_SEC))),
+                max_bytes=int(float(os.getenv("TOWER_ARCHIVE_MAX_MB", str(DEFAULT_ARCHIVE_MAX_BYTES / 1024 ** 2))) * 1024 ** 2),
+                max_age_sec=float(os.getenv("TOWER_ARCHIVE_MAX_AGE_HOURS", str(DEFAULT_ARCHIVE_MAX_AGE_SEC / 3600))) * 3600,
+            )
+        
+        # Keep-alive control-plane listener for /tower/buffer and event ingest, on a
+        # fixed worker pool and its own port; TOWER_CONTROL_PORT unset or 0 disables it
+        self.control_server: Optional[ControlPlaneServer] = None
+        control_port = int(os.getenv("TOWER_CONTROL_PORT", "0") or 0)
+        if control_port > 0:
+            self.control_server = ControlPlaneServer(
+                self.http_server.handle_control_request,
+                host=os.getenv("TOWER_CONTROL_HOST", http_host),
+                port=control_port,
+                workers=int(os.getenv("TOWER_CONTROL_WORKERS", str(DEFAULT_CONTROL_WORKERS))),
+            )
+        
         # Set station shutdown check callback in encoder_manager per contract T-EVENTS5 exception
         # This allows encoder_manager to suppress PCM loss warnings when station is shutting down
         self.encoder._station_shutdown_check = lambda: self.http_server.event_buffer.is_station_shutting_down()
@@ -123,17 +179,54 @@ class TowerService:
             transport=transport
         )
         
+        # Relay (edge) mode: TOWER_RELAY_ORIGIN=host:port sources already-encoded MP3
+        # and events from an origin Tower; PCM ingest, AudioPump and the encoder stay idle
+        self.relay: Optional[OriginRelay] = None
+        relay_origin = os.getenv("TOWER_RELAY_ORIGIN", "").strip()
+        if relay_origin:
+            origin_host, origin_port = parse_origin(relay_origin)
+            self.relay = OriginRelay(origin_host, origin_port, self.http_server)
+        
+        # Push upstream buffer depth to subscribed providers (I58/I62) so they
+        # need not poll /tower/buffer; TOWER_BUFFER_PUSH_INTERVAL_MS=0 disables it
+        self.buffer_push: Optional[BufferTelemetryPublisher] = None
+        push_ms = float(os.getenv("TOWER_BUFFER_PUSH_INTERVAL_MS", str(DEFAULT_PUSH_INTERVAL_SEC * 1000)))
+        if push_ms > 0 and self.relay is None:
+            push_socket_path = os.getenv("TOWER_BUFFER_PUSH_SOCKET_PATH") or default_push_socket_path(socket_path)
+            self.buffer_push = BufferTelemetryPublisher(
+                self.pcm_buffer, push_socket_path, interval_sec=push_ms / 1000.0
+            )
+        
         self.running = False
 
     def start(self):
-        """Start encoder + HTTP server threads."""
+        """
+        Start encoder + HTTP server threads.
+        
+        In relay mode only the listeners and the origin relay start, and this
+        returns once they are running (frames arrive on the relay's threads).
+        """
         logger.info("=== Tower starting ===")
         
+        if self.relay is not None:
+            self._start_listeners()
+            self.relay.start()
+            self.running = True
+            return
+        
         # Start PCM Ingestion (before AudioPump per contract I51)
         # Per contract I51: PCM Ingestion MUST be ready before AudioPump begins ticking
         self.pcm_ingestor.start()
         logger.info("PCM Ingestion started")
         
+        if self.buffer_push:
+            try:
+                self.buffer_push.start()
+            except OSError as e:
+                # Providers fall back to polling /tower/buffer
+                logger.warning(f"Buffer telemetry push unavailable: {e}")
+                self.buffer_push = None
+        
         # Start encoder (this also starts the drain thread internally)
         # Per contract [I7.1]: EncoderManager MAY start before AudioPump, but system MUST feed
         # initial silence per [S19] step 4, and AudioPump MUST begin ticking within ≤1 grace period.
@@ -153,12 +246,32 @@ class TowerService:
         # So we just log that it's started as part of encoder startup
         logger.info("EncoderOutputDrain started")
         
+        self._start_listeners()
+        
+        self.running = True
+        self.main_loop()
+
+    def _start_listeners(self):
+        """Start the archive, the HTTP server thread and, if configured, the control-plane listener."""
+        if self.http_server.archive:
+            try:
+                self.http_server.archive.start()
+            except OSError as e:
+                # Broadcast continues unrecorded; /stream?start= answers 404
+                logger.warning(f"MP3 archive unavailable: {e}")
+                self.http_server.archive = None
+        
         # Start HTTP server (in daemon thread)
         threading.Thread(target=self.http_server.serve_forever, daemon=True).start()
         logger.info("HTTP server listening")
         
-        self.running = True
-        self.main_loop()
+        if self.control_server:
+            try:
+                self.control_server.start()
+            except OSError as e:
+                # Control traffic stays on the main listener
+                logger.warning(f"Control-plane listener unavailable: {e}")
+                self.control_server = None
 
     def main_loop(self):
         """
@@ -215,6 +328,7 @@ class TowerService:
         - "RESTART_RECOVERY" [O5]: Encoder restart in progress
         - "OFFLINE_TEST_MODE" [O6]: Testing mode - FFmpeg encoder is disabled
         - "DEGRADED" [O7]: Maximum restart attempts reached - encoder has failed permanently
+        - "RELAY": MP3 is relayed from an origin Tower (TOWER_RELAY_ORIGIN); no local encoder
         
         Returns:
             str: Current operational mode name
@@ -223,6 +337,9 @@ class TowerService:
         # Per contract [I22], TowerService is the root owner of operational mode state
         # Per contract [S27], SupervisorState maps to Operational Modes
         
+        if self.relay is not None:
+            return "RELAY"
+        
         if not self.encoder._encoder_enabled:
             return "OFFLINE_TEST_MODE"
         
@@ -269,7 +386,7 @@ class TowerService:
         # Get buffer stats
         mp3_stats = self.mp3_buffer.stats()
         
-        return {
+        state = {
             "mode": mode,
             "fps": fps,
             "fallback": mode in ("FALLBACK", "BOOTING", "RESTART_RECOVERY", "DEGRADED", "OFFLINE_TEST_MODE"),
@@ -278,6 +395,9 @@ class TowerService:
             "mp3_buffer_capacity": mp3_stats.capacity,
             "mp3_buffer_overflow_count": mp3_stats.overflow_count,
         }
+        if self.relay is not None:
+            state["relay"] = self.relay.stats()
+        return state
     
     def stop(self):
         """
@@ -297,6 +417,10 @@ class TowerService:
         # This stops the main_loop() which is running in the current thread
         self.running = False
         
+        if self.relay is not None:
+            logger.info(f"Origin relay: {self.relay.stats()}")
+            self.relay.stop()
+        
         # Per contract [I27] #1: Stop AudioPump (metronome halts)
         self.audio_pump.stop()
         
@@ -312,6 +436,8 @@ class TowerService:
         
         # Per contract I53: Stop PCM Ingestion gracefully
         self.pcm_ingestor.stop()
+        if self.buffer_push:
+            self.buffer_push.stop()
         
         # Per contract [I27] #3: Stop HTTP server (close client sockets)
         # HTTPServer now owns client management directly
@@ -325,7 +451,14 @@ class TowerService:
         # Per contract [I27] #4: Wait for all threads to exit (join)
         # HTTP server runs in daemon thread, so it will terminate when main thread exits
         # But we explicitly stop it to close the socket
+        logger.info(f"Stream admission: {self.http_server.get_admission_stats()}")
+        if self.control_server:
+            logger.info(f"Control-plane listener: {self.control_server.stats()}")
+            self.control_server.stop()
         self.http_server.stop()
+        if self.http_server.archive:
+            logger.info(f"MP3 archive: {self.http_server.get_archive_stats()}")
+            self.http_server.archive.stop()
         
         # Per contract [I27] #5: Return only after a fully quiescent system state
         # Verify no critical threads are still running
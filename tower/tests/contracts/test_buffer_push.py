@@ -0,0 +1,104 @@
+"""
+Contract tests for the upstream buffer push channel (NEW_PCM_INGEST_CONTRACT I58).
+
+Tower pushes fixed-size buffer samples to subscribers on a Unix socket, on
+every change and on a heartbeat, without ever blocking on a slow subscriber.
+"""
+
+import socket
+import time
+
+import pytest
+
+from tower.audio.ring_buffer import FrameRingBuffer
+from tower.ingest.buffer_push import (
+    SAMPLE_MAGIC,
+    SAMPLE_STRUCT,
+    BufferTelemetryPublisher,
+    default_push_socket_path,
+)
+
+FRAME = b"\x00" * 4096
+
+
+@pytest.fixture
+def publisher(tmp_path):
+    buffer = FrameRingBuffer(capacity=8, expected_frame_size=4096)
+    pub = BufferTelemetryPublisher(buffer, str(tmp_path / "pcm-buffer.sock"), interval_sec=0.005, heartbeat_sec=0.2)
+    pub.start()
+    yield buffer, pub
+    pub.stop()
+
+
+def _subscribe(pub):
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.connect(pub.socket_path)
+    sock.settimeout(2.0)
+    return sock
+
+
+def _read_sample(sock):
+    data = b""
+    while len(data) < SAMPLE_STRUCT.size:
+        data += sock.recv(SAMPLE_STRUCT.size - len(data))
+    magic, seq, sent_at, capacity, count, overflow = SAMPLE_STRUCT.unpack(data)
+    assert magic == SAMPLE_MAGIC
+    return seq, sent_at, capacity, count, overflow
+
+
+def test_socket_path_derived_from_pcm_socket():
+    assert default_push_socket_path("/run/retrowaves/pcm.sock") == "/run/retrowaves/pcm-buffer.sock"
+
+
+def test_subscriber_gets_current_state_then_changes(publisher):
+    buffer, pub = publisher
+    buffer.push_frame(FRAME)
+    sock = _subscribe(pub)
+    try:
+        seq, sent_at, capacity, count, overflow = _read_sample(sock)
+        assert (capacity, count, overflow) == (8, 1, 0)
+        assert sent_at <= time.monotonic()
+        buffer.push_frame(FRAME)
+        next_seq, _, _, count, _ = _read_sample(sock)
+        assert next_seq == seq + 1 and count == 2
+    finally:
+        sock.close()
+
+
+def test_heartbeat_without_changes(publisher):
+    _, pub = publisher
+    sock = _subscribe(pub)
+    try:
+        first = _read_sample(sock)
+        second = _read_sample(sock)  # nothing changed: arrives on the heartbeat
+        assert second[0] == first[0] + 1
+        assert second[1] - first[1] >= pub.heartbeat_sec * 0.9
+    finally:
+        sock.close()
+
+
+def test_stalled_subscriber_never_blocks_publisher(publisher):
+    buffer, pub = publisher
+    stalled = _subscribe(pub)
+    try:
+        # Far more samples than the socket buffer holds, none of them read
+        started = time.monotonic()
+        for i in range(20000):
+            buffer.push_frame(FRAME) if i % 2 else buffer.pop_frame()
+            pub.publish_once(force=True)
+        assert time.monotonic() - started < 5.0
+        assert pub.samples_dropped > 0
+    finally:
+        stalled.close()
+
+
+def test_disconnected_subscriber_is_removed(publisher):
+    _, pub = publisher
+    sock = _subscribe(pub)
+    _read_sample(sock)
+    assert pub.subscriber_count() == 1
+    sock.close()
+    deadline = time.monotonic() + 2.0
+    while pub.subscriber_count() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert pub.subscriber_count() == 0
@@ -0,0 +1,127 @@
+"""
+Contract tests for the keep-alive control-plane listener (NEW_TOWER_RUNTIME_CONTRACT
+T-BUF, T-EVENTS1 control-plane MAY): incremental parsing, keep-alive and
+in-order pipelined responses, served by a fixed worker pool.
+"""
+
+import json
+import socket
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from tower.http.control_server import ControlPlaneServer, parse_request
+from tower.http.server import HTTPServer
+
+
+class _Buffer:
+    def stats(self):
+        return SimpleNamespace(capacity=100, count=25, overflow_count=3)
+
+
+@pytest.fixture
+def control():
+    http_server = HTTPServer(host="127.0.0.1", port=0, frame_source=None, buffer_stats_provider=_Buffer())
+    server = ControlPlaneServer(http_server.handle_control_request, "127.0.0.1", 0, workers=2, idle_timeout_sec=0.5)
+    server.start()
+    yield server, http_server
+    server.stop()
+
+
+def _request_bytes(method, path, body=None, close=False):
+    payload = json.dumps(body).encode() if body is not None else b""
+    connection = "Connection: close\r\n" if close else ""
+    return (f"{method} {path} HTTP/1.1\r\nHost: tower\r\n{connection}"
+            f"Content-Length: {len(payload)}\r\n\r\n").encode() + payload
+
+
+def _read_responses(sock, count):
+    """Read count Content-Length framed responses; returns [(status, headers, body)]."""
+    data = b""
+    responses = []
+    while len(responses) < count:
+        while b"\r\n\r\n" not in data:
+            chunk = sock.recv(65536)
+            if not chunk:
+                return responses
+            data += chunk
+        head, _, data = data.partition(b"\r\n\r\n")
+        lines = head.decode().split("\r\n")
+        headers = {k.strip().lower(): v.strip() for k, v in (line.split(":", 1) for line in lines[1:])}
+        length = int(headers["content-length"])
+        while len(data) < length:
+            data += sock.recv(65536)
+        responses.append((int(lines[0].split()[1]), headers, data[:length]))
+        data = data[length:]
+    return responses
+
+
+def test_parser_is_incremental():
+    raw = _request_bytes("POST", "/tower/events/ingest/batch", {"events": []}) + _request_bytes("GET", "/tower/buffer")
+    buf = bytearray()
+    for byte in raw[:-1]:
+        buf.append(byte)
+        parsed = parse_request(buf)
+        if parsed:
+            request, consumed = parsed
+            assert (request.method, json.loads(request.body)) == ("POST", {"events": []})
+            del buf[:consumed]
+    assert parse_request(buf) is None  # second request still one byte short
+    buf.append(raw[-1])
+    request, consumed = parse_request(buf)
+    assert (request.method, request.path, consumed) == ("GET", "/tower/buffer", len(buf))
+
+
+def test_pipelined_requests_are_answered_in_order_on_one_connection(control):
+    server, http_server = control
+    event = {"event_type": "song_playing", "timestamp": 1.0, "metadata": {}}
+    sock = socket.create_connection(("127.0.0.1", server.bound_port), timeout=2.0)
+    try:
+        sock.sendall(
+            _request_bytes("GET", "/tower/buffer")
+            + _request_bytes("POST", "/tower/events/ingest/batch", {"events": [event, {"event_type": "now_playing"}]})
+            + _request_bytes("POST", "/tower/events/ingest", event)
+            + _request_bytes("GET", "/stream")
+        )
+        (s1, h1, b1), (s2, _, b2), (s3, _, _), (s4, _, _) = _read_responses(sock, 4)
+        assert (s1, json.loads(b1)) == (200, {"capacity": 100, "count": 25, "overflow_count": 3, "ratio": 0.25})
+        assert h1["connection"] == "keep-alive"
+        assert (s2, json.loads(b2)) == (200, {"accepted": 1, "rejected": 1})
+        assert (s3, s4) == (204, 404)
+        assert http_server.get_event_history_stats()["latest_seq"] == 2
+        # Same connection still serves requests
+        sock.sendall(_request_bytes("GET", "/tower/buffer", close=True))
+        [(status, headers, _)] = _read_responses(sock, 1)
+        assert status == 200 and headers["connection"] == "close"
+        assert sock.recv(1) == b""
+    finally:
+        sock.close()
+    stats = server.stats()
+    assert stats["connections_accepted"] == 1 and stats["requests_served"] == 5
+
+
+def test_fixed_workers_malformed_requests_and_idle_close(control):
+    server, _ = control
+    threads_before = threading.active_count()
+    socks = [socket.create_connection(("127.0.0.1", server.bound_port), timeout=2.0) for _ in range(10)]
+    try:
+        for sock in socks:
+            sock.sendall(_request_bytes("GET", "/tower/buffer"))
+        for sock in socks:
+            assert _read_responses(sock, 1)[0][0] == 200
+        assert threading.active_count() == threads_before  # no thread per connection or request
+
+        socks[0].sendall(b"NONSENSE\r\n\r\n")
+        [(status, _, _)] = _read_responses(socks[0], 1)
+        assert status == 400 and server.stats()["parse_errors"] == 1
+
+        deadline = time.monotonic() + 3.0
+        while server.stats()["connections"] and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert server.stats()["connections"] == 0
+        assert socks[1].recv(1) == b""
+    finally:
+        for sock in socks:
+            sock.close()
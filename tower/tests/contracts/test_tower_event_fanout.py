@@ -0,0 +1,135 @@
+"""
+Contract tests for the WebSocket event fan-out stage (NEW_TOWER_RUNTIME_CONTRACT
+T-WS4, T-WS6, T-WS7): publishing never waits on clients, a stalled client is
+dropped without delaying the others, and delivery latency is exported.
+"""
+
+import json
+import socket
+import threading
+import time
+
+import pytest
+
+from tower.http.event_fanout import EventFanout
+from tower.http.websocket import create_close_frame, encode_websocket_frame
+
+
+@pytest.fixture
+def fanout():
+    fan = EventFanout(stall_timeout_sec=0.25)
+    fan.start()
+    yield fan
+    fan.stop()
+
+
+def _pair(fan, client_id, event_type_filter=None, sndbuf=None):
+    tower_end, client_end = socket.socketpair()
+    if sndbuf:
+        tower_end.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, sndbuf)
+    tower_end.settimeout(1.0)
+    fan.add_client(client_id, tower_end, event_type_filter)
+    client_end.settimeout(2.0)
+    return tower_end, client_end
+
+
+def _frame(event_type, size=0):
+    body = json.dumps({"event_type": event_type, "metadata": {"pad": "x" * size}}).encode()
+    return event_type, encode_websocket_frame(body, opcode=0x1)
+
+
+def _recv_exactly(sock, n):
+    data = b""
+    while len(data) < n:
+        chunk = sock.recv(n - len(data))
+        if not chunk:
+            break
+        data += chunk
+    return data
+
+
+def test_filter_groups_share_one_payload(fanout):
+    _, all_events = _pair(fanout, "all")
+    _, songs_only = _pair(fanout, "songs", event_type_filter="song_playing")
+    frames = [_frame("song_playing"), _frame("segment_playing")]
+    fanout.publish(frames)
+    expected_all = frames[0][1] + frames[1][1]
+    assert _recv_exactly(all_events, len(expected_all)) == expected_all
+    assert _recv_exactly(songs_only, len(frames[0][1])) == frames[0][1]
+
+
+def test_stalled_client_is_dropped_without_delaying_others(fanout):
+    stalled_tower, stalled = _pair(fanout, "stalled", sndbuf=4096)
+    _, good = _pair(fanout, "good")
+    frame = _frame("song_playing", size=16 * 1024)
+    received = 0
+    started = time.monotonic()
+    for _ in range(8):
+        publish_started = time.monotonic()
+        fanout.publish([frame])
+        assert time.monotonic() - publish_started < 0.01  # never waits on a client
+        received += len(_recv_exactly(good, len(frame[1])))
+    # The good client got every event while the stalled one was still connected
+    assert received == 8 * len(frame[1])
+    assert time.monotonic() - started < 0.5
+    deadline = time.monotonic() + 2.0
+    while fanout.has_client("stalled") and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not fanout.has_client("stalled") and fanout.has_client("good")
+    assert fanout.stats()["slow_consumers_dropped"] == 1
+    stalled.close()
+    stalled_tower.close()
+
+
+def test_control_frames_queue_behind_events_and_latency_is_exported(fanout):
+    _, client = _pair(fanout, "c")
+    event = _frame("song_playing")
+    pong = encode_websocket_frame(b"hi", opcode=0xA)
+    fanout.publish([event])
+    fanout.send_control("c", pong)
+    assert _recv_exactly(client, len(event[1]) + len(pong)) == event[1] + pong
+    latency = fanout.stats()["latency_ms"]
+    assert latency["p50"] is not None and latency["p99"] >= latency["p50"]
+
+
+def test_close_reply_follows_pending_event_data_and_ends_delivery():
+    fanout = EventFanout(stall_timeout_sec=2.0)
+    fanout.start()
+    try:
+        tower_end, client = _pair(fanout, "c", sndbuf=4096)
+        big = _frame("song_playing", size=64 * 1024)  # still being written when the close arrives
+        fanout.publish([big])
+        closer = threading.Thread(target=fanout.close_client, args=("c",))
+        closer.start()
+        deadline = time.monotonic() + 2.0
+        while fanout._clients["c"].close_written is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        fanout.publish([_frame("segment_playing")])  # after the close: never sent
+        received = _recv_exactly(client, len(big[1]) + len(create_close_frame()))
+        closer.join(timeout=2.0)
+    finally:
+        fanout.stop()
+    assert not closer.is_alive() and not fanout.has_client("c")
+    assert received == big[1] + create_close_frame()  # whole event frame, then the close frame
+    tower_end.close()
+    assert client.recv(4096) == b""
+
+
+def test_loop_error_is_logged_and_delivery_continues(fanout, monkeypatch):
+    _, client = _pair(fanout, "c")
+    real_fan_out = fanout._fan_out
+    failures = []
+
+    def failing_once():
+        if not failures:
+            failures.append(1)
+            raise RuntimeError("injected")
+        real_fan_out()
+
+    monkeypatch.setattr(fanout, "_fan_out", failing_once)
+    first, second = _frame("song_playing"), _frame("segment_playing")
+    fanout.publish([first])
+    assert _recv_exactly(client, len(first[1])) == first[1]  # delivered by the next pass
+    fanout.publish([second])
+    assert _recv_exactly(client, len(second[1])) == second[1]
+    assert failures and fanout.stats()["loop_errors"] == 1
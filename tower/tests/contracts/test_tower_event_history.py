@@ -0,0 +1,173 @@
+"""
+Contract tests for the bounded event replay history (NEW_TOWER_RUNTIME_CONTRACT
+T-EVENTS2 exception, T-EXPOSE7): sequence-numbered events, type and time-range
+queries, and WebSocket since=<seq> replay followed by the live tail.
+"""
+
+import base64
+import json
+import os
+import socket
+import threading
+import time
+
+import pytest
+
+from tower.http.event_history import EventHistory
+from tower.http.server import HTTPServer
+
+
+@pytest.fixture
+def server():
+    srv = HTTPServer(host="127.0.0.1", port=0, frame_source=None)
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 2.0
+    while srv._server_sock is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.05)
+    yield srv, srv._server_sock.getsockname()[1]
+    srv.stop()
+
+
+def _read_response(sock):
+    """Read one HTTP response; returns (status, body)."""
+    data = b""
+    while b"\r\n\r\n" not in data:
+        chunk = sock.recv(4096)
+        if not chunk:
+            break
+        data += chunk
+    head, _, rest = data.partition(b"\r\n\r\n")
+    lines = head.decode().split("\r\n")
+    headers = {k.strip().lower(): v.strip() for k, v in (line.split(":", 1) for line in lines[1:] if ":" in line)}
+    if "content-length" in headers:
+        length = int(headers["content-length"])
+        while len(rest) < length:
+            chunk = sock.recv(4096)
+            if not chunk:
+                break
+            rest += chunk
+        rest = rest[:length]
+    return int(lines[0].split()[1]), rest
+
+
+def _request(port, method, path, body=None):
+    # Raw sockets: tower/ on sys.path can shadow the stdlib http package
+    sock = socket.create_connection(("127.0.0.1", port), timeout=2.0)
+    try:
+        payload = json.dumps(body).encode() if body is not None else b""
+        sock.sendall(
+            f"{method} {path} HTTP/1.1\r\nHost: tower\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(payload)}\r\nConnection: close\r\n\r\n".encode() + payload
+        )
+        return _read_response(sock)
+    finally:
+        sock.close()
+
+
+def _post_events(port, *event_types):
+    events = [{"event_type": t, "timestamp": time.monotonic(), "metadata": {}} for t in event_types]
+    status, _ = _request(port, "POST", "/tower/events/ingest/batch", {"events": events})
+    assert status == 200
+
+
+def _ws_connect(port, query):
+    sock = socket.create_connection(("127.0.0.1", port), timeout=2.0)
+    key = base64.b64encode(os.urandom(16)).decode()
+    sock.sendall(
+        f"GET /tower/events{query} HTTP/1.1\r\nHost: tower\r\nUpgrade: websocket\r\n"
+        f"Connection: Upgrade\r\nSec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n".encode()
+    )
+    data = b""
+    while b"\r\n\r\n" not in data:
+        chunk = sock.recv(4096)
+        if not chunk:
+            break
+        data += chunk
+    head, _, rest = data.partition(b"\r\n\r\n")
+    return sock, int(head.split()[1]), rest
+
+
+def _read_ws_texts(sock, count, data=b""):
+    """Decode count unmasked WebSocket text frames from sock."""
+    texts = []
+    while len(texts) < count:
+        while True:
+            if len(data) >= 2:
+                length = data[1] & 0x7F
+                header = 2 if length < 126 else 4
+                if length == 126 and len(data) >= 4:
+                    length = int.from_bytes(data[2:4], "big")
+                if len(data) >= header and len(data) >= header + length and (data[1] & 0x7F) <= 126:
+                    break
+            data += sock.recv(65536)
+        texts.append(json.loads(data[header:header + length]))
+        data = data[header + length:]
+    return texts
+
+
+def test_history_is_bounded_and_indexed_by_seq_type_and_time():
+    history = EventHistory(capacity=4)
+    for i, event_type in enumerate(["song_playing", "segment_playing"] * 3):
+        seq = history.append(event_type, 100.0 + i, {"n": i}, b"f%d" % i)
+        assert seq == i + 1
+    assert history.stats()["retained"] == 4 and history.oldest_seq() == 3
+    assert [e.seq for e in history.since(0)] == [3, 4, 5, 6]  # evicted events are gone
+    assert [e.seq for e in history.since(4)] == [5, 6]
+    assert [e.seq for e in history.since(0, event_type="song_playing")] == [3, 5]
+    assert [e.seq for e in history.between(103.0, 104.5)] == [4, 5]
+    assert [e.seq for e in history.between(103.0, None, event_type="segment_playing", limit=1)] == [4]
+    assert history.since(6) == [] and history.between(200.0) == []
+
+
+def test_since_replays_then_continues_with_live_tail(server):
+    srv, port = server
+    _post_events(port, "song_playing", "segment_playing", "song_playing")
+    sock, status, rest = _ws_connect(port, "?since=1")
+    try:
+        assert status == 101
+        replay = _read_ws_texts(sock, 2, rest)
+        assert [(e["seq"], e["event_type"]) for e in replay] == [(2, "segment_playing"), (3, "song_playing")]
+        _post_events(port, "segment_playing")
+        assert [e["seq"] for e in _read_ws_texts(sock, 1)] == [4]
+    finally:
+        sock.close()
+
+
+def test_replay_and_live_tail_meet_without_gaps_or_duplicates(server):
+    srv, port = server
+    stop = threading.Event()
+
+    def publish():
+        while not stop.is_set():
+            srv._broadcast_events_to_streaming_clients([("song_playing", 0.0, {})])
+            time.sleep(0.001)
+
+    publisher = threading.Thread(target=publish, daemon=True)
+    publisher.start()
+    try:
+        time.sleep(0.05)
+        sock, status, rest = _ws_connect(port, "?since=0&event_type=song_playing")
+        assert status == 101
+        seqs = [e["seq"] for e in _read_ws_texts(sock, 200, rest)]
+        sock.close()
+    finally:
+        stop.set()
+        publisher.join(timeout=2.0)
+    assert seqs == list(range(1, 201))
+
+
+def test_history_endpoint_and_invalid_since(server):
+    srv, port = server
+    _post_events(port, "station_startup", "song_playing", "song_playing")
+    status, body = _request(port, "GET", "/tower/events/history?event_type=song_playing&limit=1")
+    result = json.loads(body)
+    assert status == 200
+    assert [e["seq"] for e in result["events"]] == [2]
+    assert (result["oldest_seq"], result["latest_seq"]) == (1, 3)
+    status, body = _request(port, "GET", "/tower/events/history?since=2")
+    assert [e["seq"] for e in json.loads(body)["events"]] == [3]
+    sock, status, _ = _ws_connect(port, "?since=latest")
+    sock.close()
+    assert status == 400
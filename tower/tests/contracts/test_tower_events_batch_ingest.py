@@ -0,0 +1,135 @@
+"""
+Contract tests for batch event ingestion (NEW_TOWER_RUNTIME_CONTRACT T-EVENTS1, T-EVENTS7).
+
+POST /tower/events/ingest/batch validates each event, fans the valid ones out
+to WebSocket clients in emission order as one payload per client, and keeps
+the connection alive for the next batch.
+"""
+
+import json
+import socket
+import threading
+import time
+
+import pytest
+
+from tower.http.server import HTTPServer
+
+
+@pytest.fixture
+def server():
+    srv = HTTPServer(host="127.0.0.1", port=0, frame_source=None)
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 2.0
+    while srv._server_sock is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.05)
+    yield srv, srv._server_sock.getsockname()[1]
+    srv.stop()
+
+
+def _connect(port):
+    # Raw sockets: tower/ on sys.path can shadow the stdlib http package
+    return socket.create_connection(("127.0.0.1", port), timeout=2.0)
+
+
+def _request(sock, method, path, body=None):
+    """Send one HTTP/1.1 request and return (status, headers, body)."""
+    payload = json.dumps(body).encode() if body is not None else b""
+    sock.sendall(
+        f"{method} {path} HTTP/1.1\r\nHost: tower\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(payload)}\r\n\r\n".encode() + payload
+    )
+    data = b""
+    while b"\r\n\r\n" not in data:
+        chunk = sock.recv(4096)
+        if not chunk:
+            break
+        data += chunk
+    head, _, rest = data.partition(b"\r\n\r\n")
+    lines = head.decode().split("\r\n")
+    headers = {k.strip().lower(): v.strip() for k, v in (line.split(":", 1) for line in lines[1:] if ":" in line)}
+    length = int(headers.get("content-length", len(rest)))
+    while len(rest) < length:
+        chunk = sock.recv(4096)
+        if not chunk:
+            break
+        rest += chunk
+    return int(lines[0].split()[1]), headers, rest[:length]
+
+
+def _event(event_type, n=0):
+    return {"event_type": event_type, "timestamp": time.monotonic(), "metadata": {"n": n}}
+
+
+def _read_ws_texts(sock, count):
+    """Decode count unmasked WebSocket text frames from sock."""
+    sock.settimeout(2.0)
+    data = b""
+    texts = []
+    while len(texts) < count:
+        while True:
+            if len(data) >= 2:
+                length = data[1] & 0x7F
+                header = 2 if length < 126 else 4
+                if length == 126 and len(data) >= 4:
+                    length = int.from_bytes(data[2:4], "big")
+                if len(data) >= header and len(data) >= header + length and (data[1] & 0x7F) <= 126:
+                    break
+            data += sock.recv(65536)
+        texts.append(json.loads(data[header:header + length]))
+        data = data[header + length:]
+    return texts
+
+
+def test_batch_is_validated_and_fanned_out_in_order(server):
+    srv, port = server
+    tower_end, client_end = socket.socketpair()
+    tower_end.settimeout(1.0)
+    srv._event_fanout.add_client("ws", tower_end)
+    try:
+        events = [_event("song_playing", 1), _event("now_playing"), _event("segment_playing", 2), "junk"]
+        conn = _connect(port)
+        status, _, body = _request(conn, "POST", "/tower/events/ingest/batch", {"events": events})
+        assert status == 200
+        assert json.loads(body) == {"accepted": 2, "rejected": 2}
+        received = _read_ws_texts(client_end, 2)
+        assert [(e["event_type"], e["metadata"]["n"]) for e in received] == [("song_playing", 1), ("segment_playing", 2)]
+        deadline = time.monotonic() + 1.0  # counted just after the write the client has read
+        while srv.get_event_fanout_stats()["payloads_delivered"] < 1 and time.monotonic() < deadline:
+            time.sleep(0.005)
+        assert srv.get_event_fanout_stats()["payloads_delivered"] == 1  # whole batch as one payload
+        conn.close()
+    finally:
+        tower_end.close()
+        client_end.close()
+
+
+def test_connection_is_kept_alive_between_batches(server):
+    _, port = server
+    conn = _connect(port)
+    try:
+        for i in range(5):
+            # Same TCP connection throughout
+            status, headers, _ = _request(conn, "POST", "/tower/events/ingest/batch",
+                                          {"events": [_event("song_playing", i)]})
+            assert status == 200
+            assert headers["connection"] == "keep-alive"
+        # Any other request on the kept-alive connection is still served
+        status, _, _ = _request(conn, "GET", "/tower/buffer")
+        assert status in (200, 503)
+    finally:
+        conn.close()
+
+
+def test_shutdown_state_follows_batched_lifecycle_events(server):
+    srv, port = server
+    conn = _connect(port)
+    try:
+        _request(conn, "POST", "/tower/events/ingest/batch", {"events": [_event("station_shutdown")]})
+        assert srv.event_buffer.is_station_shutting_down()
+        status, _, _ = _request(conn, "POST", "/tower/events/ingest/batch", {"events": {"not": "a list"}})
+        assert status == 400
+    finally:
+        conn.close()
@@ -0,0 +1,146 @@
+"""
+Contract tests for GET /tower/events/sse (NEW_TOWER_RUNTIME_CONTRACT T-EXPOSE11):
+the WebSocket event stream as text/event-stream through the same fan-out,
+with event_type filtering, Last-Event-ID resume and heartbeat comments.
+"""
+
+import json
+import socket
+import threading
+import time
+
+import pytest
+
+from tower.http.event_fanout import SSE_HEARTBEAT, EventFanout
+from tower.http.server import HTTPServer
+
+
+@pytest.fixture
+def server():
+    srv = HTTPServer(host="127.0.0.1", port=0, frame_source=None)
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 2.0
+    while srv._server_sock is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.05)
+    yield srv, srv._server_sock.getsockname()[1]
+    srv.stop()
+
+
+def _open_stream(port, query="", last_event_id=None):
+    """Open the SSE stream over a raw socket; returns (sock, status, bytes after headers)."""
+    sock = socket.create_connection(("127.0.0.1", port), timeout=2.0)
+    extra = f"Last-Event-ID: {last_event_id}\r\n" if last_event_id is not None else ""
+    sock.sendall(f"GET /tower/events/sse{query} HTTP/1.1\r\nHost: tower\r\n{extra}\r\n".encode())
+    data = b""
+    while b"\r\n\r\n" not in data:
+        chunk = sock.recv(4096)
+        if not chunk:
+            break
+        data += chunk
+    head, _, rest = data.partition(b"\r\n\r\n")
+    return sock, int(head.split()[1]), rest
+
+
+def _read_messages(sock, count, data=b""):
+    """Read count SSE messages (comments skipped); returns [(id, data_json)]."""
+    messages = []
+    while len(messages) < count:
+        while b"\n\n" not in data:
+            data += sock.recv(65536)
+        block, _, data = data.partition(b"\n\n")
+        fields = dict(line.split(b": ", 1) for line in block.split(b"\n") if line and not line.startswith(b":"))
+        if fields:
+            messages.append((int(fields[b"id"]), json.loads(fields[b"data"])))
+    return messages
+
+
+def _publish(srv, *event_types):
+    srv._broadcast_events_to_streaming_clients([(t, 0.0, {"n": i}) for i, t in enumerate(event_types)])
+
+
+def _wait_for_clients(srv, count):
+    deadline = time.monotonic() + 2.0
+    while srv.get_event_fanout_stats()["sse_clients"] < count and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_sse_stream_is_filtered_and_matches_websocket_payload(server):
+    srv, port = server
+    sock, status, rest = _open_stream(port, "?event_type=song_playing")
+    try:
+        assert status == 200
+        _wait_for_clients(srv, 1)
+        _publish(srv, "segment_playing", "song_playing")
+        [(seq, event)] = _read_messages(sock, 1, rest)
+        assert seq == event["seq"] == 2
+        assert event["event_type"] == "song_playing"
+        entry = srv._event_history.since(1)[0]
+        assert entry.sse_message == b"id: 2\ndata: " + json.dumps(entry.event).encode() + b"\n\n"
+    finally:
+        sock.close()
+
+
+def test_last_event_id_resumes_without_gaps(server):
+    srv, port = server
+    _publish(srv, "song_playing", "segment_playing", "song_playing")
+    sock, status, rest = _open_stream(port, "?since=0", last_event_id=1)  # header wins
+    try:
+        assert status == 200
+        assert [seq for seq, _ in _read_messages(sock, 2, rest)] == [2, 3]
+        _publish(srv, "segment_playing")
+        assert [seq for seq, _ in _read_messages(sock, 1)] == [4]
+    finally:
+        sock.close()
+    sock, status, _ = _open_stream(port, last_event_id="abc")
+    sock.close()
+    assert status == 400
+
+
+def test_idle_sse_clients_get_heartbeats():
+    fanout = EventFanout(heartbeat_sec=0.05)
+    fanout.start()
+    tower_end, client_end = socket.socketpair()
+    ws_tower_end, ws_client_end = socket.socketpair()
+    for sock in (tower_end, ws_tower_end):
+        sock.settimeout(1.0)
+    client_end.settimeout(2.0)
+    ws_client_end.settimeout(0.2)
+    try:
+        fanout.add_client("sse", tower_end, encoding="sse")
+        fanout.add_client("ws", ws_tower_end)
+        assert client_end.recv(64).startswith(SSE_HEARTBEAT)
+        assert fanout.stats()["heartbeats_sent"] >= 1
+        with pytest.raises(socket.timeout):
+            ws_client_end.recv(64)  # WebSocket clients rely on ping/pong instead
+    finally:
+        fanout.stop()
+        client_end.close()
+        ws_client_end.close()
+
+
+
+@pytest.mark.parametrize("encoding", ["sse", "ws"])
+def test_slow_consumer_drop_only_sends_websocket_close_to_websocket_clients(encoding):
+    fanout = EventFanout()  # not started: the drop is driven directly
+    tower_end, client_end = socket.socketpair()
+    tower_end.settimeout(1.0)
+    client_end.settimeout(2.0)
+    try:
+        fanout.add_client("slow", tower_end, encoding=encoding)
+        fanout._drop_slow(fanout._clients["slow"], "test")
+        received = b""
+        while True:
+            chunk = client_end.recv(65536)
+            if not chunk:
+                break
+            received += chunk
+        assert fanout.stats()["slow_consumers_dropped"] == 1
+        if encoding == "sse":
+            assert received == b""  # the event-stream just ends; no binary framing injected
+        else:
+            assert received[:1] == b"\x88"  # WebSocket close frame
+    finally:
+        client_end.close()
+        tower_end.close()
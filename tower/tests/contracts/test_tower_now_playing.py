@@ -0,0 +1,160 @@
+"""
+Contract tests for GET /tower/now-playing (NEW_TOWER_RUNTIME_CONTRACT T-EXPOSE10):
+a pre-serialized document regenerated only on change, strong ETag with 304,
+and ?wait= long-poll that returns as soon as the document changes.
+"""
+
+import json
+import socket
+import threading
+import time
+
+import pytest
+
+from tower.http.now_playing import NowPlaying
+from tower.http.server import HTTPServer
+
+
+@pytest.fixture
+def server():
+    srv = HTTPServer(host="127.0.0.1", port=0, frame_source=None)
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 2.0
+    while srv._server_sock is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.05)
+    yield srv, srv._server_sock.getsockname()[1]
+    srv.stop()
+
+
+def _get(port, path, etag=None):
+    """GET over a raw socket (tower/ on sys.path can shadow the stdlib http package)."""
+    sock = socket.create_connection(("127.0.0.1", port), timeout=5.0)
+    try:
+        extra = f'If-None-Match: "{etag}"\r\n' if etag else ""
+        sock.sendall(f"GET {path} HTTP/1.1\r\nHost: tower\r\n{extra}Connection: close\r\n\r\n".encode())
+        data = b""
+        while True:
+            chunk = sock.recv(4096)
+            if not chunk:
+                break
+            data += chunk
+    finally:
+        sock.close()
+    head, _, body = data.partition(b"\r\n\r\n")
+    lines = head.decode().split("\r\n")
+    headers = {k.strip().lower(): v.strip() for k, v in (line.split(":", 1) for line in lines[1:] if ":" in line)}
+    return int(lines[0].split()[1]), headers.get("etag", "").strip('"'), body
+
+
+def _song(srv, title):
+    srv._broadcast_events_to_streaming_clients([("song_playing", 0.0, {"title": title})])
+
+
+def test_document_changes_only_when_content_changes():
+    now_playing = NowPlaying()
+    initial = now_playing.current()
+    assert json.loads(initial.body)["on_air"] is False
+    assert now_playing.update({"event_type": "song_playing", "seq": 1, "metadata": {"title": "A"}})
+    first = now_playing.current()
+    assert not now_playing.update({"event_type": "song_playing", "seq": 2, "metadata": {"title": "A"}})
+    assert not now_playing.update({"event_type": "station_startup", "seq": 3, "metadata": {}})
+    assert now_playing.current() is first and first.etag != initial.etag
+    assert json.loads(first.body)["metadata"] == {"title": "A"}
+    assert now_playing.update({"event_type": "station_shutdown", "seq": 4, "metadata": {}})
+    assert json.loads(now_playing.current().body)["on_air"] is False
+
+
+def test_etag_and_not_modified(server):
+    srv, port = server
+    _song(srv, "A")
+    status, etag, body = _get(port, "/tower/now-playing")
+    assert status == 200 and etag
+    assert json.loads(body)["metadata"] == {"title": "A"}
+    status, etag_again, body = _get(port, "/tower/now-playing", etag=etag)
+    assert (status, etag_again, body) == (304, etag, b"")
+    _song(srv, "B")
+    status, new_etag, body = _get(port, "/tower/now-playing", etag=etag)
+    assert status == 200 and new_etag != etag
+
+
+def test_long_poll_returns_on_change_or_times_out(server):
+    srv, port = server
+    _song(srv, "A")
+    _, etag, _ = _get(port, "/tower/now-playing")
+    started = time.monotonic()
+    status, _, _ = _get(port, "/tower/now-playing?wait=0.2", etag=etag)
+    assert status == 304 and time.monotonic() - started >= 0.2
+
+    threading.Timer(0.1, _song, args=(srv, "B")).start()
+    started = time.monotonic()
+    status, new_etag, body = _get(port, "/tower/now-playing?wait=10", etag=etag)
+    assert status == 200 and new_etag != etag
+    assert json.loads(body)["metadata"] == {"title": "B"}
+    assert time.monotonic() - started < 2.0
+
+
+def _send_long_poll(port, etag, wait, keep_alive=False):
+    sock = socket.create_connection(("127.0.0.1", port), timeout=5.0)
+    connection = "" if keep_alive else "Connection: close\r\n"
+    sock.sendall(
+        f'GET /tower/now-playing?wait={wait} HTTP/1.1\r\nHost: tower\r\nIf-None-Match: "{etag}"\r\n{connection}\r\n'.encode()
+    )
+    return sock
+
+
+def _read_response(sock):
+    data = b""
+    while b"\r\n\r\n" not in data:
+        data += sock.recv(4096)
+    head, _, body = data.partition(b"\r\n\r\n")
+    length = next((int(line.split(b":")[1]) for line in head.split(b"\r\n") if line.lower().startswith(b"content-length")), 0)
+    while len(body) < length:
+        body += sock.recv(4096)
+    return int(head.split()[1]), body
+
+
+def test_held_long_polls_do_not_occupy_threads_and_are_capped(server):
+    srv, port = server
+    _song(srv, "A")
+    _, etag, _ = _get(port, "/tower/now-playing")
+    srv._now_playing.max_waiters = 20
+    threads_before = threading.active_count()
+    held = [_send_long_poll(port, etag, 10) for _ in range(20)]
+    try:
+        deadline = time.monotonic() + 2.0
+        while srv._now_playing.stats()["long_polls_waiting"] < 20 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert srv._now_playing.stats()["long_polls_waiting"] == 20
+        time.sleep(0.05)  # handler threads have returned
+        assert threading.active_count() <= threads_before + 2  # the waiter thread, not one per request
+
+        # Registry full: answered 304 at once instead of held
+        started = time.monotonic()
+        status, _, _ = _get(port, "/tower/now-playing?wait=10", etag=etag)
+        assert status == 304 and time.monotonic() - started < 1.0
+        assert srv._now_playing.stats()["long_polls_rejected"] == 1
+
+        _song(srv, "B")
+        for sock in held:
+            status, body = _read_response(sock)
+            assert status == 200 and json.loads(body)["metadata"] == {"title": "B"}
+        assert srv._now_playing.stats()["long_polls_waiting"] == 0
+    finally:
+        for sock in held:
+            sock.close()
+
+
+def test_keep_alive_connection_continues_after_held_long_poll(server):
+    srv, port = server
+    _song(srv, "A")
+    _, etag, _ = _get(port, "/tower/now-playing")
+    sock = _send_long_poll(port, etag, 0.2, keep_alive=True)
+    try:
+        assert _read_response(sock) == (304, b"")
+        sock.sendall(b"GET /tower/now-playing HTTP/1.1\r\nHost: tower\r\n\r\n")
+        status, body = _read_response(sock)
+        assert status == 200 and json.loads(body)["metadata"] == {"title": "A"}
+    finally:
+        sock.close()
@@ -0,0 +1,163 @@
+"""
+Contract tests for relay (edge) mode (NEW_TOWER_RUNTIME_CONTRACT T-MODE2): a
+Tower that relays an origin Tower's MP3 /stream and events, exercised with
+two local HTTPServers.
+"""
+
+import json
+import socket
+import threading
+import time
+
+import pytest
+
+from tower.audio.mp3_framer import MP3Framer
+from tower.http.admission import AdmissionController
+from tower.http.server import HTTPServer
+from tower.ingest.origin_relay import OriginRelay
+
+FRAME_SIZE = 384  # 128 kbps, 48 kHz, no padding
+
+
+def _frame(n):
+    return b"\xff\xfb\x94\x00" + bytes([n % 200]) * (FRAME_SIZE - 4)
+
+
+def _wait_for(predicate, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+def _start_server(admission=None):
+    srv = HTTPServer(host="127.0.0.1", port=0, frame_source=None)
+    srv.admission = admission
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    assert _wait_for(lambda: srv._server_sock is not None)
+    time.sleep(0.05)
+    return srv, srv._server_sock.getsockname()[1]
+
+
+def _open_stream(port):
+    # Raw sockets: tower/ on sys.path can shadow the stdlib http package
+    sock = socket.create_connection(("127.0.0.1", port), timeout=2.0)
+    sock.sendall(b"GET /stream HTTP/1.1\r\nHost: tower\r\n\r\n")
+    data = b""
+    while b"\r\n\r\n" not in data:
+        data += sock.recv(4096)
+    head, _, body = data.partition(b"\r\n\r\n")
+    return sock, head.decode(), body
+
+
+@pytest.fixture
+def towers():
+    origin, origin_port = _start_server()
+    edge, edge_port = _start_server()
+    stop = threading.Event()
+
+    def pump():
+        n = 0
+        while not stop.is_set():
+            origin.broadcast(_frame(n))
+            n += 1
+            time.sleep(0.005)
+
+    threading.Thread(target=pump, daemon=True).start()
+    relay = OriginRelay(
+        "127.0.0.1", origin_port, edge, stream_idle_sec=0.5, backoff_initial_sec=0.05, backoff_max_sec=0.2
+    )
+    yield origin, edge, edge_port, relay
+    stop.set()
+    relay.stop()
+    edge.stop()
+    origin.stop()
+
+
+def test_framer_restores_frame_boundaries():
+    frames = [_frame(n) for n in range(5)]
+    # Leading garbage and a false sync (0xFF 0xFF is a sync word with an invalid header)
+    stream = b"\x00\x12\xff\xff\xff\x00" + b"".join(frames)
+    framer = MP3Framer()
+    out = []
+    for i in range(0, len(stream), 97):  # chunks never aligned to frames
+        out += framer.feed(stream[i:i + 97])
+    assert out == frames
+    assert framer.discarded_bytes == 6 and framer.pending_bytes == 0
+
+
+def test_relay_broadcasts_whole_frames_and_reconnects(towers):
+    origin, edge, edge_port, relay = towers
+    relay.start()
+    assert _wait_for(lambda: relay.stats()["frames_relayed"] > 5)
+    listener, head, body = _open_stream(edge_port)
+    try:
+        assert head.startswith("HTTP/1.1 200")
+        while len(body) < FRAME_SIZE * 3:
+            body += listener.recv(65536)
+        assert body[:4] == b"\xff\xfb\x94\x00"  # the listener joined on a frame boundary
+        assert all(body[i:i + 4] == b"\xff\xfb\x94\x00" for i in range(0, FRAME_SIZE * 3, FRAME_SIZE))
+
+        origin._close_all_clients()  # origin stops sending; the relay's idle timeout notices
+        assert _wait_for(lambda: relay.stats()["stream_connects"] >= 2)
+        relayed = relay.stats()["frames_relayed"]
+        assert _wait_for(lambda: relay.stats()["frames_relayed"] > relayed + 5)
+        assert len(edge._connected_clients) == 1  # edge listener untouched by the origin reconnect
+    finally:
+        listener.close()
+
+
+def test_relay_republishes_origin_events_and_resumes_with_last_event_id(towers):
+    origin, edge, edge_port, relay = towers
+    relay.start()
+    assert _wait_for(lambda: relay.stats()["events_state"] == "connected")
+    time.sleep(0.05)
+    origin._broadcast_event_to_streaming_clients("song_playing", 1.0, {"title": "First"})
+    assert _wait_for(lambda: relay.stats()["last_event_id"] == 1)
+
+    relay.stop()
+    origin._broadcast_event_to_streaming_clients("song_playing", 2.0, {"title": "Second"})
+    relay.start()  # resumes after seq 1: the event published while disconnected is replayed
+    assert _wait_for(lambda: relay.stats()["events_relayed"] == 2)
+
+    status, body = edge._events_history_body("since=0")
+    assert status == 200
+    relayed = [(e["event_type"], e["timestamp"], e["metadata"]) for e in body["events"]]
+    assert relayed == [("song_playing", 1.0, {"title": "First"}), ("song_playing", 2.0, {"title": "Second"})]
+    assert json.loads(edge._now_playing.current().body)["metadata"]["title"] == "Second"
+
+
+def test_relay_backs_off_and_honours_origin_retry_after():
+    origin, origin_port = _start_server(AdmissionController(rate_per_sec=0.001, burst=1, queue_size=0))
+    edge, _ = _start_server()
+    holder, _, _ = _open_stream(origin_port)  # takes the origin's only admission
+    relay = OriginRelay("127.0.0.1", origin_port, edge, relay_events=False, backoff_initial_sec=0.05)
+    try:
+        relay.start()
+        assert _wait_for(lambda: relay.stats()["origin_rejections"] == 1)
+        time.sleep(1.0)  # Retry-After is at least 2s, far above the 0.05s backoff
+        stats = relay.stats()
+        assert stats["origin_rejections"] == 1 and stats["stream_state"] == "backoff"
+        assert stats["events_state"] == "disabled"
+    finally:
+        relay.stop()
+        holder.close()
+        edge.stop()
+        origin.stop()
+
+
+def test_relayed_events_are_validated_like_local_ingest(towers):
+    origin, edge, _, relay = towers
+    relay.start()
+    assert _wait_for(lambda: relay.stats()["events_state"] == "connected")
+    time.sleep(0.05)
+    # The origin's own broadcast path does not validate; the edge must
+    origin._broadcast_event_to_streaming_clients("now_playing", 1.0, {"title": "Deprecated"})
+    origin._broadcast_event_to_streaming_clients("station_shutdown", 2.0, {})
+    assert _wait_for(lambda: relay.stats()["last_event_id"] == 2)
+    assert _wait_for(lambda: relay.stats()["events_relayed"] == 1)
+    assert relay.stats()["events_rejected"] == 1
+
+    _, body = edge._events_history_body("since=0")
+    assert [e["event_type"] for e in body["events"]] == ["station_shutdown"]
+    assert edge.event_buffer.is_station_shutting_down()
@@ -0,0 +1,109 @@
+"""
+Contract tests for /stream admission control (NEW_TOWER_RUNTIME_CONTRACT T-CLIENTS5):
+token bucket with a short wait queue, jittered 503 Retry-After, and an
+AudioPump tick-lateness signal that halts admissions.
+"""
+
+import socket
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from tower.encoder.audio_pump import AudioPump
+from tower.http.admission import AdmissionController
+from tower.http.server import HTTPServer
+
+
+def test_token_bucket_then_jittered_retry_after():
+    admission = AdmissionController(rate_per_sec=10, burst=2, queue_size=0, retry_after_sec=2, jitter_sec=3)
+    assert admission.admit() is None and admission.admit() is None
+    retry_afters = {admission.admit() for _ in range(20)}
+    assert all(2 <= r <= 5 for r in retry_afters) and len(retry_afters) > 1  # jittered
+    time.sleep(0.15)
+    assert admission.admit() is None  # refilled
+    assert admission.stats()["rejected_rate"] == 20
+
+
+def test_short_queue_waits_for_next_token():
+    admission = AdmissionController(rate_per_sec=20, burst=1, queue_size=1, queue_timeout_sec=0.5)
+    assert admission.admit() is None
+    results = []
+    waiter = threading.Thread(target=lambda: results.append(admission.admit()))
+    waiter.start()
+    time.sleep(0.01)
+    assert admission.admit() is not None  # queue (size 1) is taken by the waiter
+    waiter.join(timeout=2.0)
+    assert results == [None]
+    assert admission.stats()["admitted_after_wait"] == 1
+
+
+def test_overload_signal_halts_admissions():
+    lateness = {"ms": 50.0}
+    admission = AdmissionController(overload_signal=lambda: lateness["ms"], max_lateness_ms=10, halt_sec=0.2)
+    assert admission.admit() is not None
+    lateness["ms"] = 0.0
+    assert admission.admit() is not None  # still inside the halt window
+    assert admission.stats()["halted"]
+    time.sleep(0.25)
+    assert admission.admit() is None
+    assert admission.stats()["halts"] == 1 and admission.stats()["rejected_overload"] == 2
+
+
+def test_audio_pump_reports_tick_lateness():
+    encoder_manager = Mock()
+    encoder_manager.next_frame = Mock(side_effect=lambda: time.sleep(0.04) or b"\x00" * 4096)
+    pump = AudioPump(pcm_buffer=Mock(), encoder_manager=encoder_manager, downstream_buffer=Mock())
+    assert pump.tick_lateness_ms() == 0.0
+    pump.start()
+    try:
+        time.sleep(0.5)
+    finally:
+        pump.stop()
+    assert pump.overruns > 0
+    assert pump.tick_lateness_ms() > 5.0
+
+
+@pytest.fixture
+def server():
+    srv = HTTPServer(host="127.0.0.1", port=0, frame_source=None)
+    srv.admission = AdmissionController(rate_per_sec=0.1, burst=1, queue_size=0)
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 2.0
+    while srv._server_sock is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.05)
+    yield srv, srv._server_sock.getsockname()[1]
+    srv.stop()
+
+
+def _open_stream(port):
+    # Raw sockets: tower/ on sys.path can shadow the stdlib http package
+    sock = socket.create_connection(("127.0.0.1", port), timeout=2.0)
+    sock.sendall(b"GET /stream HTTP/1.1\r\nHost: tower\r\n\r\n")
+    data = b""
+    while b"\r\n\r\n" not in data:
+        chunk = sock.recv(4096)
+        if not chunk:
+            break
+        data += chunk
+    return sock, data.partition(b"\r\n\r\n")[0].decode()
+
+
+def test_stream_over_budget_gets_503_before_any_stream_header(server):
+    srv, port = server
+    admitted, head = _open_stream(port)
+    try:
+        assert head.startswith("HTTP/1.1 200")
+        refused, head = _open_stream(port)
+        refused.close()
+        assert head.startswith("HTTP/1.1 503")
+        assert "audio/mpeg" not in head
+        retry_after = int(next(line.split(":", 1)[1] for line in head.split("\r\n") if line.lower().startswith("retry-after")))
+        assert retry_after >= 1
+        assert len(srv._connected_clients) == 1  # the admitted listener is untouched
+        assert srv.get_admission_stats()["rejected"] == 1
+    finally:
+        admitted.close()
@@ -0,0 +1,187 @@
+"""
+Contract tests for the disk time-shift archive (NEW_TOWER_RUNTIME_CONTRACT T-CLIENTS6):
+segment rotation, timestamp index, retention, and /stream?start=<epoch>
+replaying from the archive before joining the live stream without a gap.
+"""
+
+import os
+import socket
+import struct
+import threading
+import time
+
+import pytest
+
+from tower.audio.mp3_archive import MP3Archive
+from tower.http.server import HTTPServer
+
+FRAME_SIZE = 384  # 128 kbps, 48 kHz, no padding
+
+
+def _frame(n):
+    return b"\xff\xfb\x94\x00" + struct.pack(">I", n) + b"\x00" * (FRAME_SIZE - 8)
+
+
+def _counters(data):
+    assert all(data[i:i + 4] == b"\xff\xfb\x94\x00" for i in range(0, len(data) - FRAME_SIZE + 1, FRAME_SIZE))
+    return [struct.unpack(">I", data[i + 4:i + 8])[0] for i in range(0, len(data) - FRAME_SIZE + 1, FRAME_SIZE)]
+
+
+def _wait_for(predicate, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_archive_rotates_indexes_and_enforces_retention(tmp_path):
+    archive = MP3Archive(str(tmp_path), segment_sec=1, max_bytes=FRAME_SIZE * 1000,
+                         index_interval_sec=0.05, flush_interval_sec=0.02)
+    archive.start()
+    marks = []
+    try:
+        for n in range(300):  # ~1.5s: spans at least two segments
+            seq = archive.append(_frame(n))
+            if n % 50 == 0:
+                marks.append((time.time(), n))
+            time.sleep(0.005)
+        assert _wait_for(lambda: archive.committed()[2] == seq)
+    finally:
+        archive.stop()
+    assert archive.stats()["segments"] >= 2 and archive.stats()["frames_dropped"] == 0
+
+    reloaded = MP3Archive(str(tmp_path), segment_sec=1)
+    reloaded.start()
+    try:
+        for mark_time, n in marks[1:]:
+            segment_start, offset = reloaded.locate(mark_time + 0.001)
+            assert offset % FRAME_SIZE == 0
+            with open(reloaded.segment_path(segment_start), "rb") as f:
+                f.seek(offset)
+                found = _counters(f.read(FRAME_SIZE))[0]
+            assert n - 20 <= found <= n  # index entry at or before the mark
+        assert reloaded.locate(time.time() + 10) is None  # past the live edge
+    finally:
+        reloaded.stop()
+
+    # Size bound: oldest segments (with their index files) go until the archive fits
+    segments = sorted(name for name in os.listdir(tmp_path) if name.endswith(".mp3"))
+    newest_size = os.path.getsize(tmp_path / segments[-1])
+    trimmed = MP3Archive(str(tmp_path), segment_sec=1, max_bytes=newest_size)
+    trimmed.start()
+    trimmed.stop()
+    assert sorted(os.listdir(tmp_path)) == [segments[-1][:-4] + ".idx", segments[-1]]
+    assert trimmed.stats()["segments_deleted"] == len(segments) - 1
+
+
+def test_restart_after_unclean_shutdown_truncates_torn_frame(tmp_path):
+    def record(frames):
+        archive = MP3Archive(str(tmp_path), index_interval_sec=0.01, flush_interval_sec=0.02)
+        archive.start()
+        try:
+            for n in frames:
+                seq = archive.append(_frame(n))
+                time.sleep(0.002)
+            assert _wait_for(lambda: archive.committed()[2] == seq)
+        finally:
+            archive.stop()
+        return archive
+
+    record(range(50))
+    newest = sorted(name for name in os.listdir(tmp_path) if name.endswith(".mp3"))[-1]
+    # Killed mid-write: half a frame on the segment, half a record on the index
+    with open(tmp_path / newest, "ab") as f:
+        f.write(_frame(999)[:FRAME_SIZE // 2])
+    with open(tmp_path / (newest[:-4] + ".idx"), "ab") as f:
+        f.write(b"\x00" * 7)
+
+    archive = record(range(50, 100))
+    assert archive.stats()["bytes_truncated"] == FRAME_SIZE // 2
+    data = b"".join((tmp_path / name).read_bytes()
+                    for name in sorted(name for name in os.listdir(tmp_path) if name.endswith(".mp3")))
+    assert len(data) % FRAME_SIZE == 0 and _counters(data) == list(range(100))
+    for name in os.listdir(tmp_path):
+        if name.endswith(".idx"):
+            assert os.path.getsize(tmp_path / name) % 16 == 0
+
+
+@pytest.fixture
+def server(tmp_path):
+    srv = HTTPServer(host="127.0.0.1", port=0, frame_source=None)
+    srv.archive = MP3Archive(str(tmp_path), index_interval_sec=0.05, flush_interval_sec=0.05)
+    srv.archive.start()
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    assert _wait_for(lambda: srv._server_sock is not None)
+    time.sleep(0.05)
+    sent = []
+    stop = threading.Event()
+
+    def pump():
+        n = 0
+        while not stop.is_set():
+            srv.broadcast(_frame(n))
+            sent.append((time.time(), n))
+            n += 1
+            time.sleep(0.005)
+
+    threading.Thread(target=pump, daemon=True).start()
+    yield srv, srv._server_sock.getsockname()[1], sent
+    stop.set()
+    srv.stop()
+    srv.archive.stop()
+
+
+def _get(port, path):
+    # Raw sockets: tower/ on sys.path can shadow the stdlib http package
+    sock = socket.create_connection(("127.0.0.1", port), timeout=2.0)
+    sock.sendall(f"GET {path} HTTP/1.1\r\nHost: tower\r\n\r\n".encode())
+    data = b""
+    while b"\r\n\r\n" not in data:
+        data += sock.recv(65536)
+    head, _, body = data.partition(b"\r\n\r\n")
+    return sock, head.decode(), body
+
+
+def test_stream_start_replays_archive_then_joins_live_without_gap(server):
+    srv, port, sent = server
+    time.sleep(0.5)
+    start_time, start_n = sent[40]
+    time.sleep(0.5)
+    sock, head, body = _get(port, f"/stream?start={start_time}")
+    try:
+        assert head.startswith("HTTP/1.1 200") and "audio/mpeg" in head
+        assert _wait_for(lambda: len(srv._connected_clients) == 1)  # caught up and joined live
+        live_n = sent[-1][1]
+        while len(body) < FRAME_SIZE * (live_n - start_n + 40):
+            body += sock.recv(65536)
+        counters = _counters(body)
+        assert start_n - 20 <= counters[0] <= start_n
+        assert counters == list(range(counters[0], counters[0] + len(counters)))  # no gap, no repeat
+        assert counters[-1] > live_n  # continued past the join into live frames
+        assert srv.get_archive_stats()["timeshift_sessions"] == 1
+    finally:
+        sock.close()
+
+
+def test_stream_start_validation(server):
+    srv, port, _ = server
+    sock, head, _ = _get(port, "/stream?start=yesterday")
+    sock.close()
+    assert head.startswith("HTTP/1.1 400")
+
+    sock, head, body = _get(port, f"/stream?start={time.time() + 60}")  # future: plain live stream
+    try:
+        assert head.startswith("HTTP/1.1 200")
+        assert _wait_for(lambda: len(srv._connected_clients) == 1)
+        assert srv.get_archive_stats()["timeshift_sessions"] == 0
+    finally:
+        sock.close()
+
+    srv.archive, archive = None, srv.archive
+    try:
+        sock, head, _ = _get(port, "/stream?start=0")
+        sock.close()
+        assert head.startswith("HTTP/1.1 404")
+    finally:
+        srv.archive = archive